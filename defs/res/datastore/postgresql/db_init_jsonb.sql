@@ -0,0 +1,86 @@
+-- Functions to query jsonb document columns (see profile_resources_jsonb.sql).
+-- Overloads of the json functions in db_init.sql with the same results, written in plain SQL
+-- over the binary jsonb representation, so no document is re-parsed and simple ones are inlined.
+
+
+CREATE OR REPLACE FUNCTION json_string(data jsonb, key text) RETURNS TEXT AS
+$$
+SELECT CASE jsonb_typeof(data #> string_to_array(key, '.'))
+    WHEN 'boolean' THEN CASE WHEN (data #>> string_to_array(key, '.'))::boolean THEN 'True' ELSE 'False' END
+    WHEN 'null' THEN NULL
+    ELSE data #>> string_to_array(key, '.')
+END
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a list of attributes
+CREATE OR REPLACE FUNCTION json_attrs(data jsonb) RETURNS TEXT[] AS
+$$
+SELECT array(SELECT jsonb_object_keys(data))
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a list of nested object types
+CREATE OR REPLACE FUNCTION json_nested(data jsonb) RETURNS TEXT[] AS
+$$
+SELECT array(SELECT value->>'type_' FROM jsonb_each(data)
+             WHERE jsonb_typeof(value) = 'object' AND coalesce(value->>'type_', '') <> '')
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a list of keywords
+CREATE OR REPLACE FUNCTION json_keywords(data jsonb) RETURNS TEXT[] AS
+$$
+SELECT CASE WHEN jsonb_typeof(data->'keywords') = 'array'
+    THEN array(SELECT jsonb_array_elements_text(data->'keywords'))
+    ELSE '{}'::text[]
+END
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a special attribute extracted from object
+CREATE OR REPLACE FUNCTION json_specialattr(data jsonb) RETURNS TEXT AS
+$$
+SELECT CASE data->>'type_'
+    WHEN 'ActorIdentity' THEN 'contact.email=' || nullif(data #>> '{details,contact,email}', '')
+    WHEN 'Org' THEN 'org_governance_name=' || nullif(data->>'org_governance_name', '')
+    WHEN 'UserRole' THEN 'governance_name=' || nullif(data->>'governance_name', '')
+    WHEN 'Policy' THEN 'policy_type=' || nullif(data->>'policy_type', '')
+END
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a list of alternative id namespaces
+CREATE OR REPLACE FUNCTION json_altids_ns(data jsonb) RETURNS TEXT[] AS
+$$
+SELECT array(SELECT DISTINCT (CASE WHEN position(':' in alt_id) > 0 THEN split_part(alt_id, ':', 1) ELSE '_' END) COLLATE "C" AS alt_ns
+             FROM jsonb_array_elements_text(CASE WHEN jsonb_typeof(data->'alt_ids') = 'array'
+                                                 THEN data->'alt_ids' ELSE '[]'::jsonb END) AS alt_id
+             ORDER BY alt_ns)
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in a list of alternative ids
+CREATE OR REPLACE FUNCTION json_altids_id(data jsonb) RETURNS TEXT[] AS
+$$
+SELECT array(SELECT DISTINCT (CASE WHEN position(':' in alt_id) > 0 THEN substr(alt_id, position(':' in alt_id) + 1) ELSE alt_id END) COLLATE "C" AS alt
+             FROM jsonb_array_elements_text(CASE WHEN jsonb_typeof(data->'alt_ids') = 'array'
+                                                 THEN data->'alt_ids' ELSE '[]'::jsonb END) AS alt_id
+             ORDER BY alt)
+$$
+LANGUAGE sql IMMUTABLE STRICT;
+
+-- Results in all attributes in one big string for full text query
+CREATE OR REPLACE FUNCTION json_allattr(data jsonb) RETURNS TEXT AS
+$$
+SELECT array_to_string(array(
+    SELECT left(attr.value #>> '{}', 500)
+    FROM (SELECT key, value FROM jsonb_each(data)
+          UNION ALL
+          SELECT key, value FROM jsonb_each(CASE WHEN data->>'type_' = 'ActorIdentity'
+                                                  AND jsonb_typeof(data #> '{details,contact}') = 'object'
+                                                 THEN data #> '{details,contact}' ELSE '{}'::jsonb END)) AS attr
+    WHERE jsonb_typeof(attr.value) IN ('string', 'number')
+      AND attr.key NOT IN ('_id', '_rev', 'type_', 'ts_created', 'ts_updated', 'lcstate', 'availability')), ' ')
+$$
+LANGUAGE sql IMMUTABLE STRICT;
@@ -0,0 +1,18 @@
+-- Events table partitioned by time range of ts_created (requires Postgres 11+).
+-- Range partitions are created and dropped by the datastore (see event_partition_interval config).
+-- ts_created values are equal length millisecond strings, so byte order is time order.
+CREATE TABLE "%(ds)s" (id varchar(300), rev int, doc json, type_ varchar(80),
+    origin varchar(300), origin_type varchar(80), sub_type varchar(120), ts_created varchar(14) COLLATE "C",
+    PRIMARY KEY (id, ts_created)) PARTITION BY RANGE (ts_created);
+
+GRANT SELECT, INSERT, UPDATE, DELETE on "%(ds)s" TO ion;
+
+-- Holds events outside of all range partitions
+CREATE TABLE "%(ds)s_pdefault" PARTITION OF "%(ds)s" DEFAULT;
+
+-- Events table indexes (created on each partition)
+CREATE INDEX "%(ds)s_type_idx" ON "%(ds)s" (type_, ts_created);
+
+CREATE INDEX "%(ds)s_origin_idx" ON "%(ds)s" (origin, ts_created);
+
+CREATE INDEX "%(ds)s_ts_created_idx" ON "%(ds)s" (ts_created);
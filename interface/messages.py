@@ -0,0 +1,4806 @@
+# Message Objects. Don't edit, it is auto generated file.
+
+import interface.objects
+from pyon.core.object import IonMessageObjectBase
+
+class container_agent_spawn_process_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'spawn_process'
+    _class_info = {'name': 'container_agent_spawn_process_in', 'decorators': {} }
+
+
+    def __init__(self, name="", module="", cls="", config=None, process_id=""):
+        self.name = name
+        self.module = module
+        self.cls = cls
+        self.config = config
+        self.process_id = process_id
+
+    _schema = {
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'module': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'cls': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'config': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_spawn_process_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'spawn_process'
+    _class_info = {'name': 'container_agent_spawn_process_out', 'decorators': {} }
+
+    def __init__(self, process_id=""):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_terminate_process_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'terminate_process'
+    _class_info = {'name': 'container_agent_terminate_process_in', 'decorators': {} }
+
+
+    def __init__(self, process_id=None):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_terminate_process_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'terminate_process'
+    _class_info = {'name': 'container_agent_terminate_process_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_start_app_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_app'
+    _class_info = {'name': 'container_agent_start_app_in', 'decorators': {} }
+
+
+    def __init__(self, appdef=None, config=None):
+        self.appdef = appdef
+        self.config = config
+
+    _schema = {
+                'appdef': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+                'config': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_start_app_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_app'
+    _class_info = {'name': 'container_agent_start_app_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_start_app_from_url_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_app_from_url'
+    _class_info = {'name': 'container_agent_start_app_from_url_in', 'decorators': {} }
+
+
+    def __init__(self, app_url=""):
+        self.app_url = app_url
+
+    _schema = {
+                'app_url': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_start_app_from_url_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_app_from_url'
+    _class_info = {'name': 'container_agent_start_app_from_url_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_start_rel_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_rel'
+    _class_info = {'name': 'container_agent_start_rel_in', 'decorators': {} }
+
+
+    def __init__(self, rel=None):
+        self.rel = rel
+
+    _schema = {
+                'rel': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_start_rel_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_rel'
+    _class_info = {'name': 'container_agent_start_rel_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_start_rel_from_url_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_rel_from_url'
+    _class_info = {'name': 'container_agent_start_rel_from_url_in', 'decorators': {} }
+
+
+    def __init__(self, rel_url=""):
+        self.rel_url = rel_url
+
+    _schema = {
+                'rel_url': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_start_rel_from_url_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'start_rel_from_url'
+    _class_info = {'name': 'container_agent_start_rel_from_url_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class container_agent_stop_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'stop'
+    _class_info = {'name': 'container_agent_stop_in', 'decorators': {} }
+
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_stop_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'stop'
+    _class_info = {'name': 'container_agent_stop_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_status_in(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'status'
+    _class_info = {'name': 'container_agent_status_in', 'decorators': {} }
+
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class container_agent_status_out(IonMessageObjectBase):
+    _svc_name = 'container_agent'
+    _op_name = 'status'
+    _class_info = {'name': 'container_agent_status_out', 'decorators': {} }
+
+    def __init__(self, cstatus=""):
+        self.cstatus = cstatus
+
+    _schema = {
+                'cstatus': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class directory_register_in(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'register'
+    _class_info = {'name': 'directory_register_in', 'decorators': {} }
+
+
+    def __init__(self, parent='/', key='', attributes=None):
+        self.parent = parent
+        self.key = key
+        self.attributes = attributes
+
+    _schema = {
+                'parent': {'type': 'str', 'default': '/', 'decorators': {}, 'description': '' },
+                'key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '' },
+                'attributes': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class directory_register_out(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'register'
+    _class_info = {'name': 'directory_register_out', 'decorators': {} }
+
+    def __init__(self, old_attributes=None):
+        self.old_attributes = old_attributes
+
+    _schema = {
+                'old_attributes': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class directory_unregister_in(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'unregister'
+    _class_info = {'name': 'directory_unregister_in', 'decorators': {} }
+
+
+    def __init__(self, parent='/', key=''):
+        self.parent = parent
+        self.key = key
+
+    _schema = {
+                'parent': {'type': 'str', 'default': '/', 'decorators': {}, 'description': '' },
+                'key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '' },
+              }
+
+class directory_unregister_out(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'unregister'
+    _class_info = {'name': 'directory_unregister_out', 'decorators': {} }
+
+    def __init__(self, old_attributes=None):
+        self.old_attributes = old_attributes
+
+    _schema = {
+                'old_attributes': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class directory_lookup_in(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'lookup'
+    _class_info = {'name': 'directory_lookup_in', 'decorators': {} }
+
+
+    def __init__(self, qualified_key=''):
+        self.qualified_key = qualified_key
+
+    _schema = {
+                'qualified_key': {'type': 'str', 'default': '', 'decorators': {}, 'description': '' },
+              }
+
+class directory_lookup_out(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'lookup'
+    _class_info = {'name': 'directory_lookup_out', 'decorators': {} }
+
+    def __init__(self, attributes=None):
+        self.attributes = attributes
+
+    _schema = {
+                'attributes': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class directory_find_in(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'find'
+    _class_info = {'name': 'directory_find_in', 'decorators': {} }
+
+
+    def __init__(self, parent='/', pattern=''):
+        self.parent = parent
+        self.pattern = pattern
+
+    _schema = {
+                'parent': {'type': 'str', 'default': '/', 'decorators': {}, 'description': '' },
+                'pattern': {'type': 'str', 'default': '', 'decorators': {}, 'description': '' },
+              }
+
+class directory_find_out(IonMessageObjectBase):
+    _svc_name = 'directory'
+    _op_name = 'find'
+    _class_info = {'name': 'directory_find_out', 'decorators': {} }
+
+    def __init__(self, entry_list=None):
+        self.entry_list = entry_list
+
+    _schema = {
+                'entry_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_create_exchange_space_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_space'
+    _class_info = {'name': 'exchange_management_create_exchange_space_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space=None, org_id=""):
+        self.exchange_space = exchange_space
+        self.org_id = org_id
+
+    _schema = {
+                'exchange_space': {'type': 'ExchangeSpace', 'default': None, 'decorators': {}, 'description': '' },
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_create_exchange_space_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_space'
+    _class_info = {'name': 'exchange_management_create_exchange_space_out', 'decorators': {} }
+
+    def __init__(self, exchange_space_id=""):
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_space_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_space'
+    _class_info = {'name': 'exchange_management_update_exchange_space_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space=None):
+        self.exchange_space = exchange_space
+
+    _schema = {
+                'exchange_space': {'type': 'ExchangeSpace', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_space_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_space'
+    _class_info = {'name': 'exchange_management_update_exchange_space_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_read_exchange_space_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_space'
+    _class_info = {'name': 'exchange_management_read_exchange_space_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space_id=""):
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_read_exchange_space_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_space'
+    _class_info = {'name': 'exchange_management_read_exchange_space_out', 'decorators': {} }
+
+    def __init__(self, exchange_space=None):
+        self.exchange_space = exchange_space
+
+    _schema = {
+                'exchange_space': {'type': 'ExchangeSpace', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_space_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_space'
+    _class_info = {'name': 'exchange_management_delete_exchange_space_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space_id=""):
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_space_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_space'
+    _class_info = {'name': 'exchange_management_delete_exchange_space_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_declare_exchange_name_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'declare_exchange_name'
+    _class_info = {'name': 'exchange_management_declare_exchange_name_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_name=None, exchange_space_id=""):
+        self.exchange_name = exchange_name
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'exchange_name': {'type': 'ExchangeName', 'default': None, 'decorators': {}, 'description': '' },
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_declare_exchange_name_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'declare_exchange_name'
+    _class_info = {'name': 'exchange_management_declare_exchange_name_out', 'decorators': {} }
+
+    def __init__(self, canonical_name=""):
+        self.canonical_name = canonical_name
+
+    _schema = {
+                'canonical_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_undeclare_exchange_name_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'undeclare_exchange_name'
+    _class_info = {'name': 'exchange_management_undeclare_exchange_name_in', 'decorators': {} }
+
+
+    def __init__(self, canonical_name="", exchange_space_id=""):
+        self.canonical_name = canonical_name
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'canonical_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_undeclare_exchange_name_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'undeclare_exchange_name'
+    _class_info = {'name': 'exchange_management_undeclare_exchange_name_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_create_exchange_point_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_point'
+    _class_info = {'name': 'exchange_management_create_exchange_point_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_point=None, exchange_space_id=""):
+        self.exchange_point = exchange_point
+        self.exchange_space_id = exchange_space_id
+
+    _schema = {
+                'exchange_point': {'type': 'ExchangePoint', 'default': None, 'decorators': {}, 'description': '' },
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_create_exchange_point_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_point'
+    _class_info = {'name': 'exchange_management_create_exchange_point_out', 'decorators': {} }
+
+    def __init__(self, exchange_point_id=""):
+        self.exchange_point_id = exchange_point_id
+
+    _schema = {
+                'exchange_point_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_point_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_point'
+    _class_info = {'name': 'exchange_management_update_exchange_point_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_point=None):
+        self.exchange_point = exchange_point
+
+    _schema = {
+                'exchange_point': {'type': 'ExchangePoint', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_point_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_point'
+    _class_info = {'name': 'exchange_management_update_exchange_point_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_read_exchange_point_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_point'
+    _class_info = {'name': 'exchange_management_read_exchange_point_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_point_id=""):
+        self.exchange_point_id = exchange_point_id
+
+    _schema = {
+                'exchange_point_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_read_exchange_point_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_point'
+    _class_info = {'name': 'exchange_management_read_exchange_point_out', 'decorators': {} }
+
+    def __init__(self, exchange_point=None):
+        self.exchange_point = exchange_point
+
+    _schema = {
+                'exchange_point': {'type': 'ExchangePoint', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_point_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_point'
+    _class_info = {'name': 'exchange_management_delete_exchange_point_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_point_id=""):
+        self.exchange_point_id = exchange_point_id
+
+    _schema = {
+                'exchange_point_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_point_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_point'
+    _class_info = {'name': 'exchange_management_delete_exchange_point_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_create_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_broker'
+    _class_info = {'name': 'exchange_management_create_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_broker=None):
+        self.exchange_broker = exchange_broker
+
+    _schema = {
+                'exchange_broker': {'type': 'ExchangeBroker', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_create_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'create_exchange_broker'
+    _class_info = {'name': 'exchange_management_create_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self, exchange_broker_id=""):
+        self.exchange_broker_id = exchange_broker_id
+
+    _schema = {
+                'exchange_broker_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_broker'
+    _class_info = {'name': 'exchange_management_update_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_broker=None):
+        self.exchange_broker = exchange_broker
+
+    _schema = {
+                'exchange_broker': {'type': 'ExchangeBroker', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_update_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'update_exchange_broker'
+    _class_info = {'name': 'exchange_management_update_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_read_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_broker'
+    _class_info = {'name': 'exchange_management_read_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_broker_id=""):
+        self.exchange_broker_id = exchange_broker_id
+
+    _schema = {
+                'exchange_broker_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_read_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'read_exchange_broker'
+    _class_info = {'name': 'exchange_management_read_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self, exchange_broker=None):
+        self.exchange_broker = exchange_broker
+
+    _schema = {
+                'exchange_broker': {'type': 'ExchangeBroker', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_broker'
+    _class_info = {'name': 'exchange_management_delete_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_broker_id=""):
+        self.exchange_broker_id = exchange_broker_id
+
+    _schema = {
+                'exchange_broker_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_delete_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'delete_exchange_broker'
+    _class_info = {'name': 'exchange_management_delete_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_add_exchange_space_to_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'add_exchange_space_to_exchange_broker'
+    _class_info = {'name': 'exchange_management_add_exchange_space_to_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space_id="", exchange_broker_id=""):
+        self.exchange_space_id = exchange_space_id
+        self.exchange_broker_id = exchange_broker_id
+
+    _schema = {
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exchange_broker_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_add_exchange_space_to_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'add_exchange_space_to_exchange_broker'
+    _class_info = {'name': 'exchange_management_add_exchange_space_to_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_remove_exchange_space_from_exchange_broker_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'remove_exchange_space_from_exchange_broker'
+    _class_info = {'name': 'exchange_management_remove_exchange_space_from_exchange_broker_in', 'decorators': {} }
+
+
+    def __init__(self, exchange_space_id="", exchange_broker_id=""):
+        self.exchange_space_id = exchange_space_id
+        self.exchange_broker_id = exchange_broker_id
+
+    _schema = {
+                'exchange_space_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exchange_broker_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_remove_exchange_space_from_exchange_broker_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'remove_exchange_space_from_exchange_broker'
+    _class_info = {'name': 'exchange_management_remove_exchange_space_from_exchange_broker_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class exchange_management_call_management_in(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'call_management'
+    _class_info = {'name': 'exchange_management_call_management_in', 'decorators': {} }
+
+
+    def __init__(self, url="", method=""):
+        self.url = url
+        self.method = method
+
+    _schema = {
+                'url': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'method': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class exchange_management_call_management_out(IonMessageObjectBase):
+    _svc_name = 'exchange_management'
+    _op_name = 'call_management'
+    _class_info = {'name': 'exchange_management_call_management_out', 'decorators': {} }
+
+    def __init__(self, content=None):
+        self.content = content
+
+    _schema = {
+                'content': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_create_actor_identity_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'create_actor_identity'
+    _class_info = {'name': 'identity_management_create_actor_identity_in', 'decorators': {} }
+
+
+    def __init__(self, actor_identity=None):
+        self.actor_identity = actor_identity
+
+    _schema = {
+                'actor_identity': {'type': 'ActorIdentity', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_create_actor_identity_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'create_actor_identity'
+    _class_info = {'name': 'identity_management_create_actor_identity_out', 'decorators': {} }
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_update_actor_identity_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'update_actor_identity'
+    _class_info = {'name': 'identity_management_update_actor_identity_in', 'decorators': {} }
+
+
+    def __init__(self, actor_identity=None):
+        self.actor_identity = actor_identity
+
+    _schema = {
+                'actor_identity': {'type': 'ActorIdentity', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_update_actor_identity_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'update_actor_identity'
+    _class_info = {'name': 'identity_management_update_actor_identity_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_read_actor_identity_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_actor_identity'
+    _class_info = {'name': 'identity_management_read_actor_identity_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_read_actor_identity_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_actor_identity'
+    _class_info = {'name': 'identity_management_read_actor_identity_out', 'decorators': {} }
+
+    def __init__(self, actor_identity=None):
+        self.actor_identity = actor_identity
+
+    _schema = {
+                'actor_identity': {'type': 'ActorIdentity', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_delete_actor_identity_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'delete_actor_identity'
+    _class_info = {'name': 'identity_management_delete_actor_identity_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_delete_actor_identity_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'delete_actor_identity'
+    _class_info = {'name': 'identity_management_delete_actor_identity_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_find_actor_identity_by_name_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'find_actor_identity_by_name'
+    _class_info = {'name': 'identity_management_find_actor_identity_by_name_in', 'decorators': {} }
+
+
+    def __init__(self, name=""):
+        self.name = name
+
+    _schema = {
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_find_actor_identity_by_name_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'find_actor_identity_by_name'
+    _class_info = {'name': 'identity_management_find_actor_identity_by_name_out', 'decorators': {} }
+
+    def __init__(self, user_info=None):
+        self.user_info = user_info
+
+    _schema = {
+                'user_info': {'type': 'ActorIdentity', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_request_password_reset_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'request_password_reset'
+    _class_info = {'name': 'identity_management_request_password_reset_in', 'decorators': {} }
+
+
+    def __init__(self, username=""):
+        self.username = username
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_request_password_reset_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'request_password_reset'
+    _class_info = {'name': 'identity_management_request_password_reset_out', 'decorators': {} }
+
+    def __init__(self, reset_token=""):
+        self.reset_token = reset_token
+
+    _schema = {
+                'reset_token': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_reset_password_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'reset_password'
+    _class_info = {'name': 'identity_management_reset_password_in', 'decorators': {} }
+
+
+    def __init__(self, username="", token_string="", new_password=""):
+        self.username = username
+        self.token_string = token_string
+        self.new_password = new_password
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'token_string': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'new_password': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_reset_password_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'reset_password'
+    _class_info = {'name': 'identity_management_reset_password_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_register_credentials_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'register_credentials'
+    _class_info = {'name': 'identity_management_register_credentials_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", credentials=None):
+        self.actor_id = actor_id
+        self.credentials = credentials
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'credentials': {'type': 'Credentials', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_register_credentials_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'register_credentials'
+    _class_info = {'name': 'identity_management_register_credentials_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_unregister_credentials_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'unregister_credentials'
+    _class_info = {'name': 'identity_management_unregister_credentials_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", credentials_name=""):
+        self.actor_id = actor_id
+        self.credentials_name = credentials_name
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'credentials_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_unregister_credentials_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'unregister_credentials'
+    _class_info = {'name': 'identity_management_unregister_credentials_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_is_user_existing_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'is_user_existing'
+    _class_info = {'name': 'identity_management_is_user_existing_in', 'decorators': {} }
+
+
+    def __init__(self, username=""):
+        self.username = username
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_is_user_existing_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'is_user_existing'
+    _class_info = {'name': 'identity_management_is_user_existing_out', 'decorators': {} }
+
+    def __init__(self, user_exists=False):
+        self.user_exists = user_exists
+
+    _schema = {
+                'user_exists': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_find_actor_identity_by_username_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'find_actor_identity_by_username'
+    _class_info = {'name': 'identity_management_find_actor_identity_by_username_in', 'decorators': {} }
+
+
+    def __init__(self, username=""):
+        self.username = username
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_find_actor_identity_by_username_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'find_actor_identity_by_username'
+    _class_info = {'name': 'identity_management_find_actor_identity_by_username_out', 'decorators': {} }
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_set_actor_credentials_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_actor_credentials'
+    _class_info = {'name': 'identity_management_set_actor_credentials_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", username="", password=""):
+        self.actor_id = actor_id
+        self.username = username
+        self.password = password
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'password': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_set_actor_credentials_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_actor_credentials'
+    _class_info = {'name': 'identity_management_set_actor_credentials_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_set_user_password_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_user_password'
+    _class_info = {'name': 'identity_management_set_user_password_in', 'decorators': {} }
+
+
+    def __init__(self, username="", password=""):
+        self.username = username
+        self.password = password
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'password': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_set_user_password_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_user_password'
+    _class_info = {'name': 'identity_management_set_user_password_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_check_actor_credentials_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'check_actor_credentials'
+    _class_info = {'name': 'identity_management_check_actor_credentials_in', 'decorators': {} }
+
+
+    def __init__(self, username="", password=""):
+        self.username = username
+        self.password = password
+
+    _schema = {
+                'username': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'password': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_check_actor_credentials_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'check_actor_credentials'
+    _class_info = {'name': 'identity_management_check_actor_credentials_out', 'decorators': {} }
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_set_actor_auth_status_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_actor_auth_status'
+    _class_info = {'name': 'identity_management_set_actor_auth_status_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", status=None):
+        self.actor_id = actor_id
+        self.status = status
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'status': {'type': 'AuthStatusEnum', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_set_actor_auth_status_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'set_actor_auth_status'
+    _class_info = {'name': 'identity_management_set_actor_auth_status_out', 'decorators': {} }
+
+    def __init__(self, prev_status=None):
+        self.prev_status = prev_status
+
+    _schema = {
+                'prev_status': {'type': 'AuthStatusEnum', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_define_identity_details_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'define_identity_details'
+    _class_info = {'name': 'identity_management_define_identity_details_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", identity_details=None):
+        self.actor_id = actor_id
+        self.identity_details = identity_details
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'identity_details': {'type': 'IdentityDetails', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_define_identity_details_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'define_identity_details'
+    _class_info = {'name': 'identity_management_define_identity_details_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_read_identity_details_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_identity_details'
+    _class_info = {'name': 'identity_management_read_identity_details_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_read_identity_details_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_identity_details'
+    _class_info = {'name': 'identity_management_read_identity_details_out', 'decorators': {} }
+
+    def __init__(self, identity_details=None):
+        self.identity_details = identity_details
+
+    _schema = {
+                'identity_details': {'type': 'IdentityDetails', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_create_authentication_token_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'create_authentication_token'
+    _class_info = {'name': 'identity_management_create_authentication_token_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", start_time="", validity=0):
+        self.actor_id = actor_id
+        self.start_time = start_time
+        self.validity = validity
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'start_time': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'validity': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_create_authentication_token_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'create_authentication_token'
+    _class_info = {'name': 'identity_management_create_authentication_token_out', 'decorators': {} }
+
+    def __init__(self, token_string=""):
+        self.token_string = token_string
+
+    _schema = {
+                'token_string': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_read_authentication_token_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_authentication_token'
+    _class_info = {'name': 'identity_management_read_authentication_token_in', 'decorators': {} }
+
+
+    def __init__(self, token_string=""):
+        self.token_string = token_string
+
+    _schema = {
+                'token_string': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_read_authentication_token_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'read_authentication_token'
+    _class_info = {'name': 'identity_management_read_authentication_token_out', 'decorators': {} }
+
+    def __init__(self, token=None):
+        self.token = token
+
+    _schema = {
+                'token': {'type': 'SecurityToken', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_update_authentication_token_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'update_authentication_token'
+    _class_info = {'name': 'identity_management_update_authentication_token_in', 'decorators': {} }
+
+
+    def __init__(self, token=None):
+        self.token = token
+
+    _schema = {
+                'token': {'type': 'SecurityToken', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_update_authentication_token_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'update_authentication_token'
+    _class_info = {'name': 'identity_management_update_authentication_token_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_invalidate_authentication_token_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'invalidate_authentication_token'
+    _class_info = {'name': 'identity_management_invalidate_authentication_token_in', 'decorators': {} }
+
+
+    def __init__(self, token_string=""):
+        self.token_string = token_string
+
+    _schema = {
+                'token_string': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_invalidate_authentication_token_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'invalidate_authentication_token'
+    _class_info = {'name': 'identity_management_invalidate_authentication_token_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class identity_management_check_authentication_token_in(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'check_authentication_token'
+    _class_info = {'name': 'identity_management_check_authentication_token_in', 'decorators': {} }
+
+
+    def __init__(self, token_string=""):
+        self.token_string = token_string
+
+    _schema = {
+                'token_string': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class identity_management_check_authentication_token_out(IonMessageObjectBase):
+    _svc_name = 'identity_management'
+    _op_name = 'check_authentication_token'
+    _class_info = {'name': 'identity_management_check_authentication_token_out', 'decorators': {} }
+
+    def __init__(self, token_info=None):
+        self.token_info = token_info
+
+    _schema = {
+                'token_info': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_create_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'create_org'
+    _class_info = {'name': 'org_management_create_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org=None):
+        self.org = org
+
+    _schema = {
+                'org': {'type': 'Org', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_create_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'create_org'
+    _class_info = {'name': 'org_management_create_org_out', 'decorators': {} }
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_update_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'update_org'
+    _class_info = {'name': 'org_management_update_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org=None):
+        self.org = org
+
+    _schema = {
+                'org': {'type': 'Org', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_update_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'update_org'
+    _class_info = {'name': 'org_management_update_org_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_read_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'read_org'
+    _class_info = {'name': 'org_management_read_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_read_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'read_org'
+    _class_info = {'name': 'org_management_read_org_out', 'decorators': {} }
+
+    def __init__(self, org=None):
+        self.org = org
+
+    _schema = {
+                'org': {'type': 'Org', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_delete_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'delete_org'
+    _class_info = {'name': 'org_management_delete_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_delete_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'delete_org'
+    _class_info = {'name': 'org_management_delete_org_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_find_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org'
+    _class_info = {'name': 'org_management_find_org_in', 'decorators': {} }
+
+
+    def __init__(self, name=""):
+        self.name = name
+
+    _schema = {
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org'
+    _class_info = {'name': 'org_management_find_org_out', 'decorators': {} }
+
+    def __init__(self, org=None):
+        self.org = org
+
+    _schema = {
+                'org': {'type': 'Org', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_add_org_role_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'add_org_role'
+    _class_info = {'name': 'org_management_add_org_role_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", user_role=None):
+        self.org_id = org_id
+        self.user_role = user_role
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'user_role': {'type': 'UserRole', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_add_org_role_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'add_org_role'
+    _class_info = {'name': 'org_management_add_org_role_out', 'decorators': {} }
+
+    def __init__(self, user_role_id=""):
+        self.user_role_id = user_role_id
+
+    _schema = {
+                'user_role_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_remove_org_role_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'remove_org_role'
+    _class_info = {'name': 'org_management_remove_org_role_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", role_name="", force_removal=False):
+        self.org_id = org_id
+        self.role_name = role_name
+        self.force_removal = force_removal
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'role_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'force_removal': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_remove_org_role_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'remove_org_role'
+    _class_info = {'name': 'org_management_remove_org_role_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_find_org_role_by_name_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_role_by_name'
+    _class_info = {'name': 'org_management_find_org_role_by_name_in', 'decorators': {} }
+
+
+    def __init__(self, org_id="", role_name=""):
+        self.org_id = org_id
+        self.role_name = role_name
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'role_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_role_by_name_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_role_by_name'
+    _class_info = {'name': 'org_management_find_org_role_by_name_out', 'decorators': {} }
+
+    def __init__(self, user_role=None):
+        self.user_role = user_role
+
+    _schema = {
+                'user_role': {'type': 'UserRole', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_org_roles_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_org_roles'
+    _class_info = {'name': 'org_management_list_org_roles_in', 'decorators': {} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_org_roles_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_org_roles'
+    _class_info = {'name': 'org_management_list_org_roles_out', 'decorators': {} }
+
+    def __init__(self, user_role_list=None):
+        self.user_role_list = user_role_list
+
+    _schema = {
+                'user_role_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_negotiate_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'negotiate'
+    _class_info = {'name': 'org_management_negotiate_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, sap=None):
+        self.sap = sap
+
+    _schema = {
+                'sap': {'type': 'ServiceAgreementProposal', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_negotiate_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'negotiate'
+    _class_info = {'name': 'org_management_negotiate_out', 'decorators': {} }
+
+    def __init__(self, sap=None):
+        self.sap = sap
+
+    _schema = {
+                'sap': {'type': 'ServiceAgreementProposal', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_negotiations_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_negotiations'
+    _class_info = {'name': 'org_management_find_org_negotiations_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", proposal_type="", negotiation_status=-1):
+        self.org_id = org_id
+        self.proposal_type = proposal_type
+        self.negotiation_status = negotiation_status
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'proposal_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'negotiation_status': {'type': 'int', 'default': -1, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_negotiations_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_negotiations'
+    _class_info = {'name': 'org_management_find_org_negotiations_out', 'decorators': {} }
+
+    def __init__(self, negotiation=None):
+        self.negotiation = negotiation
+
+    _schema = {
+                'negotiation': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_closed_negotiations_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_closed_negotiations'
+    _class_info = {'name': 'org_management_find_org_closed_negotiations_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", proposal_type=""):
+        self.org_id = org_id
+        self.proposal_type = proposal_type
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'proposal_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_closed_negotiations_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_closed_negotiations'
+    _class_info = {'name': 'org_management_find_org_closed_negotiations_out', 'decorators': {} }
+
+    def __init__(self, negotiation=None):
+        self.negotiation = negotiation
+
+    _schema = {
+                'negotiation': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_user_negotiations_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_user_negotiations'
+    _class_info = {'name': 'org_management_find_user_negotiations_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, actor_id="", org_id="", proposal_type="", negotiation_status=-1):
+        self.actor_id = actor_id
+        self.org_id = org_id
+        self.proposal_type = proposal_type
+        self.negotiation_status = negotiation_status
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'proposal_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'negotiation_status': {'type': 'int', 'default': -1, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_user_negotiations_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_user_negotiations'
+    _class_info = {'name': 'org_management_find_user_negotiations_out', 'decorators': {} }
+
+    def __init__(self, negotiation=None):
+        self.negotiation = negotiation
+
+    _schema = {
+                'negotiation': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_enroll_member_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'enroll_member'
+    _class_info = {'name': 'org_management_enroll_member_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id=""):
+        self.org_id = org_id
+        self.actor_id = actor_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_enroll_member_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'enroll_member'
+    _class_info = {'name': 'org_management_enroll_member_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_cancel_member_enrollment_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'cancel_member_enrollment'
+    _class_info = {'name': 'org_management_cancel_member_enrollment_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id=""):
+        self.org_id = org_id
+        self.actor_id = actor_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_cancel_member_enrollment_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'cancel_member_enrollment'
+    _class_info = {'name': 'org_management_cancel_member_enrollment_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_is_registered_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_registered'
+    _class_info = {'name': 'org_management_is_registered_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_registered_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_registered'
+    _class_info = {'name': 'org_management_is_registered_out', 'decorators': {} }
+
+    def __init__(self, is_registered=False):
+        self.is_registered = is_registered
+
+    _schema = {
+                'is_registered': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_enrolled_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_enrolled'
+    _class_info = {'name': 'org_management_is_enrolled_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, org_id="", actor_id=""):
+        self.org_id = org_id
+        self.actor_id = actor_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_enrolled_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_enrolled'
+    _class_info = {'name': 'org_management_is_enrolled_out', 'decorators': {} }
+
+    def __init__(self, is_enrolled=False):
+        self.is_enrolled = is_enrolled
+
+    _schema = {
+                'is_enrolled': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_enrolled_actors_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_enrolled_actors'
+    _class_info = {'name': 'org_management_list_enrolled_actors_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_enrolled_actors_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_enrolled_actors'
+    _class_info = {'name': 'org_management_list_enrolled_actors_out', 'decorators': {} }
+
+    def __init__(self, actor_list=None):
+        self.actor_list = actor_list
+
+    _schema = {
+                'actor_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_orgs_for_actor_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_orgs_for_actor'
+    _class_info = {'name': 'org_management_list_orgs_for_actor_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, actor_id=""):
+        self.actor_id = actor_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_orgs_for_actor_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_orgs_for_actor'
+    _class_info = {'name': 'org_management_list_orgs_for_actor_out', 'decorators': {} }
+
+    def __init__(self, org_list=None):
+        self.org_list = org_list
+
+    _schema = {
+                'org_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_grant_role_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'grant_role'
+    _class_info = {'name': 'org_management_grant_role_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id="", role_name="", scope=None):
+        self.org_id = org_id
+        self.actor_id = actor_id
+        self.role_name = role_name
+        self.scope = scope
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'role_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'scope': {'type': 'RoleScope', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_grant_role_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'grant_role'
+    _class_info = {'name': 'org_management_grant_role_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_revoke_role_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'revoke_role'
+    _class_info = {'name': 'org_management_revoke_role_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id="", role_name=""):
+        self.org_id = org_id
+        self.actor_id = actor_id
+        self.role_name = role_name
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'role_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_revoke_role_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'revoke_role'
+    _class_info = {'name': 'org_management_revoke_role_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_has_role_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'has_role'
+    _class_info = {'name': 'org_management_has_role_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, org_id="", actor_id="", role_name=""):
+        self.org_id = org_id
+        self.actor_id = actor_id
+        self.role_name = role_name
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'role_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_has_role_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'has_role'
+    _class_info = {'name': 'org_management_has_role_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_actor_roles_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_actor_roles'
+    _class_info = {'name': 'org_management_list_actor_roles_in', 'decorators': {} }
+
+
+    def __init__(self, actor_id="", org_id=""):
+        self.actor_id = actor_id
+        self.org_id = org_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_actor_roles_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_actor_roles'
+    _class_info = {'name': 'org_management_list_actor_roles_out', 'decorators': {} }
+
+    def __init__(self, user_role_list=None):
+        self.user_role_list = user_role_list
+
+    _schema = {
+                'user_role_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_share_resource_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'share_resource'
+    _class_info = {'name': 'org_management_share_resource_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", resource_id=""):
+        self.org_id = org_id
+        self.resource_id = resource_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_share_resource_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'share_resource'
+    _class_info = {'name': 'org_management_share_resource_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_unshare_resource_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'unshare_resource'
+    _class_info = {'name': 'org_management_unshare_resource_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", resource_id=""):
+        self.org_id = org_id
+        self.resource_id = resource_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_unshare_resource_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'unshare_resource'
+    _class_info = {'name': 'org_management_unshare_resource_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_is_resource_shared_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_shared'
+    _class_info = {'name': 'org_management_is_resource_shared_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, org_id="", resource_id=""):
+        self.org_id = org_id
+        self.resource_id = resource_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_resource_shared_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_shared'
+    _class_info = {'name': 'org_management_is_resource_shared_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_shared_resources_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_shared_resources'
+    _class_info = {'name': 'org_management_list_shared_resources_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_shared_resources_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_shared_resources'
+    _class_info = {'name': 'org_management_list_shared_resources_out', 'decorators': {} }
+
+    def __init__(self, resource_list=None):
+        self.resource_list = resource_list
+
+    _schema = {
+                'resource_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_orgs_for_resource_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_orgs_for_resource'
+    _class_info = {'name': 'org_management_list_orgs_for_resource_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_list_orgs_for_resource_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'list_orgs_for_resource'
+    _class_info = {'name': 'org_management_list_orgs_for_resource_out', 'decorators': {} }
+
+    def __init__(self, org_list=None):
+        self.org_list = org_list
+
+    _schema = {
+                'org_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_acquire_resource_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'acquire_resource'
+    _class_info = {'name': 'org_management_acquire_resource_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, sap=None):
+        self.sap = sap
+
+    _schema = {
+                'sap': {'type': 'AcquireResourceProposal', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_acquire_resource_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'acquire_resource'
+    _class_info = {'name': 'org_management_acquire_resource_out', 'decorators': {} }
+
+    def __init__(self, commitment_id=""):
+        self.commitment_id = commitment_id
+
+    _schema = {
+                'commitment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_create_resource_commitment_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'create_resource_commitment'
+    _class_info = {'name': 'org_management_create_resource_commitment_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id="", resource_id="", exclusive=False, expiration=0):
+        self.org_id = org_id
+        self.actor_id = actor_id
+        self.resource_id = resource_id
+        self.exclusive = exclusive
+        self.expiration = expiration
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exclusive': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'expiration': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_create_resource_commitment_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'create_resource_commitment'
+    _class_info = {'name': 'org_management_create_resource_commitment_out', 'decorators': {} }
+
+    def __init__(self, commitment_id=""):
+        self.commitment_id = commitment_id
+
+    _schema = {
+                'commitment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_release_commitment_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'release_commitment'
+    _class_info = {'name': 'org_management_release_commitment_in', 'decorators': {"OperationVerb":"RETIRE", "AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, commitment_id=""):
+        self.commitment_id = commitment_id
+
+    _schema = {
+                'commitment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_release_commitment_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'release_commitment'
+    _class_info = {'name': 'org_management_release_commitment_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_find_commitments_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_commitments'
+    _class_info = {'name': 'org_management_find_commitments_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", resource_id="", actor_id="", exclusive=False, include_expired=False):
+        self.org_id = org_id
+        self.resource_id = resource_id
+        self.actor_id = actor_id
+        self.exclusive = exclusive
+        self.include_expired = include_expired
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exclusive': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'include_expired': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_commitments_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_commitments'
+    _class_info = {'name': 'org_management_find_commitments_out', 'decorators': {} }
+
+    def __init__(self, commitment_list=None):
+        self.commitment_list = commitment_list
+
+    _schema = {
+                'commitment_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_resource_acquired_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_acquired'
+    _class_info = {'name': 'org_management_is_resource_acquired_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, actor_id="", resource_id=""):
+        self.actor_id = actor_id
+        self.resource_id = resource_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_resource_acquired_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_acquired'
+    _class_info = {'name': 'org_management_is_resource_acquired_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_resource_acquired_exclusively_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_acquired_exclusively'
+    _class_info = {'name': 'org_management_is_resource_acquired_exclusively_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, actor_id="", resource_id=""):
+        self.actor_id = actor_id
+        self.resource_id = resource_id
+
+    _schema = {
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_is_resource_acquired_exclusively_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'is_resource_acquired_exclusively'
+    _class_info = {'name': 'org_management_is_resource_acquired_exclusively_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_acquired_resources_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_acquired_resources'
+    _class_info = {'name': 'org_management_find_acquired_resources_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", actor_id="", exclusive=False, include_expired=False):
+        self.org_id = org_id
+        self.actor_id = actor_id
+        self.exclusive = exclusive
+        self.include_expired = include_expired
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'actor_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'exclusive': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'include_expired': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_acquired_resources_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_acquired_resources'
+    _class_info = {'name': 'org_management_find_acquired_resources_out', 'decorators': {} }
+
+    def __init__(self, resource_list=None):
+        self.resource_list = resource_list
+
+    _schema = {
+                'resource_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_containers_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_containers'
+    _class_info = {'name': 'org_management_find_org_containers_in', 'decorators': {} }
+
+
+    def __init__(self, org_id=""):
+        self.org_id = org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_find_org_containers_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'find_org_containers'
+    _class_info = {'name': 'org_management_find_org_containers_out', 'decorators': {} }
+
+    def __init__(self, container_list=None):
+        self.container_list = container_list
+
+    _schema = {
+                'container_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class org_management_affiliate_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'affiliate_org'
+    _class_info = {'name': 'org_management_affiliate_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", affiliate_org_id=""):
+        self.org_id = org_id
+        self.affiliate_org_id = affiliate_org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'affiliate_org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_affiliate_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'affiliate_org'
+    _class_info = {'name': 'org_management_affiliate_org_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class org_management_unaffiliate_org_in(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'unaffiliate_org'
+    _class_info = {'name': 'org_management_unaffiliate_org_in', 'decorators': {"AlwaysVerifyPolicy":""} }
+
+
+    def __init__(self, org_id="", affiliate_org_id=""):
+        self.org_id = org_id
+        self.affiliate_org_id = affiliate_org_id
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'affiliate_org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class org_management_unaffiliate_org_out(IonMessageObjectBase):
+    _svc_name = 'org_management'
+    _op_name = 'unaffiliate_org'
+    _class_info = {'name': 'org_management_unaffiliate_org_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class policy_management_create_resource_access_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_resource_access_policy'
+    _class_info = {'name': 'policy_management_create_resource_access_policy_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", policy_name="", description="", policy_rule="", ordinal=0):
+        self.resource_id = resource_id
+        self.policy_name = policy_name
+        self.description = description
+        self.policy_rule = policy_rule
+        self.ordinal = ordinal
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'description': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_rule': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'ordinal': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_resource_access_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_resource_access_policy'
+    _class_info = {'name': 'policy_management_create_resource_access_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_service_access_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_service_access_policy'
+    _class_info = {'name': 'policy_management_create_service_access_policy_in', 'decorators': {} }
+
+
+    def __init__(self, service_name="", policy_name="", description="", policy_rule="", ordinal=0):
+        self.service_name = service_name
+        self.policy_name = policy_name
+        self.description = description
+        self.policy_rule = policy_rule
+        self.ordinal = ordinal
+
+    _schema = {
+                'service_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'description': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_rule': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'ordinal': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_service_access_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_service_access_policy'
+    _class_info = {'name': 'policy_management_create_service_access_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_common_service_access_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_common_service_access_policy'
+    _class_info = {'name': 'policy_management_create_common_service_access_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy_name="", description="", policy_rule="", ordinal=0):
+        self.policy_name = policy_name
+        self.description = description
+        self.policy_rule = policy_rule
+        self.ordinal = ordinal
+
+    _schema = {
+                'policy_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'description': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_rule': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'ordinal': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_common_service_access_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_common_service_access_policy'
+    _class_info = {'name': 'policy_management_create_common_service_access_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_add_process_operation_precondition_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_process_operation_precondition_policy'
+    _class_info = {'name': 'policy_management_add_process_operation_precondition_policy_in', 'decorators': {} }
+
+
+    def __init__(self, process_id="", op="", policy_content=""):
+        self.process_id = process_id
+        self.op = op
+        self.policy_content = policy_content
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'op': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_content': {'type': 'str', 'default': "", 'decorators': {}, 'description': 'Can\ be\ a\ local\ method\ name\ or\ snippet\ of\ code' },
+              }
+
+class policy_management_add_process_operation_precondition_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_process_operation_precondition_policy'
+    _class_info = {'name': 'policy_management_add_process_operation_precondition_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_add_service_operation_precondition_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_service_operation_precondition_policy'
+    _class_info = {'name': 'policy_management_add_service_operation_precondition_policy_in', 'decorators': {} }
+
+
+    def __init__(self, service_name="", op="", policy_content=""):
+        self.service_name = service_name
+        self.op = op
+        self.policy_content = policy_content
+
+    _schema = {
+                'service_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'op': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_content': {'type': 'str', 'default': "", 'decorators': {}, 'description': 'Can\ be\ a\ local\ method\ name\ or\ snippet\ of\ code' },
+              }
+
+class policy_management_add_service_operation_precondition_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_service_operation_precondition_policy'
+    _class_info = {'name': 'policy_management_add_service_operation_precondition_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_policy'
+    _class_info = {'name': 'policy_management_create_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy=None):
+        self.policy = policy
+
+    _schema = {
+                'policy': {'type': 'Policy', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_create_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'create_policy'
+    _class_info = {'name': 'policy_management_create_policy_out', 'decorators': {} }
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_update_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'update_policy'
+    _class_info = {'name': 'policy_management_update_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy=None):
+        self.policy = policy
+
+    _schema = {
+                'policy': {'type': 'Policy', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_update_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'update_policy'
+    _class_info = {'name': 'policy_management_update_policy_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class policy_management_read_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'read_policy'
+    _class_info = {'name': 'policy_management_read_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_read_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'read_policy'
+    _class_info = {'name': 'policy_management_read_policy_out', 'decorators': {} }
+
+    def __init__(self, policy=None):
+        self.policy = policy
+
+    _schema = {
+                'policy': {'type': 'Policy', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_delete_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'delete_policy'
+    _class_info = {'name': 'policy_management_delete_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_delete_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'delete_policy'
+    _class_info = {'name': 'policy_management_delete_policy_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class policy_management_enable_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'enable_policy'
+    _class_info = {'name': 'policy_management_enable_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_enable_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'enable_policy'
+    _class_info = {'name': 'policy_management_enable_policy_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class policy_management_disable_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'disable_policy'
+    _class_info = {'name': 'policy_management_disable_policy_in', 'decorators': {} }
+
+
+    def __init__(self, policy_id=""):
+        self.policy_id = policy_id
+
+    _schema = {
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_disable_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'disable_policy'
+    _class_info = {'name': 'policy_management_disable_policy_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class policy_management_add_resource_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_resource_policy'
+    _class_info = {'name': 'policy_management_add_resource_policy_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", policy_id=""):
+        self.resource_id = resource_id
+        self.policy_id = policy_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_add_resource_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'add_resource_policy'
+    _class_info = {'name': 'policy_management_add_resource_policy_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_remove_resource_policy_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'remove_resource_policy'
+    _class_info = {'name': 'policy_management_remove_resource_policy_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", policy_id=""):
+        self.resource_id = resource_id
+        self.policy_id = policy_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'policy_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_remove_resource_policy_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'remove_resource_policy'
+    _class_info = {'name': 'policy_management_remove_resource_policy_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_find_resource_policies_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'find_resource_policies'
+    _class_info = {'name': 'policy_management_find_resource_policies_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_find_resource_policies_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'find_resource_policies'
+    _class_info = {'name': 'policy_management_find_resource_policies_out', 'decorators': {} }
+
+    def __init__(self, policy_list=None):
+        self.policy_list = policy_list
+
+    _schema = {
+                'policy_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_resource_access_policy_rules_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_resource_access_policy_rules'
+    _class_info = {'name': 'policy_management_get_active_resource_access_policy_rules_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", org_name=""):
+        self.resource_id = resource_id
+        self.org_name = org_name
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_resource_access_policy_rules_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_resource_access_policy_rules'
+    _class_info = {'name': 'policy_management_get_active_resource_access_policy_rules_out', 'decorators': {} }
+
+    def __init__(self, policy_list=None):
+        self.policy_list = policy_list
+
+    _schema = {
+                'policy_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_service_access_policy_rules_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_service_access_policy_rules'
+    _class_info = {'name': 'policy_management_get_active_service_access_policy_rules_in', 'decorators': {} }
+
+
+    def __init__(self, service_name="", org_name=""):
+        self.service_name = service_name
+        self.org_name = org_name
+
+    _schema = {
+                'service_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_service_access_policy_rules_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_service_access_policy_rules'
+    _class_info = {'name': 'policy_management_get_active_service_access_policy_rules_out', 'decorators': {} }
+
+    def __init__(self, policy_list=None):
+        self.policy_list = policy_list
+
+    _schema = {
+                'policy_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_service_operation_preconditions_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_service_operation_preconditions'
+    _class_info = {'name': 'policy_management_get_active_service_operation_preconditions_in', 'decorators': {} }
+
+
+    def __init__(self, service_name="", op="", org_name=""):
+        self.service_name = service_name
+        self.op = op
+        self.org_name = org_name
+
+    _schema = {
+                'service_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'op': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_service_operation_preconditions_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_service_operation_preconditions'
+    _class_info = {'name': 'policy_management_get_active_service_operation_preconditions_out', 'decorators': {} }
+
+    def __init__(self, policy_list=None):
+        self.policy_list = policy_list
+
+    _schema = {
+                'policy_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_process_operation_preconditions_in(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_process_operation_preconditions'
+    _class_info = {'name': 'policy_management_get_active_process_operation_preconditions_in', 'decorators': {} }
+
+
+    def __init__(self, process_key="", op="", org_name=""):
+        self.process_key = process_key
+        self.op = op
+        self.org_name = org_name
+
+    _schema = {
+                'process_key': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'op': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'org_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class policy_management_get_active_process_operation_preconditions_out(IonMessageObjectBase):
+    _svc_name = 'policy_management'
+    _op_name = 'get_active_process_operation_preconditions'
+    _class_info = {'name': 'policy_management_get_active_process_operation_preconditions_out', 'decorators': {} }
+
+    def __init__(self, policy_list=None):
+        self.policy_list = policy_list
+
+    _schema = {
+                'policy_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_create_process_definition_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'create_process_definition'
+    _class_info = {'name': 'process_dispatcher_create_process_definition_in', 'decorators': {} }
+
+
+    def __init__(self, process_definition=None, process_definition_id=""):
+        self.process_definition = process_definition
+        self.process_definition_id = process_definition_id
+
+    _schema = {
+                'process_definition': {'type': 'ProcessDefinition', 'default': None, 'decorators': {}, 'description': '' },
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_create_process_definition_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'create_process_definition'
+    _class_info = {'name': 'process_dispatcher_create_process_definition_out', 'decorators': {} }
+
+    def __init__(self, process_definition_id=""):
+        self.process_definition_id = process_definition_id
+
+    _schema = {
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_read_process_definition_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'read_process_definition'
+    _class_info = {'name': 'process_dispatcher_read_process_definition_in', 'decorators': {} }
+
+
+    def __init__(self, process_definition_id=""):
+        self.process_definition_id = process_definition_id
+
+    _schema = {
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_read_process_definition_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'read_process_definition'
+    _class_info = {'name': 'process_dispatcher_read_process_definition_out', 'decorators': {} }
+
+    def __init__(self, process_definition=None):
+        self.process_definition = process_definition
+
+    _schema = {
+                'process_definition': {'type': 'ProcessDefinition', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_delete_process_definition_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'delete_process_definition'
+    _class_info = {'name': 'process_dispatcher_delete_process_definition_in', 'decorators': {} }
+
+
+    def __init__(self, process_definition_id=""):
+        self.process_definition_id = process_definition_id
+
+    _schema = {
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_delete_process_definition_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'delete_process_definition'
+    _class_info = {'name': 'process_dispatcher_delete_process_definition_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class process_dispatcher_create_process_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'create_process'
+    _class_info = {'name': 'process_dispatcher_create_process_in', 'decorators': {} }
+
+
+    def __init__(self, process_definition_id=""):
+        self.process_definition_id = process_definition_id
+
+    _schema = {
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_create_process_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'create_process'
+    _class_info = {'name': 'process_dispatcher_create_process_out', 'decorators': {} }
+
+    def __init__(self, process_id=""):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_schedule_process_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'schedule_process'
+    _class_info = {'name': 'process_dispatcher_schedule_process_in', 'decorators': {} }
+
+
+    def __init__(self, process_definition_id="", schedule=None, configuration=None, process_id="", name=""):
+        self.process_definition_id = process_definition_id
+        self.schedule = schedule
+        self.configuration = configuration
+        self.process_id = process_id
+        self.name = name
+
+    _schema = {
+                'process_definition_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'schedule': {'type': 'ProcessSchedule', 'default': None, 'decorators': {}, 'description': '' },
+                'configuration': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_schedule_process_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'schedule_process'
+    _class_info = {'name': 'process_dispatcher_schedule_process_out', 'decorators': {} }
+
+    def __init__(self, process_id=""):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_cancel_process_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'cancel_process'
+    _class_info = {'name': 'process_dispatcher_cancel_process_in', 'decorators': {} }
+
+
+    def __init__(self, process_id=""):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_cancel_process_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'cancel_process'
+    _class_info = {'name': 'process_dispatcher_cancel_process_out', 'decorators': {} }
+
+    def __init__(self, success=True):
+        self.success = success
+
+    _schema = {
+                'success': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_read_process_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'read_process'
+    _class_info = {'name': 'process_dispatcher_read_process_in', 'decorators': {} }
+
+
+    def __init__(self, process_id=""):
+        self.process_id = process_id
+
+    _schema = {
+                'process_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_read_process_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'read_process'
+    _class_info = {'name': 'process_dispatcher_read_process_out', 'decorators': {} }
+
+    def __init__(self, process=None):
+        self.process = process
+
+    _schema = {
+                'process': {'type': 'Process', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class process_dispatcher_list_processes_in(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'list_processes'
+    _class_info = {'name': 'process_dispatcher_list_processes_in', 'decorators': {} }
+
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class process_dispatcher_list_processes_out(IonMessageObjectBase):
+    _svc_name = 'process_dispatcher'
+    _op_name = 'list_processes'
+    _class_info = {'name': 'process_dispatcher_list_processes_out', 'decorators': {} }
+
+    def __init__(self, processes=None):
+        self.processes = processes
+
+    _schema = {
+                'processes': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_query_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'query'
+    _class_info = {'name': 'resource_management_query_in', 'decorators': {} }
+
+
+    def __init__(self, query=None, id_only=True, search_args=None):
+        self.query = query
+        self.id_only = id_only
+        self.search_args = search_args
+
+    _schema = {
+                'query': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+                'search_args': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_query_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'query'
+    _class_info = {'name': 'resource_management_query_out', 'decorators': {} }
+
+    def __init__(self, results=None):
+        self.results = results
+
+    _schema = {
+                'results': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_query_view_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'query_view'
+    _class_info = {'name': 'resource_management_query_view_in', 'decorators': {} }
+
+
+    def __init__(self, view_id="", view_name="", ext_query=None, id_only=True, search_args=None):
+        self.view_id = view_id
+        self.view_name = view_name
+        self.ext_query = ext_query
+        self.id_only = id_only
+        self.search_args = search_args
+
+    _schema = {
+                'view_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'view_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'ext_query': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+                'search_args': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_query_view_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'query_view'
+    _class_info = {'name': 'resource_management_query_view_out', 'decorators': {} }
+
+    def __init__(self, results=None):
+        self.results = results
+    # -----------------
+    # View management. Views are persisted parameterizable queries
+
+    _schema = {
+                'results': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_create_view_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'create_view'
+    _class_info = {'name': 'resource_management_create_view_in', 'decorators': {} }
+
+
+    def __init__(self, view=None):
+        self.view = view
+
+    _schema = {
+                'view': {'type': 'View', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_create_view_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'create_view'
+    _class_info = {'name': 'resource_management_create_view_out', 'decorators': {} }
+
+    def __init__(self, view_id=""):
+        self.view_id = view_id
+
+    _schema = {
+                'view_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_update_view_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'update_view'
+    _class_info = {'name': 'resource_management_update_view_in', 'decorators': {} }
+
+
+    def __init__(self, view=None):
+        self.view = view
+
+    _schema = {
+                'view': {'type': 'View', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_update_view_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'update_view'
+    _class_info = {'name': 'resource_management_update_view_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_management_read_view_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'read_view'
+    _class_info = {'name': 'resource_management_read_view_in', 'decorators': {} }
+
+
+    def __init__(self, view_id=""):
+        self.view_id = view_id
+
+    _schema = {
+                'view_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_read_view_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'read_view'
+    _class_info = {'name': 'resource_management_read_view_out', 'decorators': {} }
+
+    def __init__(self, view=None):
+        self.view = view
+
+    _schema = {
+                'view': {'type': 'View', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_delete_view_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'delete_view'
+    _class_info = {'name': 'resource_management_delete_view_in', 'decorators': {} }
+
+
+    def __init__(self, view_id=""):
+        self.view_id = view_id
+
+    _schema = {
+                'view_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_delete_view_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'delete_view'
+    _class_info = {'name': 'resource_management_delete_view_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_management_create_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'create_resource'
+    _class_info = {'name': 'resource_management_create_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource=None):
+        self.resource = resource
+
+    _schema = {
+                'resource': {'type': 'Resource', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_create_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'create_resource'
+    _class_info = {'name': 'resource_management_create_resource_out', 'decorators': {} }
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_update_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'update_resource'
+    _class_info = {'name': 'resource_management_update_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource=None):
+        self.resource = resource
+
+    _schema = {
+                'resource': {'type': 'Resource', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_update_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'update_resource'
+    _class_info = {'name': 'resource_management_update_resource_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_management_read_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'read_resource'
+    _class_info = {'name': 'resource_management_read_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_read_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'read_resource'
+    _class_info = {'name': 'resource_management_read_resource_out', 'decorators': {} }
+
+    def __init__(self, resource=None):
+        self.resource = resource
+
+    _schema = {
+                'resource': {'type': 'Resource', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_delete_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'delete_resource'
+    _class_info = {'name': 'resource_management_delete_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_delete_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'delete_resource'
+    _class_info = {'name': 'resource_management_delete_resource_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_management_get_org_resource_attributes_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_org_resource_attributes'
+    _class_info = {'name': 'resource_management_get_org_resource_attributes_in', 'decorators': {} }
+
+
+    def __init__(self, org_id="", order_by="", type_filter=None, limit=0, skip=0):
+        self.org_id = org_id
+        self.order_by = order_by
+        self.type_filter = type_filter
+        self.limit = limit
+        self.skip = skip
+
+    _schema = {
+                'org_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'order_by': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'type_filter': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'skip': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_get_org_resource_attributes_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_org_resource_attributes'
+    _class_info = {'name': 'resource_management_get_org_resource_attributes_out', 'decorators': {} }
+
+    def __init__(self, resource_list=None):
+        self.resource_list = resource_list
+
+    _schema = {
+                'resource_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_get_distinct_values_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_distinct_values'
+    _class_info = {'name': 'resource_management_get_distinct_values_in', 'decorators': {} }
+
+
+    def __init__(self, restype="", attr_list=None, res_filter=None):
+        self.restype = restype
+        self.attr_list = attr_list
+        self.res_filter = res_filter
+
+    _schema = {
+                'restype': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'attr_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+                'res_filter': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_get_distinct_values_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_distinct_values'
+    _class_info = {'name': 'resource_management_get_distinct_values_out', 'decorators': {} }
+
+    def __init__(self, value_list=None):
+        self.value_list = value_list
+
+    _schema = {
+                'value_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_execute_lifecycle_transition_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'execute_lifecycle_transition'
+    _class_info = {'name': 'resource_management_execute_lifecycle_transition_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", transition_event=""):
+        self.resource_id = resource_id
+        self.transition_event = transition_event
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'transition_event': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_execute_lifecycle_transition_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'execute_lifecycle_transition'
+    _class_info = {'name': 'resource_management_execute_lifecycle_transition_out', 'decorators': {} }
+
+    def __init__(self, lcstate=""):
+        self.lcstate = lcstate
+
+    _schema = {
+                'lcstate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_get_lifecycle_events_in(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_lifecycle_events'
+    _class_info = {'name': 'resource_management_get_lifecycle_events_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_management_get_lifecycle_events_out(IonMessageObjectBase):
+    _svc_name = 'resource_management'
+    _op_name = 'get_lifecycle_events'
+    _class_info = {'name': 'resource_management_get_lifecycle_events_out', 'decorators': {} }
+
+    def __init__(self, transition_events=None):
+        self.transition_events = transition_events
+
+    _schema = {
+                'transition_events': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create'
+    _class_info = {'name': 'resource_registry_create_in', 'decorators': {"OperationVerb":"CREATE"} }
+
+
+    def __init__(self, object=None):
+        self.object = object
+
+    _schema = {
+                'object': {'type': 'Resource', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create'
+    _class_info = {'name': 'resource_registry_create_out', 'decorators': {} }
+
+    def __init__(self, tuple=None):
+        self.tuple = tuple
+
+    _schema = {
+                'tuple': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read'
+    _class_info = {'name': 'resource_registry_read_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, object_id="", rev_id=""):
+        self.object_id = object_id
+        self.rev_id = rev_id
+
+    _schema = {
+                'object_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'rev_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read'
+    _class_info = {'name': 'resource_registry_read_out', 'decorators': {} }
+
+    def __init__(self, object=None):
+        self.object = object
+
+    _schema = {
+                'object': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_mult_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_mult'
+    _class_info = {'name': 'resource_registry_read_mult_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, object_ids=None):
+        self.object_ids = object_ids
+
+    _schema = {
+                'object_ids': {'type': 'list', 'default': None, 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_registry_read_mult_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_mult'
+    _class_info = {'name': 'resource_registry_read_mult_out', 'decorators': {} }
+
+    def __init__(self, objects=None):
+        self.objects = objects
+
+    _schema = {
+                'objects': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_update_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'update'
+    _class_info = {'name': 'resource_registry_update_in', 'decorators': {"OperationVerb":"UPDATE"} }
+
+
+    def __init__(self, object=None):
+        self.object = object
+
+    _schema = {
+                'object': {'type': 'Resource', 'default': None, 'decorators': {"ResourceId":"_id"}, 'description': '' },
+              }
+
+class resource_registry_update_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'update'
+    _class_info = {'name': 'resource_registry_update_out', 'decorators': {} }
+
+    def __init__(self, tuple=None):
+        self.tuple = tuple
+
+    _schema = {
+                'tuple': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_delete_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete'
+    _class_info = {'name': 'resource_registry_delete_in', 'decorators': {"OperationVerb":"DELETE"} }
+
+
+    def __init__(self, object_id=""):
+        self.object_id = object_id
+
+    _schema = {
+                'object_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_registry_delete_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete'
+    _class_info = {'name': 'resource_registry_delete_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_retire_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'retire'
+    _class_info = {'name': 'resource_registry_retire_in', 'decorators': {"OperationVerb":"RETIRE"} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_registry_retire_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'retire'
+    _class_info = {'name': 'resource_registry_retire_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_lcs_delete_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'lcs_delete'
+    _class_info = {'name': 'resource_registry_lcs_delete_in', 'decorators': {"OperationVerb":"RETIRE"} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_registry_lcs_delete_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'lcs_delete'
+    _class_info = {'name': 'resource_registry_lcs_delete_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_execute_lifecycle_transition_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'execute_lifecycle_transition'
+    _class_info = {'name': 'resource_registry_execute_lifecycle_transition_in', 'decorators': {"OperationVerb":"LCS-CHANGE"} }
+
+
+    def __init__(self, resource_id="", transition_event=""):
+        self.resource_id = resource_id
+        self.transition_event = transition_event
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'transition_event': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_execute_lifecycle_transition_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'execute_lifecycle_transition'
+    _class_info = {'name': 'resource_registry_execute_lifecycle_transition_out', 'decorators': {} }
+
+    def __init__(self, lcstate=""):
+        self.lcstate = lcstate
+
+    _schema = {
+                'lcstate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_set_lifecycle_state_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'set_lifecycle_state'
+    _class_info = {'name': 'resource_registry_set_lifecycle_state_in', 'decorators': {"OperationVerb":"LCS-CHANGE"} }
+
+
+    def __init__(self, resource_id="", target_lcstate=""):
+        self.resource_id = resource_id
+        self.target_lcstate = target_lcstate
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'target_lcstate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_set_lifecycle_state_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'set_lifecycle_state'
+    _class_info = {'name': 'resource_registry_set_lifecycle_state_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_create_attachment_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_attachment'
+    _class_info = {'name': 'resource_registry_create_attachment_in', 'decorators': {"OperationVerb":"CREATE"} }
+
+
+    def __init__(self, resource_id="", attachment=None):
+        self.resource_id = resource_id
+        self.attachment = attachment
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'attachment': {'type': 'Attachment', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_attachment_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_attachment'
+    _class_info = {'name': 'resource_registry_create_attachment_out', 'decorators': {} }
+
+    def __init__(self, attachment_id=""):
+        self.attachment_id = attachment_id
+
+    _schema = {
+                'attachment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_attachment_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_attachment'
+    _class_info = {'name': 'resource_registry_read_attachment_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, attachment_id="", include_content=False):
+        self.attachment_id = attachment_id
+        self.include_content = include_content
+
+    _schema = {
+                'attachment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'include_content': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_attachment_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_attachment'
+    _class_info = {'name': 'resource_registry_read_attachment_out', 'decorators': {} }
+
+    def __init__(self, attachment=None):
+        self.attachment = attachment
+
+    _schema = {
+                'attachment': {'type': 'Attachment', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_delete_attachment_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete_attachment'
+    _class_info = {'name': 'resource_registry_delete_attachment_in', 'decorators': {"OperationVerb":"DELETE"} }
+
+
+    def __init__(self, attachment_id=""):
+        self.attachment_id = attachment_id
+
+    _schema = {
+                'attachment_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_delete_attachment_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete_attachment'
+    _class_info = {'name': 'resource_registry_delete_attachment_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_find_attachments_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_attachments'
+    _class_info = {'name': 'resource_registry_find_attachments_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, resource_id="", keyword="", limit=0, descending=False, include_content=False, id_only=True):
+        self.resource_id = resource_id
+        self.keyword = keyword
+        self.limit = limit
+        self.descending = descending
+        self.include_content = include_content
+        self.id_only = id_only
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'keyword': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'descending': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'include_content': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_attachments_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_attachments'
+    _class_info = {'name': 'resource_registry_find_attachments_out', 'decorators': {} }
+
+    def __init__(self, attachment_list=None):
+        self.attachment_list = attachment_list
+
+    _schema = {
+                'attachment_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_association_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_association'
+    _class_info = {'name': 'resource_registry_create_association_in', 'decorators': {"OperationVerb":"CREATE"} }
+
+
+    def __init__(self, subject="", predicate="", object="", assoc_type=None):
+        self.subject = subject
+        self.predicate = predicate
+        self.object = object
+        self.assoc_type = assoc_type
+
+    _schema = {
+                'subject': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'assoc_type': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_association_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_association'
+    _class_info = {'name': 'resource_registry_create_association_out', 'decorators': {} }
+
+    def __init__(self, tuple=None):
+        self.tuple = tuple
+
+    _schema = {
+                'tuple': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_association_mult_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_association_mult'
+    _class_info = {'name': 'resource_registry_create_association_mult_in', 'decorators': {"OperationVerb":"CREATE"} }
+
+
+    def __init__(self, assoc_list=None):
+        self.assoc_list = assoc_list
+
+    _schema = {
+                'assoc_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_create_association_mult_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'create_association_mult'
+    _class_info = {'name': 'resource_registry_create_association_mult_out', 'decorators': {} }
+
+    def __init__(self, tuple=None):
+        self.tuple = tuple
+
+    _schema = {
+                'tuple': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_delete_association_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete_association'
+    _class_info = {'name': 'resource_registry_delete_association_in', 'decorators': {"OperationVerb":"DELETE"} }
+
+
+    def __init__(self, association=""):
+        self.association = association
+
+    _schema = {
+                'association': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Association,str"}, 'description': '' },
+              }
+
+class resource_registry_delete_association_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'delete_association'
+    _class_info = {'name': 'resource_registry_delete_association_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_registry_read_object_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_object'
+    _class_info = {'name': 'resource_registry_read_object_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, subject="", predicate="", object_type="", assoc="", id_only=False):
+        self.subject = subject
+        self.predicate = predicate
+        self.object_type = object_type
+        self.assoc = assoc
+        self.id_only = id_only
+
+    _schema = {
+                'subject': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'assoc': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_object_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_object'
+    _class_info = {'name': 'resource_registry_read_object_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_objects_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_objects'
+    _class_info = {'name': 'resource_registry_find_objects_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, subject="", predicate="", object_type="", id_only=False, limit=0, skip=0, descending=False):
+        self.subject = subject
+        self.predicate = predicate
+        self.object_type = object_type
+        self.id_only = id_only
+        self.limit = limit
+        self.skip = skip
+        self.descending = descending
+
+    _schema = {
+                'subject': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'skip': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'descending': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_objects_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_objects'
+    _class_info = {'name': 'resource_registry_find_objects_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_subject_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_subject'
+    _class_info = {'name': 'resource_registry_read_subject_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, subject_type="", predicate="", object="", assoc="", id_only=False):
+        self.subject_type = subject_type
+        self.predicate = predicate
+        self.object = object
+        self.assoc = assoc
+        self.id_only = id_only
+
+    _schema = {
+                'subject_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'assoc': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_read_subject_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'read_subject'
+    _class_info = {'name': 'resource_registry_read_subject_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_subjects_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_subjects'
+    _class_info = {'name': 'resource_registry_find_subjects_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, subject_type="", predicate="", object="", id_only=False, limit=0, skip=0, descending=False):
+        self.subject_type = subject_type
+        self.predicate = predicate
+        self.object = object
+        self.id_only = id_only
+        self.limit = limit
+        self.skip = skip
+        self.descending = descending
+
+    _schema = {
+                'subject_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'skip': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'descending': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_subjects_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_subjects'
+    _class_info = {'name': 'resource_registry_find_subjects_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_associations_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_associations'
+    _class_info = {'name': 'resource_registry_find_associations_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, subject="", predicate="", object="", assoc_type=None, id_only=False, anyside="", limit=0, skip=0, descending=False):
+        self.subject = subject
+        self.predicate = predicate
+        self.object = object
+        self.assoc_type = assoc_type
+        self.id_only = id_only
+        self.anyside = anyside
+        self.limit = limit
+        self.skip = skip
+        self.descending = descending
+
+    _schema = {
+                'subject': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'assoc_type': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'anyside': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'skip': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'descending': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_associations_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_associations'
+    _class_info = {'name': 'resource_registry_find_associations_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_objects_mult_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_objects_mult'
+    _class_info = {'name': 'resource_registry_find_objects_mult_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, subjects=None, id_only=False, predicate=""):
+        self.subjects = subjects
+        self.id_only = id_only
+        self.predicate = predicate
+
+    _schema = {
+                'subjects': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_objects_mult_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_objects_mult'
+    _class_info = {'name': 'resource_registry_find_objects_mult_out', 'decorators': {} }
+
+    def __init__(self, results=None):
+        self.results = results
+
+    _schema = {
+                'results': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_subjects_mult_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_subjects_mult'
+    _class_info = {'name': 'resource_registry_find_subjects_mult_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, objects=None, id_only=False, predicate=""):
+        self.objects = objects
+        self.id_only = id_only
+        self.predicate = predicate
+
+    _schema = {
+                'objects': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_subjects_mult_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_subjects_mult'
+    _class_info = {'name': 'resource_registry_find_subjects_mult_out', 'decorators': {} }
+
+    def __init__(self, results=None):
+        self.results = results
+
+    _schema = {
+                'results': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_get_association_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'get_association'
+    _class_info = {'name': 'resource_registry_get_association_in', 'decorators': {"OperationVerb":"GET"} }
+
+
+    def __init__(self, subject="", predicate="", object="", assoc_type=None, id_only=False):
+        self.subject = subject
+        self.predicate = predicate
+        self.object = object
+        self.assoc_type = assoc_type
+        self.id_only = id_only
+
+    _schema = {
+                'subject': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'predicate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'object': {'type': 'str', 'default': "", 'decorators': {"ContentType":"Resource,str"}, 'description': '' },
+                'assoc_type': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_get_association_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'get_association'
+    _class_info = {'name': 'resource_registry_get_association_out', 'decorators': {} }
+
+    def __init__(self, association=None):
+        self.association = association
+
+    _schema = {
+                'association': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_resources_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_resources'
+    _class_info = {'name': 'resource_registry_find_resources_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, restype="", lcstate="", name="", id_only=False):
+        self.restype = restype
+        self.lcstate = lcstate
+        self.name = name
+        self.id_only = id_only
+
+    _schema = {
+                'restype': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'lcstate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_resources_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_resources'
+    _class_info = {'name': 'resource_registry_find_resources_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_resources_ext_in(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_resources_ext'
+    _class_info = {'name': 'resource_registry_find_resources_ext_in', 'decorators': {"OperationVerb":"FIND"} }
+
+
+    def __init__(self, restype="", lcstate="", name="", keyword="", nested_type="", attr_name="", attr_value="", alt_id="", alt_id_ns="", limit=0, skip=0, descending=False, id_only=False, query=None):
+        self.restype = restype
+        self.lcstate = lcstate
+        self.name = name
+        self.keyword = keyword
+        self.nested_type = nested_type
+        self.attr_name = attr_name
+        self.attr_value = attr_value
+        self.alt_id = alt_id
+        self.alt_id_ns = alt_id_ns
+        self.limit = limit
+        self.skip = skip
+        self.descending = descending
+        self.id_only = id_only
+        self.query = query
+
+    _schema = {
+                'restype': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'lcstate': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'keyword': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'nested_type': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'attr_name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'attr_value': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'alt_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'alt_id_ns': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'limit': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'skip': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'descending': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'id_only': {'type': 'bool', 'default': False, 'decorators': {}, 'description': '' },
+                'query': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_registry_find_resources_ext_out(IonMessageObjectBase):
+    _svc_name = 'resource_registry'
+    _op_name = 'find_resources_ext'
+    _class_info = {'name': 'resource_registry_find_resources_ext_out', 'decorators': {} }
+
+    def __init__(self, list=None):
+        self.list = list
+
+    _schema = {
+                'list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class system_management_perform_action_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'perform_action'
+    _class_info = {'name': 'system_management_perform_action_in', 'decorators': {} }
+
+
+    def __init__(self, predicate=None, action=None):
+        self.predicate = predicate
+        self.action = action
+
+    _schema = {
+                'predicate': {'type': 'ContainerManagementPredicate', 'default': None, 'decorators': {}, 'description': '' },
+                'action': {'type': 'ContainerManagementAction', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class system_management_perform_action_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'perform_action'
+    _class_info = {'name': 'system_management_perform_action_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_set_log_level_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'set_log_level'
+    _class_info = {'name': 'system_management_set_log_level_in', 'decorators': {} }
+
+
+    def __init__(self, logger="", level="", recursive=True):
+        self.logger = logger
+        self.level = level
+        self.recursive = recursive
+
+    _schema = {
+                'logger': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'level': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'recursive': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class system_management_set_log_level_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'set_log_level'
+    _class_info = {'name': 'system_management_set_log_level_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_reset_policy_cache_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'reset_policy_cache'
+    _class_info = {'name': 'system_management_reset_policy_cache_in', 'decorators': {} }
+
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_reset_policy_cache_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'reset_policy_cache'
+    _class_info = {'name': 'system_management_reset_policy_cache_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_trigger_garbage_collection_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'trigger_garbage_collection'
+    _class_info = {'name': 'system_management_trigger_garbage_collection_in', 'decorators': {} }
+
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_trigger_garbage_collection_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'trigger_garbage_collection'
+    _class_info = {'name': 'system_management_trigger_garbage_collection_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_trigger_container_snapshot_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'trigger_container_snapshot'
+    _class_info = {'name': 'system_management_trigger_container_snapshot_in', 'decorators': {} }
+
+
+    def __init__(self, snapshot_id="", include_snapshots=None, exclude_snapshots=None, take_at_time="", clear_all=False, persist_snapshot=True, snapshot_kwargs=None):
+        self.snapshot_id = snapshot_id
+        self.include_snapshots = include_snapshots
+        self.exclude_snapshots = exclude_snapshots
+        self.take_at_time = take_at_time
+        self.clear_all = clear_all
+        self.persist_snapshot = persist_snapshot
+        self.snapshot_kwargs = snapshot_kwargs
+
+    _schema = {
+                'snapshot_id': {'type': 'str', 'default': "", 'decorators': {}, 'description': 'Unique\ identifier\ for\ a\ snapshot' },
+                'include_snapshots': {'type': 'list', 'default': None, 'decorators': {}, 'description': 'List\ of\ special\ snapshots\ to\ include' },
+                'exclude_snapshots': {'type': 'list', 'default': None, 'decorators': {}, 'description': 'List\ of\ special\ snapshots\ to\ exclude' },
+                'take_at_time': {'type': 'str', 'default': "", 'decorators': {}, 'description': 'System\ timestamp\ for\ time\ when\ to\ take\ the\ snapshot' },
+                'clear_all': {'type': 'bool', 'default': False, 'decorators': {}, 'description': 'If\ True\,\ clear\ snapshots' },
+                'persist_snapshot': {'type': 'bool', 'default': True, 'decorators': {}, 'description': 'If\ True\,\ persist\ snapshot\,\ otherwise\ log\ only' },
+                'snapshot_kwargs': {'type': 'dict', 'default': None, 'decorators': {}, 'description': 'Arbitrary\ args\ for\ snapshot' },
+              }
+
+class system_management_trigger_container_snapshot_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'trigger_container_snapshot'
+    _class_info = {'name': 'system_management_trigger_container_snapshot_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class system_management_prepare_system_shutdown_in(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'prepare_system_shutdown'
+    _class_info = {'name': 'system_management_prepare_system_shutdown_in', 'decorators': {} }
+
+
+    def __init__(self, mode=""):
+        self.mode = mode
+
+    _schema = {
+                'mode': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class system_management_prepare_system_shutdown_out(IonMessageObjectBase):
+    _svc_name = 'system_management'
+    _op_name = 'prepare_system_shutdown'
+    _class_info = {'name': 'system_management_prepare_system_shutdown_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class hello_hello_in(IonMessageObjectBase):
+    _svc_name = 'hello'
+    _op_name = 'hello'
+    _class_info = {'name': 'hello_hello_in', 'decorators': {"OperationVerb":"READ"} }
+
+
+    def __init__(self, text=""):
+        self.text = text
+
+    _schema = {
+                'text': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class hello_hello_out(IonMessageObjectBase):
+    _svc_name = 'hello'
+    _op_name = 'hello'
+    _class_info = {'name': 'hello_hello_out', 'decorators': {} }
+
+    def __init__(self, text=""):
+        self.text = text
+
+    _schema = {
+                'text': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class hello_noop_in(IonMessageObjectBase):
+    _svc_name = 'hello'
+    _op_name = 'noop'
+    _class_info = {'name': 'hello_noop_in', 'decorators': {"OperationVerb":"INERT"} }
+
+
+    def __init__(self, text=""):
+        self.text = text
+
+    _schema = {
+                'text': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class hello_noop_out(IonMessageObjectBase):
+    _svc_name = 'hello'
+    _op_name = 'noop'
+    _class_info = {'name': 'hello_noop_out', 'decorators': {} }
+
+    def __init__(self, text=""):
+        self.text = text
+
+    _schema = {
+                'text': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class sample_doc_fields__in(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'doc_fields_'
+    _class_info = {'name': 'sample_doc_fields__in', 'decorators': {} }
+
+
+    def __init__(self, name="name", time="2011-07-27T02:59:43.1Z", an_int=1, a_float=1.1, a_string="text", none=None, a_dict=None, a_list=None):
+        self.name = name
+        self.time = time
+        self.an_int = an_int
+        self.a_float = a_float
+        self.a_string = a_string
+        self.none = none
+        self.a_dict = a_dict
+        self.a_list = a_list
+
+    _schema = {
+                'name': {'type': 'str', 'default': "name", 'decorators': {}, 'description': '' },
+                'time': {'type': 'str', 'default': "2011-07-27T02:59:43.1Z", 'decorators': {}, 'description': '' },
+                'an_int': {'type': 'int', 'default': 1, 'decorators': {}, 'description': '' },
+                'a_float': {'type': 'float', 'default': 1.1, 'decorators': {}, 'description': '' },
+                'a_string': {'type': 'str', 'default': "text", 'decorators': {}, 'description': '' },
+                'none': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+                'a_dict': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'a_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class sample_doc_fields__out(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'doc_fields_'
+    _class_info = {'name': 'sample_doc_fields__out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class sample_sample_ping_in(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'sample_ping'
+    _class_info = {'name': 'sample_sample_ping_in', 'decorators': {} }
+
+
+    def __init__(self, name="name", time="2011-07-27T02:59:43.1Z", an_int=0, a_float=0.0, a_str="", none=None, a_dict=None, a_list=None):
+        self.name = name
+        self.time = time
+        self.an_int = an_int
+        self.a_float = a_float
+        self.a_str = a_str
+        self.none = none
+        self.a_dict = a_dict
+        self.a_list = a_list
+
+    _schema = {
+                'name': {'type': 'str', 'default': "name", 'decorators': {}, 'description': '' },
+                'time': {'type': 'str', 'default': "2011-07-27T02:59:43.1Z", 'decorators': {}, 'description': '' },
+                'an_int': {'type': 'int', 'default': 0, 'decorators': {}, 'description': '' },
+                'a_float': {'type': 'float', 'default': 0.0, 'decorators': {}, 'description': '' },
+                'a_str': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+                'none': {'type': 'str', 'default': None, 'decorators': {}, 'description': '' },
+                'a_dict': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+                'a_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class sample_sample_ping_out(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'sample_ping'
+    _class_info = {'name': 'sample_sample_ping_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class sample_sample_other_op_in(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'sample_other_op'
+    _class_info = {'name': 'sample_sample_other_op_in', 'decorators': {} }
+
+
+    def __init__(self, foo="bar", num=84, name=""):
+        self.foo = foo
+        self.num = num
+        self.name = name
+
+    _schema = {
+                'foo': {'type': 'str', 'default': "bar", 'decorators': {}, 'description': '' },
+                'num': {'type': 'int', 'default': 84, 'decorators': {}, 'description': '' },
+                'name': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class sample_sample_other_op_out(IonMessageObjectBase):
+    _svc_name = 'sample'
+    _op_name = 'sample_other_op'
+    _class_info = {'name': 'sample_sample_other_op_out', 'decorators': {} }
+
+    def __init__(self, result=""):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'str', 'default': "", 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_negotiate_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'negotiate'
+    _class_info = {'name': 'resource_agent_negotiate_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", sap_in=None):
+        self.resource_id = resource_id
+        self.sap_in = sap_in
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'sap_in': {'type': 'ServiceAgreementProposal', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_negotiate_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'negotiate'
+    _class_info = {'name': 'resource_agent_negotiate_out', 'decorators': {} }
+
+    def __init__(self, sap_out=None):
+        self.sap_out = sap_out
+    # -----------------
+    # Capabilities interface
+
+    _schema = {
+                'sap_out': {'type': 'ServiceAgreementProposal', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_capabilities_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_capabilities'
+    _class_info = {'name': 'resource_agent_get_capabilities_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", current_state=True):
+        self.resource_id = resource_id
+        self.current_state = current_state
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'current_state': {'type': 'bool', 'default': True, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_capabilities_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_capabilities'
+    _class_info = {'name': 'resource_agent_get_capabilities_out', 'decorators': {} }
+
+    def __init__(self, capability_list=None):
+        self.capability_list = capability_list
+
+    _schema = {
+                'capability_list': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_execute_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'execute_resource'
+    _class_info = {'name': 'resource_agent_execute_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", command=None):
+        self.resource_id = resource_id
+        self.command = command
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'command': {'type': 'AgentCommand', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_execute_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'execute_resource'
+    _class_info = {'name': 'resource_agent_execute_resource_out', 'decorators': {} }
+
+    def __init__(self, result=None):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'AgentCommandResult', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_resource'
+    _class_info = {'name': 'resource_agent_get_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", params=None):
+        self.resource_id = resource_id
+        self.params = params
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'params': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_resource'
+    _class_info = {'name': 'resource_agent_get_resource_out', 'decorators': {} }
+
+    def __init__(self, result=None):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_set_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'set_resource'
+    _class_info = {'name': 'resource_agent_set_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", params=None):
+        self.resource_id = resource_id
+        self.params = params
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'params': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_set_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'set_resource'
+    _class_info = {'name': 'resource_agent_set_resource_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_agent_get_resource_state_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_resource_state'
+    _class_info = {'name': 'resource_agent_get_resource_state_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_agent_get_resource_state_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_resource_state'
+    _class_info = {'name': 'resource_agent_get_resource_state_out', 'decorators': {} }
+
+    def __init__(self, result='str'):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'str', 'default': 'str', 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_ping_resource_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'ping_resource'
+    _class_info = {'name': 'resource_agent_ping_resource_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_agent_ping_resource_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'ping_resource'
+    _class_info = {'name': 'resource_agent_ping_resource_out', 'decorators': {} }
+
+    def __init__(self, result='str'):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'str', 'default': 'str', 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_execute_agent_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'execute_agent'
+    _class_info = {'name': 'resource_agent_execute_agent_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", command=None):
+        self.resource_id = resource_id
+        self.command = command
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'command': {'type': 'AgentCommand', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_execute_agent_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'execute_agent'
+    _class_info = {'name': 'resource_agent_execute_agent_out', 'decorators': {} }
+
+    def __init__(self, result=None):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'AgentCommandResult', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_agent_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_agent'
+    _class_info = {'name': 'resource_agent_get_agent_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", params=None):
+        self.resource_id = resource_id
+        self.params = params
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'params': {'type': 'list', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_get_agent_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_agent'
+    _class_info = {'name': 'resource_agent_get_agent_out', 'decorators': {} }
+
+    def __init__(self, result=None):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_set_agent_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'set_agent'
+    _class_info = {'name': 'resource_agent_set_agent_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id="", params=None):
+        self.resource_id = resource_id
+        self.params = params
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+                'params': {'type': 'dict', 'default': None, 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_set_agent_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'set_agent'
+    _class_info = {'name': 'resource_agent_set_agent_out', 'decorators': {} }
+
+    def __init__(self):
+        pass
+
+    _schema = {
+              }
+
+class resource_agent_get_agent_state_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_agent_state'
+    _class_info = {'name': 'resource_agent_get_agent_state_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_agent_get_agent_state_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'get_agent_state'
+    _class_info = {'name': 'resource_agent_get_agent_state_out', 'decorators': {} }
+
+    def __init__(self, result='str'):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'str', 'default': 'str', 'decorators': {}, 'description': '' },
+              }
+
+class resource_agent_ping_agent_in(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'ping_agent'
+    _class_info = {'name': 'resource_agent_ping_agent_in', 'decorators': {} }
+
+
+    def __init__(self, resource_id=""):
+        self.resource_id = resource_id
+
+    _schema = {
+                'resource_id': {'type': 'str', 'default': "", 'decorators': {"ResourceId":""}, 'description': '' },
+              }
+
+class resource_agent_ping_agent_out(IonMessageObjectBase):
+    _svc_name = 'resource_agent'
+    _op_name = 'ping_agent'
+    _class_info = {'name': 'resource_agent_ping_agent_out', 'decorators': {} }
+
+    def __init__(self, result='str'):
+        self.result = result
+
+    _schema = {
+                'result': {'type': 'str', 'default': 'str', 'decorators': {}, 'description': '' },
+              }
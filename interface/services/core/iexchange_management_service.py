@@ -0,0 +1,1115 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Manages the Exchange, the secure messaging infrastructure, and its associated resources,     such as Exchange Spaces, Names, Points and Brokers.", 
+    "name": "exchange_management", 
+    "op_list": [
+        "delete_exchange_space", 
+        "update_exchange_space", 
+        "call_management", 
+        "create_exchange_broker", 
+        "update_exchange_point", 
+        "read_exchange_point", 
+        "create_exchange_space", 
+        "delete_exchange_point", 
+        "update_exchange_broker", 
+        "remove_exchange_space_from_exchange_broker", 
+        "declare_exchange_name", 
+        "delete_exchange_broker", 
+        "read_exchange_broker", 
+        "read_exchange_space", 
+        "create_exchange_point", 
+        "undeclare_exchange_name", 
+        "add_exchange_space_to_exchange_broker"
+    ], 
+    "operations": {
+        "add_exchange_space_to_exchange_broker": {
+            "description": "Adds an exchange space to an exchange broker.", 
+            "in": {
+                "exchange_broker_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_broker_id", 
+                    "type": "str"
+                }, 
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id", 
+                "exchange_broker_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "call_management": {
+            "description": "Makes a call to the RabbitMQ Management HTTP API", 
+            "in": {
+                "method": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "method", 
+                    "type": "str"
+                }, 
+                "url": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "url", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "url", 
+                "method"
+            ], 
+            "out": {
+                "content": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "content", 
+                    "type": "dict"
+                }
+            }, 
+            "out_list": [
+                "content"
+            ], 
+            "spec": null, 
+            "throws": {
+                "ServerError": "the management API responded with an HTTP error, or any other issue", 
+                "ServiceUnavailable": "a connection error occured to the management API", 
+                "Timeout": "the call to the management API tiemed out"
+            }
+        }, 
+        "create_exchange_broker": {
+            "description": "Creates an exchange broker resource", 
+            "in": {
+                "exchange_broker": {
+                    "decorators": {}, 
+                    "default": "!ExchangeBroker", 
+                    "description": "", 
+                    "name": "exchange_broker", 
+                    "type": "ExchangeBroker"
+                }
+            }, 
+            "in_list": [
+                "exchange_broker"
+            ], 
+            "out": {
+                "exchange_broker_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_broker_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "exchange_broker_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "create_exchange_point": {
+            "description": "Create an exchange point resource within the exchange space provided by the id.", 
+            "in": {
+                "exchange_point": {
+                    "decorators": {}, 
+                    "default": "!ExchangePoint", 
+                    "description": "", 
+                    "name": "exchange_point", 
+                    "type": "ExchangePoint"
+                }, 
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id", 
+                "exchange_point"
+            ], 
+            "out": {
+                "exchange_point_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_point_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "exchange_point_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_exchange_space": {
+            "description": "Creates an Exchange Space distributed resource from the parameter exchangespace object.", 
+            "in": {
+                "exchange_space": {
+                    "decorators": {}, 
+                    "default": "!ExchangeSpace", 
+                    "description": "", 
+                    "name": "exchange_space", 
+                    "type": "ExchangeSpace"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "exchange_space"
+            ], 
+            "out": {
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "exchange_space_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "declare_exchange_name": {
+            "description": "Create an Exchange Name resource resource", 
+            "in": {
+                "exchange_name": {
+                    "decorators": {}, 
+                    "default": "!ExchangeName", 
+                    "description": "", 
+                    "name": "exchange_name", 
+                    "type": "ExchangeName"
+                }, 
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id", 
+                "exchange_name"
+            ], 
+            "out": {
+                "canonical_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "canonical_name", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "canonical_name"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "delete_exchange_broker": {
+            "description": "Deletes an existing exchange broker resource.", 
+            "in": {
+                "exchange_broker_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_broker_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_broker_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "delete_exchange_point": {
+            "description": "Delete an existing exchange point resource.", 
+            "in": {
+                "exchange_point_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_point_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_point_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "delete_exchange_space": {
+            "description": "Deletes an existing exchange space resource for the provided id.", 
+            "in": {
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_exchange_broker": {
+            "description": "Returns an existing exchange broker resource.", 
+            "in": {
+                "exchange_broker_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_broker_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_broker_id"
+            ], 
+            "out": {
+                "exchange_broker": {
+                    "decorators": {}, 
+                    "default": "!ExchangeBroker", 
+                    "description": "", 
+                    "name": "exchange_broker", 
+                    "type": "ExchangeBroker"
+                }
+            }, 
+            "out_list": [
+                "exchange_broker"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_exchange_point": {
+            "description": "Return an existing exchange point resource.", 
+            "in": {
+                "exchange_point_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_point_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_point_id"
+            ], 
+            "out": {
+                "exchange_point": {
+                    "decorators": {}, 
+                    "default": "!ExchangePoint", 
+                    "description": "", 
+                    "name": "exchange_point", 
+                    "type": "ExchangePoint"
+                }
+            }, 
+            "out_list": [
+                "exchange_point"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_exchange_space": {
+            "description": "Returns an Exchange Space resource for the provided exchange space id.", 
+            "in": {
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id"
+            ], 
+            "out": {
+                "exchange_space": {
+                    "decorators": {}, 
+                    "default": "!ExchangeSpace", 
+                    "description": "", 
+                    "name": "exchange_space", 
+                    "type": "ExchangeSpace"
+                }
+            }, 
+            "out_list": [
+                "exchange_space"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "remove_exchange_space_from_exchange_broker": {
+            "description": "Removes an exchange space from an exchange broker.", 
+            "in": {
+                "exchange_broker_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_broker_id", 
+                    "type": "str"
+                }, 
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id", 
+                "exchange_broker_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "undeclare_exchange_name": {
+            "description": "Remove an exhange nane resource", 
+            "in": {
+                "canonical_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "canonical_name", 
+                    "type": "str"
+                }, 
+                "exchange_space_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "exchange_space_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exchange_space_id", 
+                "canonical_name"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_exchange_broker": {
+            "description": "Updates an existing exchange broker resource.", 
+            "in": {
+                "exchange_broker": {
+                    "decorators": {}, 
+                    "default": "!ExchangeBroker", 
+                    "description": "", 
+                    "name": "exchange_broker", 
+                    "type": "ExchangeBroker"
+                }
+            }, 
+            "in_list": [
+                "exchange_broker"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_exchange_point": {
+            "description": "Update an existing exchange point resource.", 
+            "in": {
+                "exchange_point": {
+                    "decorators": {}, 
+                    "default": "!ExchangePoint", 
+                    "description": "", 
+                    "name": "exchange_point", 
+                    "type": "ExchangePoint"
+                }
+            }, 
+            "in_list": [
+                "exchange_point"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_exchange_space": {
+            "description": "Updates an existing Exchange Space resource with data passed in as a parameter.", 
+            "in": {
+                "exchange_space": {
+                    "decorators": {}, 
+                    "default": "!ExchangeSpace", 
+                    "description": "", 
+                    "name": "exchange_space", 
+                    "type": "ExchangeSpace"
+                }
+            }, 
+            "in_list": [
+                "exchange_space"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class ExchangeManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IExchangeManagementService(Interface):
+    """None
+    """
+
+    def delete_exchange_space(exchange_space_id=''):
+        """Deletes an existing exchange space resource for the provided id.
+
+        @param exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_exchange_space(exchange_space=None):
+        """Updates an existing Exchange Space resource with data passed in as a parameter.
+
+        @param exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def call_management(url='', method=''):
+        """Makes a call to the RabbitMQ Management HTTP API
+
+        @param url    str
+        @param method    str
+        @retval content    dict
+        @throws ServerError    the management API responded with an HTTP error, or any other issue
+        @throws Timeout    the call to the management API tiemed out
+        @throws ServiceUnavailable    a connection error occured to the management API
+        """
+        pass
+
+    def create_exchange_broker(exchange_broker=None):
+        """Creates an exchange broker resource
+
+        @param exchange_broker    ExchangeBroker
+        @retval exchange_broker_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def update_exchange_point(exchange_point=None):
+        """Update an existing exchange point resource.
+
+        @param exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def read_exchange_point(exchange_point_id=''):
+        """Return an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @retval exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_exchange_space(org_id='', exchange_space=None):
+        """Creates an Exchange Space distributed resource from the parameter exchangespace object.
+
+        @param org_id    str
+        @param exchange_space    ExchangeSpace
+        @retval exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def delete_exchange_point(exchange_point_id=''):
+        """Delete an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_exchange_broker(exchange_broker=None):
+        """Updates an existing exchange broker resource.
+
+        @param exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def remove_exchange_space_from_exchange_broker(exchange_space_id='', exchange_broker_id=''):
+        """Removes an exchange space from an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def declare_exchange_name(exchange_space_id='', exchange_name=None):
+        """Create an Exchange Name resource resource
+
+        @param exchange_space_id    str
+        @param exchange_name    ExchangeName
+        @retval canonical_name    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def delete_exchange_broker(exchange_broker_id=''):
+        """Deletes an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_exchange_broker(exchange_broker_id=''):
+        """Returns an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @retval exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_exchange_space(exchange_space_id=''):
+        """Returns an Exchange Space resource for the provided exchange space id.
+
+        @param exchange_space_id    str
+        @retval exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_exchange_point(exchange_space_id='', exchange_point=None):
+        """Create an exchange point resource within the exchange space provided by the id.
+
+        @param exchange_space_id    str
+        @param exchange_point    ExchangePoint
+        @retval exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def undeclare_exchange_name(exchange_space_id='', canonical_name=''):
+        """Remove an exhange nane resource
+
+        @param exchange_space_id    str
+        @param canonical_name    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_exchange_space_to_exchange_broker(exchange_space_id='', exchange_broker_id=''):
+        """Adds an exchange space to an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+class BaseExchangeManagementService(BaseService):
+    implements(IExchangeManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'exchange_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ExchangeManagementServiceDependentClients(process=self)
+
+
+    def delete_exchange_space(self, exchange_space_id=''):
+        """Deletes an existing exchange space resource for the provided id.
+
+        @param exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_exchange_space(self, exchange_space=None):
+        """Updates an existing Exchange Space resource with data passed in as a parameter.
+
+        @param exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def call_management(self, url='', method=''):
+        """Makes a call to the RabbitMQ Management HTTP API
+
+        @param url    str
+        @param method    str
+        @retval content    dict
+        @throws ServerError    the management API responded with an HTTP error, or any other issue
+        @throws Timeout    the call to the management API tiemed out
+        @throws ServiceUnavailable    a connection error occured to the management API
+        """
+        pass
+
+    def create_exchange_broker(self, exchange_broker=None):
+        """Creates an exchange broker resource
+
+        @param exchange_broker    ExchangeBroker
+        @retval exchange_broker_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def update_exchange_point(self, exchange_point=None):
+        """Update an existing exchange point resource.
+
+        @param exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def read_exchange_point(self, exchange_point_id=''):
+        """Return an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @retval exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_exchange_space(self, org_id='', exchange_space=None):
+        """Creates an Exchange Space distributed resource from the parameter exchangespace object.
+
+        @param org_id    str
+        @param exchange_space    ExchangeSpace
+        @retval exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def delete_exchange_point(self, exchange_point_id=''):
+        """Delete an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_exchange_broker(self, exchange_broker=None):
+        """Updates an existing exchange broker resource.
+
+        @param exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def remove_exchange_space_from_exchange_broker(self, exchange_space_id='', exchange_broker_id=''):
+        """Removes an exchange space from an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def declare_exchange_name(self, exchange_space_id='', exchange_name=None):
+        """Create an Exchange Name resource resource
+
+        @param exchange_space_id    str
+        @param exchange_name    ExchangeName
+        @retval canonical_name    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def delete_exchange_broker(self, exchange_broker_id=''):
+        """Deletes an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_exchange_broker(self, exchange_broker_id=''):
+        """Returns an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @retval exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_exchange_space(self, exchange_space_id=''):
+        """Returns an Exchange Space resource for the provided exchange space id.
+
+        @param exchange_space_id    str
+        @retval exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_exchange_point(self, exchange_space_id='', exchange_point=None):
+        """Create an exchange point resource within the exchange space provided by the id.
+
+        @param exchange_space_id    str
+        @param exchange_point    ExchangePoint
+        @retval exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def undeclare_exchange_name(self, exchange_space_id='', canonical_name=''):
+        """Remove an exhange nane resource
+
+        @param exchange_space_id    str
+        @param canonical_name    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def add_exchange_space_to_exchange_broker(self, exchange_space_id='', exchange_broker_id=''):
+        """Adds an exchange space to an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+
+
+
+class ExchangeManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IExchangeManagementService)
+
+
+    def delete_exchange_space(self, exchange_space_id='', headers=None, timeout=None):
+        """Deletes an existing exchange space resource for the provided id.
+
+        @param exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_delete_exchange_space_in', **{'exchange_space_id': exchange_space_id}), op='delete_exchange_space', headers=headers, timeout=timeout)
+
+    def update_exchange_space(self, exchange_space=None, headers=None, timeout=None):
+        """Updates an existing Exchange Space resource with data passed in as a parameter.
+
+        @param exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('exchange_management_update_exchange_space_in', **{'exchange_space': exchange_space or None}), op='update_exchange_space', headers=headers, timeout=timeout)
+
+    def call_management(self, url='', method='', headers=None, timeout=None):
+        """Makes a call to the RabbitMQ Management HTTP API
+
+        @param url    str
+        @param method    str
+        @retval content    dict
+        @throws ServerError    the management API responded with an HTTP error, or any other issue
+        @throws Timeout    the call to the management API tiemed out
+        @throws ServiceUnavailable    a connection error occured to the management API
+        """
+        return self.request(IonObject('exchange_management_call_management_in', **{'url': url,'method': method}), op='call_management', headers=headers, timeout=timeout)
+
+    def create_exchange_broker(self, exchange_broker=None, headers=None, timeout=None):
+        """Creates an exchange broker resource
+
+        @param exchange_broker    ExchangeBroker
+        @retval exchange_broker_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('exchange_management_create_exchange_broker_in', **{'exchange_broker': exchange_broker or None}), op='create_exchange_broker', headers=headers, timeout=timeout)
+
+    def update_exchange_point(self, exchange_point=None, headers=None, timeout=None):
+        """Update an existing exchange point resource.
+
+        @param exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('exchange_management_update_exchange_point_in', **{'exchange_point': exchange_point or None}), op='update_exchange_point', headers=headers, timeout=timeout)
+
+    def read_exchange_point(self, exchange_point_id='', headers=None, timeout=None):
+        """Return an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @retval exchange_point    ExchangePoint
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_read_exchange_point_in', **{'exchange_point_id': exchange_point_id}), op='read_exchange_point', headers=headers, timeout=timeout)
+
+    def create_exchange_space(self, org_id='', exchange_space=None, headers=None, timeout=None):
+        """Creates an Exchange Space distributed resource from the parameter exchangespace object.
+
+        @param org_id    str
+        @param exchange_space    ExchangeSpace
+        @retval exchange_space_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('exchange_management_create_exchange_space_in', **{'org_id': org_id,'exchange_space': exchange_space or None}), op='create_exchange_space', headers=headers, timeout=timeout)
+
+    def delete_exchange_point(self, exchange_point_id='', headers=None, timeout=None):
+        """Delete an existing exchange point resource.
+
+        @param exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_delete_exchange_point_in', **{'exchange_point_id': exchange_point_id}), op='delete_exchange_point', headers=headers, timeout=timeout)
+
+    def update_exchange_broker(self, exchange_broker=None, headers=None, timeout=None):
+        """Updates an existing exchange broker resource.
+
+        @param exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('exchange_management_update_exchange_broker_in', **{'exchange_broker': exchange_broker or None}), op='update_exchange_broker', headers=headers, timeout=timeout)
+
+    def remove_exchange_space_from_exchange_broker(self, exchange_space_id='', exchange_broker_id='', headers=None, timeout=None):
+        """Removes an exchange space from an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_remove_exchange_space_from_exchange_broker_in', **{'exchange_space_id': exchange_space_id,'exchange_broker_id': exchange_broker_id}), op='remove_exchange_space_from_exchange_broker', headers=headers, timeout=timeout)
+
+    def declare_exchange_name(self, exchange_space_id='', exchange_name=None, headers=None, timeout=None):
+        """Create an Exchange Name resource resource
+
+        @param exchange_space_id    str
+        @param exchange_name    ExchangeName
+        @retval canonical_name    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('exchange_management_declare_exchange_name_in', **{'exchange_space_id': exchange_space_id,'exchange_name': exchange_name or None}), op='declare_exchange_name', headers=headers, timeout=timeout)
+
+    def delete_exchange_broker(self, exchange_broker_id='', headers=None, timeout=None):
+        """Deletes an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_delete_exchange_broker_in', **{'exchange_broker_id': exchange_broker_id}), op='delete_exchange_broker', headers=headers, timeout=timeout)
+
+    def read_exchange_broker(self, exchange_broker_id='', headers=None, timeout=None):
+        """Returns an existing exchange broker resource.
+
+        @param exchange_broker_id    str
+        @retval exchange_broker    ExchangeBroker
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_read_exchange_broker_in', **{'exchange_broker_id': exchange_broker_id}), op='read_exchange_broker', headers=headers, timeout=timeout)
+
+    def read_exchange_space(self, exchange_space_id='', headers=None, timeout=None):
+        """Returns an Exchange Space resource for the provided exchange space id.
+
+        @param exchange_space_id    str
+        @retval exchange_space    ExchangeSpace
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_read_exchange_space_in', **{'exchange_space_id': exchange_space_id}), op='read_exchange_space', headers=headers, timeout=timeout)
+
+    def create_exchange_point(self, exchange_space_id='', exchange_point=None, headers=None, timeout=None):
+        """Create an exchange point resource within the exchange space provided by the id.
+
+        @param exchange_space_id    str
+        @param exchange_point    ExchangePoint
+        @retval exchange_point_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('exchange_management_create_exchange_point_in', **{'exchange_space_id': exchange_space_id,'exchange_point': exchange_point or None}), op='create_exchange_point', headers=headers, timeout=timeout)
+
+    def undeclare_exchange_name(self, exchange_space_id='', canonical_name='', headers=None, timeout=None):
+        """Remove an exhange nane resource
+
+        @param exchange_space_id    str
+        @param canonical_name    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_undeclare_exchange_name_in', **{'exchange_space_id': exchange_space_id,'canonical_name': canonical_name}), op='undeclare_exchange_name', headers=headers, timeout=timeout)
+
+    def add_exchange_space_to_exchange_broker(self, exchange_space_id='', exchange_broker_id='', headers=None, timeout=None):
+        """Adds an exchange space to an exchange broker.
+
+        @param exchange_space_id    str
+        @param exchange_broker_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('exchange_management_add_exchange_space_to_exchange_broker_in', **{'exchange_space_id': exchange_space_id,'exchange_broker_id': exchange_broker_id}), op='add_exchange_space_to_exchange_broker', headers=headers, timeout=timeout)
+
+
+
+class ExchangeManagementServiceClient(RPCClient, ExchangeManagementServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ExchangeManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'exchange_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ExchangeManagementServiceClientMixin.__init__(self)
+
+
+class ExchangeManagementServiceProcessClient(ProcessRPCClient, ExchangeManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ExchangeManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'exchange_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ExchangeManagementServiceClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,2758 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Services to define and administer an Org (aka facility, community), to enroll/remove members,     to grant/revoke roles and to provide access to the resources of an Org to enrolled or affiliated     entities (identities). Maintains resource contracts and commitments.", 
+    "name": "org_management", 
+    "op_list": [
+        "list_enrolled_actors", 
+        "list_shared_resources", 
+        "update_org", 
+        "find_org", 
+        "affiliate_org", 
+        "find_acquired_resources", 
+        "read_org", 
+        "list_org_roles", 
+        "release_commitment", 
+        "enroll_member", 
+        "find_commitments", 
+        "list_orgs_for_actor", 
+        "find_org_closed_negotiations", 
+        "delete_org", 
+        "grant_role", 
+        "create_org", 
+        "is_registered", 
+        "is_resource_shared", 
+        "add_org_role", 
+        "is_resource_acquired_exclusively", 
+        "remove_org_role", 
+        "negotiate", 
+        "revoke_role", 
+        "has_role", 
+        "create_resource_commitment", 
+        "unaffiliate_org", 
+        "acquire_resource", 
+        "cancel_member_enrollment", 
+        "list_actor_roles", 
+        "unshare_resource", 
+        "find_org_negotiations", 
+        "find_org_containers", 
+        "share_resource", 
+        "is_enrolled", 
+        "find_user_negotiations", 
+        "is_resource_acquired", 
+        "list_orgs_for_resource", 
+        "find_org_role_by_name"
+    ], 
+    "operations": {
+        "acquire_resource": {
+            "description": "Creates a Commitment for the specified resource for a specified actor withing the specified Org as defined in the proposal. Once shared, the resource is committed to the actor.", 
+            "in": {
+                "sap": {
+                    "decorators": {}, 
+                    "default": "!AcquireResourceProposal", 
+                    "description": "", 
+                    "name": "sap", 
+                    "type": "AcquireResourceProposal"
+                }
+            }, 
+            "in_list": [
+                "sap"
+            ], 
+            "out": {
+                "commitment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "commitment_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "commitment_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "add_org_role": {
+            "description": "Adds a UserRole to an Org, if the role by the specified name does not exist.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "user_role": {
+                    "decorators": {}, 
+                    "default": "!UserRole", 
+                    "description": "", 
+                    "name": "user_role", 
+                    "type": "UserRole"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "user_role"
+            ], 
+            "out": {
+                "user_role_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "user_role_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "user_role_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified name does not exist"
+            }
+        }, 
+        "affiliate_org": {
+            "description": "Creates an association between multiple Orgs as an affiliation so that they may coordinate activities between them. Throws a NotFound exception if neither id is found.", 
+            "in": {
+                "affiliate_org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "affiliate_org_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "affiliate_org_id", 
+                "org_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "cancel_member_enrollment": {
+            "description": "Cancels the membership of a specific actor actor within the specified Org. Once canceled, the actor will no longer have access to the resource of that Org.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_org": {
+            "description": "Creates an Org based on the provided object. The id string returned is the internal id by which Org will be identified in the data store.", 
+            "in": {
+                "org": {
+                    "decorators": {}, 
+                    "default": "!Org", 
+                    "description": "", 
+                    "name": "org", 
+                    "type": "Org"
+                }
+            }, 
+            "in_list": [
+                "org"
+            ], 
+            "out": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "org_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "create_resource_commitment": {
+            "description": "Creates a Commitment Resource for the specified resource for a specified actor withing the specified Org. Once shared, the resource is committed to the actor.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "exclusive": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "exclusive", 
+                    "type": "bool"
+                }, 
+                "expiration": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "expiration", 
+                    "type": "int"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exclusive", 
+                "resource_id", 
+                "org_id", 
+                "expiration", 
+                "actor_id"
+            ], 
+            "out": {
+                "commitment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "commitment_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "commitment_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "delete_org": {
+            "description": "Permanently deletes Org object with the specified id. Throws exception if id does not match any persisted Org object.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "enroll_member": {
+            "description": "Enrolls an actor into an Org so that they may find and negotiate to use resources of the Org. Membership in the ION Org is implied by registration with the system, so a membership association to the ION Org is not maintained.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_acquired_resources": {
+            "description": "Returns a list of resources acquired within the specified Org, optionally for the specified actor. If exclusive == True, only return exclusively acquired resources", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "exclusive": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "exclusive", 
+                    "type": "bool"
+                }, 
+                "include_expired": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "include_expired", 
+                    "type": "bool"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exclusive", 
+                "org_id", 
+                "actor_id", 
+                "include_expired"
+            ], 
+            "out": {
+                "resource_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "resource_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "resource_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_commitments": {
+            "description": "Returns all commitments in specified org and optionally a given actor and/or optionally a given resource. If exclusive == True, only return exclusive commitments.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "exclusive": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "exclusive", 
+                    "type": "bool"
+                }, 
+                "include_expired": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "include_expired", 
+                    "type": "bool"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "exclusive", 
+                "resource_id", 
+                "org_id", 
+                "include_expired", 
+                "actor_id"
+            ], 
+            "out": {
+                "commitment_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "commitment_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "commitment_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_org": {
+            "description": "Returns the Org object for the specified name. Returns the system root Org if no name provided.", 
+            "in": {
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "name"
+            ], 
+            "out": {
+                "org": {
+                    "decorators": {}, 
+                    "default": "!Org", 
+                    "description": "", 
+                    "name": "org", 
+                    "type": "Org"
+                }
+            }, 
+            "out_list": [
+                "org"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified name does not exist"
+            }
+        }, 
+        "find_org_closed_negotiations": {
+            "description": "Returns a list of closed negotiations for an Org - those which are Accepted or Rejected. Will throw a not NotFound exception if any of the specified ids do not exist.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "proposal_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "proposal_type", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "proposal_type"
+            ], 
+            "out": {
+                "negotiation": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "negotiation", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "negotiation"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_org_containers": {
+            "description": "Returns a list of containers associated with an Org. Will throw a not NotFound exception if the specified id does not exist.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {
+                "container_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "container_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "container_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_org_negotiations": {
+            "description": "Returns a list of negotiations for an Org. An optional proposal_type can be supplied or else all proposals will be returned. An optional negotiation_status can be supplied or else all proposals will be returned. Will throw a not NotFound exception if any of the specified ids do not exist.", 
+            "in": {
+                "negotiation_status": {
+                    "decorators": {}, 
+                    "default": -1, 
+                    "description": "", 
+                    "name": "negotiation_status", 
+                    "type": "int"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "proposal_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "proposal_type", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "proposal_type", 
+                "negotiation_status"
+            ], 
+            "out": {
+                "negotiation": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "negotiation", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "negotiation"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "find_org_role_by_name": {
+            "description": "Returns the UserRole object for the specified name in the Org. Throws exception if name does not match any persisted User Role or the Org does not exist. objects.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "role_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "role_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "role_name", 
+                "org_id"
+            ], 
+            "out": {
+                "user_role": {
+                    "decorators": {}, 
+                    "default": "!UserRole", 
+                    "description": "", 
+                    "name": "user_role", 
+                    "type": "UserRole"
+                }
+            }, 
+            "out_list": [
+                "user_role"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified name or if does not exist"
+            }
+        }, 
+        "find_user_negotiations": {
+            "description": "Returns a list of negotiations for a specified Actor. All negotiations for all Orgs will be returned unless an org_id is specified. An optional proposal_type can be supplied or else all proposals will be returned. An optional negotiation_status can be provided or else all proposals will be returned.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "negotiation_status": {
+                    "decorators": {}, 
+                    "default": -1, 
+                    "description": "", 
+                    "name": "negotiation_status", 
+                    "type": "int"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "proposal_type": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "proposal_type", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "proposal_type", 
+                "actor_id", 
+                "negotiation_status"
+            ], 
+            "out": {
+                "negotiation": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "negotiation", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "negotiation"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "grant_role": {
+            "description": "Grants a defined role within an organization to a specific actor. A role of Member is automatically implied with successful enrollment. Will throw a not NotFound exception if none of the specified ids or role_name does not exist.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "role_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "role_name", 
+                    "type": "str"
+                }, 
+                "scope": {
+                    "decorators": {}, 
+                    "default": "!RoleScope", 
+                    "description": "", 
+                    "name": "scope", 
+                    "type": "RoleScope"
+                }
+            }, 
+            "in_list": [
+                "scope", 
+                "role_name", 
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "has_role": {
+            "description": "Returns True if the specified actor_id has the specified role_name in the Org and False if not. Throws a NotFound exception if neither id is found.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "role_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "role_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "role_name", 
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "is_enrolled": {
+            "description": "Returns True if the specified actor_id is enrolled in the Org and False if not. Throws a NotFound exception if neither id is found.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {
+                "is_enrolled": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "is_enrolled", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "is_enrolled"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "is_registered": {
+            "description": "Returns True if the specified actor_id is registered with the ION system; otherwise False.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id"
+            ], 
+            "out": {
+                "is_registered": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "is_registered", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "is_registered"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if the actor_id is not specified."
+            }
+        }, 
+        "is_resource_acquired": {
+            "description": "Returns True if the specified resource_id has been acquired. The actor_id is optional, as the operation can return True if the resource is acquired by any actor or specifically by the specified actor_id, otherwise False is returned.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id", 
+                "resource_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if resource_id is not specified"
+            }
+        }, 
+        "is_resource_acquired_exclusively": {
+            "description": "Returns True if the specified resource_id has been acquired exclusively. The actor_id is optional, as the operation can return True if the resource is acquired exclusively by any actor or specifically by the specified actor_id, otherwise False is returned.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id", 
+                "resource_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if resource_id is not specified"
+            }
+        }, 
+        "is_resource_shared": {
+            "description": "Returns True if the resource has been shared in the specified org_id; otherwise False is returned.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "resource_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if either org_id or resource_id is not specified"
+            }
+        }, 
+        "list_actor_roles": {
+            "description": "Returns a list of UserRoles for a specific actor, optionally only within in an Org. The org_governance_name is contained within each UserRole object", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {
+                "user_role_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "user_role_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "user_role_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_enrolled_actors": {
+            "description": "Returns a list of actors enrolled in an Org. Will throw a not NotFound exception if none of the specified ids do not exist.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {
+                "actor_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "actor_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "actor_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_org_roles": {
+            "description": "Returns a list of roles available in an Org. Will throw a not NotFound exception if none of the specified ids do not exist.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {
+                "user_role_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "user_role_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "user_role_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_orgs_for_actor": {
+            "description": "Returns a list of Orgs that the actor is enrolled in. Will throw a not NotFound exception if none of the specified ids do not exist.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "actor_id"
+            ], 
+            "out": {
+                "org_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "org_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "org_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_orgs_for_resource": {
+            "description": "Returns a list of Orgs that the resource is shared in.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "org_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "org_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "org_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_shared_resources": {
+            "description": "Returns a list of resources shared in an Org.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {
+                "resource_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "resource_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "resource_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "negotiate": {
+            "description": "A generic operation for negotiating actions with an Org, such as for enrollment, role request or to acquire a resource managed by the Org. The Service Agreement Proposal is used to specify conditions of the proposal as well as counter proposals and the Org will create Negotiation Resource to track the history and status of the negotiation.", 
+            "in": {
+                "sap": {
+                    "decorators": {}, 
+                    "default": "!ServiceAgreementProposal", 
+                    "description": "", 
+                    "name": "sap", 
+                    "type": "ServiceAgreementProposal"
+                }
+            }, 
+            "in_list": [
+                "sap"
+            ], 
+            "out": {
+                "sap": {
+                    "decorators": {}, 
+                    "default": "!ServiceAgreementProposal", 
+                    "description": "", 
+                    "name": "sap", 
+                    "type": "ServiceAgreementProposal"
+                }
+            }, 
+            "out_list": [
+                "sap"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "If an SAP is not provided or incomplete", 
+                "Inconsistent": "If an SAP has inconsistent information", 
+                "NotFound": "If any of the ids in the SAP do not exist"
+            }
+        }, 
+        "read_org": {
+            "description": "Returns the Org object for the specified id. Throws exception if id does not match any persisted Org objects.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id"
+            ], 
+            "out": {
+                "org": {
+                    "decorators": {}, 
+                    "default": "!Org", 
+                    "description": "", 
+                    "name": "org", 
+                    "type": "Org"
+                }
+            }, 
+            "out_list": [
+                "org"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "release_commitment": {
+            "description": "Release the commitment that was created for resources.", 
+            "in": {
+                "commitment_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "commitment_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "commitment_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "remove_org_role": {
+            "description": "Removes a UserRole from an Org. The UserRole will not be removed if there are users associated with the UserRole unless the force_removal parameter is set to True", 
+            "in": {
+                "force_removal": {
+                    "decorators": {}, 
+                    "default": false, 
+                    "description": "", 
+                    "name": "force_removal", 
+                    "type": "bool"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "role_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "role_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "force_removal", 
+                "role_name", 
+                "org_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified name does not exist"
+            }
+        }, 
+        "revoke_role": {
+            "description": "Revokes a defined Role within an organization to a specific actor. Will throw a not NotFound exception if none of the specified ids or role_name does not exist.", 
+            "in": {
+                "actor_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "actor_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "role_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "role_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "role_name", 
+                "org_id", 
+                "actor_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "share_resource": {
+            "description": "Share a resource with the specified Org. Once shared, the resource will be added to a directory of available resources within the Org.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "unaffiliate_org": {
+            "description": "Removes an association between multiple Orgs as an affiliation. Throws a NotFound exception if neither id is found.", 
+            "in": {
+                "affiliate_org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "affiliate_org_id", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "affiliate_org_id", 
+                "org_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "unshare_resource": {
+            "description": "Unshare a resource with the specified Org. Once unshared, the resource will be removed from the directory of available resources within the Org.", 
+            "in": {
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_org": {
+            "description": "Updates the Org based on provided object.", 
+            "in": {
+                "org": {
+                    "decorators": {}, 
+                    "default": "!Org", 
+                    "description": "", 
+                    "name": "org", 
+                    "type": "Org"
+                }
+            }, 
+            "in_list": [
+                "org"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class OrgManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IOrgManagementService(Interface):
+    """None
+    """
+
+    def list_enrolled_actors(org_id=''):
+        """Returns a list of actors enrolled in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval actor_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_shared_resources(org_id=''):
+        """Returns a list of resources shared in an Org.
+
+        @param org_id    str
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_org(org=None):
+        """Updates the Org based on provided object.
+
+        @param org    Org
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def find_org(name=''):
+        """Returns the Org object for the specified name. Returns the system root Org
+        if no name provided.
+
+        @param name    str
+        @retval org    Org
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def affiliate_org(affiliate_org_id='', org_id=''):
+        """Creates an association between multiple Orgs as an affiliation
+        so that they may coordinate activities between them.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_acquired_resources(exclusive=False, org_id='', actor_id='', include_expired=False):
+        """Returns a list of resources acquired within the specified Org, optionally for the specified
+        actor. If exclusive == True, only return exclusively acquired resources
+
+        @param exclusive    bool
+        @param org_id    str
+        @param actor_id    str
+        @param include_expired    bool
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_org(org_id=''):
+        """Returns the Org object for the specified id.
+        Throws exception if id does not match any persisted Org
+        objects.
+
+        @param org_id    str
+        @retval org    Org
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_org_roles(org_id=''):
+        """Returns a list of roles available in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def release_commitment(commitment_id=''):
+        """Release the commitment that was created for resources.
+
+        @param commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def enroll_member(org_id='', actor_id=''):
+        """Enrolls an actor into an Org so that they may find and negotiate to use
+        resources of the Org. Membership in the ION Org is implied by registration
+        with the system, so a membership association to the ION Org is not maintained.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_commitments(exclusive=False, resource_id='', org_id='', include_expired=False, actor_id=''):
+        """Returns all commitments in specified org and optionally a given actor and/or optionally a given resource.
+        If exclusive == True, only return exclusive commitments.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param include_expired    bool
+        @param actor_id    str
+        @retval commitment_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_orgs_for_actor(actor_id=''):
+        """Returns a list of Orgs that the actor is enrolled in. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param actor_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_closed_negotiations(org_id='', proposal_type=''):
+        """Returns a list of closed negotiations for an Org - those which are Accepted or Rejected.
+        Will throw a not NotFound exception if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def delete_org(org_id=''):
+        """Permanently deletes Org object with the specified
+        id. Throws exception if id does not match any persisted Org object.
+
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def grant_role(scope=None, role_name='', org_id='', actor_id=''):
+        """Grants a defined role within an organization to a specific actor. A role of Member is
+        automatically implied with successful enrollment. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param scope    RoleScope
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_org(org=None):
+        """Creates an Org based on the provided object. The id string returned
+        is the internal id by which Org will be identified in the data store.
+
+        @param org    Org
+        @retval org_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def is_registered(actor_id=''):
+        """Returns True if the specified actor_id is registered with the ION system; otherwise False.
+
+        @param actor_id    str
+        @retval is_registered    bool
+        @throws BadRequest    if the actor_id is not specified.
+        """
+        pass
+
+    def is_resource_shared(org_id='', resource_id=''):
+        """Returns True if the resource has been shared in the specified org_id; otherwise False is returned.
+
+        @param org_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if either org_id or resource_id is not specified
+        """
+        pass
+
+    def add_org_role(org_id='', user_role=None):
+        """Adds a UserRole to an Org, if the role by the specified
+        name does not exist.
+
+        @param org_id    str
+        @param user_role    UserRole
+        @retval user_role_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def is_resource_acquired_exclusively(actor_id='', resource_id=''):
+        """Returns True if the specified resource_id has been acquired exclusively. The actor_id is optional, as the operation can
+        return True if the resource is acquired exclusively by any actor or specifically by the specified actor_id,
+        otherwise False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        pass
+
+    def remove_org_role(force_removal=False, role_name='', org_id=''):
+        """Removes a UserRole from an Org. The UserRole will not be removed if there are
+        users associated with the UserRole unless the force_removal parameter is set to True
+
+        @param force_removal    bool
+        @param role_name    str
+        @param org_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def negotiate(sap=None):
+        """A generic operation for negotiating actions with an Org, such as for enrollment, role request or to acquire a
+        resource managed by the Org. The Service Agreement Proposal is used to specify conditions of the proposal as well
+        as counter proposals and the Org will create Negotiation Resource to track the history and status of the negotiation.
+
+        @param sap    ServiceAgreementProposal
+        @retval sap    ServiceAgreementProposal
+        @throws NotFound    If any of the ids in the SAP do not exist
+        @throws Inconsistent    If an SAP has inconsistent information
+        @throws BadRequest    If an SAP is not provided or incomplete
+        """
+        pass
+
+    def revoke_role(role_name='', org_id='', actor_id=''):
+        """Revokes a defined Role within an organization to a specific actor. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def has_role(role_name='', org_id='', actor_id=''):
+        """Returns True if the specified actor_id has the specified role_name in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_resource_commitment(exclusive=False, resource_id='', org_id='', expiration=0, actor_id=''):
+        """Creates a Commitment Resource for the specified resource for a specified actor withing the specified Org. Once shared,
+        the resource is committed to the actor.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param expiration    int
+        @param actor_id    str
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def unaffiliate_org(affiliate_org_id='', org_id=''):
+        """Removes an association between multiple Orgs as an affiliation.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def acquire_resource(sap=None):
+        """Creates a Commitment for the specified resource for a specified actor withing the specified Org
+        as defined in the proposal. Once shared, the resource is committed to the actor.
+
+        @param sap    AcquireResourceProposal
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def cancel_member_enrollment(org_id='', actor_id=''):
+        """Cancels the membership of a specific actor actor within the specified Org.
+        Once canceled, the actor will no longer have access to the resource of that Org.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_actor_roles(org_id='', actor_id=''):
+        """Returns a list of UserRoles for a specific actor, optionally only within in an Org.
+        The org_governance_name is contained within each UserRole object
+
+        @param org_id    str
+        @param actor_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def unshare_resource(org_id='', resource_id=''):
+        """Unshare a resource with the specified Org. Once unshared, the resource will be
+        removed from the directory of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_negotiations(org_id='', proposal_type='', negotiation_status=-1):
+        """Returns a list of negotiations for an Org. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be supplied
+        or else all proposals will be returned. Will throw a not NotFound exception
+        if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_containers(org_id=''):
+        """Returns a list of containers associated with an Org. Will throw a not NotFound exception
+        if the specified id does not exist.
+
+        @param org_id    str
+        @retval container_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def share_resource(org_id='', resource_id=''):
+        """Share a resource with the specified Org. Once shared, the resource will be added to a directory
+        of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def is_enrolled(org_id='', actor_id=''):
+        """Returns True if the specified actor_id is enrolled in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param org_id    str
+        @param actor_id    str
+        @retval is_enrolled    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_user_negotiations(org_id='', proposal_type='', actor_id='', negotiation_status=-1):
+        """Returns a list of negotiations for a specified Actor. All negotiations for all Orgs will be returned
+        unless an org_id is specified. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be provided
+        or else all proposals will be returned.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param actor_id    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def is_resource_acquired(actor_id='', resource_id=''):
+        """Returns True if the specified resource_id has been acquired. The actor_id is optional, as the operation can
+        return True if the resource is acquired by any actor or specifically by the specified actor_id, otherwise
+        False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        pass
+
+    def list_orgs_for_resource(resource_id=''):
+        """Returns a list of Orgs that the resource is shared in.
+
+        @param resource_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_role_by_name(role_name='', org_id=''):
+        """Returns the UserRole object for the specified name in the Org.
+        Throws exception if name does not match any persisted User Role or the Org does not exist.
+        objects.
+
+        @param role_name    str
+        @param org_id    str
+        @retval user_role    UserRole
+        @throws NotFound    object with specified name or if does not exist
+        """
+        pass
+
+class BaseOrgManagementService(BaseService):
+    implements(IOrgManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'org_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = OrgManagementServiceDependentClients(process=self)
+
+
+    def list_enrolled_actors(self, org_id=''):
+        """Returns a list of actors enrolled in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval actor_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_shared_resources(self, org_id=''):
+        """Returns a list of resources shared in an Org.
+
+        @param org_id    str
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def update_org(self, org=None):
+        """Updates the Org based on provided object.
+
+        @param org    Org
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def find_org(self, name=''):
+        """Returns the Org object for the specified name. Returns the system root Org
+        if no name provided.
+
+        @param name    str
+        @retval org    Org
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def affiliate_org(self, affiliate_org_id='', org_id=''):
+        """Creates an association between multiple Orgs as an affiliation
+        so that they may coordinate activities between them.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_acquired_resources(self, exclusive=False, org_id='', actor_id='', include_expired=False):
+        """Returns a list of resources acquired within the specified Org, optionally for the specified
+        actor. If exclusive == True, only return exclusively acquired resources
+
+        @param exclusive    bool
+        @param org_id    str
+        @param actor_id    str
+        @param include_expired    bool
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_org(self, org_id=''):
+        """Returns the Org object for the specified id.
+        Throws exception if id does not match any persisted Org
+        objects.
+
+        @param org_id    str
+        @retval org    Org
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_org_roles(self, org_id=''):
+        """Returns a list of roles available in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def release_commitment(self, commitment_id=''):
+        """Release the commitment that was created for resources.
+
+        @param commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def enroll_member(self, org_id='', actor_id=''):
+        """Enrolls an actor into an Org so that they may find and negotiate to use
+        resources of the Org. Membership in the ION Org is implied by registration
+        with the system, so a membership association to the ION Org is not maintained.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_commitments(self, exclusive=False, resource_id='', org_id='', include_expired=False, actor_id=''):
+        """Returns all commitments in specified org and optionally a given actor and/or optionally a given resource.
+        If exclusive == True, only return exclusive commitments.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param include_expired    bool
+        @param actor_id    str
+        @retval commitment_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_orgs_for_actor(self, actor_id=''):
+        """Returns a list of Orgs that the actor is enrolled in. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param actor_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_closed_negotiations(self, org_id='', proposal_type=''):
+        """Returns a list of closed negotiations for an Org - those which are Accepted or Rejected.
+        Will throw a not NotFound exception if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def delete_org(self, org_id=''):
+        """Permanently deletes Org object with the specified
+        id. Throws exception if id does not match any persisted Org object.
+
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def grant_role(self, scope=None, role_name='', org_id='', actor_id=''):
+        """Grants a defined role within an organization to a specific actor. A role of Member is
+        automatically implied with successful enrollment. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param scope    RoleScope
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_org(self, org=None):
+        """Creates an Org based on the provided object. The id string returned
+        is the internal id by which Org will be identified in the data store.
+
+        @param org    Org
+        @retval org_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def is_registered(self, actor_id=''):
+        """Returns True if the specified actor_id is registered with the ION system; otherwise False.
+
+        @param actor_id    str
+        @retval is_registered    bool
+        @throws BadRequest    if the actor_id is not specified.
+        """
+        pass
+
+    def is_resource_shared(self, org_id='', resource_id=''):
+        """Returns True if the resource has been shared in the specified org_id; otherwise False is returned.
+
+        @param org_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if either org_id or resource_id is not specified
+        """
+        pass
+
+    def add_org_role(self, org_id='', user_role=None):
+        """Adds a UserRole to an Org, if the role by the specified
+        name does not exist.
+
+        @param org_id    str
+        @param user_role    UserRole
+        @retval user_role_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def is_resource_acquired_exclusively(self, actor_id='', resource_id=''):
+        """Returns True if the specified resource_id has been acquired exclusively. The actor_id is optional, as the operation can
+        return True if the resource is acquired exclusively by any actor or specifically by the specified actor_id,
+        otherwise False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        pass
+
+    def remove_org_role(self, force_removal=False, role_name='', org_id=''):
+        """Removes a UserRole from an Org. The UserRole will not be removed if there are
+        users associated with the UserRole unless the force_removal parameter is set to True
+
+        @param force_removal    bool
+        @param role_name    str
+        @param org_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        pass
+
+    def negotiate(self, sap=None):
+        """A generic operation for negotiating actions with an Org, such as for enrollment, role request or to acquire a
+        resource managed by the Org. The Service Agreement Proposal is used to specify conditions of the proposal as well
+        as counter proposals and the Org will create Negotiation Resource to track the history and status of the negotiation.
+
+        @param sap    ServiceAgreementProposal
+        @retval sap    ServiceAgreementProposal
+        @throws NotFound    If any of the ids in the SAP do not exist
+        @throws Inconsistent    If an SAP has inconsistent information
+        @throws BadRequest    If an SAP is not provided or incomplete
+        """
+        pass
+
+    def revoke_role(self, role_name='', org_id='', actor_id=''):
+        """Revokes a defined Role within an organization to a specific actor. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def has_role(self, role_name='', org_id='', actor_id=''):
+        """Returns True if the specified actor_id has the specified role_name in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_resource_commitment(self, exclusive=False, resource_id='', org_id='', expiration=0, actor_id=''):
+        """Creates a Commitment Resource for the specified resource for a specified actor withing the specified Org. Once shared,
+        the resource is committed to the actor.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param expiration    int
+        @param actor_id    str
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def unaffiliate_org(self, affiliate_org_id='', org_id=''):
+        """Removes an association between multiple Orgs as an affiliation.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def acquire_resource(self, sap=None):
+        """Creates a Commitment for the specified resource for a specified actor withing the specified Org
+        as defined in the proposal. Once shared, the resource is committed to the actor.
+
+        @param sap    AcquireResourceProposal
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def cancel_member_enrollment(self, org_id='', actor_id=''):
+        """Cancels the membership of a specific actor actor within the specified Org.
+        Once canceled, the actor will no longer have access to the resource of that Org.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_actor_roles(self, org_id='', actor_id=''):
+        """Returns a list of UserRoles for a specific actor, optionally only within in an Org.
+        The org_governance_name is contained within each UserRole object
+
+        @param org_id    str
+        @param actor_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def unshare_resource(self, org_id='', resource_id=''):
+        """Unshare a resource with the specified Org. Once unshared, the resource will be
+        removed from the directory of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_negotiations(self, org_id='', proposal_type='', negotiation_status=-1):
+        """Returns a list of negotiations for an Org. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be supplied
+        or else all proposals will be returned. Will throw a not NotFound exception
+        if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_containers(self, org_id=''):
+        """Returns a list of containers associated with an Org. Will throw a not NotFound exception
+        if the specified id does not exist.
+
+        @param org_id    str
+        @retval container_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def share_resource(self, org_id='', resource_id=''):
+        """Share a resource with the specified Org. Once shared, the resource will be added to a directory
+        of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def is_enrolled(self, org_id='', actor_id=''):
+        """Returns True if the specified actor_id is enrolled in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param org_id    str
+        @param actor_id    str
+        @retval is_enrolled    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_user_negotiations(self, org_id='', proposal_type='', actor_id='', negotiation_status=-1):
+        """Returns a list of negotiations for a specified Actor. All negotiations for all Orgs will be returned
+        unless an org_id is specified. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be provided
+        or else all proposals will be returned.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param actor_id    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def is_resource_acquired(self, actor_id='', resource_id=''):
+        """Returns True if the specified resource_id has been acquired. The actor_id is optional, as the operation can
+        return True if the resource is acquired by any actor or specifically by the specified actor_id, otherwise
+        False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        pass
+
+    def list_orgs_for_resource(self, resource_id=''):
+        """Returns a list of Orgs that the resource is shared in.
+
+        @param resource_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def find_org_role_by_name(self, role_name='', org_id=''):
+        """Returns the UserRole object for the specified name in the Org.
+        Throws exception if name does not match any persisted User Role or the Org does not exist.
+        objects.
+
+        @param role_name    str
+        @param org_id    str
+        @retval user_role    UserRole
+        @throws NotFound    object with specified name or if does not exist
+        """
+        pass
+
+
+
+
+class OrgManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IOrgManagementService)
+
+
+    def list_enrolled_actors(self, org_id='', headers=None, timeout=None):
+        """Returns a list of actors enrolled in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval actor_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_enrolled_actors_in', **{'org_id': org_id}), op='list_enrolled_actors', headers=headers, timeout=timeout)
+
+    def list_shared_resources(self, org_id='', headers=None, timeout=None):
+        """Returns a list of resources shared in an Org.
+
+        @param org_id    str
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_shared_resources_in', **{'org_id': org_id}), op='list_shared_resources', headers=headers, timeout=timeout)
+
+    def update_org(self, org=None, headers=None, timeout=None):
+        """Updates the Org based on provided object.
+
+        @param org    Org
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('org_management_update_org_in', **{'org': org or None}), op='update_org', headers=headers, timeout=timeout)
+
+    def find_org(self, name='', headers=None, timeout=None):
+        """Returns the Org object for the specified name. Returns the system root Org
+        if no name provided.
+
+        @param name    str
+        @retval org    Org
+        @throws NotFound    object with specified name does not exist
+        """
+        return self.request(IonObject('org_management_find_org_in', **{'name': name}), op='find_org', headers=headers, timeout=timeout)
+
+    def affiliate_org(self, affiliate_org_id='', org_id='', headers=None, timeout=None):
+        """Creates an association between multiple Orgs as an affiliation
+        so that they may coordinate activities between them.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_affiliate_org_in', **{'affiliate_org_id': affiliate_org_id,'org_id': org_id}), op='affiliate_org', headers=headers, timeout=timeout)
+
+    def find_acquired_resources(self, exclusive=False, org_id='', actor_id='', include_expired=False, headers=None, timeout=None):
+        """Returns a list of resources acquired within the specified Org, optionally for the specified
+        actor. If exclusive == True, only return exclusively acquired resources
+
+        @param exclusive    bool
+        @param org_id    str
+        @param actor_id    str
+        @param include_expired    bool
+        @retval resource_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_acquired_resources_in', **{'exclusive': exclusive,'org_id': org_id,'actor_id': actor_id,'include_expired': include_expired}), op='find_acquired_resources', headers=headers, timeout=timeout)
+
+    def read_org(self, org_id='', headers=None, timeout=None):
+        """Returns the Org object for the specified id.
+        Throws exception if id does not match any persisted Org
+        objects.
+
+        @param org_id    str
+        @retval org    Org
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_read_org_in', **{'org_id': org_id}), op='read_org', headers=headers, timeout=timeout)
+
+    def list_org_roles(self, org_id='', headers=None, timeout=None):
+        """Returns a list of roles available in an Org. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param org_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_org_roles_in', **{'org_id': org_id}), op='list_org_roles', headers=headers, timeout=timeout)
+
+    def release_commitment(self, commitment_id='', headers=None, timeout=None):
+        """Release the commitment that was created for resources.
+
+        @param commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_release_commitment_in', **{'commitment_id': commitment_id}), op='release_commitment', headers=headers, timeout=timeout)
+
+    def enroll_member(self, org_id='', actor_id='', headers=None, timeout=None):
+        """Enrolls an actor into an Org so that they may find and negotiate to use
+        resources of the Org. Membership in the ION Org is implied by registration
+        with the system, so a membership association to the ION Org is not maintained.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_enroll_member_in', **{'org_id': org_id,'actor_id': actor_id}), op='enroll_member', headers=headers, timeout=timeout)
+
+    def find_commitments(self, exclusive=False, resource_id='', org_id='', include_expired=False, actor_id='', headers=None, timeout=None):
+        """Returns all commitments in specified org and optionally a given actor and/or optionally a given resource.
+        If exclusive == True, only return exclusive commitments.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param include_expired    bool
+        @param actor_id    str
+        @retval commitment_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_commitments_in', **{'exclusive': exclusive,'resource_id': resource_id,'org_id': org_id,'include_expired': include_expired,'actor_id': actor_id}), op='find_commitments', headers=headers, timeout=timeout)
+
+    def list_orgs_for_actor(self, actor_id='', headers=None, timeout=None):
+        """Returns a list of Orgs that the actor is enrolled in. Will throw a not NotFound exception
+        if none of the specified ids do not exist.
+
+        @param actor_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_orgs_for_actor_in', **{'actor_id': actor_id}), op='list_orgs_for_actor', headers=headers, timeout=timeout)
+
+    def find_org_closed_negotiations(self, org_id='', proposal_type='', headers=None, timeout=None):
+        """Returns a list of closed negotiations for an Org - those which are Accepted or Rejected.
+        Will throw a not NotFound exception if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_org_closed_negotiations_in', **{'org_id': org_id,'proposal_type': proposal_type}), op='find_org_closed_negotiations', headers=headers, timeout=timeout)
+
+    def delete_org(self, org_id='', headers=None, timeout=None):
+        """Permanently deletes Org object with the specified
+        id. Throws exception if id does not match any persisted Org object.
+
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_delete_org_in', **{'org_id': org_id}), op='delete_org', headers=headers, timeout=timeout)
+
+    def grant_role(self, scope=None, role_name='', org_id='', actor_id='', headers=None, timeout=None):
+        """Grants a defined role within an organization to a specific actor. A role of Member is
+        automatically implied with successful enrollment. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param scope    RoleScope
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_grant_role_in', **{'scope': scope or None,'role_name': role_name,'org_id': org_id,'actor_id': actor_id}), op='grant_role', headers=headers, timeout=timeout)
+
+    def create_org(self, org=None, headers=None, timeout=None):
+        """Creates an Org based on the provided object. The id string returned
+        is the internal id by which Org will be identified in the data store.
+
+        @param org    Org
+        @retval org_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('org_management_create_org_in', **{'org': org or None}), op='create_org', headers=headers, timeout=timeout)
+
+    def is_registered(self, actor_id='', headers=None, timeout=None):
+        """Returns True if the specified actor_id is registered with the ION system; otherwise False.
+
+        @param actor_id    str
+        @retval is_registered    bool
+        @throws BadRequest    if the actor_id is not specified.
+        """
+        return self.request(IonObject('org_management_is_registered_in', **{'actor_id': actor_id}), op='is_registered', headers=headers, timeout=timeout)
+
+    def is_resource_shared(self, org_id='', resource_id='', headers=None, timeout=None):
+        """Returns True if the resource has been shared in the specified org_id; otherwise False is returned.
+
+        @param org_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if either org_id or resource_id is not specified
+        """
+        return self.request(IonObject('org_management_is_resource_shared_in', **{'org_id': org_id,'resource_id': resource_id}), op='is_resource_shared', headers=headers, timeout=timeout)
+
+    def add_org_role(self, org_id='', user_role=None, headers=None, timeout=None):
+        """Adds a UserRole to an Org, if the role by the specified
+        name does not exist.
+
+        @param org_id    str
+        @param user_role    UserRole
+        @retval user_role_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        return self.request(IonObject('org_management_add_org_role_in', **{'org_id': org_id,'user_role': user_role or None}), op='add_org_role', headers=headers, timeout=timeout)
+
+    def is_resource_acquired_exclusively(self, actor_id='', resource_id='', headers=None, timeout=None):
+        """Returns True if the specified resource_id has been acquired exclusively. The actor_id is optional, as the operation can
+        return True if the resource is acquired exclusively by any actor or specifically by the specified actor_id,
+        otherwise False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        return self.request(IonObject('org_management_is_resource_acquired_exclusively_in', **{'actor_id': actor_id,'resource_id': resource_id}), op='is_resource_acquired_exclusively', headers=headers, timeout=timeout)
+
+    def remove_org_role(self, force_removal=False, role_name='', org_id='', headers=None, timeout=None):
+        """Removes a UserRole from an Org. The UserRole will not be removed if there are
+        users associated with the UserRole unless the force_removal parameter is set to True
+
+        @param force_removal    bool
+        @param role_name    str
+        @param org_id    str
+        @throws NotFound    object with specified name does not exist
+        """
+        return self.request(IonObject('org_management_remove_org_role_in', **{'force_removal': force_removal,'role_name': role_name,'org_id': org_id}), op='remove_org_role', headers=headers, timeout=timeout)
+
+    def negotiate(self, sap=None, headers=None, timeout=None):
+        """A generic operation for negotiating actions with an Org, such as for enrollment, role request or to acquire a
+        resource managed by the Org. The Service Agreement Proposal is used to specify conditions of the proposal as well
+        as counter proposals and the Org will create Negotiation Resource to track the history and status of the negotiation.
+
+        @param sap    ServiceAgreementProposal
+        @retval sap    ServiceAgreementProposal
+        @throws NotFound    If any of the ids in the SAP do not exist
+        @throws Inconsistent    If an SAP has inconsistent information
+        @throws BadRequest    If an SAP is not provided or incomplete
+        """
+        return self.request(IonObject('org_management_negotiate_in', **{'sap': sap or None}), op='negotiate', headers=headers, timeout=timeout)
+
+    def revoke_role(self, role_name='', org_id='', actor_id='', headers=None, timeout=None):
+        """Revokes a defined Role within an organization to a specific actor. Will throw a not NotFound exception
+        if none of the specified ids or role_name does not exist.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_revoke_role_in', **{'role_name': role_name,'org_id': org_id,'actor_id': actor_id}), op='revoke_role', headers=headers, timeout=timeout)
+
+    def has_role(self, role_name='', org_id='', actor_id='', headers=None, timeout=None):
+        """Returns True if the specified actor_id has the specified role_name in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param role_name    str
+        @param org_id    str
+        @param actor_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_has_role_in', **{'role_name': role_name,'org_id': org_id,'actor_id': actor_id}), op='has_role', headers=headers, timeout=timeout)
+
+    def create_resource_commitment(self, exclusive=False, resource_id='', org_id='', expiration=0, actor_id='', headers=None, timeout=None):
+        """Creates a Commitment Resource for the specified resource for a specified actor withing the specified Org. Once shared,
+        the resource is committed to the actor.
+
+        @param exclusive    bool
+        @param resource_id    str
+        @param org_id    str
+        @param expiration    int
+        @param actor_id    str
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_create_resource_commitment_in', **{'exclusive': exclusive,'resource_id': resource_id,'org_id': org_id,'expiration': expiration,'actor_id': actor_id}), op='create_resource_commitment', headers=headers, timeout=timeout)
+
+    def unaffiliate_org(self, affiliate_org_id='', org_id='', headers=None, timeout=None):
+        """Removes an association between multiple Orgs as an affiliation.
+        Throws a NotFound exception if neither id is found.
+
+        @param affiliate_org_id    str
+        @param org_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_unaffiliate_org_in', **{'affiliate_org_id': affiliate_org_id,'org_id': org_id}), op='unaffiliate_org', headers=headers, timeout=timeout)
+
+    def acquire_resource(self, sap=None, headers=None, timeout=None):
+        """Creates a Commitment for the specified resource for a specified actor withing the specified Org
+        as defined in the proposal. Once shared, the resource is committed to the actor.
+
+        @param sap    AcquireResourceProposal
+        @retval commitment_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_acquire_resource_in', **{'sap': sap or None}), op='acquire_resource', headers=headers, timeout=timeout)
+
+    def cancel_member_enrollment(self, org_id='', actor_id='', headers=None, timeout=None):
+        """Cancels the membership of a specific actor actor within the specified Org.
+        Once canceled, the actor will no longer have access to the resource of that Org.
+
+        @param org_id    str
+        @param actor_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_cancel_member_enrollment_in', **{'org_id': org_id,'actor_id': actor_id}), op='cancel_member_enrollment', headers=headers, timeout=timeout)
+
+    def list_actor_roles(self, org_id='', actor_id='', headers=None, timeout=None):
+        """Returns a list of UserRoles for a specific actor, optionally only within in an Org.
+        The org_governance_name is contained within each UserRole object
+
+        @param org_id    str
+        @param actor_id    str
+        @retval user_role_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_actor_roles_in', **{'org_id': org_id,'actor_id': actor_id}), op='list_actor_roles', headers=headers, timeout=timeout)
+
+    def unshare_resource(self, org_id='', resource_id='', headers=None, timeout=None):
+        """Unshare a resource with the specified Org. Once unshared, the resource will be
+        removed from the directory of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_unshare_resource_in', **{'org_id': org_id,'resource_id': resource_id}), op='unshare_resource', headers=headers, timeout=timeout)
+
+    def find_org_negotiations(self, org_id='', proposal_type='', negotiation_status=-1, headers=None, timeout=None):
+        """Returns a list of negotiations for an Org. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be supplied
+        or else all proposals will be returned. Will throw a not NotFound exception
+        if any of the specified ids do not exist.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_org_negotiations_in', **{'org_id': org_id,'proposal_type': proposal_type,'negotiation_status': negotiation_status}), op='find_org_negotiations', headers=headers, timeout=timeout)
+
+    def find_org_containers(self, org_id='', headers=None, timeout=None):
+        """Returns a list of containers associated with an Org. Will throw a not NotFound exception
+        if the specified id does not exist.
+
+        @param org_id    str
+        @retval container_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_org_containers_in', **{'org_id': org_id}), op='find_org_containers', headers=headers, timeout=timeout)
+
+    def share_resource(self, org_id='', resource_id='', headers=None, timeout=None):
+        """Share a resource with the specified Org. Once shared, the resource will be added to a directory
+        of available resources within the Org.
+
+        @param org_id    str
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_share_resource_in', **{'org_id': org_id,'resource_id': resource_id}), op='share_resource', headers=headers, timeout=timeout)
+
+    def is_enrolled(self, org_id='', actor_id='', headers=None, timeout=None):
+        """Returns True if the specified actor_id is enrolled in the Org and False if not.
+        Throws a NotFound exception if neither id is found.
+
+        @param org_id    str
+        @param actor_id    str
+        @retval is_enrolled    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_is_enrolled_in', **{'org_id': org_id,'actor_id': actor_id}), op='is_enrolled', headers=headers, timeout=timeout)
+
+    def find_user_negotiations(self, org_id='', proposal_type='', actor_id='', negotiation_status=-1, headers=None, timeout=None):
+        """Returns a list of negotiations for a specified Actor. All negotiations for all Orgs will be returned
+        unless an org_id is specified. An optional proposal_type can be supplied
+        or else all proposals will be returned. An optional negotiation_status can be provided
+        or else all proposals will be returned.
+
+        @param org_id    str
+        @param proposal_type    str
+        @param actor_id    str
+        @param negotiation_status    int
+        @retval negotiation    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_find_user_negotiations_in', **{'org_id': org_id,'proposal_type': proposal_type,'actor_id': actor_id,'negotiation_status': negotiation_status}), op='find_user_negotiations', headers=headers, timeout=timeout)
+
+    def is_resource_acquired(self, actor_id='', resource_id='', headers=None, timeout=None):
+        """Returns True if the specified resource_id has been acquired. The actor_id is optional, as the operation can
+        return True if the resource is acquired by any actor or specifically by the specified actor_id, otherwise
+        False is returned.
+
+        @param actor_id    str
+        @param resource_id    str
+        @retval success    bool
+        @throws BadRequest    if resource_id is not specified
+        """
+        return self.request(IonObject('org_management_is_resource_acquired_in', **{'actor_id': actor_id,'resource_id': resource_id}), op='is_resource_acquired', headers=headers, timeout=timeout)
+
+    def list_orgs_for_resource(self, resource_id='', headers=None, timeout=None):
+        """Returns a list of Orgs that the resource is shared in.
+
+        @param resource_id    str
+        @retval org_list    list
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('org_management_list_orgs_for_resource_in', **{'resource_id': resource_id}), op='list_orgs_for_resource', headers=headers, timeout=timeout)
+
+    def find_org_role_by_name(self, role_name='', org_id='', headers=None, timeout=None):
+        """Returns the UserRole object for the specified name in the Org.
+        Throws exception if name does not match any persisted User Role or the Org does not exist.
+        objects.
+
+        @param role_name    str
+        @param org_id    str
+        @retval user_role    UserRole
+        @throws NotFound    object with specified name or if does not exist
+        """
+        return self.request(IonObject('org_management_find_org_role_by_name_in', **{'role_name': role_name,'org_id': org_id}), op='find_org_role_by_name', headers=headers, timeout=timeout)
+
+
+
+class OrgManagementServiceClient(RPCClient, OrgManagementServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("OrgManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'org_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        OrgManagementServiceClientMixin.__init__(self)
+
+
+class OrgManagementServiceProcessClient(ProcessRPCClient, OrgManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("OrgManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'org_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        OrgManagementServiceClientMixin.__init__(self)
+
+
+
+
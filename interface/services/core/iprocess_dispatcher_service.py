@@ -0,0 +1,598 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Service to create, read, update and delete process definitions and processes,     and manage process execution.  Process definitions represent executables.     Processes represent the executing code within the system.", 
+    "name": "process_dispatcher", 
+    "op_list": [
+        "delete_process_definition", 
+        "create_process", 
+        "read_process", 
+        "list_processes", 
+        "create_process_definition", 
+        "schedule_process", 
+        "cancel_process", 
+        "read_process_definition"
+    ], 
+    "operations": {
+        "cancel_process": {
+            "description": "Cancels the execution of the given process id.", 
+            "in": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id"
+            ], 
+            "out": {
+                "success": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "success", 
+                    "type": "bool"
+                }
+            }, 
+            "out_list": [
+                "success"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_process": {
+            "description": "Create a process resource and process id. Does not yet start the process", 
+            "in": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id"
+            ], 
+            "out": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "create_process_definition": {
+            "description": "Creates a Process Definition based on given object.", 
+            "in": {
+                "process_definition": {
+                    "decorators": {}, 
+                    "default": "!ProcessDefinition", 
+                    "description": "", 
+                    "name": "process_definition", 
+                    "type": "ProcessDefinition"
+                }, 
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id", 
+                "process_definition"
+            ], 
+            "out": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_definition_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "delete_process_definition": {
+            "description": "Deletes/retires a Process Definition.", 
+            "in": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "list_processes": {
+            "description": "Lists managed processes", 
+            "in": {}, 
+            "in_list": [], 
+            "out": {
+                "processes": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "processes", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "processes"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "read_process": {
+            "description": "Returns a Process as an object.", 
+            "in": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_id"
+            ], 
+            "out": {
+                "process": {
+                    "decorators": {}, 
+                    "default": "!Process", 
+                    "description": "", 
+                    "name": "process", 
+                    "type": "Process"
+                }
+            }, 
+            "out_list": [
+                "process"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_process_definition": {
+            "description": "Returns a Process Definition as object.", 
+            "in": {
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id"
+            ], 
+            "out": {
+                "process_definition": {
+                    "decorators": {}, 
+                    "default": "!ProcessDefinition", 
+                    "description": "", 
+                    "name": "process_definition", 
+                    "type": "ProcessDefinition"
+                }
+            }, 
+            "out_list": [
+                "process_definition"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "schedule_process": {
+            "description": "Schedule a process definition for execution on an Execution Engine. If no process id is given, a new unique ID is generated.", 
+            "in": {
+                "configuration": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "configuration", 
+                    "type": "dict"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "process_definition_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_definition_id", 
+                    "type": "str"
+                }, 
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }, 
+                "schedule": {
+                    "decorators": {}, 
+                    "default": "!ProcessSchedule", 
+                    "description": "", 
+                    "name": "schedule", 
+                    "type": "ProcessSchedule"
+                }
+            }, 
+            "in_list": [
+                "process_definition_id", 
+                "process_id", 
+                "name", 
+                "configuration", 
+                "schedule"
+            ], 
+            "out": {
+                "process_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "process_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "process_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": "https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Process+Dispatcher+Service"
+}"""
+
+
+class ProcessDispatcherServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IProcessDispatcherService(Interface):
+    """Service to create, read, update and delete process definitions and processes,
+    and manage process execution.  Process definitions represent executables.
+    Processes represent the executing code within the system.
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Process+Dispatcher+Service
+    """
+
+    def delete_process_definition(process_definition_id=''):
+        """Deletes/retires a Process Definition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_process(process_definition_id=''):
+        """Create a process resource and process id. Does not yet start the process
+
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_process(process_id=''):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_processes():
+        """Lists managed processes
+
+        @retval processes    list
+        """
+        pass
+
+    def create_process_definition(process_definition_id='', process_definition=None):
+        """Creates a Process Definition based on given object.
+
+        @param process_definition_id    str
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def schedule_process(process_definition_id='', process_id='', name='', configuration=None, schedule=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def cancel_process(process_id=''):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_process_definition(process_definition_id=''):
+        """Returns a Process Definition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+class BaseProcessDispatcherService(BaseService):
+    implements(IProcessDispatcherService)
+    """Service to create, read, update and delete process definitions and processes,
+    and manage process execution.  Process definitions represent executables.
+    Processes represent the executing code within the system.
+
+    @see https://confluence.oceanobservatories.org/display/syseng/CIAD+CEI+OV+Process+Dispatcher+Service
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'process_dispatcher'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ProcessDispatcherServiceDependentClients(process=self)
+
+
+    def delete_process_definition(self, process_definition_id=''):
+        """Deletes/retires a Process Definition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_process(self, process_definition_id=''):
+        """Create a process resource and process id. Does not yet start the process
+
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_process(self, process_id=''):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def list_processes(self):
+        """Lists managed processes
+
+        @retval processes    list
+        """
+        pass
+
+    def create_process_definition(self, process_definition_id='', process_definition=None):
+        """Creates a Process Definition based on given object.
+
+        @param process_definition_id    str
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def schedule_process(self, process_definition_id='', process_id='', name='', configuration=None, schedule=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def cancel_process(self, process_id=''):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def read_process_definition(self, process_definition_id=''):
+        """Returns a Process Definition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+
+
+
+class ProcessDispatcherServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IProcessDispatcherService)
+
+
+    def delete_process_definition(self, process_definition_id='', headers=None, timeout=None):
+        """Deletes/retires a Process Definition.
+
+        @param process_definition_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('process_dispatcher_delete_process_definition_in', **{'process_definition_id': process_definition_id}), op='delete_process_definition', headers=headers, timeout=timeout)
+
+    def create_process(self, process_definition_id='', headers=None, timeout=None):
+        """Create a process resource and process id. Does not yet start the process
+
+        @param process_definition_id    str
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('process_dispatcher_create_process_in', **{'process_definition_id': process_definition_id}), op='create_process', headers=headers, timeout=timeout)
+
+    def read_process(self, process_id='', headers=None, timeout=None):
+        """Returns a Process as an object.
+
+        @param process_id    str
+        @retval process    Process
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('process_dispatcher_read_process_in', **{'process_id': process_id}), op='read_process', headers=headers, timeout=timeout)
+
+    def list_processes(self, headers=None, timeout=None):
+        """Lists managed processes
+
+        @retval processes    list
+        """
+        return self.request(IonObject('process_dispatcher_list_processes_in', **{}), op='list_processes', headers=headers, timeout=timeout)
+
+    def create_process_definition(self, process_definition_id='', process_definition=None, headers=None, timeout=None):
+        """Creates a Process Definition based on given object.
+
+        @param process_definition_id    str
+        @param process_definition    ProcessDefinition
+        @retval process_definition_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('process_dispatcher_create_process_definition_in', **{'process_definition_id': process_definition_id,'process_definition': process_definition or None}), op='create_process_definition', headers=headers, timeout=timeout)
+
+    def schedule_process(self, process_definition_id='', process_id='', name='', configuration=None, schedule=None, headers=None, timeout=None):
+        """Schedule a process definition for execution on an Execution Engine. If no process id is given,
+        a new unique ID is generated.
+
+        @param process_definition_id    str
+        @param process_id    str
+        @param name    str
+        @param configuration    dict
+        @param schedule    ProcessSchedule
+        @retval process_id    str
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('process_dispatcher_schedule_process_in', **{'process_definition_id': process_definition_id,'process_id': process_id,'name': name,'configuration': configuration or None,'schedule': schedule or None}), op='schedule_process', headers=headers, timeout=timeout)
+
+    def cancel_process(self, process_id='', headers=None, timeout=None):
+        """Cancels the execution of the given process id.
+
+        @param process_id    str
+        @retval success    bool
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('process_dispatcher_cancel_process_in', **{'process_id': process_id}), op='cancel_process', headers=headers, timeout=timeout)
+
+    def read_process_definition(self, process_definition_id='', headers=None, timeout=None):
+        """Returns a Process Definition as object.
+
+        @param process_definition_id    str
+        @retval process_definition    ProcessDefinition
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('process_dispatcher_read_process_definition_in', **{'process_definition_id': process_definition_id}), op='read_process_definition', headers=headers, timeout=timeout)
+
+
+
+class ProcessDispatcherServiceClient(RPCClient, ProcessDispatcherServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ProcessDispatcherServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'process_dispatcher'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ProcessDispatcherServiceClientMixin.__init__(self)
+
+
+class ProcessDispatcherServiceProcessClient(ProcessRPCClient, ProcessDispatcherServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ProcessDispatcherServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'process_dispatcher'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ProcessDispatcherServiceClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,1075 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+from interface.services.core.iresource_registry_service import ResourceRegistryServiceProcessClient
+
+SCHEMA_JSON = """{
+    "dependencies": [
+        "resource_registry"
+    ], 
+    "description": "Service that manages resources and their lifecycle.     Also provides a resource discovery and query capability.", 
+    "name": "resource_management", 
+    "op_list": [
+        "get_distinct_values", 
+        "create_resource", 
+        "read_resource", 
+        "get_org_resource_attributes", 
+        "read_view", 
+        "create_view", 
+        "execute_lifecycle_transition", 
+        "query", 
+        "update_resource", 
+        "update_view", 
+        "get_lifecycle_events", 
+        "delete_view", 
+        "query_view", 
+        "delete_resource"
+    ], 
+    "operations": {
+        "create_resource": {
+            "description": "Creates an arbitrary resource object via its defined create function, so that it can successively can be accessed via the agent interface.", 
+            "in": {
+                "resource": {
+                    "decorators": {}, 
+                    "default": "!Resource", 
+                    "description": "", 
+                    "name": "resource", 
+                    "type": "Resource"
+                }
+            }, 
+            "in_list": [
+                "resource"
+            ], 
+            "out": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "resource_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "create_view": {
+            "description": "Creates a view resource.", 
+            "in": {
+                "view": {
+                    "decorators": {}, 
+                    "default": "!View", 
+                    "description": "", 
+                    "name": "view", 
+                    "type": "View"
+                }
+            }, 
+            "in_list": [
+                "view"
+            ], 
+            "out": {
+                "view_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "view_id", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "view_id"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object passed has _id or _rev attribute"
+            }
+        }, 
+        "delete_resource": {
+            "description": "Deletes an existing resource via the configured service operation.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "delete_view": {
+            "description": "Delete a View resource", 
+            "in": {
+                "view_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "view_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "view_id"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "execute_lifecycle_transition": {
+            "description": "Alter object lifecycle according to given transition event. Throws exception if resource object does not exist or given transition_event is unknown/illegal. The new life cycle state after applying the transition is returned.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }, 
+                "transition_event": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "transition_event", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "transition_event", 
+                "resource_id"
+            ], 
+            "out": {
+                "lcstate": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "lcstate", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "lcstate"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "transition event unknown or illegal in current state; resource type has no lifecycle", 
+                "Conflict": "race condition while trying to update", 
+                "NotFound": "resource object does not exist"
+            }
+        }, 
+        "get_distinct_values": {
+            "description": "Returns a list of distinct values for given resource type and list of attribute names. Only supports simple types for the attribute values. Returns a sorted list of list of values in the order given by attr_list.", 
+            "in": {
+                "attr_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "attr_list", 
+                    "type": "list"
+                }, 
+                "res_filter": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "res_filter", 
+                    "type": "dict"
+                }, 
+                "restype": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "restype", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "attr_list", 
+                "res_filter", 
+                "restype"
+            ], 
+            "out": {
+                "value_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "value_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "value_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "illegal arguments"
+            }
+        }, 
+        "get_lifecycle_events": {
+            "description": "For a given resource, return a list of possible lifecycle transition events.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "transition_events": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "transition_events", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "transition_events"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "transition event unknown or illegal in current state; resource type has no lifecycle", 
+                "NotFound": "resource object does not exist"
+            }
+        }, 
+        "get_org_resource_attributes": {
+            "description": "For a given org, return a list of dicts with core resource attributes (_id, type_, name, description, ts_created, ts_modified, lcstate, availability, visibility and alt_resource_type). The returned list is ordered by name unless otherwise specified. Supports pagination and white-list filtering if provided.", 
+            "in": {
+                "limit": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "limit", 
+                    "type": "int"
+                }, 
+                "order_by": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "order_by", 
+                    "type": "str"
+                }, 
+                "org_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "org_id", 
+                    "type": "str"
+                }, 
+                "skip": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "skip", 
+                    "type": "int"
+                }, 
+                "type_filter": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "type_filter", 
+                    "type": "list"
+                }
+            }, 
+            "in_list": [
+                "org_id", 
+                "order_by", 
+                "limit", 
+                "type_filter", 
+                "skip"
+            ], 
+            "out": {
+                "resource_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "resource_list", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "resource_list"
+            ], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "illegal arguments"
+            }
+        }, 
+        "query": {
+            "description": "Issue a query provided in structured dict format or internal datastore query format. Returns a list of resource or event objects or their IDs only. Search_args may contain parameterized values. See the query format definition: https://confluence.oceanobservatories.org/display/CIDev/Discovery+Service+Query+Format", 
+            "in": {
+                "id_only": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "query": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "query", 
+                    "type": "dict"
+                }, 
+                "search_args": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "search_args", 
+                    "type": "dict"
+                }
+            }, 
+            "in_list": [
+                "query", 
+                "search_args", 
+                "id_only"
+            ], 
+            "out": {
+                "results": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "results", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "results"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "query_view": {
+            "description": "Execute an existing query as defined within a View resource, providing additional arguments for parameterized values. If ext_query is provided, it will be combined with the query defined by the View. Search_args may contain parameterized values. Returns a list of resource or event objects or their IDs only.", 
+            "in": {
+                "ext_query": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "ext_query", 
+                    "type": "dict"
+                }, 
+                "id_only": {
+                    "decorators": {}, 
+                    "default": true, 
+                    "description": "", 
+                    "name": "id_only", 
+                    "type": "bool"
+                }, 
+                "search_args": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "search_args", 
+                    "type": "dict"
+                }, 
+                "view_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "view_id", 
+                    "type": "str"
+                }, 
+                "view_name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "view_name", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "ext_query", 
+                "view_id", 
+                "search_args", 
+                "view_name", 
+                "id_only"
+            ], 
+            "out": {
+                "results": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "results", 
+                    "type": "list"
+                }
+            }, 
+            "out_list": [
+                "results"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "read_resource": {
+            "description": "Returns an existing resource via the configured service operation.", 
+            "in": {
+                "resource_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "resource_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "resource_id"
+            ], 
+            "out": {
+                "resource": {
+                    "decorators": {}, 
+                    "default": "!Resource", 
+                    "description": "", 
+                    "name": "resource", 
+                    "type": "Resource"
+                }
+            }, 
+            "out_list": [
+                "resource"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "read_view": {
+            "description": "Read a View resource", 
+            "in": {
+                "view_id": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "view_id", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "view_id"
+            ], 
+            "out": {
+                "view": {
+                    "decorators": {}, 
+                    "default": "!View", 
+                    "description": "", 
+                    "name": "view", 
+                    "type": "View"
+                }
+            }, 
+            "out_list": [
+                "view"
+            ], 
+            "spec": null, 
+            "throws": {
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_resource": {
+            "description": "Updates an existing resource via the configured service operation.", 
+            "in": {
+                "resource": {
+                    "decorators": {}, 
+                    "default": "!Resource", 
+                    "description": "", 
+                    "name": "resource", 
+                    "type": "Resource"
+                }
+            }, 
+            "in_list": [
+                "resource"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }, 
+        "update_view": {
+            "description": "Update a View resource", 
+            "in": {
+                "view": {
+                    "decorators": {}, 
+                    "default": "!View", 
+                    "description": "", 
+                    "name": "view", 
+                    "type": "View"
+                }
+            }, 
+            "in_list": [
+                "view"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": {
+                "BadRequest": "if object does not have _id or _rev attribute", 
+                "Conflict": "object not based on latest persisted object version", 
+                "NotFound": "object with specified id does not exist"
+            }
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class ResourceManagementServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+        self._resource_registry = ResourceRegistryServiceProcessClient(process=process)
+
+    @property
+    def resource_registry(self):
+        if self._process.container is not None and self._process.container.has_capability("RESOURCE_REGISTRY"):
+            return ResourceRegistryServiceWrapper(self._process.container.resource_registry, self._process)
+        return self._resource_registry
+
+
+
+class IResourceManagementService(Interface):
+    """None
+    """
+
+    def get_distinct_values(attr_list=None, res_filter=None, restype=''):
+        """Returns a list of distinct values for given resource type and list of attribute names.
+        Only supports simple types for the attribute values.
+        Returns a sorted list of list of values in the order given by attr_list.
+
+        @param attr_list    list
+        @param res_filter    dict
+        @param restype    str
+        @retval value_list    list
+        @throws BadRequest    illegal arguments
+        """
+        pass
+
+    def create_resource(resource=None):
+        """Creates an arbitrary resource object via its defined create function, so that it
+        can successively can be accessed via the agent interface.
+
+        @param resource    Resource
+        @retval resource_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def read_resource(resource_id=''):
+        """Returns an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @retval resource    Resource
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def get_org_resource_attributes(org_id='', order_by='', limit=0, type_filter=None, skip=0):
+        """For a given org, return a list of dicts with core resource attributes (_id, type_, name, description,
+        ts_created, ts_modified, lcstate, availability, visibility and alt_resource_type).
+        The returned list is ordered by name unless otherwise specified.
+        Supports pagination and white-list filtering if provided.
+
+        @param org_id    str
+        @param order_by    str
+        @param limit    int
+        @param type_filter    list
+        @param skip    int
+        @retval resource_list    list
+        @throws BadRequest    illegal arguments
+        """
+        pass
+
+    def read_view(view_id=''):
+        """Read a View resource
+
+        @param view_id    str
+        @retval view    View
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_view(view=None):
+        """Creates a view resource.
+
+        @param view    View
+        @retval view_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def execute_lifecycle_transition(transition_event='', resource_id=''):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def query(query=None, search_args=None, id_only=True):
+        """Issue a query provided in structured dict format or internal datastore query format.
+        Returns a list of resource or event objects or their IDs only.
+        Search_args may contain parameterized values.
+        See the query format definition: https://confluence.oceanobservatories.org/display/CIDev/Discovery+Service+Query+Format
+
+        @param query    dict
+        @param search_args    dict
+        @param id_only    bool
+        @retval results    list
+        """
+        pass
+
+    def update_resource(resource=None):
+        """Updates an existing resource via the configured service operation.
+
+        @param resource    Resource
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def update_view(view=None):
+        """Update a View resource
+
+        @param view    View
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def get_lifecycle_events(resource_id=''):
+        """For a given resource, return a list of possible lifecycle transition events.
+
+        @param resource_id    str
+        @retval transition_events    list
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        """
+        pass
+
+    def delete_view(view_id=''):
+        """Delete a View resource
+
+        @param view_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def query_view(ext_query=None, view_id='', search_args=None, view_name='', id_only=True):
+        """Execute an existing query as defined within a View resource, providing additional arguments for
+        parameterized values.
+        If ext_query is provided, it will be combined with the query defined by the View.
+        Search_args may contain parameterized values.
+        Returns a list of resource or event objects or their IDs only.
+
+        @param ext_query    dict
+        @param view_id    str
+        @param search_args    dict
+        @param view_name    str
+        @param id_only    bool
+        @retval results    list
+        """
+        pass
+
+    def delete_resource(resource_id=''):
+        """Deletes an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+class BaseResourceManagementService(BaseService):
+    implements(IResourceManagementService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'resource_management'
+    dependencies = ['resource_registry']
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = ResourceManagementServiceDependentClients(process=self)
+
+
+    def get_distinct_values(self, attr_list=None, res_filter=None, restype=''):
+        """Returns a list of distinct values for given resource type and list of attribute names.
+        Only supports simple types for the attribute values.
+        Returns a sorted list of list of values in the order given by attr_list.
+
+        @param attr_list    list
+        @param res_filter    dict
+        @param restype    str
+        @retval value_list    list
+        @throws BadRequest    illegal arguments
+        """
+        pass
+
+    def create_resource(self, resource=None):
+        """Creates an arbitrary resource object via its defined create function, so that it
+        can successively can be accessed via the agent interface.
+
+        @param resource    Resource
+        @retval resource_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def read_resource(self, resource_id=''):
+        """Returns an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @retval resource    Resource
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def get_org_resource_attributes(self, org_id='', order_by='', limit=0, type_filter=None, skip=0):
+        """For a given org, return a list of dicts with core resource attributes (_id, type_, name, description,
+        ts_created, ts_modified, lcstate, availability, visibility and alt_resource_type).
+        The returned list is ordered by name unless otherwise specified.
+        Supports pagination and white-list filtering if provided.
+
+        @param org_id    str
+        @param order_by    str
+        @param limit    int
+        @param type_filter    list
+        @param skip    int
+        @retval resource_list    list
+        @throws BadRequest    illegal arguments
+        """
+        pass
+
+    def read_view(self, view_id=''):
+        """Read a View resource
+
+        @param view_id    str
+        @retval view    View
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def create_view(self, view=None):
+        """Creates a view resource.
+
+        @param view    View
+        @retval view_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        pass
+
+    def execute_lifecycle_transition(self, transition_event='', resource_id=''):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        pass
+
+    def query(self, query=None, search_args=None, id_only=True):
+        """Issue a query provided in structured dict format or internal datastore query format.
+        Returns a list of resource or event objects or their IDs only.
+        Search_args may contain parameterized values.
+        See the query format definition: https://confluence.oceanobservatories.org/display/CIDev/Discovery+Service+Query+Format
+
+        @param query    dict
+        @param search_args    dict
+        @param id_only    bool
+        @retval results    list
+        """
+        pass
+
+    def update_resource(self, resource=None):
+        """Updates an existing resource via the configured service operation.
+
+        @param resource    Resource
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def update_view(self, view=None):
+        """Update a View resource
+
+        @param view    View
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        pass
+
+    def get_lifecycle_events(self, resource_id=''):
+        """For a given resource, return a list of possible lifecycle transition events.
+
+        @param resource_id    str
+        @retval transition_events    list
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        """
+        pass
+
+    def delete_view(self, view_id=''):
+        """Delete a View resource
+
+        @param view_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+    def query_view(self, ext_query=None, view_id='', search_args=None, view_name='', id_only=True):
+        """Execute an existing query as defined within a View resource, providing additional arguments for
+        parameterized values.
+        If ext_query is provided, it will be combined with the query defined by the View.
+        Search_args may contain parameterized values.
+        Returns a list of resource or event objects or their IDs only.
+
+        @param ext_query    dict
+        @param view_id    str
+        @param search_args    dict
+        @param view_name    str
+        @param id_only    bool
+        @retval results    list
+        """
+        pass
+
+    def delete_resource(self, resource_id=''):
+        """Deletes an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        pass
+
+
+
+
+class ResourceManagementServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IResourceManagementService)
+
+
+    def get_distinct_values(self, attr_list=None, res_filter=None, restype='', headers=None, timeout=None):
+        """Returns a list of distinct values for given resource type and list of attribute names.
+        Only supports simple types for the attribute values.
+        Returns a sorted list of list of values in the order given by attr_list.
+
+        @param attr_list    list
+        @param res_filter    dict
+        @param restype    str
+        @retval value_list    list
+        @throws BadRequest    illegal arguments
+        """
+        return self.request(IonObject('resource_management_get_distinct_values_in', **{'attr_list': attr_list or None,'res_filter': res_filter or None,'restype': restype}), op='get_distinct_values', headers=headers, timeout=timeout)
+
+    def create_resource(self, resource=None, headers=None, timeout=None):
+        """Creates an arbitrary resource object via its defined create function, so that it
+        can successively can be accessed via the agent interface.
+
+        @param resource    Resource
+        @retval resource_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('resource_management_create_resource_in', **{'resource': resource or None}), op='create_resource', headers=headers, timeout=timeout)
+
+    def read_resource(self, resource_id='', headers=None, timeout=None):
+        """Returns an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @retval resource    Resource
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('resource_management_read_resource_in', **{'resource_id': resource_id}), op='read_resource', headers=headers, timeout=timeout)
+
+    def get_org_resource_attributes(self, org_id='', order_by='', limit=0, type_filter=None, skip=0, headers=None, timeout=None):
+        """For a given org, return a list of dicts with core resource attributes (_id, type_, name, description,
+        ts_created, ts_modified, lcstate, availability, visibility and alt_resource_type).
+        The returned list is ordered by name unless otherwise specified.
+        Supports pagination and white-list filtering if provided.
+
+        @param org_id    str
+        @param order_by    str
+        @param limit    int
+        @param type_filter    list
+        @param skip    int
+        @retval resource_list    list
+        @throws BadRequest    illegal arguments
+        """
+        return self.request(IonObject('resource_management_get_org_resource_attributes_in', **{'org_id': org_id,'order_by': order_by,'limit': limit,'type_filter': type_filter or None,'skip': skip}), op='get_org_resource_attributes', headers=headers, timeout=timeout)
+
+    def read_view(self, view_id='', headers=None, timeout=None):
+        """Read a View resource
+
+        @param view_id    str
+        @retval view    View
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('resource_management_read_view_in', **{'view_id': view_id}), op='read_view', headers=headers, timeout=timeout)
+
+    def create_view(self, view=None, headers=None, timeout=None):
+        """Creates a view resource.
+
+        @param view    View
+        @retval view_id    str
+        @throws BadRequest    if object passed has _id or _rev attribute
+        """
+        return self.request(IonObject('resource_management_create_view_in', **{'view': view or None}), op='create_view', headers=headers, timeout=timeout)
+
+    def execute_lifecycle_transition(self, transition_event='', resource_id='', headers=None, timeout=None):
+        """Alter object lifecycle according to given transition event. Throws exception
+        if resource object does not exist or given transition_event is unknown/illegal.
+        The new life cycle state after applying the transition is returned.
+
+        @param transition_event    str
+        @param resource_id    str
+        @retval lcstate    str
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        @throws Conflict    race condition while trying to update
+        """
+        return self.request(IonObject('resource_management_execute_lifecycle_transition_in', **{'transition_event': transition_event,'resource_id': resource_id}), op='execute_lifecycle_transition', headers=headers, timeout=timeout)
+
+    def query(self, query=None, search_args=None, id_only=True, headers=None, timeout=None):
+        """Issue a query provided in structured dict format or internal datastore query format.
+        Returns a list of resource or event objects or their IDs only.
+        Search_args may contain parameterized values.
+        See the query format definition: https://confluence.oceanobservatories.org/display/CIDev/Discovery+Service+Query+Format
+
+        @param query    dict
+        @param search_args    dict
+        @param id_only    bool
+        @retval results    list
+        """
+        return self.request(IonObject('resource_management_query_in', **{'query': query or None,'search_args': search_args or None,'id_only': id_only}), op='query', headers=headers, timeout=timeout)
+
+    def update_resource(self, resource=None, headers=None, timeout=None):
+        """Updates an existing resource via the configured service operation.
+
+        @param resource    Resource
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('resource_management_update_resource_in', **{'resource': resource or None}), op='update_resource', headers=headers, timeout=timeout)
+
+    def update_view(self, view=None, headers=None, timeout=None):
+        """Update a View resource
+
+        @param view    View
+        @throws NotFound    object with specified id does not exist
+        @throws BadRequest    if object does not have _id or _rev attribute
+        @throws Conflict    object not based on latest persisted object version
+        """
+        return self.request(IonObject('resource_management_update_view_in', **{'view': view or None}), op='update_view', headers=headers, timeout=timeout)
+
+    def get_lifecycle_events(self, resource_id='', headers=None, timeout=None):
+        """For a given resource, return a list of possible lifecycle transition events.
+
+        @param resource_id    str
+        @retval transition_events    list
+        @throws NotFound    resource object does not exist
+        @throws BadRequest    transition event unknown or illegal in current state; resource type has no lifecycle
+        """
+        return self.request(IonObject('resource_management_get_lifecycle_events_in', **{'resource_id': resource_id}), op='get_lifecycle_events', headers=headers, timeout=timeout)
+
+    def delete_view(self, view_id='', headers=None, timeout=None):
+        """Delete a View resource
+
+        @param view_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('resource_management_delete_view_in', **{'view_id': view_id}), op='delete_view', headers=headers, timeout=timeout)
+
+    def query_view(self, ext_query=None, view_id='', search_args=None, view_name='', id_only=True, headers=None, timeout=None):
+        """Execute an existing query as defined within a View resource, providing additional arguments for
+        parameterized values.
+        If ext_query is provided, it will be combined with the query defined by the View.
+        Search_args may contain parameterized values.
+        Returns a list of resource or event objects or their IDs only.
+
+        @param ext_query    dict
+        @param view_id    str
+        @param search_args    dict
+        @param view_name    str
+        @param id_only    bool
+        @retval results    list
+        """
+        return self.request(IonObject('resource_management_query_view_in', **{'ext_query': ext_query or None,'view_id': view_id,'search_args': search_args or None,'view_name': view_name,'id_only': id_only}), op='query_view', headers=headers, timeout=timeout)
+
+    def delete_resource(self, resource_id='', headers=None, timeout=None):
+        """Deletes an existing resource via the configured service operation.
+
+        @param resource_id    str
+        @throws NotFound    object with specified id does not exist
+        """
+        return self.request(IonObject('resource_management_delete_resource_in', **{'resource_id': resource_id}), op='delete_resource', headers=headers, timeout=timeout)
+
+
+
+class ResourceManagementServiceClient(RPCClient, ResourceManagementServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ResourceManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'resource_management'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        ResourceManagementServiceClientMixin.__init__(self)
+
+
+class ResourceManagementServiceProcessClient(ProcessRPCClient, ResourceManagementServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("ResourceManagementServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'resource_management'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        ResourceManagementServiceClientMixin.__init__(self)
+
+
+
+
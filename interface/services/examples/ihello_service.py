@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "class docstring", 
+    "name": "hello", 
+    "op_list": [
+        "noop", 
+        "hello"
+    ], 
+    "operations": {
+        "hello": {
+            "description": "@todo document this interface!!!", 
+            "in": {
+                "text": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "text", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "text"
+            ], 
+            "out": {
+                "text": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "text", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "text"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "noop": {
+            "description": "@todo document this interface!!!", 
+            "in": {
+                "text": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "text", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "text"
+            ], 
+            "out": {
+                "text": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "text", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "text"
+            ], 
+            "spec": null, 
+            "throws": null
+        }
+    }, 
+    "spec": ""
+}"""
+
+
+class HelloServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class IHelloService(Interface):
+    """None
+    """
+
+    def noop(text=''):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        pass
+
+    def hello(text=''):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        pass
+
+class BaseHelloService(BaseService):
+    implements(IHelloService)
+    """None
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'hello'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = HelloServiceDependentClients(process=self)
+
+
+    def noop(self, text=''):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        pass
+
+    def hello(self, text=''):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        pass
+
+
+
+
+class HelloServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(IHelloService)
+
+
+    def noop(self, text='', headers=None, timeout=None):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        return self.request(IonObject('hello_noop_in', **{'text': text}), op='noop', headers=headers, timeout=timeout)
+
+    def hello(self, text='', headers=None, timeout=None):
+        """@todo document this interface!!!
+
+        @param text    str
+        @retval text    str
+        """
+        return self.request(IonObject('hello_hello_in', **{'text': text}), op='hello', headers=headers, timeout=timeout)
+
+
+
+class HelloServiceClient(RPCClient, HelloServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("HelloServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'hello'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        HelloServiceClientMixin.__init__(self)
+
+
+class HelloServiceProcessClient(ProcessRPCClient, HelloServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("HelloServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'hello'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        HelloServiceClientMixin.__init__(self)
+
+
+
+
@@ -0,0 +1,403 @@
+#!/usr/bin/env python
+#
+# File generated on 2026-10-16 20:55:50.919611
+#
+
+from zope.interface import Interface, implements
+
+from collections import OrderedDict, defaultdict
+
+import interface.objects
+from pyon.core.bootstrap import IonObject
+from pyon.ion.resregistry import ResourceRegistryServiceWrapper
+from pyon.ion.service import BaseService, BaseClients
+from pyon.net.endpoint import RPCClient
+from pyon.ion.endpoint import ProcessRPCClient
+from pyon.util.log import log
+
+
+SCHEMA_JSON = """{
+    "dependencies": [], 
+    "description": "Example service documentation", 
+    "name": "sample", 
+    "op_list": [
+        "sample_ping", 
+        "doc_fields_", 
+        "sample_other_op"
+    ], 
+    "operations": {
+        "doc_fields_": {
+            "description": "@todo document this interface!!!", 
+            "in": {
+                "a_dict": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "a_dict", 
+                    "type": "dict"
+                }, 
+                "a_float": {
+                    "decorators": {}, 
+                    "default": 1.1, 
+                    "description": "", 
+                    "name": "a_float", 
+                    "type": "float"
+                }, 
+                "a_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "a_list", 
+                    "type": "list"
+                }, 
+                "a_string": {
+                    "decorators": {}, 
+                    "default": "text", 
+                    "description": "", 
+                    "name": "a_string", 
+                    "type": "str"
+                }, 
+                "an_int": {
+                    "decorators": {}, 
+                    "default": 1, 
+                    "description": "", 
+                    "name": "an_int", 
+                    "type": "int"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "name", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "none": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "none", 
+                    "type": "NoneType"
+                }, 
+                "time": {
+                    "decorators": {}, 
+                    "default": "2011-07-27T02:59:43.1Z", 
+                    "description": "", 
+                    "name": "time", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "none", 
+                "name", 
+                "a_dict", 
+                "a_list", 
+                "a_string", 
+                "a_float", 
+                "time", 
+                "an_int"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "sample_other_op": {
+            "description": "@todo document this interface!!!", 
+            "in": {
+                "foo": {
+                    "decorators": {}, 
+                    "default": "bar", 
+                    "description": "", 
+                    "name": "foo", 
+                    "type": "str"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "num": {
+                    "decorators": {}, 
+                    "default": 84, 
+                    "description": "", 
+                    "name": "num", 
+                    "type": "int"
+                }
+            }, 
+            "in_list": [
+                "foo", 
+                "num", 
+                "name"
+            ], 
+            "out": {
+                "result": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "result", 
+                    "type": "str"
+                }
+            }, 
+            "out_list": [
+                "result"
+            ], 
+            "spec": null, 
+            "throws": null
+        }, 
+        "sample_ping": {
+            "description": "@todo document this interface!!!", 
+            "in": {
+                "a_dict": {
+                    "decorators": {}, 
+                    "default": {}, 
+                    "description": "", 
+                    "name": "a_dict", 
+                    "type": "dict"
+                }, 
+                "a_float": {
+                    "decorators": {}, 
+                    "default": 0.0, 
+                    "description": "", 
+                    "name": "a_float", 
+                    "type": "float"
+                }, 
+                "a_list": {
+                    "decorators": {}, 
+                    "default": [], 
+                    "description": "", 
+                    "name": "a_list", 
+                    "type": "list"
+                }, 
+                "a_str": {
+                    "decorators": {}, 
+                    "default": "", 
+                    "description": "", 
+                    "name": "a_str", 
+                    "type": "str"
+                }, 
+                "an_int": {
+                    "decorators": {}, 
+                    "default": 0, 
+                    "description": "", 
+                    "name": "an_int", 
+                    "type": "int"
+                }, 
+                "name": {
+                    "decorators": {}, 
+                    "default": "name", 
+                    "description": "", 
+                    "name": "name", 
+                    "type": "str"
+                }, 
+                "none": {
+                    "decorators": {}, 
+                    "default": null, 
+                    "description": "", 
+                    "name": "none", 
+                    "type": "NoneType"
+                }, 
+                "time": {
+                    "decorators": {}, 
+                    "default": "2011-07-27T02:59:43.1Z", 
+                    "description": "", 
+                    "name": "time", 
+                    "type": "str"
+                }
+            }, 
+            "in_list": [
+                "none", 
+                "name", 
+                "a_dict", 
+                "a_list", 
+                "a_str", 
+                "a_float", 
+                "time", 
+                "an_int"
+            ], 
+            "out": {}, 
+            "out_list": [], 
+            "spec": null, 
+            "throws": null
+        }
+    }, 
+    "spec": "http://url.to/service/spec"
+}"""
+
+
+class SampleServiceDependentClients(BaseClients):
+    def __init__(self, process=None):
+        self._process = process
+        BaseClients.__init__(self)
+
+
+
+
+class ISampleService(Interface):
+    """Example service documentation
+
+    @see http://url.to/service/spec
+    """
+
+    def sample_ping(none=None, name='name', a_dict=None, a_list=None, a_str='', a_float=0.0, time='2011-07-27T02:59:43.1Z', an_int=0):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_str    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        pass
+
+    def doc_fields_(none=None, name='name', a_dict=None, a_list=None, a_string='text', a_float=1.1, time='2011-07-27T02:59:43.1Z', an_int=1):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_string    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        pass
+
+    def sample_other_op(foo='bar', num=84, name=''):
+        """@todo document this interface!!!
+
+        @param foo    str
+        @param num    int
+        @param name    str
+        @retval result    str
+        """
+        pass
+
+class BaseSampleService(BaseService):
+    implements(ISampleService)
+    """Example service documentation
+
+    @see http://url.to/service/spec
+    """
+    SCHEMA_JSON=SCHEMA_JSON
+    name = 'sample'
+    dependencies = []
+
+    def __init__(self, *args, **kwargs):
+        BaseService.__init__(self, *args, **kwargs)
+        self.clients = SampleServiceDependentClients(process=self)
+
+
+    def sample_ping(self, none=None, name='name', a_dict=None, a_list=None, a_str='', a_float=0.0, time='2011-07-27T02:59:43.1Z', an_int=0):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_str    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        pass
+
+    def doc_fields_(self, none=None, name='name', a_dict=None, a_list=None, a_string='text', a_float=1.1, time='2011-07-27T02:59:43.1Z', an_int=1):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_string    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        pass
+
+    def sample_other_op(self, foo='bar', num=84, name=''):
+        """@todo document this interface!!!
+
+        @param foo    str
+        @param num    int
+        @param name    str
+        @retval result    str
+        """
+        pass
+
+
+
+
+class SampleServiceClientMixin(object):
+    """
+    # @todo Fill in client documentation.
+    """
+    #implements(ISampleService)
+
+
+    def sample_ping(self, none=None, name='name', a_dict=None, a_list=None, a_str='', a_float=0.0, time='2011-07-27T02:59:43.1Z', an_int=0, headers=None, timeout=None):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_str    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        return self.request(IonObject('sample_sample_ping_in', **{'none': none or None,'name': name,'a_dict': a_dict or None,'a_list': a_list or None,'a_str': a_str,'a_float': a_float,'time': time,'an_int': an_int}), op='sample_ping', headers=headers, timeout=timeout)
+
+    def doc_fields_(self, none=None, name='name', a_dict=None, a_list=None, a_string='text', a_float=1.1, time='2011-07-27T02:59:43.1Z', an_int=1, headers=None, timeout=None):
+        """@todo document this interface!!!
+
+        @param none    NoneType
+        @param name    str
+        @param a_dict    dict
+        @param a_list    list
+        @param a_string    str
+        @param a_float    float
+        @param time    str
+        @param an_int    int
+        """
+        return self.request(IonObject('sample_doc_fields__in', **{'none': none or None,'name': name,'a_dict': a_dict or None,'a_list': a_list or None,'a_string': a_string,'a_float': a_float,'time': time,'an_int': an_int}), op='doc_fields_', headers=headers, timeout=timeout)
+
+    def sample_other_op(self, foo='bar', num=84, name='', headers=None, timeout=None):
+        """@todo document this interface!!!
+
+        @param foo    str
+        @param num    int
+        @param name    str
+        @retval result    str
+        """
+        return self.request(IonObject('sample_sample_other_op_in', **{'foo': foo,'num': num,'name': name}), op='sample_other_op', headers=headers, timeout=timeout)
+
+
+
+class SampleServiceClient(RPCClient, SampleServiceClientMixin):
+    def __init__(self, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("SampleServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'sample'
+        RPCClient.__init__(self, to_name=to_name, node=node, **kwargs)
+        SampleServiceClientMixin.__init__(self)
+
+
+class SampleServiceProcessClient(ProcessRPCClient, SampleServiceClientMixin):
+    def __init__(self, process=None, to_name=None, name=None, node=None, **kwargs):
+        if name is not None:
+            log.warn("SampleServiceClient: 'name' parameter is deprecated, please use to_name")
+        to_name = to_name or name or 'sample'
+        ProcessRPCClient.__init__(self, process=process, to_name=to_name, node=node, **kwargs)
+        SampleServiceClientMixin.__init__(self)
+
+
+
+
@@ -59,6 +59,7 @@ setup(  name='scioncc',
                 'generate_interfaces=scripts.generate_interfaces:main',
                 'store_interfaces=scripts.store_interfaces:main',
                 'clear_db=pyon.datastore.clear_db_util:main',
+                'migrate_jsonb=pyon.datastore.jsonb_migrate_util:main',
                 'coverage=scripts.coverage:main',
                 ]
             },
@@ -69,7 +70,7 @@ setup(  name='scioncc',
             'gevent==1.0.1',
             'pyyaml==3.10',
             'simplejson==3.6.5',
-            'msgpack-python==0.1.13',  # TBD: Check if this specific version is needed
+            'msgpack-python==0.4.8',   # ExtType support needed by msgpack-ext message codec
             'pika==0.9.5',             # Messaging stack is tested and working with issues of this version
             'httplib2==0.9.1',
             'zope.interface==4.1.1',
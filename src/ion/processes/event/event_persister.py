@@ -3,6 +3,7 @@
 """Process that subscribes to ALL events and persists them efficiently in bulk into the events datastore"""
 
 import pprint
+import time
 from gevent.queue import Queue
 from gevent.event import Event
 
@@ -23,6 +24,10 @@ class EventPersister(StandaloneProcess):
 
         self.persist_blacklist = self.CFG.get_safe("process.event_persister.persist_blacklist", {})
 
+        # Time in between creating and dropping time partitions of the events datastore
+        self.partition_maintenance_interval = float(self.CFG.get_safe("process.event_persister.partition_maintenance_interval", 0))
+        self._next_partition_maintenance = 0
+
         self._event_type_blacklist = [entry['event_type'] for entry in self.persist_blacklist if entry.get('event_type', None) and len(entry) == 1]
         self._complex_blacklist = [entry for entry in self.persist_blacklist if not (entry.get('event_type', None) and len(entry) == 1)]
         if self._complex_blacklist:
@@ -134,6 +139,8 @@ class EventPersister(StandaloneProcess):
                     self._process_events(events_to_process)
                 self.events_to_persist = None
                 self.failure_count = 0
+
+                self._maintain_partitions()
             except Exception as ex:
                 # Note: Persisting events may fail occasionally during test runs (when the "events" datastore is force
                 # deleted and recreated). We'll log and keep retrying forever.
@@ -145,6 +152,15 @@ class EventPersister(StandaloneProcess):
         if event_list:
             self.container.event_repository.put_events(event_list)
 
+    def _maintain_partitions(self):
+        if self.partition_maintenance_interval <= 0 or time.time() < self._next_partition_maintenance:
+            return
+        self._next_partition_maintenance = time.time() + self.partition_maintenance_interval
+        try:
+            self.container.event_repository.maintain_partitions()
+        except Exception:
+            log.exception("Error maintaining event partitions")
+
     def _process_events(self, event_list):
         for plugin_name, plugin in self.process_plugins.iteritems():
             try:
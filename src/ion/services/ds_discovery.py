@@ -57,6 +57,11 @@ class DatastoreDiscovery(object):
                           ]
 
     def execute_query(self, discovery_query, id_only=True, query_args=None, query_params=None):
+        """Executes a discovery query or datastore query expression and returns the result list.
+        If query_args has query_info=True, a dict with details of the executed query is appended
+        to the results. For keyset paged queries (page_token set in the query expression's query_args),
+        this is the only way to get the next_page_token for the next page.
+        """
         try:
             if "QUERYEXP" in discovery_query:
                 ds_query, ds_name = discovery_query, discovery_query["query_args"].get("datastore", DataStore.DS_RESOURCES)
@@ -125,6 +130,9 @@ class DatastoreDiscovery(object):
                     order_list.append((col, colsort))
             order_by = qb.order_by(order_list)
 
+        if "page_token" in discovery_query:
+            qb.set_page_token(discovery_query["page_token"])
+
         qb.build_query(where=where, order_by=order_by)
         return qb.get_query(), ds_name
 
@@ -102,6 +102,8 @@ class ResourceManagementService(BaseResourceManagementService):
             view_qargs["id_only"] = ext_qargs.get("id_only", view_qargs["id_only"])
             view_qargs["limit"] = ext_qargs.get("limit", view_qargs["limit"])
             view_qargs["skip"] = ext_qargs.get("skip", view_qargs["skip"])
+            if "page_token" in ext_qargs:
+                view_qargs["page_token"] = ext_qargs["page_token"]
 
         return self._discovery_request(view_query, id_only=id_only,
                                        search_args=search_args, query_params=query_params)
@@ -125,6 +127,7 @@ class ResourceManagementService(BaseResourceManagementService):
             # Only return the count of ID only search
             query.pop("limit", None)
             query.pop("skip", None)
+            query.pop("page_token", None)
             res = self.ds_discovery.execute_query(query, id_only=True, query_args=search_args, query_params=query_params)
             return [len(res)]
 
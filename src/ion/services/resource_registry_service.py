@@ -4,7 +4,7 @@ __author__ = 'Thomas R. Lennan, Michael Meisinger, Stephen Henrie'
 
 from pyon.core.governance import MODERATOR_ROLE, OPERATOR_ROLE, GovernanceHeaderValues, has_org_role
 from pyon.ion.resregistry import ResourceRegistryServiceWrapper
-from pyon.public import log, OT, RT, PRED, Inconsistent, MSG_HEADER_ACTOR
+from pyon.public import log, CFG, OT, RT, PRED, Inconsistent, MSG_HEADER_ACTOR
 
 from interface.services.core.iresource_registry_service import BaseResourceRegistryService
 
@@ -15,6 +15,8 @@ class ResourceRegistryService(BaseResourceRegistryService):
     system resources. Uses a datastore instance for resource object persistence.
     """
 
+    MAX_SUBGRAPH_DEPTH = CFG.get_safe('service.resource_registry.max_subgraph_depth', 20)
+
     def on_init(self):
         # Use the wrapper to adapt the container resource registry to the service interface.
         # It also provides mapping from process context actor_id to function arguments.
@@ -125,6 +127,13 @@ class ResourceRegistryService(BaseResourceRegistryService):
     def find_subjects_mult(self, objects=None, id_only=False, predicate=""):
         return self.resource_registry.find_subjects_mult(objects=objects, id_only=id_only, predicate=predicate)
 
+    def get_subgraph(self, root="", predicate=None, max_depth=0, direction="O", id_only=False):
+        # Bound the recursion for remote callers, including unlimited depth (0)
+        if self.MAX_SUBGRAPH_DEPTH and (max_depth <= 0 or max_depth > self.MAX_SUBGRAPH_DEPTH):
+            max_depth = self.MAX_SUBGRAPH_DEPTH
+        return self.resource_registry.get_subgraph(root=root, predicate=predicate, max_depth=max_depth,
+            direction=direction, id_only=id_only)
+
     def find_resources(self, restype="", lcstate="", name="", id_only=False):
         return self.resource_registry.find_resources(restype=restype, lcstate=lcstate, name=name, id_only=id_only)
 
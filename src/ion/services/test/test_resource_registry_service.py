@@ -3,6 +3,7 @@
 __author__ = 'Michael Meisinger, Thomas Lennan, Stephen Henrie'
 
 import unittest
+from mock import patch
 from nose.plugins.attrib import attr
 
 from pyon.core.exception import BadRequest, Conflict, NotFound, Inconsistent
@@ -10,6 +11,8 @@ from pyon.public import IonObject, PRED, RT, LCS, LCE, AS, iex, log, OT
 from pyon.ion.resource import lcstate
 from pyon.util.int_test import IonIntegrationTestCase
 
+from ion.services.resource_registry_service import ResourceRegistryService
+
 from interface.objects import Attachment, AttachmentType, Resource, ProcessDefinition
 from interface.services.core.iresource_registry_service import ResourceRegistryServiceClient
 
@@ -33,6 +36,7 @@ class TestResourceRegistry(IonIntegrationTestCase):
         self._do_test_attach()
         self._do_test_association()
         self._do_test_find_resources()
+        self._do_test_subgraph()
 
     def _do_test_crud(self):
         # Some quick registry tests
@@ -425,3 +429,24 @@ class TestResourceRegistry(IonIntegrationTestCase):
         ret = self.resource_registry_service.find_resources(RT.ProcessDefinition, LCS.DEPLOYED, None, False)
         self.assertEquals(len(ret[0]), 1)
         self.assertEquals(ret[0][0]._id, read_obj._id)
+
+    def _do_test_subgraph(self):
+        res_ids = [self.resource_registry_service.create(IonObject(RT.Org, name="org%s" % i))[0] for i in xrange(3)]
+        self.resource_registry_service.create_association(res_ids[0], PRED.hasResource, res_ids[1])
+        self.resource_registry_service.create_association(res_ids[1], PRED.hasResource, res_ids[2])
+
+        sub_ids, assocs = self.resource_registry_service.get_subgraph(res_ids[0], predicate=[PRED.hasResource], id_only=True)
+        self.assertEquals(sub_ids, res_ids)
+        self.assertEquals(len(assocs), 2)
+
+        sub_objs, assocs = self.resource_registry_service.get_subgraph(res_ids[2], max_depth=1, direction="S")
+        self.assertEquals([o.name for o in sub_objs], ["org2", "org1"])
+        self.assertEquals(len(assocs), 1)
+
+        # Depth is limited for service callers, also when unlimited
+        with patch.object(ResourceRegistryService, "MAX_SUBGRAPH_DEPTH", 1):
+            sub_ids, assocs = self.resource_registry_service.get_subgraph(res_ids[0], id_only=True)
+        self.assertEquals(sub_ids, res_ids[:2])
+
+        with self.assertRaises(NotFound):
+            self.resource_registry_service.get_subgraph("NONE", id_only=True)
@@ -11,6 +11,7 @@ import sys
 import json
 import simplejson
 
+from pyon.core.object import get_obj_dict
 from pyon.public import BadRequest, OT
 from pyon.util.containers import get_datetime
 
@@ -38,7 +39,7 @@ json_dumps = json.dumps
 json_loads = simplejson.loads   # Faster loading than regular json
 
 def encode_ion_object(obj):
-    return obj.__dict__
+    return get_obj_dict(obj)
 
 
 # -------------------------------------------------------------------------
@@ -4,7 +4,6 @@
 
 __author__ = 'Michael Meisinger'
 
-from copy import deepcopy
 import time
 import re
 from gevent.lock import RLock
@@ -22,7 +21,7 @@ from pyon.ion.stream import StreamPublisher, StreamSubscriber
 from pyon.net.channel import RecvChannel
 from pyon.net.messaging import IDPool
 from pyon.net.transport import NameTrio, TransportError
-from pyon.util.containers import DotDict, for_name, named_any, dict_merge, get_safe, is_valid_identifier
+from pyon.util.containers import DotDict, LazyCopyDotDict, for_name, named_any, dict_merge, get_safe, is_valid_identifier
 from pyon.util.log import log
 
 from interface.objects import ProcessStateEnum, CapabilityContainer, Service, Process, ServiceStateEnum
@@ -117,7 +116,8 @@ class ProcManager(object):
         process_id = process_id or "%s.%s" % (self.container.id, self.proc_id_pool.get_id())
         log.debug("ProcManager.spawn_process(name=%s, module.cls=%s.%s, config=%s) as pid=%s", name, module, cls, config, process_id)
 
-        process_cfg = deepcopy(CFG)
+        # Behaves like a deep copy of CFG, only copying what the process accesses
+        process_cfg = LazyCopyDotDict(CFG)
         if config:
             # Use provided config. Must be dict or DotDict
             if not isinstance(config, DotDict):
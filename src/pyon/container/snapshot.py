@@ -12,7 +12,7 @@ from putil.timer import get_accumulators
 from pyon.public import log, IonObject, BadRequest, CFG
 from pyon.util.containers import get_ion_ts
 
-DEFAULT_SNAPSHOTS = ["basic", "config", "processes", "policy", "accumulators", "gevent", "gevent_block"]
+DEFAULT_SNAPSHOTS = ["basic", "config", "processes", "policy", "accumulators", "datastore", "gevent", "gevent_block"]
 
 
 class ContainerSnapshot(object):
@@ -178,6 +178,17 @@ class ContainerSnapshot(object):
 
         return snap_result
 
+    def _snap_datastore(self, **kwargs):
+        snap_result = {}
+        if CFG.get_safe("container.datastore.default_server", None) == "postgresql":
+            from pyon.datastore.postgresql.base_store import get_connection_pool_stats
+            snap_result["connection_pools"] = get_connection_pool_stats()
+        directory = getattr(self.container, "directory", None)
+        if directory and getattr(directory, "dir_cache", None) is not None:
+            snap_result["directory_cache"] = directory.get_cache_stats()
+
+        return snap_result
+
     def _snap_accumulators(self, **kwargs):
         all_acc_dict = {}
         for acc_name, acc in get_accumulators().iteritems():
@@ -9,7 +9,7 @@ from pyon.core import (bootstrap, MSG_HEADER_ACTOR, MSG_HEADER_ROLES, MSG_HEADER
 from pyon.core.bootstrap import IonObject
 from pyon.core.exception import BadRequest, Inconsistent
 from pyon.ion.resource import RT, PRED, OT
-from pyon.util.containers import get_safe, get_ion_ts_millis
+from pyon.util.containers import get_safe, get_ion_ts_millis, ExpiringLRUCache
 from pyon.util.log import log
 
 # These constants are ubiquitous, so define in the container
@@ -28,6 +28,81 @@ DECORATOR_RESOURCE_ID = "ResourceId"
 DECORATOR_USER_CONTEXT_ID = "UserContextId"
 
 
+class GovernanceCache(object):
+    """
+    Container-wide cache of actor roles and of commitments by principal and by resource, used by the
+    governance helper functions in this module. The GovernanceController keeps it current based on
+    events; entries also expire after a time to live and no later than the first commitment expiration.
+    """
+    def __init__(self, max_size=10000, ttl=300):
+        self.actor_roles = ExpiringLRUCache(max_size=max_size, ttl=ttl)              # actor_id -> role dict
+        self.principal_commitments = ExpiringLRUCache(max_size=max_size, ttl=ttl)    # principal_id -> commitments
+        self.resource_commitments = ExpiringLRUCache(max_size=max_size, ttl=ttl)     # resource_id -> commitments
+
+    def put_commitments(self, cache, key, commitments):
+        """Caches a list of commitments, expiring the entry when the first of the commitments expires"""
+        ttl = cache.ttl
+        cur_time = get_ion_ts_millis()
+        expirations = [int(com.expiration) for com in commitments if int(com.expiration) > cur_time]
+        if expirations:
+            expires_in = (min(expirations) - cur_time) / 1000.0
+            ttl = min(ttl, expires_in) if ttl else expires_in
+        cache.put(key, commitments, ttl=ttl)
+
+    def invalidate_actor_roles(self, actor_id=None):
+        """Removes cached roles for given actor or all actors"""
+        if actor_id:
+            self.actor_roles.invalidate(actor_id)
+        else:
+            self.actor_roles.clear()
+
+    def invalidate_commitments(self):
+        self.principal_commitments.clear()
+        self.resource_commitments.clear()
+
+    def invalidate_association(self, subject_id, predicate, object_id):
+        """Removes cache entries affected by a new or removed association"""
+        if predicate == PRED.hasRole:
+            self.actor_roles.invalidate(subject_id)
+        elif predicate == PRED.hasCommitment:
+            self.principal_commitments.invalidate(subject_id)
+        elif predicate == PRED.hasTarget:
+            self.resource_commitments.invalidate(object_id)
+
+    def clear(self):
+        self.invalidate_actor_roles()
+        self.invalidate_commitments()
+
+    def get_stats(self):
+        return dict(actor_roles=self.actor_roles.get_stats(),
+                    principal_commitments=self.principal_commitments.get_stats(),
+                    resource_commitments=self.resource_commitments.get_stats())
+
+
+def _get_governance_cache(gov_controller):
+    return getattr(gov_controller, "governance_cache", None)
+
+
+def is_governance_cache_enabled():
+    """Returns True if the governance controller of this container caches roles and commitments"""
+    gov_controller = getattr(bootstrap.container_instance, "governance_controller", None)
+    return _get_governance_cache(gov_controller) is not None
+
+
+def invalidate_governance_cache(subject_id=None, predicate=None, object_id=None):
+    """
+    Removes cached roles and commitments affected by a change of an association in this container.
+    Called after the change is committed, so does not raise.
+    """
+    gov_controller = getattr(bootstrap.container_instance, "governance_controller", None)
+    gov_cache = _get_governance_cache(gov_controller)
+    if gov_cache is not None:
+        try:
+            gov_cache.invalidate_association(subject_id, predicate, object_id)
+        except Exception:
+            log.exception("Could not invalidate governance cache for association %s %s %s", subject_id, predicate, object_id)
+
+
 def get_role_message_headers(org_roles):
     """
     Iterate the Org(s) that the user belongs to and create a header that lists only the
@@ -100,9 +175,21 @@ def find_roles_by_actor(actor_id=None):
     if actor_id is None or not len(actor_id):
         raise BadRequest("The actor_id parameter is missing")
 
+    gov_controller = bootstrap.container_instance.governance_controller
+    gov_cache = _get_governance_cache(gov_controller)
+    role_dict = gov_cache.actor_roles.get(actor_id) if gov_cache is not None else None
+    if role_dict is None:
+        role_dict = _find_roles_by_actor(gov_controller, actor_id)
+        if gov_cache is not None:
+            gov_cache.actor_roles.put(actor_id, role_dict)
+
+    # Callers may modify the result
+    return {org_name: list(roles) for org_name, roles in role_dict.iteritems()}
+
+
+def _find_roles_by_actor(gov_controller, actor_id):
     role_dict = dict()
 
-    gov_controller = bootstrap.container_instance.governance_controller
     role_list, _ = gov_controller.rr.find_objects(actor_id, PRED.hasRole, RT.UserRole)
 
     for role in role_list:
@@ -181,7 +268,8 @@ def get_valid_principal_commitments(principal_id=None, consumer_id=None):
 
     try:
         gov_controller = bootstrap.container_instance.governance_controller
-        commitments, _ = gov_controller.rr.find_objects(principal_id, PRED.hasCommitment, RT.Commitment, id_only=False)
+        commitments = _find_commitments(gov_controller, "principal_commitments", principal_id,
+                                        lambda: gov_controller.rr.find_objects(principal_id, PRED.hasCommitment, RT.Commitment, id_only=False)[0])
         if not commitments:
             return None
 
@@ -208,7 +296,8 @@ def get_valid_resource_commitments(resource_id=None, actor_id=None):
 
     try:
         gov_controller = bootstrap.container_instance.governance_controller
-        commitments, _ = gov_controller.rr.find_subjects(RT.Commitment, PRED.hasTarget, resource_id, id_only=False)
+        commitments = _find_commitments(gov_controller, "resource_commitments", resource_id,
+                                        lambda: gov_controller.rr.find_subjects(RT.Commitment, PRED.hasTarget, resource_id, id_only=False)[0])
         if not commitments:
             return None
 
@@ -224,6 +313,20 @@ def get_valid_resource_commitments(resource_id=None, actor_id=None):
     return None
 
 
+def _find_commitments(gov_controller, cache_name, key, find_func):
+    """Returns all commitments (including expired) for key from the named governance cache or find_func"""
+    gov_cache = _get_governance_cache(gov_controller)
+    if gov_cache is None:
+        return find_func()
+
+    cache = getattr(gov_cache, cache_name)
+    commitments = cache.get(key)
+    if commitments is None:
+        commitments = find_func()
+        gov_cache.put_commitments(cache, key, commitments)
+    return commitments
+
+
 def has_valid_resource_commitments(actor_id, resource_id):
     """
     Returns a ResourceCommitmentStatus object indicating the commitment status between this resource/actor
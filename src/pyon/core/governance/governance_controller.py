@@ -9,7 +9,7 @@ import types
 from pyon.core import PROCTYPE_AGENT, PROCTYPE_SERVICE
 from pyon.core.bootstrap import CFG, get_service_registry, is_testing
 from pyon.core.exception import NotFound, Unauthorized
-from pyon.core.governance import get_system_actor_header, get_system_actor
+from pyon.core.governance import get_system_actor_header, get_system_actor, GovernanceCache
 from pyon.core.governance.governance_dispatcher import GovernanceDispatcher
 from pyon.core.governance.policy.policy_decision import PolicyDecisionPointManager
 from pyon.core.interceptor.interceptor import Invocation
@@ -37,6 +37,8 @@ class GovernanceController(object):
         self.interceptor_order = []
         self.policy_decision_point_manager = None
         self.governance_dispatcher = None
+        self.governance_cache = None    # Actor roles and commitments, see pyon.core.governance
+        self.governance_cache_subscribers = []
 
         # Holds a list per service operation of policy methods to be called before operation is invoked
         self._service_op_preconditions = {}
@@ -81,6 +83,16 @@ class GovernanceController(object):
             self.policy_event_subscriber = EventSubscriber(event_type=OT.PolicyEvent, callback=self.policy_event_callback)
             self.policy_event_subscriber.start()
 
+            cache_size = config.get('governance_cache_size', 10000)
+            if cache_size:
+                self.governance_cache = GovernanceCache(max_size=cache_size, ttl=config.get('governance_cache_ttl', 300))
+                self.governance_cache_subscribers = [
+                    EventSubscriber(event_type=OT.ResourceModifiedEvent, origin_type=RT.UserRole, callback=self.governance_cache_event_callback),
+                    EventSubscriber(event_type=OT.ResourceModifiedEvent, origin_type=RT.Commitment, callback=self.governance_cache_event_callback),
+                    EventSubscriber(event_type=OT.OrgEvent, origin_type=RT.Org, callback=self.governance_cache_event_callback)]
+                for sub in self.governance_cache_subscribers:
+                    sub.start()
+
             self._policy_snapshot = self._get_policy_snapshot()
             self._log_policy_update("start_governance_ctrl", message="Container start")
 
@@ -109,6 +121,9 @@ class GovernanceController(object):
 
         if self.policy_event_subscriber is not None:
             self.policy_event_subscriber.stop()
+        for sub in self.governance_cache_subscribers:
+            sub.stop()
+        self.governance_cache_subscribers = []
 
     @property
     def is_container_org_boundary(self):
@@ -201,6 +216,9 @@ class GovernanceController(object):
             self.resource_policy_event_callback(policy_event, *args, **kwargs)
         elif policy_event.type_ == OT.ServicePolicyEvent:
             self.service_policy_event_callback(policy_event, *args, **kwargs)
+        elif policy_event.type_ == OT.UserRoleCacheResetEvent:
+            if self.governance_cache is not None:
+                self.governance_cache.invalidate_actor_roles()
 
         self._log_policy_update("policy_event_callback",
                                 message="Event processed",
@@ -236,6 +254,23 @@ class GovernanceController(object):
 
         self.update_resource_access_policy(resource_id, delete_policy)
 
+    def governance_cache_event_callback(self, event, *args, **kwargs):
+        """Removes cached actor roles and commitments affected by UserRole, Commitment and Org events
+        """
+        if self.governance_cache is None:
+            return
+
+        if event.type_ == OT.ResourceModifiedEvent:
+            if event.origin_type == RT.UserRole:
+                self.governance_cache.invalidate_actor_roles()
+            elif event.origin_type == RT.Commitment:
+                self.governance_cache.invalidate_commitments()
+        elif event.type_ in (OT.UserRoleGrantedEvent, OT.UserRoleRevokedEvent, OT.UserRoleModifiedEvent,
+                             OT.OrgMembershipGrantedEvent, OT.OrgMembershipCancelledEvent):
+            self.governance_cache.invalidate_actor_roles(event.actor_id)
+        elif event.type_ in (OT.ResourceCommitmentCreatedEvent, OT.ResourceCommitmentReleasedEvent):
+            self.governance_cache.invalidate_commitments()
+
     def reset_policy_cache(self):
         """Empty and reload the container's policy caches.
         Reload by getting policy for each of the container's processes and common policy.
@@ -257,6 +292,8 @@ class GovernanceController(object):
 
     def _clear_container_policy_caches(self):
         self.policy_decision_point_manager.clear_policy_cache()
+        if self.governance_cache is not None:
+            self.governance_cache.clear()
         self.unregister_all_process_policy_preconditions()
 
     def update_process_policies(self, process_instance, safe_mode=False, force_update=True):
@@ -37,6 +37,9 @@ class GovernanceInterceptor(BaseInternalGovernanceInterceptor):
 
         log.debug("GovernanceInterceptor enabled: %s" % str(self.enabled))
 
+    def is_active(self, path):
+        return getattr(self, "enabled", True)
+
     def outgoing(self, invocation):
         if not self.enabled:
             return invocation
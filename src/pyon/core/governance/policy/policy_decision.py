@@ -18,12 +18,14 @@ from ndg.xacml.core.context.environment import Environment
 from ndg.xacml.core.context.pdp import PDP
 from ndg.xacml.core.context.result import Decision
 
+from pyon.core.bootstrap import CFG
 from pyon.core import (MSG_HEADER_ACTOR, MSG_HEADER_ROLES, MSG_HEADER_OP, MSG_HEADER_FORMAT, MSG_HEADER_USER_CONTEXT_ID,
                        PROCTYPE_AGENT, PROCTYPE_SERVICE)
 from pyon.core.exception import NotFound
 from pyon.core.governance import SUPERUSER_ROLE, ANONYMOUS_ACTOR, DECORATOR_OP_VERB
 from pyon.core.governance.governance_dispatcher import GovernanceDispatcher
 from pyon.core.registry import is_ion_object, message_classes, get_class_decorator_value
+from pyon.util.containers import ExpiringLRUCache
 from pyon.util.log import log
 
 
@@ -73,6 +75,9 @@ POLICY_RULE_CA_DENY_OVERRIDES = "urn:oasis:names:tc:xacml:1.0:rule-combining-alg
 POLICY_RULE_CA_FIRST_APPLICABLE = "urn:oasis:names:tc:xacml:1.0:rule-combining-algorithm:first-applicable"
 EMPTY_POLICY_ID = "urn:oasis:names:tc:xacml:2.0:example:policyid:empty_policy_set"
 
+# Policy rules referencing these cannot have their decisions cached (message content evaluation)
+NON_CACHEABLE_RULE_MARKERS = (ACTION_PARAMETERS, 'function:evaluate-code', 'function:evaluate-function')
+
 
 class PolicyDecisionPointManager(object):
 
@@ -80,6 +85,13 @@ class PolicyDecisionPointManager(object):
         self.resource_policy_decision_point = {}
         self.service_policy_decision_point = {}
 
+        # Cache of policy decisions for PDPs without message content evaluation
+        self._pdp_cache_info = {}   # PDP -> (rules use sender id, rules use user context id); only cacheable PDPs
+        self._op_verbs = {}         # message format -> operation verb
+        cache_size = CFG.get_safe('interceptor.interceptors.governance.config.decision_cache_size', 10000)
+        cache_ttl = CFG.get_safe('interceptor.interceptors.governance.config.decision_cache_ttl', 300)
+        self.decision_cache = ExpiringLRUCache(max_size=cache_size, ttl=cache_ttl) if cache_size else None
+
         self.empty_pdp = self.get_empty_pdp()
         self.set_common_service_policy_rules([])
 
@@ -125,10 +137,28 @@ class PolicyDecisionPointManager(object):
 
     def get_empty_pdp(self):
         policy_set = self.create_policy_from_rules(EMPTY_POLICY_ID, "")
-        input_source = StringIO(policy_set)
-        pdp = PDP.fromPolicySource(input_source, ReaderFactory)
+        return self._create_pdp(policy_set, "")
+
+    def _create_pdp(self, policy_set, rules_text):
+        """Returns a new PDP for the given policy set and registers whether its decisions can be cached"""
+        pdp = PDP.fromPolicySource(StringIO(policy_set), ReaderFactory)
+        if not any(marker in rules_text for marker in NON_CACHEABLE_RULE_MARKERS):
+            self._pdp_cache_info[pdp] = (SENDER_ID in rules_text, USER_CONTEXT_ID in rules_text)
         return pdp
 
+    def _discard_pdp(self, pdp):
+        if pdp is not None:
+            self._pdp_cache_info.pop(pdp, None)
+        self.clear_decision_cache()
+
+    def clear_decision_cache(self):
+        """Removes all cached policy decisions. Called whenever policies change"""
+        if self.decision_cache is not None:
+            self.decision_cache.clear()
+
+    def get_decision_cache_stats(self):
+        return self.decision_cache.get_stats() if self.decision_cache is not None else {}
+
     def get_service_pdp(self, service_name):
         """Return a compiled policy indexed by the specified service name, or default (empty)"""
         if service_name in self.service_policy_decision_point:
@@ -148,8 +178,8 @@ class PolicyDecisionPointManager(object):
     def set_common_service_policy_rules(self, policy_list):
         rules_text = self._get_rules_text(policy_list)
         self.common_service_rules = rules_text
-        input_source = StringIO(self.create_policy_from_rules(COMMON_SERVICE_POLICY_RULES, rules_text))
-        self.load_common_service_pdp = PDP.fromPolicySource(input_source, ReaderFactory)
+        self._discard_pdp(getattr(self, "load_common_service_pdp", None))
+        self.load_common_service_pdp = self._create_pdp(self.create_policy_from_rules(COMMON_SERVICE_POLICY_RULES, rules_text), rules_text)
 
     def list_service_policies(self):
         return self.service_policy_decision_point.keys()
@@ -168,11 +198,10 @@ class PolicyDecisionPointManager(object):
 
         # Create a new PDP object for the service
         rules_text = self._get_rules_text(policy_list)
-        input_source = StringIO(self.create_policy_from_rules(service_name, rules_text))
-        self.service_policy_decision_point[service_name] = PDP.fromPolicySource(input_source, ReaderFactory)
+        self.service_policy_decision_point[service_name] = self._create_pdp(self.create_policy_from_rules(service_name, rules_text), rules_text)
 
     def clear_service_policy(self, service_name):
-        self.service_policy_decision_point.pop(service_name, None)
+        self._discard_pdp(self.service_policy_decision_point.pop(service_name, None))
 
     def list_resource_policies(self):
         return self.resource_policy_decision_point.keys()
@@ -191,14 +220,15 @@ class PolicyDecisionPointManager(object):
 
         # Create a new PDP object for the resource
         rules_text = self._get_rules_text(policy_list)
-        input_source = StringIO(self.create_resource_policy_from_rules(resource_key, rules_text))
-        self.resource_policy_decision_point[resource_key] = PDP.fromPolicySource(input_source, ReaderFactory)
+        self.resource_policy_decision_point[resource_key] = self._create_pdp(self.create_resource_policy_from_rules(resource_key, rules_text), rules_text)
 
     def clear_resource_policy(self, resource_key):
-        self.resource_policy_decision_point.pop(resource_key, None)
+        self._discard_pdp(self.resource_policy_decision_point.pop(resource_key, None))
 
     def clear_policy_cache(self):
-        """Remove all policies"""
+        """Remove all policies and cached decisions"""
+        for pdp in self.resource_policy_decision_point.values() + self.service_policy_decision_point.values():
+            self._discard_pdp(pdp)
         self.resource_policy_decision_point.clear()
         self.service_policy_decision_point.clear()
         self.set_common_service_policy_rules([])
@@ -250,7 +280,11 @@ class PolicyDecisionPointManager(object):
         if attribute is not None:
             subject.attributes.append(attribute)
 
-    def _create_request_from_message(self, invocation, receiver, receiver_type=PROCTYPE_SERVICE):
+    def _get_request_attributes(self, invocation):
+        """
+        Extracts the message attributes used in policy requests, except message content.
+        @retval  A dict with sender, actor_id, user_context_id, user_context_differs, role_lists, op, verb, process
+        """
         sender, sender_type = invocation.get_message_sender()
         op = invocation.get_header_value(MSG_HEADER_OP, 'Unknown')
         actor_id = invocation.get_header_value(MSG_HEADER_ACTOR, ANONYMOUS_ACTOR)
@@ -259,19 +293,8 @@ class PolicyDecisionPointManager(object):
         actor_roles = invocation.get_header_value(MSG_HEADER_ROLES, {})
         message_format = invocation.get_header_value(MSG_HEADER_FORMAT, '')
 
-        # if receiver == "agpro_exchange":
-        #     print "### POLICY DECISION rty=%s recv=%s actor=%s context=%s differ:%s" % (receiver_type, receiver, actor_id, user_context_id, user_context_differs)
-        #     print " Headers: %s" % invocation.headers
-
         #log.debug("Checking XACML Request: receiver_type: %s, sender: %s, receiver:%s, op:%s,  ion_actor_id:%s, ion_actor_roles:%s", receiver_type, sender, receiver, op, ion_actor_id, actor_roles)
 
-        request = Request()
-        subject = Subject()
-        subject.attributes.append(self.create_string_attribute(SENDER_ID, sender))
-        subject.attributes.append(self.create_string_attribute(Identifiers.Subject.SUBJECT_ID, actor_id))
-        subject.attributes.append(self.create_string_attribute(USER_CONTEXT_ID, user_context_id))
-        subject.attributes.append(self.create_string_attribute(USER_CONTEXT_DIFFERS, str(user_context_differs)))
-
         # Get the Org name associated with the endpoint process
         endpoint_process = invocation.get_arg_value('process', None)
         if endpoint_process is not None and hasattr(endpoint_process, 'org_governance_name'):
@@ -282,22 +305,55 @@ class PolicyDecisionPointManager(object):
         # If this process is not associated with the root Org, then iterate over the roles associated
         # with the user only for the Org that this process is associated with otherwise include all roles
         # and create attributes for each
+        role_lists = []
         if org_governance_name == self.governance_controller.system_root_org_name:
             #log.debug("Including roles for all Orgs")
             # If the process Org name is the same for the System Root Org, then include all of them to be safe
             for org in actor_roles:
-                self.create_org_role_attribute(actor_roles[org], subject)
+                role_lists.append(actor_roles[org])
         else:
             if org_governance_name in actor_roles:
                 log.debug("Org Roles (%s): %s", org_governance_name, ' '.join(actor_roles[org_governance_name]))
-                self.create_org_role_attribute(actor_roles[org_governance_name], subject)
+                role_lists.append(actor_roles[org_governance_name])
 
             # Handle the special case for the ION system actor
             if self.governance_controller.system_root_org_name in actor_roles:
                 if SUPERUSER_ROLE in actor_roles[self.governance_controller.system_root_org_name]:
                     log.debug("Including SUPERUSER role")
-                    self.create_org_role_attribute([SUPERUSER_ROLE], subject)
+                    role_lists.append([SUPERUSER_ROLE])
+
+        return dict(sender=sender, actor_id=actor_id, user_context_id=user_context_id,
+                    user_context_differs=user_context_differs, role_lists=role_lists, op=op,
+                    verb=self._get_operation_verb(message_format), process=endpoint_process)
+
+    def _get_operation_verb(self, message_format):
+        """Returns the OperationVerb decorator value for the message class, if any (cached)"""
+        if message_format in self._op_verbs:
+            return self._op_verbs[message_format]
+
+        # Check to see if there is a OperationVerb decorator specifying a Verb used with policy
+        operation_verb = None
+        if is_ion_object(message_format):
+            try:
+                msg_class = message_classes[message_format]
+                operation_verb = get_class_decorator_value(msg_class, DECORATOR_OP_VERB)
+            except NotFound:
+                pass
+        self._op_verbs[message_format] = operation_verb
+        return operation_verb
+
+    def _create_request_from_message(self, invocation, receiver, receiver_type=PROCTYPE_SERVICE, req_attrs=None):
+        req_attrs = req_attrs or self._get_request_attributes(invocation)
 
+        request = Request()
+        subject = Subject()
+        subject.attributes.append(self.create_string_attribute(SENDER_ID, req_attrs['sender']))
+        subject.attributes.append(self.create_string_attribute(Identifiers.Subject.SUBJECT_ID, req_attrs['actor_id']))
+        subject.attributes.append(self.create_string_attribute(USER_CONTEXT_ID, req_attrs['user_context_id']))
+        subject.attributes.append(self.create_string_attribute(USER_CONTEXT_DIFFERS, str(req_attrs['user_context_differs'])))
+
+        for role_list in req_attrs['role_lists']:
+            self.create_org_role_attribute(role_list, subject)
 
         request.subjects.append(subject)
 
@@ -308,24 +364,17 @@ class PolicyDecisionPointManager(object):
         request.resources.append(resource)
 
         request.action = Action()
-        request.action.attributes.append(self.create_string_attribute(Identifiers.Action.ACTION_ID, op))
-
-        # Check to see if there is a OperationVerb decorator specifying a Verb used with policy
-        if is_ion_object(message_format):
-            try:
-                msg_class = message_classes[message_format]
-                operation_verb = get_class_decorator_value(msg_class, DECORATOR_OP_VERB)
-                if operation_verb is not None:
-                    request.action.attributes.append(self.create_string_attribute(ACTION_VERB, operation_verb))
+        request.action.attributes.append(self.create_string_attribute(Identifiers.Action.ACTION_ID, req_attrs['op']))
 
-            except NotFound:
-                pass
+        if req_attrs['verb'] is not None:
+            request.action.attributes.append(self.create_string_attribute(ACTION_VERB, req_attrs['verb']))
 
         # Create generic attributes for each of the primitive message parameter types to be available in XACML rules
         # and evaluation functions
         parameter_dict = {'message': invocation.message,
                           'headers': invocation.headers,
                           'annotations': invocation.message_annotations}
+        endpoint_process = req_attrs['process']
         if endpoint_process is not None:
             parameter_dict['process'] = endpoint_process
 
@@ -333,6 +382,35 @@ class PolicyDecisionPointManager(object):
 
         return request
 
+    def _get_decision_cache_key(self, pdp, req_attrs, receiver, receiver_type):
+        """Returns the decision cache key for a request or None if decisions of this PDP cannot be cached"""
+        if self.decision_cache is None:
+            return None
+        cache_info = self._pdp_cache_info.get(pdp, None)
+        if cache_info is None:
+            return None
+        uses_sender, uses_user_context = cache_info
+        roles = frozenset(role for role_list in req_attrs['role_lists'] for role in role_list)
+        return (receiver, receiver_type, req_attrs['op'], req_attrs['verb'], req_attrs['actor_id'], roles,
+                req_attrs['user_context_differs'],
+                req_attrs['sender'] if uses_sender else None,
+                req_attrs['user_context_id'] if uses_user_context else None)
+
+    def _check_request_policies(self, invocation, pdp, receiver, receiver_type):
+        """Returns the policy decision for the request, from the decision cache if possible"""
+        req_attrs = self._get_request_attributes(invocation)
+        cache_key = self._get_decision_cache_key(pdp, req_attrs, receiver, receiver_type)
+        if cache_key is not None:
+            decision = self.decision_cache.get(cache_key)
+            if decision is not None:
+                if GovernanceDispatcher.POLICY__STATUS_REASON_ANNOTATION in invocation.message_annotations:
+                    return Decision.DENY
+                return decision
+
+        requestCtx = self._create_request_from_message(invocation, receiver, receiver_type, req_attrs)
+
+        return self._evaluate_pdp(invocation, pdp, requestCtx, cache_key)
+
     def check_agent_request_policies(self, invocation):
         process = invocation.get_arg_value('process')
         if not process:
@@ -361,27 +439,23 @@ class PolicyDecisionPointManager(object):
         if not receiver:
             raise NotFound('No receiver for this message')
 
-        requestCtx = self._create_request_from_message(invocation, receiver, receiver_type)
-
         pdp = self.get_service_pdp(receiver)
         if pdp is None:
             return Decision.NOT_APPLICABLE
 
-        return self._evaluate_pdp(invocation, pdp, requestCtx)
+        return self._check_request_policies(invocation, pdp, receiver, receiver_type)
 
     def check_resource_request_policies(self, invocation, resource_id):
         if not resource_id:
             raise NotFound('The resource_id is not set')
 
-        requestCtx = self._create_request_from_message(invocation, resource_id, 'resource')
-
         pdp = self.get_resource_pdp(resource_id)
         if pdp is None:
             return Decision.NOT_APPLICABLE
 
-        return self._evaluate_pdp(invocation, pdp, requestCtx)
+        return self._check_request_policies(invocation, pdp, resource_id, 'resource')
 
-    def _evaluate_pdp(self, invocation, pdp, requestCtx):
+    def _evaluate_pdp(self, invocation, pdp, requestCtx, cache_key=None):
         try:
             response = pdp.evaluate(requestCtx)
         except Exception as e:
@@ -399,4 +473,7 @@ class PolicyDecisionPointManager(object):
             if result.decision == Decision.DENY:
                 break
 
+        if cache_key is not None:
+            self.decision_cache.put(cache_key, result.decision)
+
         return result.decision
@@ -284,6 +284,60 @@ class PolicyDecisionUnitTest(PyonTestCase):
         self.assertEqual(response.value, "Permit")
 
 
+    def test_decision_cache(self):
+        gc = Mock()
+        gc.system_root_org_name = 'sys_org_name'
+        service_key = 'service_key'
+        pdpm = PolicyDecisionPointManager(gc)
+        pdpm.set_service_policy_rules(service_key, self.permit_SUPERUSER_rule)
+
+        invocation = Mock()
+        invocation.message_annotations = {}
+        invocation.message = {'argument1': 0}
+        invocation.headers = {'op': 'op', 'ion-actor-id': 'ion-actor-id', 'ion-actor-roles': {'sys_org_name': ['SUPERUSER']}}
+        invocation.get_message_receiver.return_value = service_key
+        invocation.get_message_sender.return_value = ['Unknown', 'Unknown']
+        invocation.get_header_value = Mock(side_effect=lambda key, default: invocation.headers.get(key, default))
+        process = Mock()
+        process.org_governance_name = 'sys_org_name'
+        invocation.args = {'process': process}
+        invocation.get_arg_value = Mock(side_effect=lambda key, default: invocation.args.get(key, default))
+
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "Permit")
+        self.assertEqual(pdpm.decision_cache.get_stats()['misses'], 1)
+
+        # Repeated request is answered from the cache
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "Permit")
+        self.assertEqual(pdpm.decision_cache.get_stats()['hits'], 1)
+
+        # Different roles are a different cache entry
+        invocation.headers['ion-actor-roles'] = {'sys_org_name': ['MEMBER']}
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "NotApplicable")
+        self.assertEqual(len(pdpm.decision_cache), 2)
+
+        # Changing policies invalidates cached decisions
+        invocation.headers['ion-actor-roles'] = {'sys_org_name': ['SUPERUSER']}
+        pdpm.set_service_policy_rules(service_key, self.deny_SUPERUSER_rule)
+        self.assertEqual(len(pdpm.decision_cache), 0)
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "Deny")
+
+        # Rules evaluating message content are never cached
+        pdpm.set_service_policy_rules(service_key, self.deny_message_parameter_rule)
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "Deny")
+        invocation.message = {'argument1': 5}
+        invocation.message_annotations = {}
+        response = pdpm.check_service_request_policies(invocation)
+        self.assertEqual(response.value, "Permit")
+        self.assertEqual(len(pdpm.decision_cache), 0)
+
+        pdpm.clear_policy_cache()
+        self.assertEqual(len(pdpm.decision_cache), 0)
+
     def test_agent_policies(self):
 
         # set up data
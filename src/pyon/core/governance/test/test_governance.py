@@ -2,7 +2,7 @@
 
 __author__ = 'Stephen P. Henrie'
 
-from mock import Mock
+from mock import Mock, patch
 from nose.plugins.attrib import attr
 
 from pyon.util.unit_test import PyonTestCase
@@ -12,7 +12,10 @@ from pyon.core.exception import Unauthorized, BadRequest, Inconsistent
 from pyon.core.governance.governance_controller import GovernanceController
 from pyon.core.governance import MODERATOR_ROLE, MEMBER_ROLE, SUPERUSER_ROLE, GovernanceHeaderValues
 from pyon.core.governance import find_roles_by_actor, get_actor_header, get_system_actor_header, get_role_message_headers, get_valid_resource_commitments, get_valid_principal_commitments
-from pyon.ion.resource import PRED, RT
+from pyon.core.governance import GovernanceCache, invalidate_governance_cache
+from pyon.ion.resource import PRED, RT, OT
+from pyon.ion.resregistry import ResourceRegistry
+from pyon.util.containers import get_ion_ts_millis
 from pyon.ion.service import BaseService
 from pyon.util.int_test import IonIntegrationTestCase
 from pyon.util.context import LocalContextMixin
@@ -275,6 +278,95 @@ class GovernanceUnitTest(PyonTestCase):
         self.assertEqual(gov_values.actor_roles, {'ION': [SUPERUSER_ROLE, MODERATOR_ROLE, MEMBER_ROLE]})
         self.assertEqual(gov_values.resource_id,'')
 
+    def test_governance_cache(self):
+        gc = self.governance_controller
+        gc._system_root_org_name = 'ION'
+        gc.governance_cache = GovernanceCache(max_size=10, ttl=60)
+        rr = gc.container.resource_registry
+
+        role = Mock()
+        role.org_governance_name = 'ION'
+        role.governance_name = MODERATOR_ROLE
+        rr.find_objects.return_value = ([role], [])
+
+        with patch('pyon.core.governance.bootstrap.container_instance') as container:
+            container.governance_controller = gc
+
+            actor_roles = find_roles_by_actor('actor1')
+            self.assertEqual(actor_roles, {'ION': [MODERATOR_ROLE, MEMBER_ROLE]})
+            actor_roles['ION'].append(SUPERUSER_ROLE)
+            self.assertEqual(find_roles_by_actor('actor1'), {'ION': [MODERATOR_ROLE, MEMBER_ROLE]})
+            self.assertEqual(rr.find_objects.call_count, 1)
+
+            # New role association in this container
+            invalidate_governance_cache('actor1', PRED.hasRole, 'role1')
+            find_roles_by_actor('actor1')
+            self.assertEqual(rr.find_objects.call_count, 2)
+
+            # Role revoked in another container
+            gc.governance_cache_event_callback(IonObject(OT.UserRoleRevokedEvent, origin='org1', origin_type=RT.Org, actor_id='actor1'))
+            find_roles_by_actor('actor1')
+            self.assertEqual(rr.find_objects.call_count, 3)
+
+            # Commitments are filtered for expiration even when cached
+            cur_time = get_ion_ts_millis()
+            expired_com = Mock(consumer='actor1', expiration=str(cur_time - 1000))
+            valid_com = Mock(consumer='actor1', expiration=str(cur_time + 50000))
+            other_com = Mock(consumer='actor2', expiration='0')
+            rr.find_subjects.return_value = ([expired_com, valid_com, other_com], [])
+
+            self.assertEqual(get_valid_resource_commitments('res1', 'actor1'), [valid_com])
+            self.assertEqual(get_valid_resource_commitments('res1', 'actor2'), [other_com])
+            self.assertEqual(rr.find_subjects.call_count, 1)
+
+            # Cache entry expires no later than the first commitment
+            _, expires = gc.governance_cache.resource_commitments._cache['res1']
+            self.assertLess(expires, cur_time / 1000.0 + 51)
+
+            gc.governance_cache_event_callback(IonObject(OT.ResourceCommitmentReleasedEvent, origin='org1', origin_type=RT.Org, resource_id='res1'))
+            self.assertEqual(len(gc.governance_cache.resource_commitments), 0)
+
+    @patch('pyon.ion.resregistry.EventPublisher', Mock())
+    def test_governance_cache_association_delete(self):
+        gc = self.governance_controller
+        gc.governance_cache = GovernanceCache(max_size=10, ttl=60)
+        rr_store = Mock()
+        rr = ResourceRegistry(datastore_manager=Mock(get_datastore=Mock(return_value=rr_store)), container=Mock())
+
+        role_assoc = IonObject(OT.Association, s='actor1', st=RT.ActorIdentity, p=PRED.hasRole, o='role1', ot=RT.UserRole)
+        role_assoc._id = 'assoc1'
+        rr_store.read.return_value = role_assoc
+
+        with patch('pyon.core.governance.bootstrap.container_instance') as container:
+            container.governance_controller = gc
+
+            # Role association deleted by id
+            gc.governance_cache.actor_roles.put('actor1', {'ION': [MODERATOR_ROLE, MEMBER_ROLE]})
+            rr.delete_association(u'assoc1')
+            rr_store.delete.assert_called_once_with(u'assoc1', object_type="Association")
+            self.assertIsNone(gc.governance_cache.actor_roles.get('actor1'))
+
+            # Invalidation failures do not fail the committed delete
+            with patch.object(gc.governance_cache, 'invalidate_association', side_effect=KeyError('x')):
+                self.assertEqual(rr.delete_association('assoc1'), rr_store.delete.return_value)
+
+            # Without a cache, the association is not read
+            gc.governance_cache = None
+            rr_store.read.reset_mock()
+            rr.delete_association('assoc1')
+            self.assertFalse(rr_store.read.called)
+            gc.governance_cache = GovernanceCache(max_size=10, ttl=60)
+
+            # Role association retired with its resource
+            gc.governance_cache.actor_roles.put('actor1', {'ION': [MODERATOR_ROLE, MEMBER_ROLE]})
+            role_obj = IonObject(RT.UserRole, lcstate='DEPLOYED', availability='AVAILABLE')
+            role_obj._id = 'role1'
+            rr_store.read.return_value = role_obj
+            rr.find_associations = Mock(return_value=[role_assoc])
+            rr.lcs_delete('role1')
+            self.assertTrue(role_assoc.retired)
+            self.assertIsNone(gc.governance_cache.actor_roles.get('actor1'))
+
 
 class GovernanceTestProcess(LocalContextMixin):
     name = 'gov_test'
@@ -6,10 +6,10 @@ import msgpack
 import sys
 import numpy as np
 
-from pyon.core.bootstrap import get_obj_registry
 from pyon.core.exception import BadRequest
 from pyon.core.interceptor.interceptor import Interceptor
-from pyon.core.object import IonObjectBase, IonMessageObjectBase
+from pyon.core.object import IonObjectBase, IonMessageObjectBase, IonSlotsObjectBase, get_type_converter, get_obj_dict
+from pyon.core.registry import model_classes, message_classes, enum_classes
 from pyon.util.containers import get_safe, DotDict
 from pyon.util.log import log
 
@@ -23,20 +23,21 @@ class EncodeTypes(object):
     SET = 's'
     LIST = 'l'
     NPARRAY = 'a'
+    NPBUFFER = 'b'
     COMPLEX = 'c'
     DTYPE = 'd'
     SLICE = 'i'
     NPVAL = 'n'
 
 
-# Global lazy load reference to the Pyon object registry (we be set on first use, not on load).
-# Note: We need this here so that the decode_ion/encode_ion functions can be imported (i.e. be static).
-obj_registry = None
+def _decoded_value(value):
+    return value
 
 
 def decode_ion(obj):
     """msgpack object hook to decode granule (numpy) types and IonObjects.
-    This works for nested IonObjects as well"""
+    This works for nested IonObjects as well.
+    Note: numpy arrays sent as raw bytes are decoded without copy and are read-only"""
 
     # NOTE: Just matching on dict with "type_" is a bit weak
     if "type_" in obj:
@@ -45,18 +46,17 @@ def decode_ion(obj):
             obj.pop("__noion__")
             return obj
 
-        global obj_registry
-        if obj_registry is None:
-            obj_registry = get_obj_registry()
-
-        ion_obj = obj_registry.new(obj["type_"])
-        for k, v in obj.iteritems():
-            # unicode translate to utf8
-            # Note: This is not recursive within dicts/list or any other types
-            if isinstance(v, unicode):
-                v = v.encode('utf8')
-            if k != "type_":
-                setattr(ion_obj, k, v)
+        # Nested values are already decoded. Unicode values are translated to utf8
+        # Note: This is not recursive within dicts/list or any other types
+        converter = get_type_converter(obj["type_"])
+        ion_obj = converter.from_dict(obj, _decoded_value)
+        if not converter.fields.issuperset(obj):
+            for k in obj.viewkeys() - converter.fields:
+                v = obj[k]
+                if isinstance(ion_obj, IonSlotsObjectBase):
+                    log.info("discard %s not in current schema", k)
+                    continue
+                setattr(ion_obj, k, v.encode('utf8') if isinstance(v, unicode) else v)
         return ion_obj
 
     if 't' not in obj:
@@ -67,6 +67,10 @@ def decode_ion(obj):
     if objt == EncodeTypes.LIST:
         return list(obj['o'])
 
+    elif objt == EncodeTypes.NPBUFFER:
+        # Zero-copy: the array is a read-only view on the message buffer
+        return np.frombuffer(obj['o'], dtype=np.dtype(obj['d'])).reshape(obj['s'])
+
     elif objt == EncodeTypes.NPARRAY:
         return np.array(obj['o'], dtype=np.dtype(obj['d']))
 
@@ -100,7 +104,7 @@ def encode_ion(obj):
         # There must be a type_ in here so that the object can be decoded
         if not isinstance(obj, IonMessageObjectBase) and not hasattr(obj, "type_"):
             log.error("IonObject with no type_: %s", obj)
-        return obj.__dict__
+        return get_obj_dict(obj)
 
     if isinstance(obj, list):
         return {'t': EncodeTypes.LIST, 'o': tuple(obj)}
@@ -109,7 +113,10 @@ def encode_ion(obj):
         return {'t': EncodeTypes.SET, 'o': tuple(obj)}
 
     if isinstance(obj, np.ndarray):
-        return {'t': EncodeTypes.NPARRAY, 'o': obj.tolist(), 'd': obj.dtype.str}
+        if obj.dtype.hasobject:
+            return {'t': EncodeTypes.NPARRAY, 'o': obj.tolist(), 'd': obj.dtype.str}
+        # Contiguous raw bytes with dtype (incl. byte order) and shape instead of a list of Python objects
+        return {'t': EncodeTypes.NPBUFFER, 'o': np.ascontiguousarray(obj).tostring(), 'd': obj.dtype.str, 's': obj.shape}
 
     if isinstance(obj, complex):
         return {'t': EncodeTypes.COMPLEX, 'o': (obj.real, obj.imag)}
@@ -132,14 +139,197 @@ def encode_ion(obj):
     raise TypeError('Unknown type "%s" in user specified encoder: "%s"' % (type(obj), obj))
 
 
+class MsgpackCodec(object):
+    """
+    Default message codec: msgpack with the encode_ion/decode_ion hooks.
+    IonObjects are encoded as dicts with type_ and decoded field by field.
+    """
+    name = "msgpack"
+
+    available = True
+
+    def encode(self, obj):
+        return msgpack.packb(obj, default=encode_ion)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, object_hook=decode_ion, use_list=1)
+
+
+class ExtTypes(object):
+    IONOBJ = 1
+    NPARRAY = 2
+    SET = 3
+    COMPLEX = 4
+    NPVAL = 5
+    DTYPE = 6
+    SLICE = 7
+
+
+class MsgpackExtCodec(object):
+    """
+    Compact message codec based on msgpack ExtType (requires msgpack >= 0.4).
+    IonObjects are encoded as type name plus a positional tuple of their schema fields (in sorted
+    field name order), lists are native msgpack arrays and numpy arrays are carried as raw bytes.
+    Sender and receiver must share the same object schema version.
+    Decoded numpy arrays are read-only views on the message buffer.
+    """
+    name = "msgpack-ext"
+
+    available = hasattr(msgpack, "ExtType")
+
+    def __init__(self):
+        if not self.available:
+            raise BadRequest("Codec %s requires msgpack with ExtType support" % self.name)
+        self._fields_by_class = {}      # IonObject class -> (sorted schema field tuple, schema field set)
+        self._class_by_type = {}        # type name -> (IonObject class, sorted schema field tuple)
+
+    def encode(self, obj):
+        return msgpack.packb(obj, default=self._encode_ext)
+
+    def decode(self, data):
+        return msgpack.unpackb(data, ext_hook=self._decode_ext, use_list=True)
+
+    def _get_fields(self, clzz):
+        fields = self._fields_by_class.get(clzz, None)
+        if fields is None:
+            field_names = tuple(sorted(clzz._schema))
+            fields = self._fields_by_class[clzz] = (field_names, frozenset(field_names))
+        return fields
+
+    def _get_class(self, type_name):
+        clzz_info = self._class_by_type.get(type_name, None)
+        if clzz_info is None:
+            clzz = model_classes.get(type_name, None) or message_classes.get(type_name, None) or enum_classes.get(type_name, None)
+            if clzz is None:
+                raise BadRequest("Cannot decode unknown object type %s" % type_name)
+            clzz_info = self._class_by_type[type_name] = (clzz, self._get_fields(clzz)[0])
+        return clzz_info
+
+    def _encode_ext(self, obj):
+        packb = msgpack.packb
+        if isinstance(obj, IonObjectBase):
+            field_names, field_set = self._get_fields(obj.__class__)
+            obj_dict = obj.__dict__
+            try:
+                values = [obj_dict[f] for f in field_names]
+                extras = {k: v for k, v in obj_dict.iteritems() if k not in field_set} or None
+            except KeyError:
+                # Incompletely initialized object - send all attributes by name
+                values, extras = None, obj_dict
+            return msgpack.ExtType(ExtTypes.IONOBJ, packb((obj.__class__.__name__, values, extras), default=self._encode_ext))
+
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                return msgpack.ExtType(ExtTypes.NPARRAY, packb((obj.dtype.str, obj.shape, None, obj.tolist()), default=self._encode_ext))
+            return msgpack.ExtType(ExtTypes.NPARRAY, packb((obj.dtype.str, obj.shape, np.ascontiguousarray(obj).tostring(), None)))
+
+        if isinstance(obj, set):
+            return msgpack.ExtType(ExtTypes.SET, packb(tuple(obj), default=self._encode_ext))
+
+        if isinstance(obj, complex):
+            return msgpack.ExtType(ExtTypes.COMPLEX, packb((obj.real, obj.imag)))
+
+        if isinstance(obj, np.number):
+            if isinstance(obj, numpy_floats):
+                return msgpack.ExtType(ExtTypes.NPVAL, packb((obj.dtype.str, float(obj.astype(float)))))
+            elif isinstance(obj, numpy_ints):
+                return msgpack.ExtType(ExtTypes.NPVAL, packb((obj.dtype.str, int(obj.astype(int)))))
+            else:
+                raise TypeError('Unsupported type "%s"' % type(obj))
+
+        if isinstance(obj, slice):
+            return msgpack.ExtType(ExtTypes.SLICE, packb((obj.start, obj.stop, obj.step)))
+
+        if isinstance(obj, np.dtype):
+            return msgpack.ExtType(ExtTypes.DTYPE, packb(obj.str))
+
+        # Must raise type error for any unknown object
+        raise TypeError('Unknown type "%s" in user specified encoder: "%s"' % (type(obj), obj))
+
+    def _decode_ext(self, code, data):
+        if code == ExtTypes.IONOBJ:
+            type_name, values, extras = msgpack.unpackb(data, ext_hook=self._decode_ext, use_list=True)
+            clzz, field_names = self._get_class(type_name)
+            ion_obj = clzz.__new__(clzz)
+            obj_dict = ion_obj.__dict__
+            if values is not None:
+                if len(values) != len(field_names):
+                    raise BadRequest("Object type %s schema mismatch: got %s fields, expected %s" % (
+                        type_name, len(values), len(field_names)))
+                obj_dict.update(zip(field_names, values))
+            if extras:
+                obj_dict.update(extras)
+            return ion_obj
+
+        if code == ExtTypes.NPARRAY:
+            dtype, shape, buf, items = msgpack.unpackb(data, ext_hook=self._decode_ext, use_list=True)
+            if buf is None:
+                return np.array(items, dtype=np.dtype(dtype))
+            return np.frombuffer(buf, dtype=np.dtype(dtype)).reshape(shape)
+
+        if code == ExtTypes.SET:
+            return set(msgpack.unpackb(data, ext_hook=self._decode_ext, use_list=True))
+
+        if code == ExtTypes.COMPLEX:
+            real, imag = msgpack.unpackb(data)
+            return complex(real, imag)
+
+        if code == ExtTypes.NPVAL:
+            dtype, value = msgpack.unpackb(data)
+            return np.dtype(dtype).type(value)
+
+        if code == ExtTypes.SLICE:
+            start, stop, step = msgpack.unpackb(data)
+            return slice(start, stop, step)
+
+        if code == ExtTypes.DTYPE:
+            return np.dtype(msgpack.unpackb(data))
+
+        return msgpack.ExtType(code, data)
+
+
+# Known message codecs by name of the encoding header value
+codec_classes = {MsgpackCodec.name: MsgpackCodec,
+                 MsgpackExtCodec.name: MsgpackExtCodec}
+
+
 class EncodeInterceptor(Interceptor):
+    """
+    Encodes outgoing messages with the configured codec and sets the encoding header.
+    Decodes incoming messages with the codec named in their encoding header (default msgpack).
+    """
 
     def __init__(self):
         self.max_message_size = sys.maxint  # Will be set appropriately from interceptor config
+        self.default_codec = MsgpackCodec()
+        self.codec = self.default_codec
+        self._codecs = {self.default_codec.name: self.default_codec}
 
     def configure(self, config):
         self.max_message_size = get_safe(config, 'max_message_size', 20000000)
-        log.debug("EncodeInterceptor enabled")
+
+        codec_name = get_safe(config, 'codec', MsgpackCodec.name)
+        if codec_name not in codec_classes:
+            raise BadRequest("Unknown message codec: %s" % codec_name)
+        if codec_classes[codec_name].available:
+            self.codec = self._get_codec(codec_name)
+        else:
+            # Never select a codec that cannot be used with the installed msgpack
+            self.codec = self.default_codec
+            log.warn("Message codec %s not available - using %s", codec_name, self.default_codec.name)
+        log.debug("EncodeInterceptor enabled, codec=%s", self.codec.name)
+
+    def _get_codec(self, name):
+        codec = self._codecs.get(name, None)
+        if codec is None:
+            codec_cls = codec_classes.get(name, None)
+            if codec_cls is None:
+                return self.default_codec
+            if not codec_cls.available:
+                raise BadRequest("Message codec %s not available with installed msgpack %s" % (
+                    name, ".".join(str(v) for v in msgpack.version)))
+            codec = self._codecs[name] = codec_cls()
+        return codec
 
     def outgoing(self, invocation):
         payload = invocation.message
@@ -153,10 +343,11 @@ class EncodeInterceptor(Interceptor):
 
         # Msgpack the content to binary str - does nested IonObject encoding
         try:
-            invocation.message = msgpack.packb(payload, default=encode_ion)
+            invocation.message = self.codec.encode(payload)
         except Exception:
             log.error("Illegal type in IonObject attributes: %s", payload)
             raise BadRequest("Illegal type in IonObject attributes")
+        invocation.headers['encoding'] = self.codec.name
 
         # Make sure no Nones exist in headers - this indicates a problem somewhere up the stack.
         # pika will choke hard on them as well, masking the actual problem, so we catch here.
@@ -174,7 +365,8 @@ class EncodeInterceptor(Interceptor):
 
     def incoming(self, invocation):
         # Un-Msgpack the content from binary string - does IonObject decoding
-        invocation.message = msgpack.unpackb(invocation.message, object_hook=decode_ion, use_list=1)
+        codec = self._get_codec(invocation.headers.get('encoding', None))
+        invocation.message = codec.decode(invocation.message)
 
         # At this point there could be a recursive unicode treatment, if necessary
 
@@ -2,6 +2,8 @@
 
 __author__ = 'Dave Foster <dfoster@asascience.com>, Thomas R. Lennan, Michael Meisinger'
 
+import time
+
 from pyon.core import PROCTYPE_SERVICE, PROCTYPE_AGENT, PROCTYPE_SIMPLE
 
 
@@ -107,6 +109,13 @@ class Interceptor(object):
     def configure(self, config):
         pass
 
+    def is_active(self, path):
+        """
+        Returns False if this interceptor does nothing for the given path (incoming/outgoing),
+        so that compiled interceptor chains can skip it entirely. Called once per chain compilation.
+        """
+        return True
+
     def outgoing(self, invocation):
         pass
 
@@ -119,3 +128,50 @@ def process_interceptors(interceptors, invocation):
         func = getattr(interceptor, invocation.path)
         invocation = func(invocation)
     return invocation
+
+
+# Interceptor timing counters: "<interceptor class>.<path>" -> [call count, total time in sec]
+interceptor_stats = {}
+
+
+def get_interceptor_stats():
+    """Returns a dict of call count and total time (sec) by interceptor class and path"""
+    return {key: dict(count=stats[0], time=stats[1]) for key, stats in interceptor_stats.iteritems()}
+
+
+class InterceptorChain(object):
+    """
+    An interceptor stack for one path (incoming/outgoing), compiled into the bound methods of its
+    active interceptors. Counts calls and time spent per interceptor in interceptor_stats.
+    """
+    def __init__(self, interceptors, path):
+        self.interceptors = interceptors
+        self.path = path
+        self._funcs = []
+        for interceptor in interceptors:
+            if not interceptor.is_active(path):
+                continue
+            stats = interceptor_stats.setdefault("%s.%s" % (type(interceptor).__name__, path), [0, 0.0])
+            self._funcs.append((getattr(interceptor, path), stats))
+
+    def process(self, invocation):
+        for func, stats in self._funcs:
+            start_time = time.time()
+            try:
+                invocation = func(invocation)
+            finally:
+                stats[0] += 1
+                stats[1] += time.time() - start_time
+        return invocation
+
+
+def get_interceptor_chain(chains, interceptors, stack_name, path):
+    """
+    Returns the InterceptorChain for the named stack from the given cache dict.
+    Compiles the chain on first use and again if the stack was replaced.
+    """
+    stack = interceptors.get(stack_name, None) or ()
+    chain = chains.get(stack_name, None)
+    if chain is None or chain.interceptors is not stack:
+        chain = chains[stack_name] = InterceptorChain(stack, path)
+    return chain
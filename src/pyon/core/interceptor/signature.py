@@ -26,9 +26,12 @@ class SignatureInterceptor(Interceptor):
         self._dict_sorter = DictSorter()
         self.auth = authentication.Authentication()
 
+    def is_active(self, path):
+        return self.auth.authentication_enabled()
+
     def outgoing(self, invocation):
-        msg = str(self._dict_sorter.serialize(invocation.message))
         if self.auth.authentication_enabled():
+            msg = str(self._dict_sorter.serialize(invocation.message))
             signer = 'no-signer'
             if Container.instance is not None:
                 signer = Container.instance.id
@@ -39,8 +42,8 @@ class SignatureInterceptor(Interceptor):
         return invocation
 
     def incoming(self, invocation):
-        msg = str(self._dict_sorter.serialize(invocation.message))
         if self.auth.authentication_enabled():
+            msg = str(self._dict_sorter.serialize(invocation.message))
             headers = invocation.headers
             if not 'signature' in headers or not 'signer' in headers or not 'certificate' in headers:
                 raise BadRequest("Digital signature missing from request")
@@ -4,11 +4,13 @@ __author__ = 'Luke Campbell <lcampbell@asascience.com>'
 
 import unittest
 from nose.plugins.attrib import attr
+from mock import Mock, patch
 
 from pyon.util.unit_test import PyonTestCase
-from pyon.core.interceptor.encode import EncodeInterceptor
+from pyon.core.interceptor.encode import EncodeInterceptor, MsgpackExtCodec
+from pyon.core.interceptor.signature import SignatureInterceptor
 from pyon.core.interceptor.validate import ValidateInterceptor
-from pyon.core.interceptor.interceptor import Invocation
+from pyon.core.interceptor.interceptor import Invocation, Interceptor, InterceptorChain, get_interceptor_chain, get_interceptor_stats
 from pyon.public import IonObject, DotDict, BadRequest
 
 try:
@@ -46,6 +48,28 @@ class InterceptorTest(PyonTestCase):
         b = received.message
         self.assertTrue((a==b).all())
 
+    @unittest.skipIf(not _have_numpy, 'No numpy')
+    def test_numpy_buffer_encode(self):
+        from pyon.core.interceptor.encode import encode_ion, EncodeTypes
+        a = np.arange(24, dtype='>i4').reshape(2, 3, 4)
+        a_t = a.T       # Not C contiguous
+
+        enc = encode_ion(a)
+        self.assertEquals(enc['t'], EncodeTypes.NPBUFFER)
+        self.assertEquals(enc['o'], a.tostring())
+        self.assertEquals(encode_ion(np.array([{}, 1], dtype=object))['t'], EncodeTypes.NPARRAY)
+
+        invoke = Invocation()
+        invoke.message = {'a': a, 'a_t': a_t}
+        encode = EncodeInterceptor()
+        received = encode.incoming(encode.outgoing(invoke)).message
+
+        for orig, recv in ((a, received['a']), (a_t, received['a_t'])):
+            self.assertEquals(recv.dtype, orig.dtype)
+            self.assertEquals(recv.shape, orig.shape)
+            self.assertTrue((recv == orig).all())
+            self.assertFalse(recv.flags.writeable)
+
     @unittest.skipIf(not _have_numpy, 'No numpy')
     def test_packed_numpy(self):
         a = np.array([(90,8010,3,14112,3.14159265358979323846264)],dtype='float32')
@@ -397,3 +421,110 @@ class InterceptorTest(PyonTestCase):
         self.assertEquals(msg_encoded1, msg_encoded2)
         self.assertIsInstance(msg_rec1["configuration"], dict)
         self.assertIsInstance(msg_rec2["configuration"], dict)
+
+    def test_encoding_header(self):
+        invoke = Invocation()
+        invoke.message = {'a': [1, 2]}
+        encode = EncodeInterceptor()
+
+        mangled = encode.outgoing(invoke)
+        self.assertEquals(mangled.headers['encoding'], 'msgpack')
+
+        # Unknown or missing encoding falls back to msgpack
+        mangled.headers['encoding'] = 'unknown'
+        received = encode.incoming(mangled)
+        self.assertEquals(received.message, {'a': [1, 2]})
+
+        self.assertRaises(BadRequest, encode.configure, {'codec': 'unknown'})
+
+    def test_ext_codec(self):
+        encode = EncodeInterceptor()
+        encode.configure({'codec': 'msgpack-ext'})
+
+        obj = IonObject('Resource', name='res1', alt_ids=['a', 'b'], addl={'x': {1, 2}})
+        obj._id = 'id1'
+        msg = {'obj': obj, 'lst': [obj, 1, 2.5, 3j], 'sl': slice(1, 5, 2)}
+        if _have_numpy:
+            msg['arr'] = np.arange(12, dtype='int16').reshape(3, 4)
+            msg['npval'] = np.float32(1.5)
+
+        invoke = Invocation()
+        invoke.message = msg
+        mangled = encode.outgoing(invoke)
+        self.assertEquals(mangled.headers['encoding'], 'msgpack-ext')
+
+        received = encode.incoming(mangled).message
+        self.assertEquals(received['obj'], obj)
+        self.assertEquals(received['obj']._id, 'id1')
+        self.assertEquals(received['obj'].addl['x'], {1, 2})
+        self.assertEquals(received['lst'][0], obj)
+        self.assertEquals(received['lst'][1:], [1, 2.5, 3j])
+        self.assertEquals(received['sl'], slice(1, 5, 2))
+        if _have_numpy:
+            self.assertEquals(received['arr'].dtype, np.dtype('int16'))
+            self.assertTrue((received['arr'] == msg['arr']).all())
+            self.assertEquals(received['npval'], np.float32(1.5))
+
+        # Messages in the default encoding are still understood
+        invoke = Invocation()
+        invoke.message = msg
+        mangled = EncodeInterceptor().outgoing(invoke)
+        self.assertEquals(encode.incoming(mangled).message['obj'], obj)
+
+    def test_ext_codec_unavailable(self):
+        with patch.object(MsgpackExtCodec, 'available', False):
+            encode = EncodeInterceptor()
+            encode.configure({'codec': 'msgpack-ext'})
+            self.assertEquals(encode.codec.name, 'msgpack')
+
+            invoke = Invocation()
+            invoke.message = {'a': [1, 2]}
+            mangled = encode.outgoing(invoke)
+            self.assertEquals(mangled.headers['encoding'], 'msgpack')
+            self.assertEquals(encode.incoming(mangled).message, {'a': [1, 2]})
+
+            mangled.headers['encoding'] = 'msgpack-ext'
+            self.assertRaises(BadRequest, encode.incoming, mangled)
+
+    def test_signature_inactive(self):
+        sig = SignatureInterceptor()
+        sig.auth = Mock()
+        sig.auth.authentication_enabled.return_value = False
+        sig._dict_sorter = Mock()
+
+        invoke = Invocation()
+        invoke.message = {'a': [1, 2]}
+        self.assertFalse(sig.is_active(None))
+        self.assertEquals(sig.outgoing(invoke).headers, {})
+        sig.incoming(invoke)
+        self.assertFalse(sig._dict_sorter.serialize.called)
+
+    def test_interceptor_chain(self):
+        class AddInterceptor(Interceptor):
+            def __init__(self, value, active=True):
+                self.value, self.active = value, active
+            def is_active(self, path):
+                return self.active
+            def incoming(self, invocation):
+                invocation.message.append(self.value)
+                return invocation
+
+        stack = [AddInterceptor(1), AddInterceptor(2, active=False), AddInterceptor(3)]
+        chain = InterceptorChain(stack, Invocation.PATH_IN)
+
+        invoke = Invocation(path=Invocation.PATH_IN, message=[])
+        self.assertEquals(chain.process(invoke).message, [1, 3])
+        self.assertGreaterEqual(get_interceptor_stats()['AddInterceptor.incoming']['count'], 2)
+
+        # Chains are compiled once and recompiled when the stack is replaced
+        chains = {}
+        interceptors = {'message_incoming': stack}
+        chain1 = get_interceptor_chain(chains, interceptors, 'message_incoming', Invocation.PATH_IN)
+        self.assertIs(get_interceptor_chain(chains, interceptors, 'message_incoming', Invocation.PATH_IN), chain1)
+        interceptors['message_incoming'] = stack[:1]
+        chain2 = get_interceptor_chain(chains, interceptors, 'message_incoming', Invocation.PATH_IN)
+        self.assertIsNot(chain2, chain1)
+        self.assertEquals(chain2.process(Invocation(path=Invocation.PATH_IN, message=[])).message, [1])
+
+        empty_chain = get_interceptor_chain(chains, interceptors, 'process_incoming', Invocation.PATH_IN)
+        self.assertIs(empty_chain.process(invoke), invoke)
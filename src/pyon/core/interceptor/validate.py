@@ -2,14 +2,37 @@
 
 """Messaging interceptor to validate IonObjects"""
 
-from pyon.core.interceptor.interceptor import Interceptor
+from pyon.core.interceptor.interceptor import Interceptor, Invocation
 from pyon.core.bootstrap import IonObject, CFG
 from pyon.core.exception import BadRequest
-from pyon.core.object import IonObjectBase, walk
+from pyon.core.object import IonObjectBase
 from pyon.core.registry import is_ion_object
 from pyon.util.log import log
 
 
+_container_types = (dict, list, tuple, set, IonObjectBase)
+
+
+def validate_ionobjs(obj):
+    """
+    Validates all IonObjects in a possibly nested structure of dicts, iterables and IonObjects.
+    Does not copy the structure (in contrast to walk).
+    """
+    if isinstance(obj, IonObjectBase):
+        obj._validate(validate_objects=False)
+        values = obj.__dict__.values()
+    elif isinstance(obj, dict):
+        values = obj.itervalues()
+    elif isinstance(obj, (list, tuple, set)):
+        values = obj
+    else:
+        return
+
+    for value in values:
+        if isinstance(value, _container_types):
+            validate_ionobjs(value)
+
+
 class ValidateInterceptor(Interceptor):
     """
     Validates IonObject content within message
@@ -24,6 +47,10 @@ class ValidateInterceptor(Interceptor):
         self.raise_exception = CFG.get_safe("container.objects.validate.interceptor_error", False) is True
         log.debug("ValidateInterceptor enabled: %s" % self.enabled)
 
+    def is_active(self, path):
+        # Nothing to validate on the outbound side
+        return self.enabled and path == Invocation.PATH_IN
+
     def outgoing(self, invocation):
         # Set validate flag in header if IonObject(s) found in message
 
@@ -49,13 +76,8 @@ class ValidateInterceptor(Interceptor):
             # any errors and keep going, since logging and seeing invalid situations are better
             # than skipping validation altogether.
 
-            def validate_ionobj(obj):
-                if isinstance(obj, IonObjectBase):
-                    obj._validate(validate_objects=False)
-                return obj
-
             try:
-                walk(payload, validate_ionobj)
+                validate_ionobjs(payload)
             except AttributeError as e:
                 raise_hdr = invocation.headers.get('raise-exception', None)
                 if (self.raise_exception and raise_hdr is not False) or invocation.headers.get('raise-exception', None):
@@ -229,9 +229,13 @@ class ObjectModelGenerator:
         the top of the objects.py.  Defs are also put into a dict
         so we can easily reference their values later in the parsing logic.
         '''
+        enums_by_name.clear()   # In case of repeated generation
         self.dataobject_output_text = "#!/usr/bin/env python\n\n"
         self.dataobject_output_text += "#\n# This file is auto generated\n#\n\n"
-        self.dataobject_output_text += "from pyon.core.object import IonObjectBase\n"
+        if getattr(opts, "slots", False):
+            self.dataobject_output_text += "from pyon.core.object import IonObjectBase, IonSlotsObjectBase\n"
+        else:
+            self.dataobject_output_text += "from pyon.core.object import IonObjectBase\n"
         self.dataobject_output_text += "#\n# Enums\n\n"
         self.dataobject_output_text += "class IonEnum(object):\n"
         self.dataobject_output_text += "    pass\n"
@@ -330,7 +334,9 @@ class ObjectModelGenerator:
         '''
         Walk the data model definition yaml files.  Generate
         corresponding classes in the objects.py file.
+        With opts.slots, classes keep their attributes in __slots__ (see IonSlotsObjectBase)
         '''
+        slots = getattr(opts, "slots", False)
 
         # Delimit the break between the enum classes and
         # and the data model classes
@@ -346,6 +352,10 @@ class ObjectModelGenerator:
         fields = []
         field_details = []
         init_lines = []
+        slot_fields = []
+        slot_defaults = []
+        lazy_defaults = []
+        super_fields = set()
         first_time = True
         decorators = ''
         class_decorators = {}
@@ -400,7 +410,11 @@ class ObjectModelGenerator:
                         converted_value = value
                         args.append(", ")
                         args.append(field + "=None")
-                        init_lines.append('        self.' + field + " = " + field + " or " + value_type + "()\n")
+                        if slots:
+                            init_lines.append('        if ' + field + ':\n            self.' + field + " = " + field + "\n")
+                            lazy_defaults.append("'" + field + "': " + value_type)
+                        else:
+                            init_lines.append('        self.' + field + " = " + field + " or " + value_type + "()\n")
                     else:
                         value_type = type(value).__name__
                         if value_type == 'dict' and "__IsEnum" in value:
@@ -412,12 +426,20 @@ class ObjectModelGenerator:
                                 value_type = 'dict'
                             args.append(", ")
                             args.append(field + "=None")
-                            init_lines.append('        self.' + field + " = " + field + " or " + converted_value + "\n")
+                            if slots:
+                                init_lines.append('        if ' + field + ':\n            self.' + field + " = " + field + "\n")
+                                lazy_defaults.append("'" + field + "': lambda: " + converted_value)
+                            else:
+                                init_lines.append('        self.' + field + " = " + field + " or " + converted_value + "\n")
                         else:
                             args.append(", ")
                             args.append(field + "=" + converted_value)
                             init_lines.append('        self.' + field + " = " + field + "\n")
+                            if slots:
+                                slot_defaults.append("'" + field + "': " + converted_value)
                     fields.append(field)
+                    if field not in super_fields:
+                        slot_fields.append(field)
                     field_details.append((field, value_type, converted_value, csv_description, decorators))
                     if enum_type:
                         current_class_schema += "\n                '" + field + "': {'type': '" + value_type + "', 'default': " + converted_value + ", 'enum_type': '" + enum_type + "', 'decorators': {" + decorators + "}" + ", 'description': '" + re.escape(description) + "'},"
@@ -458,6 +480,9 @@ class ObjectModelGenerator:
                         self.dataobject_output_text += arg
 
                     self.dataobject_output_text += "):\n"
+                    if not any(init_line.strip() and not init_line.strip().startswith('#') for init_line in init_lines):
+                        # Only possible with slots, where type_ is not set in __init__
+                        init_lines.append("        pass\n")
                     for init_line in init_lines:
                         self.dataobject_output_text += init_line
                 if len(current_class_schema) > 0:
@@ -465,11 +490,17 @@ class ObjectModelGenerator:
                         self.dataobject_output_text += current_class_schema + "\n              }.items())\n"
                     else:
                         self.dataobject_output_text += current_class_schema + "\n              }\n"
+                    if slots:
+                        self.dataobject_output_text += self._get_slots_text(super_class, schema_extended, slot_fields, slot_defaults, lazy_defaults)
                 self.dataobject_output_text += '\n'
                 args = []
                 fields = []
                 field_details = []
                 init_lines = []
+                slot_fields = []
+                slot_defaults = []
+                lazy_defaults = []
+                super_fields = set()
                 current_class = line.split(":")[0]
 
                 try:
@@ -482,6 +513,7 @@ class ObjectModelGenerator:
                     args = args + self.class_args_dict[super_class]["args"]
                     init_lines.append('        ' + super_class + ".__init__(self")
                     fields = fields + self.class_args_dict[super_class]["fields"]
+                    super_fields = set(fields)
                     for super_field in fields:
                         init_lines.append(", " + super_field)
                     init_lines.append(")\n")
@@ -491,8 +523,12 @@ class ObjectModelGenerator:
                 else:
                     schema_extended = False
                     current_class_schema = "\n    _schema = {"
-                    line = line.replace(':', '(IonObjectBase')
-                init_lines.append("        self.type_ = '" + current_class + "'\n")
+                    line = line.replace(':', '(IonSlotsObjectBase' if slots else '(IonObjectBase')
+                if slots:
+                    # type_ is a class level default
+                    slot_defaults.append("'type_': '" + current_class + "'")
+                else:
+                    init_lines.append("        self.type_ = '" + current_class + "'\n")
                 class_comment_temp = "\n    '''\n    " + class_comment.replace("'''","\\'\\'\\'") + "\n    '''" if class_comment else ''
                 self.dataobject_output_text += "class " + line + "):" + class_comment_temp + "\n\n"
 
@@ -514,6 +550,8 @@ class ObjectModelGenerator:
                 self.dataobject_output_text += current_class_schema + "\n              }.items())\n"
             else:
                 self.dataobject_output_text += current_class_schema + "\n              }\n"
+            if slots:
+                self.dataobject_output_text += self._get_slots_text(super_class, schema_extended, slot_fields, slot_defaults, lazy_defaults)
 
         # clean up cumulative version from dictionary because it creates problems
         # while generating document
@@ -524,6 +562,19 @@ class ObjectModelGenerator:
         for cv_class in cv_classes:
             del self.class_args_dict[cv_class]
 
+    def _get_slots_text(self, super_class, schema_extended, slot_fields, slot_defaults, lazy_defaults):
+        """
+        Returns __slots__ and class level defaults for the current class, extending the super class
+        """
+        slots_text = "    __slots__ = (" + "".join("'" + field + "', " for field in slot_fields) + ")\n"
+        if schema_extended:
+            slots_text += "    _defaults = dict(" + super_class + "._defaults.items() + {" + ", ".join(slot_defaults) + "}.items())\n"
+            slots_text += "    _lazy_defaults = dict(" + super_class + "._lazy_defaults.items() + {" + ", ".join(lazy_defaults) + "}.items())\n"
+        else:
+            slots_text += "    _defaults = {" + ", ".join(slot_defaults) + "}\n"
+            slots_text += "    _lazy_defaults = {" + ", ".join(lazy_defaults) + "}\n"
+        return slots_text
+
     def generate_object_specs(self):
         print " Object interface generator: Generating additional object specs in HTML and CSV"
 
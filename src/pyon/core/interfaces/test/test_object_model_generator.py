@@ -34,3 +34,33 @@ class ObjectModelGenerateTest(IonIntegrationTestCase):
             self.model_object.generate(self.opts)
         except:
             self.fail("object_model_generator failed")
+
+    def test_object_gen_slots(self):
+        import imp
+        import simplejson
+        from pyon.core.object import IonSlotsObjectBase, get_object_converter
+        from pyon.util.containers import ion_object_encoder
+
+        self.opts.slots = True
+        self.opts.objectdoc = False
+        self.model_object.generate(self.opts)
+        objects = imp.new_module("slots_objects")
+        exec self.model_object.dataobject_output_text in objects.__dict__
+
+        obj = objects.ActorIdentity(name="actor", details=objects.UserIdentityDetails())
+        obj.details.contact.email = "a@b.org"
+        self.assertIsInstance(obj, IonSlotsObjectBase)
+        self.assertNotIsInstance(obj.details.contact.__dict__, dict)
+        obj._validate()
+
+        # Round trip through the JSON encoder, which needs a copy of the slots __dict__ view
+        obj_dict = simplejson.loads(simplejson.dumps(obj, default=ion_object_encoder))
+        self.assertEqual(obj_dict["type_"], "ActorIdentity")
+        self.assertEqual(obj_dict["details"]["contact"]["email"], "a@b.org")
+        def deser(value):
+            if isinstance(value, dict) and "type_" in value:
+                return get_object_converter(getattr(objects, value["type_"])).from_dict(value, deser)
+            return value
+        obj1 = deser(obj_dict)
+        self.assertIsInstance(obj1, objects.ActorIdentity)
+        self.assertEqual(obj1, obj)
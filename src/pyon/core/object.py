@@ -6,10 +6,10 @@ import ast
 import os
 import re
 import inspect
-from collections import OrderedDict, Mapping, Iterable
+from collections import OrderedDict, Mapping, MutableMapping, Iterable
 
 from pyon.util.log import log
-from pyon.core.exception import BadRequest
+from pyon.core.exception import BadRequest, NotFound
 
 BUILT_IN_ATTRS = {'_id', '_rev', 'type_', 'blame_'}
 
@@ -29,6 +29,7 @@ class IonObjectBase(object):
     The interface generator will create subclasses of this base class with additional fields,
     such as _schema, and _class_info and __init__ functions with subtype attributes.
     """
+    __slots__ = ()      # Generated subclasses have an instance __dict__, unless based on IonSlotsObjectBase
     _schema = {}
     _class_info = {}
 
@@ -61,134 +62,13 @@ class IonObjectBase(object):
         """
         Compare fields to the schema and raise AttributeError if mismatched.
         Named _validate instead of validate because the data may have a field named "validate".
+        The checks are compiled once per class, see IonObjectValidator.
         """
-        fields, schema = self.__dict__, self._schema
-
-        # Check for extra fields not defined in the schema
-        extra_fields = fields.viewkeys() - schema.viewkeys() - BUILT_IN_ATTRS
-        if len(extra_fields) > 0:
-            raise AttributeError("Invalid field(s): %r" % (list(extra_fields)))
-
-        # Check required field criteria met
-        for key in schema:
-            if DECO_VALIDATE_REQUIRED in schema[key].get('decorators', {}):
-                if key not in fields or fields[key] is None:
-                    raise AttributeError("Value required for '%s'" % key)
-
-        # Check each attribute
-        for key in fields.iterkeys():
-            if key in BUILT_IN_ATTRS:
-                continue
-
-            schema_val = schema[key]
-            schema_val_type = schema_val['type']
-            schema_val_decos = schema_val.get('decorators', {})
-
-            # Side effect - Correct any float or long types that got downgraded to int
-            if isinstance(fields[key], int):
-                if schema_val_type == 'float':
-                    fields[key] = float(fields[key])
-                elif schema_val_type == 'long':
-                    fields[key] = long(fields[key])
-
-            # Side effect - Work around for OrderedDict vs dict issue
-            if type(fields[key]) == dict and schema_val_type == 'OrderedDict':
-                fields[key] = OrderedDict(fields[key])
-
-            # Basic type checking
-            field_val = fields[key]
-            field_val_type = type(field_val).__name__
-            #log.debug("Validating %s: %s: %s: %s" % (key, schema_val_type, schema_val_decos, field_val))
-
-            if field_val_type == "long" and schema_val_type == "int":
-                # Accept a long for an int
-                pass
-
-            elif field_val_type != schema_val_type:
-
-                # If the schema type is None, all types are allowed
-                if schema_val_type == 'NoneType':
-                    continue
-
-                # Allow unicode instead of str. This may be too lenient.
-                if schema_val_type == 'str' and field_val_type == 'unicode':
-                    continue
-
-                # Already checked for required above.  Assume optional and continue
-                if field_val is None:
-                    continue
-
-                # Allow unicode instead of str. This may be too lenient.
-                if schema_val_type == 'str' and field_val_type == 'unicode':
-                    continue
-
-                # IonObjects are ok for dict fields too!
-                if isinstance(field_val, IonObjectBase) and schema_val_type == 'OrderedDict':
-                    continue
-
-                # Check for inheritance
-                if self._check_inheritance_chain(type(field_val), schema_val_type):
-                    continue
-
-                # Check enum types
-                from pyon.core.registry import enum_classes
-                if isinstance(field_val, int) and schema_val_type in enum_classes:
-                    if field_val in enum_classes[schema_val_type]._str_map:
-                        continue
-                    raise AttributeError("Invalid enum value '%d' for field '%s.%s', should be between 1 and %d" %
-                            (fields[key], type(self).__name__, key, len(enum_classes(schema_val_type)._str_map)))
-
-                # Tuple allowed for list type (Msgpack decodes list to tuples)
-                if type(field_val) == tuple and schema_val_type == 'list':
-                    continue
-
-                # IonObject allowed for dict type
-                if isinstance(field_val, IonObjectBase) and schema_val_type == 'dict':
-                    #log.warn('Please convert generic dict attribute type to abstract type for field "%s.%s"' % (type(self).__name__, key))
-                    continue
-
-                # Special case check for ION object being passed where default type is dict or str
-                if DECO_VALIDATE_CONTENT_TYPE in schema_val_decos:
-                    if isinstance(field_val, IonObjectBase) and schema_val_type in ('dict', 'str'):
-                        self._check_content(key, field_val, schema_val_decos[DECO_VALIDATE_CONTENT_TYPE])
-                        continue
-
-                raise AttributeError("Invalid type '%s' for field '%s.%s', should be '%s'" %
-                        (field_val_type, type(self).__name__, key, schema_val_type))
-
-            if field_val_type == 'str' and DECO_VALIDATE_VALUE_PATTERN in schema_val_decos:
-                self._check_string_pattern_match(key, field_val, schema_val_decos[DECO_VALIDATE_VALUE_PATTERN])
-
-            if field_val_type in ('int', 'float', 'long') and DECO_VALIDATE_VALUE_RANGE in schema_val_decos:
-                self._check_numeric_value_range(key, field_val, schema_val_decos[DECO_VALIDATE_VALUE_RANGE])
-
-            if DECO_VALIDATE_CONTENT_TYPE in schema_val_decos:
-                if schema_val_type == 'list':
-                    self._check_collection_content(key, field_val, schema_val_decos[DECO_VALIDATE_CONTENT_TYPE])
-                elif schema_val_type in ('dict', 'OrderedDict'):
-                    self._check_collection_content(key, field_val.values(), schema_val_decos[DECO_VALIDATE_CONTENT_TYPE])
-                else:
-                    self._check_content(key, field_val, schema_val_decos[DECO_VALIDATE_CONTENT_TYPE])
-
-            if DECO_VALIDATE_CONTENT_COUNT in schema_val_decos and schema_val_type in ('list', 'dict', 'OrderedDict'):
-                self._check_collection_length(key, len(field_val), schema_val_decos[DECO_VALIDATE_CONTENT_COUNT])
-
-            if validate_objects:
-                # Only if desired - if entire object is walked anyways, these checks are redundant
-                if isinstance(field_val, IonObjectBase):
-                    field_val._validate()
-
-                # Next validate only IonObjects found in child collections.
-                # Note that this is non-recursive; only for first-level collections.
-                elif isinstance(field_val, Mapping):
-                    for subkey in field_val:
-                        subval = field_val[subkey]
-                        if isinstance(subval, IonObjectBase):
-                            subval._validate()
-                elif isinstance(field_val, Iterable):
-                    for subval in field_val:
-                        if isinstance(subval, IonObjectBase):
-                            subval._validate()
+        clzz = type(self)
+        validator = _validators.get(clzz, None)
+        if validator is None or validator.schema is not clzz._schema:
+            validator = _validators[clzz] = IonObjectValidator(clzz)
+        validator.validate(self, validate_objects)
 
     def _get_type(self):
         return self.__class__.__name__
@@ -259,9 +139,7 @@ class IonObjectBase(object):
                     (value, type(self).__name__, key, pattern))
 
     def _check_numeric_value_range(self, key, value, value_range):
-        value_range_parts = value_range.split(',', 1)
-        min_val = ast.literal_eval(value_range_parts[0].strip())
-        max_val = ast.literal_eval(value_range_parts[-1].strip())
+        min_val, max_val = _parse_range(value_range)
 
         if value < min_val or value > max_val:
             raise AttributeError("Invalid value %s for field '%s.%s', should be between %d and %d" %
@@ -270,9 +148,9 @@ class IonObjectBase(object):
     def _check_inheritance_chain(self, typ, expected_type):
         return any(baseclz.__name__ == expected_type for baseclz in typ.__mro__)
 
-    def _check_collection_content(self, key, list_values, content_types):
+    def _check_collection_content(self, key, list_values, content_types, split_content_types=None):
         from pyon.core.registry import issubtype
-        split_content_types = {t.strip() for t in content_types.split(',')}
+        split_content_types = split_content_types or _split_types(content_types)
 
         for value in list_values:
             for content_type in split_content_types:
@@ -291,8 +169,8 @@ class IonObjectBase(object):
                 raise AttributeError("Invalid value type '%s' in collection field '%s.%s', should be one of '%s'" %
                         (value, type(self).__name__, key, content_types))
 
-    def _check_content(self, key, value, content_types):
-        split_content_types = {t.strip() for t in content_types.split(',')}
+    def _check_content(self, key, value, content_types, split_content_types=None):
+        split_content_types = split_content_types or _split_types(content_types)
 
         for content_type in split_content_types:
             if type(value).__name__ == content_type:
@@ -306,9 +184,7 @@ class IonObjectBase(object):
                 (str(value), type(self).__name__, key, content_types))
 
     def _check_collection_length(self, key, len_list, length):
-        length_parts = length.split(',', 1)
-        min_val = ast.literal_eval(length_parts[0].strip())
-        max_val = ast.literal_eval(length_parts[-1].strip())
+        min_val, max_val = _parse_range(length)
 
         if len_list < min_val or len_list > max_val:
             raise AttributeError("Invalid value length for collection field '%s.%s', should be between %d and %d" %
@@ -322,6 +198,481 @@ class IonMessageObjectBase(IonObjectBase):
     pass
 
 
+class IonSlotsObjectBase(IonObjectBase):
+    """
+    Base class for IonObject classes generated with __slots__ (generate_interfaces --slots).
+    Instances have no __dict__. Each schema attribute is a slot, which saves the per instance
+    dict for large numbers of objects held in memory.
+    Slots not set by __init__ fall back to class level defaults:
+    - _defaults: immutable defaults (including type_) shared by all instances
+    - _lazy_defaults: factories for mutable defaults (list, dict, nested objects), which are
+      created and stored on first access
+    The __dict__ attribute is a mutable view on the schema attributes, so that code working
+    with obj.__dict__ (walk, _validate, serialization) works unchanged.
+    Attributes not in the schema cannot be set.
+    """
+    __slots__ = tuple(sorted(BUILT_IN_ATTRS))
+    _defaults = {}
+    _lazy_defaults = {}
+
+    def __getattr__(self, name):
+        # Only called if name is not a set slot or other regular attribute
+        clzz = type(self)
+        if name in clzz._defaults:
+            return clzz._defaults[name]
+        factory = clzz._lazy_defaults.get(name, None)
+        if factory is not None:
+            value = factory()
+            object.__setattr__(self, name, value)
+            return value
+        raise AttributeError("'%s' object has no attribute '%s'" % (clzz.__name__, name))
+
+    @property
+    def __dict__(self):
+        return IonSlotsDictView(self)
+
+    def __getstate__(self):
+        """Returns the set slots only, so that defaults stay shared/lazy after unpickle/deepcopy"""
+        state = {}
+        for key in self._schema.viewkeys() | BUILT_IN_ATTRS:
+            try:
+                state[key] = object.__getattribute__(self, key)
+            except AttributeError:
+                pass
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.iteritems():
+            object.__setattr__(self, key, value)
+
+
+class IonSlotsDictView(MutableMapping):
+    """
+    Mapping of the schema attributes of an IonSlotsObjectBase instance, returned as its __dict__.
+    Contains all schema attributes (lazy defaults are created on access), type_ and any other
+    built-in attributes that are set. Writes go to the object.
+    """
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj):
+        self._obj = obj
+
+    def _is_key(self, key):
+        clzz = type(self._obj)
+        if key in clzz._schema or key in clzz._defaults:
+            return True
+        if key in BUILT_IN_ATTRS:
+            try:
+                object.__getattribute__(self._obj, key)
+                return True
+            except AttributeError:
+                pass
+        return False
+
+    def __getitem__(self, key):
+        if not self._is_key(key):
+            raise KeyError(key)
+        return getattr(self._obj, key)
+
+    def __setitem__(self, key, value):
+        try:
+            object.__setattr__(self._obj, key, value)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __delitem__(self, key):
+        try:
+            object.__delattr__(self._obj, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return self._is_key(key)
+
+    def __iter__(self):
+        clzz = type(self._obj)
+        for key in clzz._schema:
+            yield key
+        for key in BUILT_IN_ATTRS:
+            if key not in clzz._schema and self._is_key(key):
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.copy())
+
+    def copy(self):
+        return {key: self[key] for key in self}
+
+
+def get_obj_dict(obj):
+    """Returns the attributes of an object (e.g. IonObject) as dict, for encoders.
+    Objects with __slots__ have a mapping view as __dict__, which is copied into a dict."""
+    obj_dict = obj.__dict__
+    return obj_dict if type(obj_dict) is dict else obj_dict.copy()
+
+
+def _parse_range(value_range):
+    """Returns (min, max) from a "min,max" or "value" decorator string"""
+    value_range_parts = value_range.split(',', 1)
+    return ast.literal_eval(value_range_parts[0].strip()), ast.literal_eval(value_range_parts[-1].strip())
+
+
+def _split_types(content_types):
+    return {t.strip() for t in content_types.split(',')}
+
+
+# Compiled validators by IonObject class
+_validators = {}
+
+# How a value type relates to a schema field type, see IonFieldValidator.classify
+TYPE_MATCH, TYPE_SKIP, TYPE_ENUM, TYPE_CONTENT, TYPE_INVALID = range(5)
+
+# What nested IonObjects to validate for a value type (if validate_objects)
+NESTED_NONE, NESTED_OBJ, NESTED_MAPPING, NESTED_ITERABLE = range(4)
+
+
+class IonFieldValidator(object):
+    """
+    Validation checks for one schema field, with decorators pre-parsed.
+    Decisions that only depend on the type of a value are computed on first encounter
+    and cached by value type.
+    """
+    __slots__ = ('key', 'type_name', 'coerce', 'to_ordered_dict', 'pattern', 'pattern_re', 'value_range',
+                 'content_types', 'split_content_types', 'content_count', 'enum_clzz', '_type_info')
+
+    def __init__(self, key, schema_val):
+        decos = schema_val.get('decorators', {})
+        self.key = key
+        self.type_name = schema_val['type']
+        self.coerce = float if self.type_name == 'float' else long if self.type_name == 'long' else None
+        self.to_ordered_dict = self.type_name == 'OrderedDict'
+        self.pattern = decos.get(DECO_VALIDATE_VALUE_PATTERN, None)
+        self.pattern_re = re.compile(self.pattern) if self.pattern is not None else None
+        self.value_range = _parse_range(decos[DECO_VALIDATE_VALUE_RANGE]) if DECO_VALIDATE_VALUE_RANGE in decos else None
+        self.content_types = decos.get(DECO_VALIDATE_CONTENT_TYPE, None)
+        self.split_content_types = _split_types(self.content_types) if self.content_types is not None else None
+        count = decos.get(DECO_VALIDATE_CONTENT_COUNT, None)
+        self.content_count = _parse_range(count) if count is not None and self.type_name in ('list', 'dict', 'OrderedDict') else None
+        self.enum_clzz = None       # Resolved on first use, enums are registered late
+        self._type_info = {}        # value type -> (TYPE_*, NESTED_*, type name)
+
+    def get_type_info(self, val_type):
+        type_info = self._type_info.get(val_type, None)
+        if type_info is None:
+            type_info = (self.classify(val_type), self._nested_kind(val_type), val_type.__name__)
+            if type_info[0] != TYPE_INVALID:
+                # Not cached if invalid - may be an enum type not registered yet
+                self._type_info[val_type] = type_info
+        return type_info
+
+    def classify(self, val_type):
+        """Type only part of the schema type check, in the order of the original checks"""
+        schema_val_type, field_val_type = self.type_name, val_type.__name__
+        if field_val_type == schema_val_type or (field_val_type == "long" and schema_val_type == "int"):
+            return TYPE_MATCH
+        is_ionobj = issubclass(val_type, IonObjectBase)
+        if schema_val_type == 'NoneType':
+            return TYPE_SKIP
+        if schema_val_type == 'str' and field_val_type == 'unicode':
+            return TYPE_SKIP
+        if val_type is type(None):
+            return TYPE_SKIP
+        if is_ionobj and schema_val_type in ('OrderedDict', 'dict'):
+            return TYPE_SKIP
+        if any(baseclz.__name__ == schema_val_type for baseclz in val_type.__mro__):
+            return TYPE_SKIP
+        if issubclass(val_type, int) and self.get_enum_class() is not None:
+            return TYPE_ENUM
+        if val_type is tuple and schema_val_type == 'list':
+            return TYPE_SKIP
+        if self.content_types is not None and is_ionobj and schema_val_type == 'str':
+            return TYPE_CONTENT
+        return TYPE_INVALID
+
+    def get_enum_class(self):
+        if self.enum_clzz is None:
+            from pyon.core.registry import enum_classes
+            self.enum_clzz = enum_classes.get(self.type_name, None)
+        return self.enum_clzz
+
+    @staticmethod
+    def _nested_kind(val_type):
+        if issubclass(val_type, IonObjectBase):
+            return NESTED_OBJ
+        if issubclass(val_type, basestring):
+            return NESTED_NONE
+        if issubclass(val_type, Mapping):
+            return NESTED_MAPPING
+        if issubclass(val_type, Iterable):
+            return NESTED_ITERABLE
+        return NESTED_NONE
+
+
+class IonObjectValidator(object):
+    """
+    Validation checks for one IonObject class, compiled from its schema once and reused for all
+    instances. Performs the same checks (incl. value side effects) as originally done by walking
+    the schema for every IonObjectBase._validate call.
+    """
+    def __init__(self, clzz):
+        self.schema = clzz._schema
+        self.type_name = clzz.__name__
+        self.valid_fields = frozenset(self.schema) | BUILT_IN_ATTRS
+        self.required_fields = tuple(key for key, schema_val in self.schema.iteritems()
+                                     if DECO_VALIDATE_REQUIRED in schema_val.get('decorators', {}))
+        self.field_validators = {key: IonFieldValidator(key, schema_val) for key, schema_val in self.schema.iteritems()
+                                 if key not in BUILT_IN_ATTRS}
+
+    def validate(self, obj, validate_objects=True):
+        fields = obj.__dict__
+
+        # Check for extra fields not defined in the schema
+        if not self.valid_fields.issuperset(fields):
+            extra_fields = fields.viewkeys() - self.valid_fields
+            raise AttributeError("Invalid field(s): %r" % (list(extra_fields)))
+
+        # Check required field criteria met
+        for key in self.required_fields:
+            if fields.get(key, None) is None:
+                raise AttributeError("Value required for '%s'" % key)
+
+        # Check each attribute
+        field_validators = self.field_validators
+        for key, field_val in fields.iteritems():
+            fv = field_validators.get(key, None)
+            if fv is None:
+                # BUILT_IN_ATTRS
+                continue
+
+            val_type = type(field_val)
+
+            # Side effect - Correct any float or long types that got downgraded to int
+            if fv.coerce is not None and isinstance(field_val, int):
+                field_val = fields[key] = fv.coerce(field_val)
+                val_type = type(field_val)
+
+            # Side effect - Work around for OrderedDict vs dict issue
+            elif val_type is dict and fv.to_ordered_dict:
+                field_val = fields[key] = OrderedDict(field_val)
+                val_type = OrderedDict
+
+            # Basic type checking
+            type_check, nested_kind, field_val_type = fv.get_type_info(val_type)
+            if type_check != TYPE_MATCH:
+                if type_check == TYPE_SKIP:
+                    continue
+                elif type_check == TYPE_ENUM:
+                    enum_clzz = fv.get_enum_class()
+                    if field_val in enum_clzz._str_map:
+                        continue
+                    raise AttributeError("Invalid enum value '%d' for field '%s.%s', should be between 1 and %d" %
+                            (field_val, self.type_name, key, len(enum_clzz._str_map)))
+                elif type_check == TYPE_CONTENT:
+                    obj._check_content(key, field_val, fv.content_types, fv.split_content_types)
+                    continue
+                raise AttributeError("Invalid type '%s' for field '%s.%s', should be '%s'" %
+                        (field_val_type, self.type_name, key, fv.type_name))
+
+            if fv.pattern_re is not None and field_val_type == 'str':
+                if not fv.pattern_re.match(field_val):
+                    raise AttributeError("Invalid value pattern %s for field '%s.%s', should match regular expression %s" %
+                            (field_val, self.type_name, key, fv.pattern))
+
+            if fv.value_range is not None and field_val_type in ('int', 'float', 'long'):
+                min_val, max_val = fv.value_range
+                if field_val < min_val or field_val > max_val:
+                    raise AttributeError("Invalid value %s for field '%s.%s', should be between %d and %d" %
+                        (str(field_val), self.type_name, key, min_val, max_val))
+
+            if fv.content_types is not None:
+                if fv.type_name == 'list':
+                    obj._check_collection_content(key, field_val, fv.content_types, fv.split_content_types)
+                elif fv.type_name in ('dict', 'OrderedDict'):
+                    obj._check_collection_content(key, field_val.values(), fv.content_types, fv.split_content_types)
+                else:
+                    obj._check_content(key, field_val, fv.content_types, fv.split_content_types)
+
+            if fv.content_count is not None:
+                min_val, max_val = fv.content_count
+                len_list = len(field_val)
+                if len_list < min_val or len_list > max_val:
+                    raise AttributeError("Invalid value length for collection field '%s.%s', should be between %d and %d" %
+                            (self.type_name, key, min_val, max_val))
+
+            if validate_objects and nested_kind != NESTED_NONE:
+                # Only if desired - if entire object is walked anyways, these checks are redundant
+                if nested_kind == NESTED_OBJ:
+                    field_val._validate()
+
+                # Next validate only IonObjects found in child collections.
+                # Note that this is non-recursive; only for first-level collections.
+                elif nested_kind == NESTED_MAPPING:
+                    for subval in field_val.itervalues():
+                        if isinstance(subval, IonObjectBase):
+                            subval._validate()
+                else:
+                    for subval in field_val:
+                        if isinstance(subval, IonObjectBase):
+                            subval._validate()
+
+
+# Compiled to-dict/from-dict converters by IonObject class and by type name
+_converters = {}
+_converters_by_type = {}
+
+# Value types that are never transformed by serialization
+SCALAR_TYPES = frozenset([str, unicode, int, long, float, bool, type(None)])
+
+# Schema field types holding scalar values
+SCALAR_FIELD_TYPES = frozenset(['str', 'int', 'long', 'float', 'bool', 'NoneType'])
+
+
+class IonObjectConverter(object):
+    """
+    To-dict and from-dict functions for one IonObject class, generated from its schema once.
+    Produce the same results as walking objects with the IonObjectSerializer/IonObjectDeserializer
+    transforms. Schema fields of scalar type are copied inline if their value is a scalar, all
+    other values are converted by the given value function (for nested objects, dicts and lists).
+    Keys of a dict not in the schema are ignored by from_dict (see fields).
+    """
+    def __init__(self, clzz):
+        self.clzz = clzz
+        self.schema = clzz._schema
+        self.type_name = clzz.__name__
+        self.fields = frozenset(self.schema) | BUILT_IN_ATTRS
+        scalar_fields = {key for key, schema_val in self.schema.iteritems()
+                         if schema_val['type'] in SCALAR_FIELD_TYPES or 'enum_type' in schema_val}
+        scalar_fields.update(BUILT_IN_ATTRS)
+        field_names = sorted(self.fields - {'type_'})
+
+        if issubclass(clzz, IonSlotsObjectBase):
+            src = self._slots_to_dict_src(field_names, scalar_fields)
+        else:
+            src = ["def to_dict(obj, ser):",
+                   "    d = obj.__dict__",
+                   "    res = {}"]
+            for key in field_names:
+                src.append("    if %r in d:" % key)
+                if key in scalar_fields:
+                    src.append("        v = d[%r]" % key)
+                    src.append("        res[%r] = v if v.__class__ in SCALAR_TYPES else ser(v)" % key)
+                else:
+                    src.append("        res[%r] = ser(d[%r])" % (key, key))
+            src.append("    res['type_'] = d['type_'] if 'type_' in d else %r" % self.type_name)
+            src.append("    return res")
+
+        if issubclass(clzz, IonSlotsObjectBase):
+            # Not initialized, unset attributes fall back to the class defaults
+            src += ["def from_dict(data, deser):",
+                    "    obj = clzz.__new__(clzz)"]
+            set_line = "        setattr_(obj, %r, v)"
+        else:
+            src += ["def from_dict(data, deser):",
+                    "    obj = clzz()",
+                    "    od = obj.__dict__"]
+            set_line = "        od[%r] = v"
+        for key in field_names:
+            src.append("    if %r in data:" % key)
+            src.append("        v = data[%r]" % key)
+            src.append("        if v.__class__ is unicode:")
+            src.append("            v = v.encode('utf8')")
+            if key in scalar_fields:
+                src.append("        elif v.__class__ not in SCALAR_TYPES:")
+                src.append("            v = deser(v)")
+            else:
+                src.append("        else:")
+                src.append("            v = deser(v)")
+            src.append(set_line % key)
+        src.append("    return obj")
+
+        namespace = dict(clzz=clzz, SCALAR_TYPES=SCALAR_TYPES,
+                         getattr_=object.__getattribute__, setattr_=object.__setattr__)
+        exec compile("\n".join(src), "<%s converter>" % self.type_name, "exec") in namespace
+        self.to_dict = namespace["to_dict"]
+        self.from_dict = namespace["from_dict"]
+
+    def _slots_to_dict_src(self, field_names, scalar_fields):
+        """All schema attributes are read (unset ones return the defaults), built-ins only if set"""
+        src = ["def to_dict(obj, ser):",
+               "    res = {}"]
+        for key in field_names:
+            if key in self.schema:
+                src.append("    v = obj.%s" % key)
+            else:
+                src.append("    try:")
+                src.append("        v = getattr_(obj, %r)" % key)
+                src.append("    except AttributeError:")
+                src.append("        pass")
+                src.append("    else:")
+            indent = "    " if key in self.schema else "        "
+            if key in scalar_fields:
+                src.append(indent + "res[%r] = v if v.__class__ in SCALAR_TYPES else ser(v)" % key)
+            else:
+                src.append(indent + "res[%r] = ser(v)" % key)
+        if 'type_' in self.clzz._defaults:
+            src.append("    res['type_'] = obj.type_")
+        else:
+            src.append("    res['type_'] = getattr(obj, 'type_', %r)" % self.type_name)
+        src.append("    return res")
+        return src
+
+
+def get_object_converter(clzz):
+    """Returns the compiled IonObjectConverter for an IonObject class"""
+    converter = _converters.get(clzz, None)
+    if converter is None or converter.schema is not clzz._schema:
+        converter = _converters[clzz] = IonObjectConverter(clzz)
+    return converter
+
+
+def get_type_converter(type_name):
+    """Returns the compiled IonObjectConverter for an IonObject type name"""
+    converter = _converters_by_type.get(type_name, None)
+    if converter is None:
+        from pyon.core.registry import model_classes, message_classes, enum_classes
+        clzz = model_classes.get(type_name, None) or message_classes.get(type_name, None) or enum_classes.get(type_name, None)
+        if clzz is None:
+            raise NotFound("No matching class found for name %s" % type_name)
+        converter = _converters_by_type[type_name] = get_object_converter(clzz)
+    return converter
+
+
+def serialize_value(value):
+    """Returns a value with all nested IonObjects converted to dicts, as walk with IonObjectSerializer"""
+    if value.__class__ in SCALAR_TYPES:
+        return value
+    if isinstance(value, IonObjectBase):
+        return get_object_converter(value.__class__).to_dict(value, serialize_value)
+    if isinstance(value, dict):
+        return {k: serialize_value(v) for k, v in value.iteritems()}
+    if isinstance(value, (list, tuple, set)):
+        return [serialize_value(v) for v in value]
+    return value
+
+
+def deserialize_value(value):
+    """Returns a value with all nested dicts with type_ converted to IonObjects, as walk with IonObjectDeserializer"""
+    if value.__class__ in SCALAR_TYPES:
+        return value
+    if isinstance(value, dict):
+        # Note: This check to detect an IonObject is a bit risky (only type_)
+        if "type_" in value:
+            converter = get_type_converter(value["type_"].encode('ascii'))
+            if not converter.fields.issuperset(value):
+                # get outdated attributes in data that are not defined in the current schema
+                for extra in value.viewkeys() - converter.fields:
+                    value.pop(extra)
+                    log.info('discard %s not in current schema' % extra)
+            return converter.from_dict(value, deserialize_value)
+        return {k: deserialize_value(v) for k, v in value.iteritems()}
+    if isinstance(value, (list, tuple, set)):
+        return [deserialize_value(v) for v in value]
+    return value
+
+
 def walk(o, cb, modify_key_value='value'):
     """
     Utility method to do recursive walking of a possible iterable (incl dicts) and return a
@@ -368,6 +719,8 @@ class IonObjectSerializationBase(object):
     """
     def __init__(self, transform_method=None, **kwargs):
         self._transform_method = transform_method or self._transform
+        # Compiled converters can only be used with the default transform
+        self._custom_transform = transform_method is not None
 
     def operate(self, obj):
         return walk(obj, self._transform_method)
@@ -400,13 +753,18 @@ class IonObjectSerializer(IonObjectSerializationBase):
 
 
     def serialize(self, obj, update_version=False):
-        self._transform_method = self._transform(update_version)
-
+        if not self._custom_transform:
+            return serialize_value(obj)
         return IonObjectSerializationBase.operate(self, obj)
 
 
 class IonObjectBlameSerializer(IonObjectSerializer):
 
+    def serialize(self, obj, update_version=False):
+        self._transform_method = self._transform(update_version)
+
+        return IonObjectSerializationBase.operate(self, obj)
+
     def _transform(self, obj):
         res = IonObjectSerializer._transform(self, obj)
         blame = None
@@ -428,13 +786,16 @@ class IonObjectDeserializer(IonObjectSerializationBase):
     into IonObjects. You *MUST* pass an object registry
     """
 
-    deserialize = IonObjectSerializationBase.operate
-
     def __init__(self, transform_method=None, obj_registry=None, **kwargs):
         assert obj_registry
         self._obj_registry = obj_registry
         IonObjectSerializationBase.__init__(self, transform_method=transform_method)
 
+    def deserialize(self, obj):
+        if not self._custom_transform:
+            return deserialize_value(obj)
+        return IonObjectSerializationBase.operate(self, obj)
+
     def _transform(self, obj):
         # Note: This check to detect an IonObject is a bit risky (only type_)
         if isinstance(obj, dict) and "type_" in obj:
@@ -465,6 +826,8 @@ class IonObjectDeserializer(IonObjectSerializationBase):
 
 class IonObjectBlameDeserializer(IonObjectDeserializer):
 
+    deserialize = IonObjectSerializationBase.operate
+
     def _transform(self, obj):
 
         def handle_ion_obj(in_obj):
@@ -6,7 +6,7 @@ import inspect
 from copy import deepcopy
 
 from pyon.core.exception import NotFound
-from pyon.core.object import walk
+from pyon.core.object import walk, IonObjectBase, BUILT_IN_ATTRS, SCALAR_TYPES
 
 import interface.objects
 import interface.messages
@@ -138,6 +138,8 @@ class IonObjectRegistry(object):
 
         from pyon.core.bootstrap import CFG
         self.validate_setattr = CFG.get_safe('container.objects.validate.setattr', False)
+        self._validating_classes = set()    # Classes with validating __setattr__ installed
+        self._object_fields = {}            # Class -> {field name: object type name}
 
     def new(self, _def, _dict=None, **kwargs):
         """Instantiates an IonObject based on given object type name and initial values.
@@ -156,34 +158,55 @@ class IonObjectRegistry(object):
             raise NotFound("No matching class found for name %s" % _def)
 
         # Conditionally override the __setattr__ method to include additional client side validation
-        if self.validate_setattr:
-            def validating_setattr(self, name, value):
-                from pyon.core.object import BUILT_IN_ATTRS
-                if name not in self._schema and name not in BUILT_IN_ATTRS:
-                    raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
-                self.__dict__[name] = value
-            setattrmethod = validating_setattr
-            setattr(clzz, "__setattr__", setattrmethod)
+        if self.validate_setattr and clzz not in self._validating_classes:
+            setattr(clzz, "__setattr__", _validating_setattr)
+            self._validating_classes.add(clzz)
 
         if _dict:
-            # Traverse input parameters looking for dict values being passed in as
-            # the init values of complex types.  Instantiate new object and substitute
-            # into the argument dict.
-            tmpdict = deepcopy(_dict)
-
-            for key in tmpdict:
-                if key in clzz._schema:
-                    if isinstance(tmpdict[key], dict) and clzz._schema[key]["type"] in model_classes:
-                        obj_param = self.new(clzz._schema[key]["type"], tmpdict[key])
-                        tmpdict[key] = obj_param
-                else:
+            # Copy the input values, looking for dict values being passed in as the init values
+            # of complex types. Instantiate new object and substitute into the argument dict.
+            object_fields = self._object_fields.get(clzz, None)
+            if object_fields is None:
+                object_fields = self._object_fields[clzz] = {key: schema_val["type"] for key, schema_val in clzz._schema.iteritems()
+                                                             if schema_val["type"] in model_classes}
+            keywordargs = {}
+            for key, value in _dict.iteritems():
+                if key not in clzz._schema:
                     raise AttributeError("'%s' object has no attribute '%s'" % (clzz.__name__, key))
+                if key in object_fields and isinstance(value, dict):
+                    keywordargs[key] = self.new(object_fields[key], value)
+                else:
+                    keywordargs[key] = _copy_value(value)
 
             # Apply dict values, then override with kwargs
-            keywordargs = tmpdict
             keywordargs.update(kwargs)
             obj = clzz(**keywordargs)
         else:
             obj = clzz(**kwargs)
 
         return obj
+
+
+def _validating_setattr(self, name, value):
+    if name not in self._schema and name not in BUILT_IN_ATTRS:
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+    self.__dict__[name] = value
+
+
+def _copy_value(value):
+    """Returns a deep copy of a value, sharing immutable values and copying plain dicts and lists directly"""
+    value_type = value.__class__
+    if value_type in SCALAR_TYPES:
+        return value
+    if value_type is dict:
+        return {k: _copy_value(v) for k, v in value.iteritems()}
+    if value_type is list:
+        return [_copy_value(v) for v in value]
+    if isinstance(value, IonObjectBase):
+        # Uninitialized instance, so that mutable defaults are not created just to be replaced
+        obj = value_type.__new__(value_type)
+        obj_dict = obj.__dict__
+        for k, v in value.__dict__.iteritems():
+            obj_dict[k] = _copy_value(v)
+        return obj
+    return deepcopy(value)
@@ -3,13 +3,44 @@
 
 __author__ = 'Adam R. Smith'
 
+import copy
+import json
+import pickle
 from nose.plugins.attrib import attr
 import unittest
 
 from pyon.util.int_test import IonIntegrationTestCase
 
-from pyon.core.registry import IonObjectRegistry
+from pyon.core.registry import IonObjectRegistry, _validating_setattr
 from pyon.core.bootstrap import IonObject
+from pyon.core.object import IonSlotsObjectBase
+
+
+# Object classes as generated with generate_interfaces --slots
+class SlotsDetails(IonSlotsObjectBase):
+    def __init__(self, value=0):
+        self.value = value
+
+    _schema = {'value': {'type': 'int', 'default': 0, 'decorators': {}, 'description': ''}}
+    __slots__ = ('value', )
+    _defaults = {'type_': 'SlotsDetails', 'value': 0}
+    _lazy_defaults = {}
+
+
+class SlotsResource(IonSlotsObjectBase):
+    def __init__(self, name='', tags=None, details=None):
+        self.name = name
+        if tags:
+            self.tags = tags
+        if details:
+            self.details = details
+
+    _schema = {'name': {'type': 'str', 'default': '', 'decorators': {}, 'description': ''},
+               'tags': {'type': 'list', 'default': [], 'decorators': {}, 'description': ''},
+               'details': {'type': 'SlotsDetails', 'default': SlotsDetails(), 'decorators': {}, 'description': ''}}
+    __slots__ = ('name', 'tags', 'details', )
+    _defaults = {'type_': 'SlotsResource', 'name': ''}
+    _lazy_defaults = {'tags': lambda: [], 'details': SlotsDetails}
 
 
 @attr('UNIT')
@@ -17,6 +48,13 @@ class ObjectTest(IonIntegrationTestCase):
     def setUp(self):
         self.patch_cfg('pyon.core.bootstrap.CFG', {'container': {'objects': {'validate': {'setattr': True}}}})
         self.registry = IonObjectRegistry()
+        self.addCleanup(self._remove_validating_setattr)
+
+    def _remove_validating_setattr(self):
+        # The registry installs __setattr__ on the shared object classes; do not affect other tests
+        for clzz in self.registry._validating_classes:
+            if clzz.__dict__.get("__setattr__", None) is _validating_setattr:
+                del clzz.__setattr__
 
     def test_new(self):
         obj = self.registry.new('SampleObject')
@@ -64,7 +102,106 @@ class ObjectTest(IonIntegrationTestCase):
         msg_obj.object = IonObject("Association")
         self.assertRaises(AttributeError, msg_obj._validate)
 
+    def test_validator_cache(self):
+        from pyon.core.object import _validators
+        obj1 = self.registry.new('SampleObject')
+        obj1._validate()
+        validator = _validators[type(obj1)]
+
+        obj2 = self.registry.new('SampleObject')
+        obj2._validate()
+        self.assertIs(_validators[type(obj2)], validator)
+
+        # Same checks for instances of a class with a cached validator
+        obj2.name = 3
+        self.assertRaises(AttributeError, obj2._validate)
+        obj2.name = u'monkey'
+        obj2._validate()
+
+        obj2.__dict__['extra_field'] = 5
+        self.assertRaises(AttributeError, obj2._validate)
+
     def test_bootstrap(self):
         """ Use the factory and singleton from bootstrap.py/public.py """
         obj = IonObject('SampleObject')
         self.assertEqual(obj.name, '')
+
+    def test_serializer(self):
+        from pyon.core.object import IonObjectSerializer, IonObjectDeserializer, _converters
+        obj = IonObject("ActorIdentity", name=u"user\xe9", alt_ids=["NS:ID1"],
+                        details=IonObject("UserIdentityDetails",
+                                          contact=IonObject("ContactInformation", individual_names_given="John")),
+                        addl={"res": [IonObject("Resource", name="foo")], "tup": (1, 2), "none": None})
+        obj._id = "ID1"
+
+        # Compiled converters produce the same results as walking the object
+        serializer = IonObjectSerializer()
+        walk_serializer = IonObjectSerializer(transform_method=serializer._transform())
+        obj_dict = serializer.serialize(obj)
+        self.assertEqual(obj_dict, walk_serializer.serialize(obj))
+        self.assertEqual(obj_dict["type_"], "ActorIdentity")
+        self.assertEqual(obj_dict["_id"], "ID1")
+        self.assertEqual(obj_dict["details"]["contact"]["type_"], "ContactInformation")
+        self.assertEqual(obj_dict["addl"]["res"][0], {"type_": "Resource", "name": "foo", "description": "",
+            "lcstate": "DRAFT", "availability": "PRIVATE", "visibility": 1, "ts_created": "", "ts_updated": "",
+            "alt_ids": [], "addl": {}})
+        self.assertEqual(obj_dict["addl"]["tup"], [1, 2])
+        self.assertIs(_converters[type(obj)], _converters[type(IonObject("ActorIdentity"))])
+
+        deserializer = IonObjectDeserializer(obj_registry=self.registry)
+        walk_deserializer = IonObjectDeserializer(obj_registry=self.registry, transform_method=deserializer._transform)
+        obj_json = json.dumps(obj_dict)
+        obj1 = deserializer.deserialize(json.loads(obj_json))
+        self.assertEqual(obj1, walk_deserializer.deserialize(json.loads(obj_json)))
+        self.assertEqual(type(obj1.name), str)
+        self.assertEqual(obj1.name, "user\xc3\xa9")
+        self.assertEqual(obj1._id, "ID1")
+        self.assertEqual(obj1.details.contact.individual_names_given, "John")
+        self.assertEqual(obj1.addl["res"][0].name, "foo")
+
+        # Attributes not in the current schema are discarded
+        obj_dict = json.loads(obj_json)
+        obj_dict["extra_field"] = 5
+        obj2 = deserializer.deserialize(obj_dict)
+        self.assertNotIn("extra_field", obj2.__dict__)
+        self.assertEqual(obj2, obj1)
+
+    def test_slots_object(self):
+        from pyon.core.object import IonObjectSerializer, get_object_converter
+        obj = SlotsResource(name="foo")
+        self.assertFalse(hasattr(obj, "foo"))
+        with self.assertRaises(AttributeError):
+            obj.foo = 1
+
+        # Defaults are shared/lazy until set
+        self.assertIs(obj.type_, SlotsResource._defaults["type_"])
+        self.assertEqual(obj.__getstate__(), {"name": "foo"})
+        obj.tags.append("a")
+        self.assertEqual(obj.tags, ["a"])
+        self.assertIsNot(obj.tags, SlotsResource().tags)
+        self.assertFalse(hasattr(obj, "_id"))
+
+        # __dict__ compatible
+        self.assertEqual(set(obj.__dict__), {"type_", "name", "tags", "details"})
+        self.assertEqual(obj.__dict__["name"], "foo")
+        obj.__dict__["_id"] = "ID1"
+        self.assertEqual(obj._id, "ID1")
+        self.assertIn("_id", obj.__dict__)
+        self.assertEqual(obj.__dict__.pop("_id"), "ID1")
+        self.assertNotIn("_id", obj.__dict__)
+        self.assertEqual(obj, SlotsResource(name="foo", tags=["a"]))
+        obj._validate()
+
+        # Serialization
+        obj_dict = IonObjectSerializer().serialize(obj)
+        self.assertEqual(obj_dict, {"type_": "SlotsResource", "name": "foo", "tags": ["a"],
+                                    "details": {"type_": "SlotsDetails", "value": 0}})
+        deser = lambda v: get_object_converter(SlotsDetails).from_dict(v, deser) if isinstance(v, dict) else v
+        obj1 = get_object_converter(SlotsResource).from_dict(obj_dict, deser)
+        self.assertEqual(obj1, obj)
+
+        # Pickling and copy keep unset attributes unset
+        obj2 = SlotsResource(name="bar")
+        for obj3 in (pickle.loads(pickle.dumps(obj2)), pickle.loads(pickle.dumps(obj2, 2)), copy.deepcopy(obj2)):
+            self.assertEqual(obj3.__getstate__(), {"name": "bar"})
+            self.assertEqual(obj3, obj2)
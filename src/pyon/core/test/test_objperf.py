@@ -15,6 +15,7 @@ import pickle, cPickle
 from pyon.util.unit_test import IonUnitTestCase
 from pyon.core.bootstrap import IonObject
 from pyon.core.object import IonObjectBase
+from pyon.core.registry import _validating_setattr
 from pyon.util.log import log
 
 allowed_chars = string.ascii_uppercase + string.digits
@@ -72,16 +73,31 @@ def create_test_object(depth=3, breadth=10, do_dict=True, do_list=True, do_ion=F
             return res_obj
 
     if obj_validate is not None:
-        from pyon.core.bootstrap import get_obj_registry
-        old_validate = get_obj_registry().validate_setattr
-        get_obj_registry().validate_setattr = obj_validate
-        test_obj = create_test_col(depth, dict)
-        get_obj_registry().validate_setattr = old_validate
+        with validate_setattr(obj_validate):
+            test_obj = create_test_col(depth, dict)
     else:
         test_obj = create_test_col(depth, dict)
 
     return test_obj
 
+@contextmanager
+def validate_setattr(enabled=True):
+    """Temporarily enables or disables the object registry's validating __setattr__. Removes it again
+    from the classes it was installed on, so that other tests are not affected."""
+    from pyon.core.bootstrap import get_obj_registry
+    obj_registry = get_obj_registry()
+    old_validate = obj_registry.validate_setattr
+    old_validating_classes = set(obj_registry._validating_classes)
+    obj_registry.validate_setattr = enabled
+    try:
+        yield
+    finally:
+        obj_registry.validate_setattr = old_validate
+        for clzz in obj_registry._validating_classes - old_validating_classes:
+            if clzz.__dict__.get("__setattr__", None) is _validating_setattr:
+                del clzz.__setattr__
+        obj_registry._validating_classes = old_validating_classes
+
 @contextmanager
 def time_it(msg="step"):
     t1 = time.time()
@@ -185,6 +201,40 @@ class ObjectPerfTest(IonUnitTestCase):
         with time_it("recursive_utf8encode1"):
             recursive_encode1(o2)
 
+    def test_new(self):
+        num_objs = 10000
+        res_dict = dict(name="Actor", description="Some actor", alt_ids=["NS:ID1", "NS:ID2"],
+                        addl={"key1": "value1", "key2": [1, 2, 3]}, credentials=[IonObject("Credentials", username="user")],
+                        details=IonObject("UserIdentityDetails", dict(contact=dict(individual_names_given="John"))))
+
+        # Values from the dict are copied; nested dicts of object types become objects
+        obj = IonObject("ActorIdentity", res_dict)
+        self.assertEqual(obj.details.contact.individual_names_given, "John")
+        self.assertIsNot(obj.details, res_dict["details"])
+        self.assertEqual(obj.addl, res_dict["addl"])
+        self.assertIsNot(obj.addl["key2"], res_dict["addl"]["key2"])
+        self.assertIsNot(obj.credentials[0], res_dict["credentials"][0])
+        self.assertEqual(obj.credentials[0].username, "user")
+
+        with time_it("IonObject(type), %s" % num_objs):
+            for i in xrange(num_objs):
+                IonObject("ActorIdentity", name="Actor")
+
+        with time_it("IonObject(type, dict), %s" % num_objs):
+            for i in xrange(num_objs):
+                IonObject("ActorIdentity", res_dict)
+
+        with time_it("IonObject(type, deepcopy(dict)), %s" % num_objs):
+            for i in xrange(num_objs):
+                IonObject("ActorIdentity", copy.deepcopy(res_dict))
+
+        was_validating = "__setattr__" in type(obj).__dict__
+        with validate_setattr(), time_it("IonObject(type, dict) validate setattr, %s" % num_objs):
+            for i in xrange(num_objs):
+                IonObject("ActorIdentity", res_dict)
+        self.assertEqual("__setattr__" in type(obj).__dict__, was_validating)
+
+
 def count_objs(obj):
     counters = {}
     def _count(obj):
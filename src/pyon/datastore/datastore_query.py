@@ -11,7 +11,9 @@ and sent as service arguments.
 
 __author__ = 'Michael Meisinger'
 
+import base64
 import datetime
+import json
 import time
 
 from pyon.core.exception import BadRequest
@@ -120,6 +122,22 @@ QUERY_EXP_KEY = "QUERYEXP"
 QUERY_EXP_ID = "qexp_v1.0"
 
 
+def encode_page_token(key_values):
+    """Returns an opaque continuation token for the sort key values of the last row of a page"""
+    return base64.urlsafe_b64encode(json.dumps(list(key_values), separators=(",", ":")))
+
+
+def decode_page_token(page_token):
+    """Returns the list of sort key values encoded in a continuation token"""
+    try:
+        key_values = json.loads(base64.urlsafe_b64decode(str(page_token)))
+    except (TypeError, ValueError):
+        raise BadRequest("Invalid page token")
+    if type(key_values) is not list:
+        raise BadRequest("Invalid page token")
+    return key_values
+
+
 class DatastoreQueryBuilder(DatastoreQueryConst):
     """Helps create structured queries to the datastore"""
 
@@ -371,6 +389,13 @@ class DatastoreQueryBuilder(DatastoreQueryConst):
         if limit is not None:
             qargs["limit"] = limit
 
+    def set_page_token(self, page_token=None):
+        """Enables keyset pagination. Pass None for the first page and the next_page_token of the
+        previous page's query result for subsequent pages. Paged queries do not apply skip.
+        Discovery returns the next_page_token only with query_info=True in the query args."""
+        qargs = self.query["query_args"]
+        qargs["page_token"] = page_token
+
     def set_id_only(self, id_only):
         qargs = self.query["query_args"]
         if id_only is not None:
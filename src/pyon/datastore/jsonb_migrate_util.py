@@ -0,0 +1,61 @@
+#!/usr/bin/env python
+
+"""Admin tool to migrate resource datastores from json to jsonb document storage"""
+
+import sys
+from optparse import OptionParser
+
+from pyon.datastore.datastore_common import DataStore
+
+
+def main():
+
+    usage = \
+    """
+    %prog [options] [datastore ...]
+    """
+    description = "Use this program to convert the document columns of existing resource datastores " \
+                  "(default: resources) from json to jsonb and rebuild their indexes. Tables are locked " \
+                  "while rewritten; stop all containers of the system first and set doc_format: jsonb " \
+                  "in the postgresql server config before restarting them."
+    parser = OptionParser(usage=usage, description=description)
+    parser.add_option("-P", "--port", dest="db_port", default=None, help="Port number for db", action="store", type=int, metavar="PORT")
+    parser.add_option("-H", "--host", dest="db_host", default='localhost', help="The host name or ip address of the db server", action="store", type=str, metavar="HOST")
+    parser.add_option("-u", "--username", dest="db_uname", default=None, help="Admin username for the db server", action="store", type=str, metavar="UNAME")
+    parser.add_option("-p", "--password", dest="db_pword", default=None, help="Admin password for the db server", action="store", type=str, metavar="PWORD")
+    parser.add_option("-d", "--database", dest="db_name", default=None, help="Database name without sysname prefix", action="store", type=str, metavar="DBNAME")
+    parser.add_option("-s", "--sysname", dest="sysname", default=None, help="The sysname of the system to migrate", action="store", type=str, metavar="SYSNAME")
+
+    (options, args) = parser.parse_args()
+
+    if not options.sysname:
+        print 'migrate_jsonb: Error: no sysname specified'
+        parser.print_help()
+        sys.exit(1)
+
+    config = create_config(options.db_host, options.db_port, options.db_uname, options.db_pword, options.db_name)
+    datastore_names = args or [DataStore.DS_RESOURCES]
+    migrate_jsonb(config, datastore_names, sysname=options.sysname)
+
+
+def create_config(host, port, admin_username, admin_password, database=None):
+    config = dict(host=host, port=port, admin_username=admin_username, admin_password=admin_password, database=database)
+    return config
+
+
+def migrate_jsonb(config, datastore_names, sysname):
+    from pyon.datastore.postgresql.base_store import PostgresDataStore
+    for ds_name in datastore_names:
+        ds = PostgresDataStore(config=config, scope=sysname, profile=DataStore.DS_PROFILE.RESOURCES)
+        if not ds.datastore_exists(ds_name):
+            print "migrate_jsonb: Datastore '%s' does not exist in database '%s'" % (ds_name, ds.database)
+            continue
+        print "migrate_jsonb: Migrating datastore '%s' in database '%s'" % (ds_name, ds.database)
+        if ds.migrate_to_jsonb(ds_name):
+            print "migrate_jsonb: Datastore '%s' migrated to jsonb" % ds_name
+        else:
+            print "migrate_jsonb: Datastore '%s' already uses jsonb" % ds_name
+
+
+if __name__ == '__main__':
+    main()
@@ -4,8 +4,13 @@
 
 __author__ = 'Michael Meisinger'
 
+import calendar
+import datetime
 import getpass
+import gevent
 import os.path
+import re
+import time
 from uuid import uuid4
 # Note: standard json is faster than simplejson for dumps
 # See https://confluence.oceanobservatories.org/display/CIDev/Container+Messaging+Performance
@@ -23,9 +28,10 @@ from putil.logging import log
 from pyon.core.exception import BadRequest, Conflict, NotFound, Inconsistent
 from pyon.datastore.datastore_common import DataStore, get_obj_geospatial_bounds, get_obj_geospatial_point, \
     get_obj_temporal_bounds, get_obj_vertical_bounds, get_obj_geometry
-from pyon.datastore.datastore_query import DQ
-from pyon.datastore.postgresql.pg_util import PostgresConnectionPool, StatementBuilder, psycopg2_connect, TracingCursor
-from pyon.util.containers import create_basic_identifier, parse_ion_ts, DotDict
+from pyon.datastore.datastore_query import DQ, decode_page_token
+from pyon.datastore.postgresql.pg_util import PostgresConnectionPool, StatementBuilder, psycopg2_connect, TracingCursor, \
+    ReplicaPoolRouter, CopyRowReader, copy_expert_blocking, get_time_partition, PARTITION_INTERVAL_DAYS
+from pyon.util.containers import create_basic_identifier, parse_ion_ts, DotDict, get_ion_ts_millis, is_valid_ts
 from pyon.util.tracer import CallTracer
 
 TABLE_PREFIX = "ion_"
@@ -42,9 +48,28 @@ OBJ_SPECIAL = {"R": ("", ("type_", "lcstate", "availability", "visibility", "nam
                "E": ("", ("origin", "origin_type", "sub_type", "ts_created", "type_")),
                }
 OBJ_TYPE_PRECED = {"R": 1, "A": 2, "D": 3}
-
-# Shared connection pool for container
-pg_connection_pool = None
+# Casts for special attribute columns that are not character types (see profile SQL)
+COL_TYPE_CAST = {"visibility": "::int", "retired": "::boolean"}
+# Name suffix of time range partitions of an events table (see profile_events_partitioned.sql)
+PARTITION_SUFFIX_RE = re.compile(r"_p(\d{8}|default)$")
+
+# Shared connection pools for container, by pool name (datastore profile or "default")
+pg_connection_pools = {}
+# Shared read replica routers for container, by primary pool name
+pg_replica_routers = {}
+DEFAULT_POOL = "default"
+
+
+def get_connection_pool_stats():
+    """Returns a dict of connection pool name to pool and prepared statement stats"""
+    pool_stats = {}
+    for pool_name, pool in pg_connection_pools.items():
+        stats = pool.get_pool_stats()
+        stats["prepared"] = pool.get_prepared_stats()
+        pool_stats[pool_name] = stats
+    for pool_name, router in pg_replica_routers.items():
+        pool_stats[pool_name]["replica_routing"] = router.get_router_stats()
+    return pool_stats
 
 
 class PostgresDataStore(DataStore):
@@ -74,7 +99,36 @@ class PostgresDataStore(DataStore):
         self.database = self.config.get('database', None) or DEFAULT_DBNAME
         self.default_database = self.config.get('default_database', None) or 'postgres'
         self.pool_maxsize = int(self.config.get('connection_pool_max', 4))
+        self.pool_minsize = int(self.config.get('connection_pool_min', 0) or 0)
+        self.pool_timeout = float(self.config.get('connection_pool_timeout', 0) or 0) or None
+        self.pool_max_idle = self.config.get('connection_pool_max_idle', None)
+        self.pool_ping_idle = self.config.get('connection_pool_ping_idle', None)
+        self.pool_profiles = self.config.get('connection_pools', None) or {}
+        self.read_replicas = self.config.get('read_replicas', None) or []
+        self.replica_sticky_time = float(self.config.get('replica_sticky_time', 0) or 0)
+        self.replica_retry_time = float(self.config.get('replica_retry_time', 30))
+        self.prepared_max = int(self.config.get('prepared_statement_max', 0) or 0)
         self.db_init = self.config.get('db_init', None) or "res/datastore/postgresql/db_init.sql"
+        self.bulk_copy_min_rows = int(self.config.get('bulk_copy_min_rows', 100))
+        self.bulk_copy_chunk_size = int(self.config.get('bulk_copy_chunk_size', 1000))
+        self.bulk_update_chunk_size = int(self.config.get('bulk_update_chunk_size', 1000))
+        self.query_fetch_size = int(self.config.get('query_fetch_size', 1000))
+        self.doc_format = self.config.get('doc_format', None) or "json"
+        if self.doc_format not in ("json", "jsonb"):
+            raise BadRequest("Unknown doc_format: %s" % self.doc_format)
+        # True if the datastore's tables store documents as jsonb (determined from the database)
+        self.jsonb_docs = False
+        self.event_partition_interval = self.config.get('event_partition_interval', None) or ""
+        if self.event_partition_interval and self.event_partition_interval not in PARTITION_INTERVAL_DAYS:
+            raise BadRequest("Unknown event_partition_interval: %s" % self.event_partition_interval)
+        self.event_retention_days = int(self.config.get('event_retention_days', None) or 0)
+        self.event_partitions_ahead = int(self.config.get('event_partitions_ahead', 2))
+        self.event_partition_retry_time = float(self.config.get('event_partition_retry_time', 300))
+        # Name suffixes of existing event partitions, None if not yet loaded
+        self._event_partitions = None
+        # Name suffixes of event partitions that could not be created -> time of next attempt
+        self._event_partition_failures = {}
+        self._events_partitioned = False
 
         # Database (Postgres database) and datastore (database table) name handling.
         # Scope database with given scope (e.g. sysname).
@@ -89,14 +143,7 @@ class PostgresDataStore(DataStore):
         self.cursor_args = dict(cursor_factory=TracingCursor, tracer=self._call_tracer)
 
         # Make sure database exists and set connection
-        dsn = "host=%s port=%s dbname=%s user=%s password=%s connect_timeout=5 application_name=%s" % (
-            self.host, self.port, self.database, self.username, self.password, "%s:%s" % ("ion", self.datastore_name))
-        clean_dsn = dsn.replace(self.password, "***") if self.password else dsn.replace("password=", "password=***")
-        log.debug("Using Postgres connection DSN: %s", clean_dsn)
-        global pg_connection_pool
-        if not pg_connection_pool:
-            pg_connection_pool = PostgresConnectionPool(dsn, maxsize=self.pool_maxsize)
-        self.pool = pg_connection_pool
+        self.pool = self._get_connection_pool(self.host, self.port)
         try:
             with self.pool.connection() as conn:
                 # Check whether database exists
@@ -108,10 +155,24 @@ class PostgresDataStore(DataStore):
                 # Check that connection works
                 pass
 
+        # Read-only operations use read replicas, if configured
+        self.read_pool = self.pool
+        if self.read_replicas:
+            self.read_pool = pg_replica_routers.get(self.pool.name, None)
+            if self.read_pool is None:
+                replica_pools = []
+                for replica in self.read_replicas:
+                    replica_host, _, replica_port = str(replica).partition(":")
+                    replica_pools.append(self._get_connection_pool(replica_host, replica_port or self.port, replica=True))
+                self.read_pool = ReplicaPoolRouter(self.pool, replica_pools, sticky_time=self.replica_sticky_time,
+                                                   retry_time=self.replica_retry_time)
+                pg_replica_routers[self.pool.name] = self.read_pool
+
         # Assert the existence of the datastore
         if self.datastore_name:
             if not self.datastore_exists():
                 self.create_datastore()
+            self.jsonb_docs = self._get_doc_column_type() == "jsonb"
 
         log.debug("PostgresDataStore: created instance database=%s, datastore_name=%s, profile=%s, scope=%s",
                  self.database, self.datastore_name, self.profile, self.scope)
@@ -143,18 +204,49 @@ class PostgresDataStore(DataStore):
 
         log.debug("Database '%s' initialized and ready.", database_name)
 
+    def _get_connection_pool(self, host, port, replica=False):
+        """
+        Returns the shared connection pool for this datastore's profile, creating it on first use.
+        Profiles configured in connection_pools get a separate pool with the given settings
+        overriding the connection_pool_* defaults, so that e.g. event persistence cannot exhaust
+        the connections used for resource reads. All other profiles share the default pool.
+        Read replicas get a pool with the same settings per profile and replica host.
+        """
+        pool_name = self.profile if self.profile in self.pool_profiles else DEFAULT_POOL
+        if replica:
+            pool_name = "%s@%s:%s" % (pool_name, host, port)
+        pool = pg_connection_pools.get(pool_name, None)
+        if pool is None:
+            dsn = "host=%s port=%s dbname=%s user=%s password=%s connect_timeout=5 application_name=%s" % (
+                host, port, self.database, self.username, self.password, "%s:%s" % ("ion", self.datastore_name))
+            clean_dsn = dsn.replace(self.password, "***") if self.password else dsn.replace("password=", "password=***")
+            log.debug("Using Postgres connection DSN: %s", clean_dsn)
+            pool_cfg = self.pool_profiles.get(pool_name, None) or {}
+            max_idle = pool_cfg.get("max_idle", self.pool_max_idle)
+            ping_idle = pool_cfg.get("ping_idle", self.pool_ping_idle)
+            pool = PostgresConnectionPool(dsn, name=pool_name, prepared_max=self.prepared_max,
+                                          maxsize=int(pool_cfg.get("max", self.pool_maxsize)),
+                                          minsize=int(pool_cfg.get("min", self.pool_minsize)),
+                                          timeout=float(pool_cfg.get("timeout", self.pool_timeout) or 0) or None,
+                                          max_idle=float(max_idle) if max_idle is not None else None,
+                                          ping_idle=float(ping_idle) if ping_idle is not None else None)
+            pg_connection_pools[pool_name] = pool
+            log.debug("Created Postgres connection pool '%s' with maxsize=%s", pool_name, pool.maxsize)
+        return pool
+
     def close(self):
         # Cannot close connections for shared connection pool for one instance
         #self.pool.closeall()
         self.pool = None
+        self.read_pool = None
 
     @classmethod
     def close_all(cls):
-        global pg_connection_pool
-        if pg_connection_pool:
-            log.info("Closing %s shared Postgres datastore connections", pg_connection_pool.size)
-            pg_connection_pool.closeall()
-            pg_connection_pool = None
+        for pool_name, pool in pg_connection_pools.items():
+            log.info("Closing %s shared Postgres datastore connections (pool %s)", pool.size, pool_name)
+            pool.closeall()
+        pg_connection_pools.clear()
+        pg_replica_routers.clear()
 
     @classmethod
     def force_disconnect(cls, database_name, default_database="postgres",
@@ -225,6 +317,11 @@ class PostgresDataStore(DataStore):
             profile = DataStore.DS_PROFILE.RESOURCES
 
         profile = profile.lower()
+        if profile == "events" and self.event_partition_interval:
+            profile = "events_partitioned"
+        elif profile == "resources" and self.doc_format == "jsonb":
+            profile = "resources_jsonb"
+            self._init_jsonb_functions()
         if not os.path.exists("res/datastore/postgresql/profile_%s.sql" % profile):
             profile = "basic"
         profile_sql = None
@@ -245,6 +342,8 @@ class PostgresDataStore(DataStore):
                     raise BadRequest("Datastore %s create error: %s" % (datastore_name, de))
                 except Exception as de:
                     raise BadRequest("Datastore %s create error: %s" % (datastore_name, de))
+        self._event_partitions = None
+        self._event_partition_failures.clear()
         log.debug("Datastore '%s' created" % (qual_ds_name))
 
     def delete_datastore(self, datastore_name=None):
@@ -268,11 +367,14 @@ class PostgresDataStore(DataStore):
                 table_del = 0
                 for table in table_list:
                     if table.startswith(qual_ds_name):
-                        statement = "DROP TABLE "+table+" CASCADE"
+                        # Partitions are already gone if their parent table was dropped first
+                        statement = "DROP TABLE IF EXISTS "+table+" CASCADE"
                         cur.execute(statement)
                         # print self.database, statement, cur.rowcount
                         table_del += abs(cur.rowcount)
 
+        self._event_partitions = None
+        self._event_partition_failures.clear()
         log.debug("Datastore '%s' deleted (%s tables)" % (datastore_name or qual_ds_name, table_del))
 
         # Good idea but not feasible because of all the still open connections to the database
@@ -315,6 +417,8 @@ class PostgresDataStore(DataStore):
         for ds in table_list:
             if ds.endswith("_assoc") or ds.endswith("_att") or ds.endswith("_dir"):
                 continue
+            if PARTITION_SUFFIX_RE.search(ds):
+                continue
             if ds.startswith(TABLE_PREFIX):
                 local_dsn = ds[len(TABLE_PREFIX):]
                 datastore_list.append(local_dsn)
@@ -341,6 +445,191 @@ class PostgresDataStore(DataStore):
         with self.pool.cursor(**self.cursor_args) as cur:
             cur.execute("VACUUM ANALYZE")
 
+    # -------------------------------------------------------------------------
+    # jsonb documents
+
+    def _get_doc_column_type(self, datastore_name=None):
+        """Returns the type of the doc column of the datastore's table: json or jsonb"""
+        qual_ds_name = self._get_datastore_name(datastore_name)
+        with self.pool.cursor(**self.cursor_args) as cur:
+            cur.execute("SELECT data_type FROM information_schema.columns WHERE table_name=%s AND column_name='doc'",
+                        (qual_ds_name,))
+            row = cur.fetchone()
+        return row[0] if row else None
+
+    def _init_jsonb_functions(self):
+        """Creates the jsonb variants of the JSON query functions using the admin user"""
+        with open("res/datastore/postgresql/db_init_jsonb.sql", "r") as f:
+            db_init_jsonb = f.read()
+        with psycopg2_connect(c_host=self.host, c_port=self.port, c_dbname=self.database,
+                              c_user=self.admin_username, c_password=self.admin_password,
+                              tracer=self._call_tracer, trace_stmt="EXECUTE db_init_jsonb.sql") as conn:
+            with conn.cursor() as cur:
+                cur.execute(db_init_jsonb)
+
+    def migrate_to_jsonb(self, datastore_name=None):
+        """
+        Converts the document columns of an existing resources datastore from json to jsonb and
+        replaces the json function indexes with the indexes of profile_resources_jsonb.sql.
+        Rewrites the tables in one transaction, holding exclusive locks until done. Containers
+        using the datastore must be restarted afterwards.
+        @retval  True if the datastore was migrated, False if it already used jsonb
+        """
+        qual_ds_name = self._get_datastore_name(datastore_name)
+        if self._get_doc_column_type(datastore_name) == "jsonb":
+            log.info("Datastore '%s' already uses jsonb documents", qual_ds_name)
+            return False
+
+        self._init_jsonb_functions()
+        with open("res/datastore/postgresql/profile_resources_jsonb.sql", "r") as f:
+            profile_sql = f.read() % dict(ds=qual_ds_name)
+        index_stmts = [stmt.strip() for stmt in profile_sql.split(";")
+                       if stmt.strip().split("\n")[-1].startswith("CREATE INDEX")]
+
+        log.info("Migrating datastore '%s' to jsonb documents", qual_ds_name)
+        with psycopg2_connect(c_host=self.host, c_port=self.port, c_dbname=self.database,
+                              c_user=self.admin_username, c_password=self.admin_password,
+                              tracer=self._call_tracer) as conn:
+            with conn.cursor() as cur:
+                # Indexes on json functions cannot be converted
+                for index_name in ("keywords", "nested", "specialattr", "altids_ns", "altids_id", "all_full"):
+                    cur.execute('DROP INDEX IF EXISTS "%s_%s_idx"' % (qual_ds_name, index_name))
+                for table in (qual_ds_name, qual_ds_name + "_assoc", qual_ds_name + "_dir"):
+                    cur.execute('ALTER TABLE "%s" ALTER COLUMN doc TYPE jsonb USING doc::jsonb' % table)
+                for index_stmt in index_stmts:
+                    cur.execute(index_stmt)
+                cur.execute('ANALYZE "%s"' % qual_ds_name)
+
+        # Statements prepared before return json documents
+        for pool in pg_connection_pools.values():
+            pool.reset_prepared()
+        if qual_ds_name == self._get_datastore_name():
+            self.jsonb_docs = True
+        log.info("Datastore '%s' migrated to jsonb documents", qual_ds_name)
+        return True
+
+    # -------------------------------------------------------------------------
+    # Time partitioned events
+
+    def _is_event_partitioned(self, qual_ds_name=None):
+        """Returns True if the events table of this datastore is partitioned by time range"""
+        if not self.event_partition_interval or self.profile != DataStore.DS_PROFILE.EVENTS:
+            return False
+        if qual_ds_name and qual_ds_name != self._get_datastore_name():
+            return False
+        if self._event_partitions is None:
+            self._load_event_partitions()
+        return self._events_partitioned
+
+    def _load_event_partitions(self):
+        qual_ds_name = self._get_datastore_name()
+        with self.pool.cursor(**self.cursor_args) as cur:
+            cur.execute("SELECT EXISTS(SELECT * FROM pg_partitioned_table WHERE partrelid=%s::regclass)", (qual_ds_name,))
+            self._events_partitioned = cur.fetchone()[0]
+            cur.execute("SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid=i.inhrelid WHERE i.inhparent=%s::regclass",
+                        (qual_ds_name,))
+            partitions = set()
+            for row in cur.fetchall():
+                match = PARTITION_SUFFIX_RE.search(row[0])
+                if match and match.group(1) != "default":
+                    partitions.add(match.group(1))
+            self._event_partitions = partitions
+        if not self._events_partitioned:
+            log.warn("Datastore '%s' is not partitioned. Ignoring event_partition_interval", qual_ds_name)
+
+    def _ensure_event_partitions(self, docs, qual_ds_name=None):
+        """Creates the missing time range partitions for event documents about to be inserted"""
+        if not self._is_event_partitioned(qual_ds_name):
+            return
+        time_partitions = {get_time_partition(doc["ts_created"], self.event_partition_interval)
+                           for doc in docs if is_valid_ts(doc.get("ts_created", None))}
+        now = time.time()
+        missing = [tp for tp in time_partitions if tp[0] not in self._event_partitions and
+                   self._event_partition_failures.get(tp[0], 0) <= now]
+        if missing:
+            self._create_event_partitions(missing)
+
+    def _create_event_partitions(self, time_partitions):
+        """Creates partitions given as tuples (name suffix, start ts, end ts) using the admin user"""
+        qual_ds_name = self._get_datastore_name()
+        failed = False
+        with psycopg2_connect(c_host=self.host, c_port=self.port, c_dbname=self.database,
+                              c_user=self.admin_username, c_password=self.admin_password,
+                              tracer=self._call_tracer) as conn:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cur:
+                for suffix, start_ts, end_ts in sorted(time_partitions):
+                    try:
+                        cur.execute('CREATE TABLE IF NOT EXISTS "%s_p%s" PARTITION OF "%s" FOR VALUES FROM (%%s) TO (%%s)' % (
+                            qual_ds_name, suffix, qual_ds_name), (start_ts, end_ts))
+                        self._event_partitions.add(suffix)
+                        self._event_partition_failures.pop(suffix, None)
+                        log.info("Created event partition %s_p%s", qual_ds_name, suffix)
+                    except DatabaseError as de:
+                        # E.g. concurrent creation or rows for the range in the default partition.
+                        # Inserts then go to the existing or default partition. Do not retry for a while.
+                        if suffix not in self._event_partition_failures:
+                            log.warn("Could not create event partition %s_p%s (retry in %ss): %s",
+                                     qual_ds_name, suffix, self.event_partition_retry_time, de)
+                        else:
+                            log.debug("Could not create event partition %s_p%s: %s", qual_ds_name, suffix, de)
+                        self._event_partition_failures[suffix] = time.time() + self.event_partition_retry_time
+                        failed = True
+        if failed:
+            # Reload, in case partitions were created concurrently
+            self._event_partitions = None
+
+    def maintain_event_partitions(self, retention_days=None):
+        """
+        Creates partitions for upcoming time intervals and drops partitions entirely older than the
+        retention period. Dropping partitions removes expired events without row deletes, index
+        maintenance or vacuum load.
+        @param retention_days  Number of days to keep events. Defaults to event_retention_days config (0 keeps all)
+        @retval  list of dropped partition table names
+        """
+        if not self._is_event_partitioned():
+            return []
+        qual_ds_name = self._get_datastore_name()
+        # Reload to include partitions created or dropped by other containers
+        self._load_event_partitions()
+
+        now_ts = get_ion_ts_millis()
+        interval_millis = PARTITION_INTERVAL_DAYS[self.event_partition_interval] * 86400000
+        upcoming = [get_time_partition(now_ts + i * interval_millis, self.event_partition_interval)
+                    for i in xrange(self.event_partitions_ahead + 1)]
+        missing = [tp for tp in upcoming if tp[0] not in self._event_partitions]
+        if missing:
+            self._create_event_partitions(missing)
+            if self._event_partitions is None:
+                self._load_event_partitions()
+
+        retention_days = self.event_retention_days if retention_days is None else retention_days
+        if retention_days <= 0:
+            return []
+        cutoff_ts = now_ts - retention_days * 86400000
+        expired = []
+        for suffix in sorted(self._event_partitions):
+            start_ts = calendar.timegm(datetime.datetime.strptime(suffix, "%Y%m%d").timetuple()) * 1000
+            _, _, end_ts = get_time_partition(start_ts, self.event_partition_interval)
+            if int(end_ts) <= cutoff_ts:
+                expired.append(suffix)
+        if not expired:
+            return []
+
+        dropped = []
+        with psycopg2_connect(c_host=self.host, c_port=self.port, c_dbname=self.database,
+                              c_user=self.admin_username, c_password=self.admin_password,
+                              tracer=self._call_tracer) as conn:
+            conn.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cur:
+                for suffix in expired:
+                    partition_name = "%s_p%s" % (qual_ds_name, suffix)
+                    cur.execute('DROP TABLE IF EXISTS "%s"' % partition_name)
+                    self._event_partitions.discard(suffix)
+                    dropped.append(partition_name)
+        log.info("Dropped %s expired event partitions older than %s days: %s", len(dropped), retention_days, dropped)
+        return dropped
+
     def datastore_exists(self, datastore_name=None):
         qual_ds_name = self._get_datastore_name(datastore_name)
         with self.pool.cursor(**self.cursor_args) as cur:
@@ -430,26 +719,32 @@ class PostgresDataStore(DataStore):
             log.warn("Could not compute value for numrange column %s: %s", col, ex)
         return res
 
+    def _get_col_value(self, col, doc):
+        """Returns the value for a special attribute column given a document"""
+        if col in GEOSPATIAL_COLS:
+            return self._get_geom_value(col, doc)
+        elif col in NUMRANGE_COLS:
+            return self._get_range_value(col, doc)
+        return doc.get(col, None)
+
+    def _get_value_placeholder(self, col, valuename):
+        """Returns the SQL expression for a named statement argument for a column"""
+        if col in GEOSPATIAL_COLS:
+            return "ST_GeomFromText(%(" + valuename + ")s,4326)"
+        elif col in NUMRANGE_COLS:
+            return "%(" + valuename + ")s::numrange"
+        return "%(" + valuename + ")s"
+
     def _create_value_expression(self, col, doc, valuename, value_dict, allow_null_values=False, assign=False):
         """Returns part of an SQL statement to insert or update a value for a column.
         Places the value into a dict for the DB client to convert properly"""
-        if col in GEOSPATIAL_COLS:
-            value = self._get_geom_value(col, doc)
-        elif col in NUMRANGE_COLS:
-            value = self._get_range_value(col, doc)
-        else:
-            value = doc.get(col, None)
+        value = self._get_col_value(col, doc)
 
         if allow_null_values or value or type(value) is bool:
             insert_expr = ", "
             if assign:
                 insert_expr += col + "="
-            if col in GEOSPATIAL_COLS:
-                insert_expr += "ST_GeomFromText(%(" + valuename + ")s,4326)"
-            elif col in NUMRANGE_COLS:
-                insert_expr += "%(" + valuename + ")s::numrange"
-            else:
-                insert_expr += "%(" + valuename + ")s"
+            insert_expr += self._get_value_placeholder(col, valuename)
             value_dict[valuename] = value
         else:
             insert_expr = None
@@ -463,6 +758,7 @@ class PostgresDataStore(DataStore):
         if '_rev' in doc:
             raise BadRequest("Doc must not have '_rev'")
         #log.debug('create_doc(): Create document id=%s', "id")
+        self._ensure_event_partitions([doc], qual_ds_name)
 
         with self.pool.cursor(**self.cursor_args) as cur:
             try:
@@ -486,7 +782,7 @@ class PostgresDataStore(DataStore):
                             xval += insert_expr
 
                 statement = "INSERT INTO " + table + " (id, rev, doc" + xcol + ") VALUES (%(id)s, 1, %(doc)s" + xval + ")"
-                cur.execute(statement, statement_args)
+                self.pool.execute_prepared(cur, statement, statement_args)
                 oid, version = doc["_id"], "1"
             except IntegrityError as ie:
                 if "_assoc_entry_unique" in ie.message:
@@ -504,8 +800,11 @@ class PostgresDataStore(DataStore):
 
         return oid, version
 
-    def create_doc_mult(self, docs, object_ids=None, datastore_name=None):
-        """Creates a list of objects and returns 3-tuples of (Success, id, rev)."""
+    def create_doc_mult(self, docs, object_ids=None, datastore_name=None, bulk_copy=None):
+        """Creates a list of objects and returns 3-tuples of (Success, id, rev).
+        @param bulk_copy  If True, stream rows via COPY; if False, use multi-row INSERT; if None
+                    use COPY for at least bulk_copy_min_rows objects of one type
+        """
         if type(docs) is not list:
             raise BadRequest("Invalid type for docs:%s" % type(docs))
         if object_ids and len(object_ids) != len(docs):
@@ -516,55 +815,98 @@ class PostgresDataStore(DataStore):
 
         qual_ds_name = self._get_datastore_name(datastore_name)
 
+        for i, doc in enumerate(docs):
+            if "_id" not in doc:
+                doc["_id"] = (object_ids[i] if object_ids else None) or self.get_unique_id()
+            doc["_rev"] = "1"
+
         doc_obj_type = [self._get_obj_type(doc, self.profile) for doc in docs]
         all_obj_types = set(doc_obj_type)
+        self._ensure_event_partitions(docs, qual_ds_name)
 
         with self.pool.cursor(**self.cursor_args) as cur:
             # Need to make sure to first insert resources then associations for referential integrity
             for obj_type in sorted(all_obj_types, key=lambda x: OBJ_TYPE_PRECED.get(x, 10)):
-                sb = StatementBuilder()
                 docs_ot = [doc for (doc, doc_ot) in zip(docs, doc_obj_type) if doc_ot == obj_type]
 
                 # Take the first document to determine the type of objects (resource, association, dir entry)
                 extra_cols, table = self._get_extra_cols(docs_ot[0], qual_ds_name, self.profile)
-                xcol = ""
-                for col in extra_cols:
-                    xcol += ", %s" % col
-                sb.append("INSERT INTO "+table+" (id, rev, doc" + xcol + ") VALUES ")
 
-                # Build a large statement
-                for i, doc in enumerate(docs_ot):
-                    object_id = object_ids[i] if object_ids else None
-                    if "_id" not in doc:
-                        object_id = object_id or self.get_unique_id()
-                        doc["_id"] = object_id
+                use_copy = bulk_copy if bulk_copy is not None else len(docs_ot) >= self.bulk_copy_min_rows
+                chunk_size = self.bulk_copy_chunk_size if use_copy else len(docs_ot)
+                for chunk_start in xrange(0, len(docs_ot), chunk_size):
+                    docs_chunk = docs_ot[chunk_start:chunk_start + chunk_size]
+                    if use_copy and chunk_start:
+                        # COPY blocks the gevent hub - let other greenlets run between chunks
+                        gevent.sleep(0)
+                    if use_copy and self._copy_docs(cur, table, extra_cols, docs_chunk):
+                        continue
+                    self._insert_docs(cur, table, extra_cols, docs_chunk)
 
-                    doc["_rev"] = "1"
-                    doc_json = json.dumps(doc)
+        result_list = [(True, doc["_id"], doc["_rev"]) for doc in docs]
 
-                    if i>0:
-                        sb.append(",")
+        return result_list
 
-                    sb.statement_args["id"+str(i)] = doc["_id"]
-                    sb.statement_args["doc"+str(i)] = doc_json
-                    xval = ""
-                    for col in extra_cols:
-                        valuename = col + str(i)
-                        insert_expr = self._create_value_expression(col, doc, valuename, sb.statement_args, allow_null_values=True)
-                        xval += insert_expr
+    def _insert_docs(self, cur, table, extra_cols, docs):
+        """Inserts documents with assigned ids into table with one multi-row INSERT statement"""
+        sb = StatementBuilder()
+        xcol = ""
+        for col in extra_cols:
+            xcol += ", %s" % col
+        sb.append("INSERT INTO "+table+" (id, rev, doc" + xcol + ") VALUES ")
 
-                    sb.append("(%(id", str(i), ")s, 1, %(doc", str(i), ")s", xval, ")")
+        # Build a large statement
+        for i, doc in enumerate(docs):
+            doc_json = json.dumps(doc)
 
-                try:
-                    cur.execute(*sb.build())
-                    if cur.rowcount != len(docs_ot):
-                        log.warn("Number of objects created (%s) != objects given (%s) in %s", cur.rowcount, len(docs_ot), table)
-                except IntegrityError as ie:
-                    raise BadRequest("Some object already exists: %s" % ie)
+            if i>0:
+                sb.append(",")
 
-        result_list = [(True, doc["_id"], doc["_rev"]) for doc in docs]
+            sb.statement_args["id"+str(i)] = doc["_id"]
+            sb.statement_args["doc"+str(i)] = doc_json
+            xval = ""
+            for col in extra_cols:
+                valuename = col + str(i)
+                insert_expr = self._create_value_expression(col, doc, valuename, sb.statement_args, allow_null_values=True)
+                xval += insert_expr
 
-        return result_list
+            sb.append("(%(id", str(i), ")s, 1, %(doc", str(i), ")s", xval, ")")
+
+        try:
+            cur.execute(*sb.build())
+            if cur.rowcount != len(docs):
+                log.warn("Number of objects created (%s) != objects given (%s) in %s", cur.rowcount, len(docs), table)
+        except IntegrityError as ie:
+            raise BadRequest("Some object already exists: %s" % ie)
+
+    def _copy_docs(self, cur, table, extra_cols, docs):
+        """Streams documents with assigned ids into table via COPY FROM STDIN within a savepoint.
+        Returns False if COPY failed on a constraint and the savepoint was rolled back, so that the
+        caller can fall back to INSERT (which reports the conflict)."""
+        def row_gen():
+            for doc in docs:
+                row = [doc["_id"], 1, json.dumps(doc)]
+                for col in extra_cols:
+                    row.append(self._get_copy_value(col, doc))
+                yield row
+
+        statement = "COPY " + table + " (id, rev, doc" + "".join(", " + col for col in extra_cols) + ") FROM STDIN"
+        cur.execute("SAVEPOINT bulk_copy")
+        try:
+            copy_expert_blocking(cur, statement, CopyRowReader(row_gen()))
+        except IntegrityError as ie:
+            log.debug("COPY into %s failed, falling back to INSERT: %s", table, ie)
+            cur.execute("ROLLBACK TO SAVEPOINT bulk_copy")
+            return False
+        cur.execute("RELEASE SAVEPOINT bulk_copy")
+        return True
+
+    def _get_copy_value(self, col, doc):
+        """Returns the value for a column in a COPY row, equivalent to _create_value_expression"""
+        value = self._get_col_value(col, doc)
+        if col in GEOSPATIAL_COLS and value:
+            return "SRID=4326;" + value
+        return value
 
     def create_attachment(self, doc, attachment_name, data, content_type=None, datastore_name=""):
         if not isinstance(attachment_name, str):
@@ -607,7 +949,13 @@ class PostgresDataStore(DataStore):
 
         return oid, version
 
-    def update_doc_mult(self, docs, datastore_name=None):
+    def update_doc_mult(self, docs, datastore_name=None, raise_on_conflict=True):
+        """Updates (or deletes if _deleted is set) a list of documents with batched statements.
+        Returns 3-tuples of (Success, id, rev).
+        @param raise_on_conflict  If True, a revision conflict raises Conflict (a missing document to delete
+                    raises NotFound) and no document is changed. If False, Success is False for documents
+                    with a revision conflict or that do not exist; these are left unchanged, all others updated.
+        """
         if type(docs) is not list:
             raise BadRequest("Invalid type for docs:%s" % type(docs))
         if not all(["_id" in doc for doc in docs]):
@@ -619,19 +967,92 @@ class PostgresDataStore(DataStore):
         log.debug('update_doc_mult(): update %s documents', len(docs))
 
         qual_ds_name = self._get_datastore_name(datastore_name)
-        # Could use cur.executemany() here but does not allow for case-by-case reaction to failure
+
+        # A document id may only occur once per statement; repeated ids go into subsequent rounds
+        rounds = []
+        for doc in docs:
+            for docs_round in rounds:
+                if doc["_id"] not in docs_round:
+                    break
+            else:
+                docs_round = {}
+                rounds.append(docs_round)
+            docs_round[doc["_id"]] = doc
+
+        success = {}    # id(doc) -> success
         with self.pool.cursor(**self.cursor_args) as cur:
-            result_list = []
-            for doc in docs:
-                if "_deleted" in doc:
-                    self._delete_doc(cur, qual_ds_name, doc["_id"])
-                    oid, version = doc["_id"], doc["_rev"]
-                else:
-                    oid, version = self._update_doc(cur, qual_ds_name, doc)
-                result_list.append((True, oid, version))
+            for docs_round in rounds:
+                # Group by table, keeping deletes separate
+                table_docs = {}
+                for doc in docs_round.itervalues():
+                    extra_cols, table = self._get_extra_cols(doc, qual_ds_name, self.profile)
+                    if "_deleted" in doc:
+                        table_docs.setdefault((table, None), []).append(doc)
+                    else:
+                        table_docs.setdefault((table, extra_cols), []).append(doc)
+
+                for (table, extra_cols), table_doc_list in table_docs.iteritems():
+                    for i in xrange(0, len(table_doc_list), self.bulk_update_chunk_size):
+                        docs_chunk = table_doc_list[i:i + self.bulk_update_chunk_size]
+                        if extra_cols is None:
+                            done_ids = self._delete_docs(cur, table, [doc["_id"] for doc in docs_chunk])
+                        else:
+                            done_ids = self._update_docs(cur, table, extra_cols, docs_chunk)
+                        for doc in docs_chunk:
+                            success[id(doc)] = doc["_id"] in done_ids
+                        if raise_on_conflict and len(done_ids) != len(docs_chunk):
+                            self._raise_update_failure(docs, success)
+
+        result_list = [(success[id(doc)], doc["_id"], doc["_rev"]) for doc in docs]
 
         return result_list
 
+    def _raise_update_failure(self, docs, success):
+        """Raises for the first document not updated in a batch. The transaction is rolled back, so
+        the revisions of documents already updated are restored as well."""
+        for doc in docs:
+            if success.get(id(doc), None) and "_deleted" not in doc:
+                doc["_rev"] = str(int(doc["_rev"]) - 1)
+        failed_doc = next(doc for doc in docs if success.get(id(doc), None) is False)
+        if "_deleted" in failed_doc:
+            raise NotFound("Object with id %s does not exist." % failed_doc["_id"])
+        raise Conflict("Object with id %s revision conflict" % failed_doc["_id"])
+
+    def _update_docs(self, cur, table, extra_cols, docs):
+        """Updates documents with one UPDATE statement, checking revisions. Increments the revision of
+        updated documents and returns the set of updated document ids."""
+        sb = StatementBuilder()
+        doc_cast = "::jsonb" if self.jsonb_docs else "::json"
+        sb.append("UPDATE ", table, " AS t SET doc=v.doc, rev=v.rev+1")
+        for col in extra_cols:
+            sb.append(", ", col, "=COALESCE(v.", col, ", t.", col, ")")
+        sb.append(" FROM (VALUES ")
+        for i, doc in enumerate(docs):
+            old_rev = int(doc["_rev"])
+            doc["_rev"] = str(old_rev + 1)
+            if i > 0:
+                sb.append(",")
+            sb.append("(%(id", str(i), ")s, %(rev", str(i), ")s::int, %(doc", str(i), ")s", doc_cast)
+            sb.statement_args["id" + str(i)] = doc["_id"]
+            sb.statement_args["rev" + str(i)] = old_rev
+            sb.statement_args["doc" + str(i)] = json.dumps(doc)
+            for col in extra_cols:
+                # Same as single document update: empty values do not change the column
+                valuename = col + str(i)
+                value = self._get_col_value(col, doc)
+                sb.statement_args[valuename] = value if (value or type(value) is bool) else None
+                sb.append(", ", self._get_value_placeholder(col, valuename), COL_TYPE_CAST.get(col, ""))
+            sb.append(")")
+        sb.append(") AS v(id, rev, doc", "".join(", " + col for col in extra_cols), ")")
+        sb.append(" WHERE t.id=v.id AND t.rev=v.rev RETURNING t.id")
+
+        cur.execute(*sb.build())
+        updated_ids = {row[0] for row in cur.fetchall()}
+        for doc in docs:
+            if doc["_id"] not in updated_ids:
+                doc["_rev"] = str(int(doc["_rev"]) - 1)
+        return updated_ids
+
     def _update_doc(self, cur, table, doc):
         old_rev = int(doc["_rev"])
         doc["_rev"] = str(old_rev+1)
@@ -716,8 +1137,8 @@ class PostgresDataStore(DataStore):
         elif object_type == "DirEntry":
             table = qual_ds_name + "_dir"
 
-        with self.pool.cursor(**self.cursor_args) as cur:
-            cur.execute("SELECT doc FROM "+table+" WHERE id=%s", (doc_id,))
+        with self.read_pool.cursor(**self.cursor_args) as cur:
+            self.read_pool.execute_prepared(cur, "SELECT doc FROM "+table+" WHERE id=%s", (doc_id,))
             doc_list = cur.fetchall()
             if not doc_list:
                 raise NotFound('Object with id %s does not exist.' % doc_id)
@@ -733,7 +1154,7 @@ class PostgresDataStore(DataStore):
         qual_ds_name = self._get_datastore_name(datastore_name)
 
         with self.pool.cursor(**self.cursor_args) as cur:
-            cur.execute("SELECT rev FROM "+qual_ds_name+" WHERE id=%s", (doc_id,))
+            self.pool.execute_prepared(cur, "SELECT rev FROM "+qual_ds_name+" WHERE id=%s", (doc_id,))
             doc_list = cur.fetchall()
             if not doc_list:
                 raise NotFound('Object with id %s does not exist.' % doc_id)
@@ -761,18 +1182,12 @@ class PostgresDataStore(DataStore):
         elif object_type == "DirEntry":
             table = qual_ds_name + "_dir"
 
-        query = "SELECT id, doc FROM "+table+" WHERE id IN ("
-        query_args = dict()
-        for i, oid in enumerate(object_ids):
-            arg_name = "id" + str(i)
-            if i>0:
-                query += ","
-            query += "%(" + arg_name + ")s"
-            query_args[arg_name] = oid
-        query += ")"
+        # Ids as one array argument, so that the statement shape does not depend on the number of ids
+        query = "SELECT id, doc FROM "+table+" WHERE id=ANY(%(ids)s)"
+        query_args = dict(ids=list(object_ids))
 
-        with self.pool.cursor(**self.cursor_args) as cur:
-            cur.execute(query, query_args)
+        with self.read_pool.cursor(**self.cursor_args) as cur:
+            self.read_pool.execute_prepared(cur, query, query_args)
             rows = cur.fetchall()
 
         doc_by_id = {row[0]: row[1] for row in rows}
@@ -842,8 +1257,15 @@ class PostgresDataStore(DataStore):
             table = qual_ds_name + "_dir"
 
         with self.pool.cursor(**self.cursor_args) as cur:
-            for doc_id in object_ids:
-                self._delete_doc(cur, table, doc_id)
+            deleted_ids = self._delete_docs(cur, table, object_ids)
+            if len(deleted_ids) != len(set(object_ids)):
+                missing_ids = [doc_id for doc_id in object_ids if doc_id not in deleted_ids]
+                raise NotFound('Object with id %s does not exist.' % missing_ids[0])
+
+    def _delete_docs(self, cur, table, doc_ids):
+        """Deletes documents with one statement. Returns the set of deleted ids"""
+        cur.execute("DELETE FROM "+table+" WHERE id=ANY(%s) RETURNING id", (list(doc_ids), ))
+        return {row[0] for row in cur.fetchall()}
 
     def _delete_doc(self, cur, table, doc_id):
         sql = "DELETE FROM "+table+" WHERE id=%s"
@@ -884,7 +1306,7 @@ class PostgresDataStore(DataStore):
         extra_clause = ""
         if "limit" in all_args and all_args['limit'] > 0:
             extra_clause += " LIMIT %s" % all_args['limit']
-        if "skip" in all_args and all_args['skip'] > 0:
+        if "skip" in all_args and all_args['skip'] > 0 and "page_token" not in all_args:
             extra_clause += " OFFSET %s " % all_args['skip']
 
         view_args['extra_clause'] = extra_clause
@@ -947,7 +1369,7 @@ class PostgresDataStore(DataStore):
             raise NotImplementedError()
 
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             #print query + query_clause + extra_clause, query_args
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
@@ -973,14 +1395,8 @@ class PostgresDataStore(DataStore):
             parent = key[2]
             if type(entry) in (list, tuple):
                 # directory entry key is a list - search for multiple
-                query_args.update(dict(org=org, parent=parent))
-                query_clause += "org=%(org)s AND parent=%(parent)s AND key IN ("
-                for i, entry1 in enumerate(entry):
-                    if i > 0:
-                        query_clause += ","
-                    query_args["key"+str(i)] = entry1
-                    query_clause += "%(key"+str(i)+")s"
-                query_clause += ")"
+                query_args.update(dict(org=org, parent=parent, keys=list(entry)))
+                query_clause += "org=%(org)s AND parent=%(parent)s AND key=ANY(%(keys)s)"
             else:
                 query_args.update(dict(org=org, parent=parent, key=entry))
                 query_clause += "org=%(org)s AND parent=%(parent)s AND key=%(key)s"
@@ -1013,9 +1429,13 @@ class PostgresDataStore(DataStore):
             raise NotImplementedError()
 
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             #print query + query_clause + extra_clause, query_args
-            cur.execute(query + query_clause + extra_clause, query_args)
+            if extra_clause:
+                cur.execute(query + query_clause + extra_clause, query_args)
+            else:
+                # Directory lookups without limits are frequent and have few statement shapes
+                self.read_pool.execute_prepared(cur, query + query_clause, query_args)
             rows = cur.fetchall()
 
         #if view_name == "by_attribute":
@@ -1046,7 +1466,7 @@ class PostgresDataStore(DataStore):
             raise NotImplementedError()
 
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -1081,7 +1501,7 @@ class PostgresDataStore(DataStore):
             order_clause += " DESC"
 
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             # print query + query_clause + order_clause + extra_clause, query_args
             cur.execute(query + query_clause + order_clause + extra_clause, query_args)
             rows = cur.fetchall()
@@ -1154,13 +1574,29 @@ class PostgresDataStore(DataStore):
         else:
             raise NotImplementedError()
 
-        if filter.get('descending', False):
+        descending = filter.get('descending', False)
+        if descending:
             order_clause += " DESC"
 
+        if "page_token" in filter:
+            # Keyset pagination: order by (ts_created, id) and seek past the last event of the previous page
+            order_clause += ", id DESC" if descending else ", id"
+            if filter["page_token"]:
+                key_values = decode_page_token(filter["page_token"])
+                if len(key_values) != 2:
+                    raise BadRequest("Page token does not match query order")
+                query_args['page_ts'], query_args['page_id'] = key_values
+                if query_clause != " WHERE ":
+                    query_clause += " AND "
+                # The plain ts_created bound lets the planner prune time partitions and use indexes
+                seek_op = "<" if descending else ">"
+                query_clause += "ts_created%s=%%(page_ts)s AND (ts_created, id)%s(%%(page_ts)s, %%(page_id)s)" % (
+                    seek_op, seek_op)
+
         if query_clause == " WHERE ":
             query_clause = " "
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             sql = query + query_clause + order_clause + extra_clause
             #print "QUERY:", sql, query_args
             #print "filter:", filter
@@ -4,6 +4,8 @@
 
 __author__ = 'Michael Meisinger'
 
+import json
+
 from pyon.core.bootstrap import get_obj_registry, CFG
 from pyon.core.exception import BadRequest, Conflict, NotFound, Inconsistent
 from pyon.core.object import IonObjectBase, IonObjectSerializer, IonObjectDeserializer
@@ -51,11 +53,15 @@ class PostgresPyonDataStore(PostgresDataStore):
                                    object_id=object_id, datastore_name=datastore_name,
                                    attachments=attachments)
 
-    def create_mult(self, objects, object_ids=None, allow_ids=None):
+    def create_mult(self, objects, object_ids=None, allow_ids=None, bulk_copy=None):
+        """
+        Creates a list of objects. Large lists are streamed via COPY (see create_doc_mult).
+        """
         if any([not isinstance(obj, IonObjectBase) for obj in objects]):
             raise BadRequest("Obj param is not instance of IonObjectBase")
 
-        return self.create_doc_mult([self._ion_object_to_persistence_dict(obj) for obj in objects], object_ids)
+        return self.create_doc_mult([self._ion_object_to_persistence_dict(obj) for obj in objects], object_ids,
+                                    bulk_copy=bulk_copy)
 
 
     def update(self, obj, datastore_name=""):
@@ -64,11 +70,12 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         return self.update_doc(self._ion_object_to_persistence_dict(obj))
 
-    def update_mult(self, objects):
+    def update_mult(self, objects, raise_on_conflict=True):
         if any([not isinstance(obj, IonObjectBase) for obj in objects]):
             raise BadRequest("Obj param is not instance of IonObjectBase")
 
-        return self.update_doc_mult([self._ion_object_to_persistence_dict(obj) for obj in objects])
+        return self.update_doc_mult([self._ion_object_to_persistence_dict(obj) for obj in objects],
+                                    raise_on_conflict=raise_on_conflict)
 
 
     def read(self, object_id, rev_id="", datastore_name="", object_type=None):
@@ -174,7 +181,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(access_args, qual_ds_name, query_clause, query_args)
         extra_clause = view_args.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -225,7 +232,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(access_args, qual_ds_name, query_clause, query_args)
         extra_clause = view_args.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -344,7 +351,7 @@ class PostgresPyonDataStore(PostgresDataStore):
         extra_clause = view_args.get("extra_clause", "")
         sql = query + query_clause + extra_clause
         #print "find_associations(): SQL=", sql, query_args
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(sql, query_args)
             rows = cur.fetchall()
 
@@ -356,6 +363,104 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         return assocs
 
+    def find_subgraph(self, root, predicate=None, max_depth=0, direction="O", id_only=False, access_args=None):
+        """
+        Returns the resources and associations reachable from a root resource by following associations
+        recursively, in one query. Does not follow cycles, but returns the associations closing them.
+        @param root  Root resource id
+        @param predicate  A predicate or list of predicates to follow. All predicates if empty
+        @param max_depth  Maximum number of associations from root to follow. 0 for unlimited
+        @param direction  O=follow associations from subject to object (root's objects are children),
+                S=from object to subject, A=any side
+        @retval tuple (resource objects or ids, root first in breadth first order, association objects)
+        """
+        if type(id_only) is not bool:
+            raise BadRequest('id_only must be type bool, not %s' % type(id_only))
+        if not root or type(root) is not str:
+            raise BadRequest("Must provide root resource id")
+        if direction not in ("O", "S", "A"):
+            raise BadRequest("Unknown direction: %s" % direction)
+        if predicate and type(predicate) not in (list, tuple):
+            predicate = [predicate]
+
+        qual_ds_name = self._get_datastore_name()
+        assoc_table = qual_ds_name + "_assoc"
+
+        def next_id(node):
+            # Expression for the id of the resource reached from node via association ass
+            if direction == "O":
+                return "ass.o"
+            elif direction == "S":
+                return "ass.s"
+            return "CASE WHEN ass.s=" + node + " THEN ass.o ELSE ass.s END"
+
+        def assoc_clause(node):
+            if direction == "O":
+                clause = "ass.s=" + node
+            elif direction == "S":
+                clause = "ass.o=" + node
+            else:
+                clause = "(ass.s=" + node + " OR ass.o=" + node + ")"
+            clause += " AND ass.retired<>true"
+            if predicate:
+                clause += " AND ass.p=ANY(%(preds)s)"
+            return clause
+
+        # Reachable nodes, each node once (with depth limit: once per depth), so dense or cyclic
+        # graphs do not cause a path explosion. UNION discards rows already found.
+        query_args = dict(root=root, preds=list(predicate or []), max_depth=max_depth)
+        depth_col, depth_next, depth_clause = "", "", ""
+        if max_depth > 0:
+            depth_col, depth_next, depth_clause = ", depth", ", sg.depth+1", " AND sg.depth<%(max_depth)s"
+        query = "WITH RECURSIVE sg(nid" + depth_col + ") AS ("
+        query += "SELECT %(root)s::text" + (", 0" if depth_col else "")
+        query += " UNION "
+        query += "SELECT " + next_id("sg.nid") + "::text" + depth_next + " FROM sg, " + assoc_table + " ass"
+        query += " WHERE " + assoc_clause("sg.nid") + depth_clause
+        query += ") SELECT 'A', ass.id, ass.s, ass.o, ass.doc FROM " + assoc_table + " ass WHERE ass.id IN ("
+        query += "SELECT ass.id FROM sg, " + assoc_table + " ass WHERE " + assoc_clause("sg.nid") + depth_clause + ")"
+        query += " UNION ALL SELECT 'R', res.id, NULL, NULL, " + ("NULL" if id_only else "res.doc")
+        query += " FROM " + qual_ds_name + " res WHERE res.id IN (SELECT nid FROM sg)"
+        query_clause = self._add_deleted_filter("res", None, "", query_args)
+        query_clause = self._add_access_filter(access_args, qual_ds_name, query_clause, query_args, tablealias="res")
+        query += " AND " + query_clause
+
+        with self.read_pool.cursor(**self.cursor_args) as cur:
+            cur.execute(query, query_args)
+            rows = cur.fetchall()
+
+        res_docs = {row[1]: row[4] for row in rows if row[0] == "R"}
+        if root not in res_docs:
+            raise NotFound("Resource %s does not exist" % root)
+        assocs_by_node = {}
+        for row in rows:
+            if row[0] == "A" and row[2] in res_docs and row[3] in res_docs:
+                if direction in ("O", "A"):
+                    assocs_by_node.setdefault(row[2], []).append(row)
+                if direction in ("S", "A") and row[2] != row[3]:
+                    assocs_by_node.setdefault(row[3], []).append(row)
+
+        # Breadth first from root, skipping parts only reachable via deleted or invisible resources
+        node_ids, assoc_rows = [root], []
+        node_depth, assoc_seen = {root: 0}, set()
+        for node_id in node_ids:
+            if max_depth > 0 and node_depth[node_id] >= max_depth:
+                continue
+            for row in assocs_by_node.get(node_id, []):
+                if row[1] in assoc_seen:
+                    continue
+                assoc_seen.add(row[1])
+                assoc_rows.append(row)
+                child_id = row[3] if row[2] == node_id else row[2]
+                if child_id not in node_depth:
+                    node_depth[child_id] = node_depth[node_id] + 1
+                    node_ids.append(child_id)
+
+        assocs = [self._persistence_dict_to_ion_object(row[4]) for row in assoc_rows]
+        if id_only:
+            return node_ids, assocs
+        return [self._persistence_dict_to_ion_object(res_docs[node_id]) for node_id in node_ids], assocs
+
     def _prepare_find_return(self, rows, res_assocs=None, id_only=True, **kwargs):
         if id_only:
             res_ids = [self._prep_id(row[0]) for row in rows]
@@ -426,8 +531,11 @@ class PostgresPyonDataStore(PostgresDataStore):
     def find_resources_ext(self, restype="", lcstate="", name="",
                            keyword=None, nested_type=None,
                            attr_name=None, attr_value=None, alt_id=None, alt_id_ns=None,
-                           limit=None, skip=None, descending=None, id_only=True, query=None, access_args=None):
+                           limit=None, skip=None, descending=None, id_only=True, query=None, access_args=None,
+                           as_iterator=False):
         filter_kwargs = self._get_view_args(dict(limit=limit, skip=skip, descending=descending), access_args)
+        if as_iterator and not query:
+            raise BadRequest("as_iterator requires a query")
         if query:
             qargs = query["query_args"]
             if id_only is not None:
@@ -436,6 +544,8 @@ class PostgresPyonDataStore(PostgresDataStore):
                 qargs["limit"] = limit
             if skip is not None and skip != 0:
                 qargs["skip"] = skip
+            if as_iterator:
+                return self.find_by_query_iter(query, access_args=access_args)
             return self.find_by_query(query, access_args=access_args)
         elif name:
             if lcstate:
@@ -482,7 +592,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -517,7 +627,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -544,7 +654,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -568,13 +678,17 @@ class PostgresPyonDataStore(PostgresDataStore):
         query_clause = " WHERE lcstate<>'DELETED' "
         query_args = dict(type_=restype, kw=[keyword])
 
-        query_clause += "AND %(kw)s <@ json_keywords(doc)"
+        if self.jsonb_docs:
+            query_clause += "AND doc @> %(kwdoc)s::jsonb"
+            query_args["kwdoc"] = json.dumps(dict(keywords=[keyword]))
+        else:
+            query_clause += "AND %(kw)s <@ json_keywords(doc)"
         if restype:
             query_clause += " AND type_=%(type_)s"
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -603,7 +717,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -637,7 +751,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -671,7 +785,7 @@ class PostgresPyonDataStore(PostgresDataStore):
 
         query_clause = self._add_access_filter(filter, qual_ds_name, query_clause, query_args)
         extra_clause = filter.get("extra_clause", "")
-        with self.pool.cursor(**self.cursor_args) as cur:
+        with self.read_pool.cursor(**self.cursor_args) as cur:
             cur.execute(query + query_clause + extra_clause, query_args)
             rows = cur.fetchall()
 
@@ -723,14 +837,66 @@ class PostgresPyonDataStore(PostgresDataStore):
     def find_by_query(self, query, access_args=None):
         """
         Find resources given a datastore query expression dict.
+        For paged queries (see DatastoreQueryBuilder.set_page_token), the continuation token for the
+        next page is set as next_page_token in the query's _result dict.
         @param query  a dict representation of a datastore query
         @retval  list of resource ids or resource objects matching query (dependent on id_only value)
         """
+        pqb = self._get_query_builder(query, access_args)
+
+        with self.read_pool.cursor(**self.cursor_args) as cur:
+            exec_query = pqb.get_query()
+            cur.execute(exec_query, pqb.get_values())
+            rows = cur.fetchall()
+            log.info("find_by_query() QUERY: %s (%s rows)", cur.query, cur.rowcount)
+            query_res = {}
+            query["_result"] = query_res
+            query_res["statement_gen"] = exec_query
+            query_res["statement_sql"] = cur.query
+            query_res["rowcount"] = cur.rowcount
+            if pqb.page_cols:
+                query_res["next_page_token"] = pqb.get_page_token(rows)
+
+        row_func = self._get_query_row_func(query, pqb)
+        res_vals = [row_func(row) for row in rows]
+
+        return res_vals
+
+    def find_by_query_iter(self, query, access_args=None, fetch_size=None):
+        """
+        Find resources given a datastore query expression dict, returning an iterator.
+        Rows are fetched from a server-side cursor in batches of fetch_size and converted as
+        the iterator is consumed. Holds a database connection until exhausted or closed.
+        @param query  a dict representation of a datastore query
+        @param fetch_size  number of rows to fetch per round trip (defaults to query_fetch_size config)
+        @retval  iterator of resource ids or resource objects matching query (dependent on id_only value)
+        """
+        pqb = self._get_query_builder(query, access_args)
+        row_func = self._get_query_row_func(query, pqb)
+        fetch_size = fetch_size or self.query_fetch_size
+
+        def query_iter():
+            with self.read_pool.cursor("query_iter", **self.cursor_args) as cur:
+                exec_query = pqb.get_query()
+                cur.execute(exec_query, pqb.get_values())
+                log.info("find_by_query_iter() QUERY: %s", cur.query)
+                while True:
+                    rows = cur.fetchmany(fetch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        yield row_func(row)
+                cur.close()
+
+        return query_iter()
+
+    def _get_query_builder(self, query, access_args=None):
+        """Returns a PostgresQueryBuilder for the query with access and deleted filters applied"""
         qual_ds_name = self._get_datastore_name()
         query_ds_sub = query["query_args"].get("ds_sub", None)
         query_format = query["query_args"].get("format", "")
 
-        pqb = PostgresQueryBuilder(query, qual_ds_name)
+        pqb = PostgresQueryBuilder(query, qual_ds_name, jsonb=self.jsonb_docs)
         if self.profile == DataStore.DS_PROFILE.RESOURCES and not query_ds_sub:
             table_alias = qual_ds_name if query_format != "complex" else "base"
             pqb.where = self._add_access_filter(access_args, qual_ds_name, pqb.where, pqb.values,
@@ -740,36 +906,33 @@ class PostgresPyonDataStore(PostgresDataStore):
             pqb.where = self._add_deleted_filter(pqb.table_aliases[0], query_ds_sub,
                                                  pqb.where, pqb.values,
                                                  show_all=query["query_args"].get("show_all", False))
+        return pqb
 
-        with self.pool.cursor(**self.cursor_args) as cur:
-            exec_query = pqb.get_query()
-            cur.execute(exec_query, pqb.get_values())
-            rows = cur.fetchall()
-            log.info("find_by_query() QUERY: %s (%s rows)", cur.query, cur.rowcount)
-            query_res = {}
-            query["_result"] = query_res
-            query_res["statement_gen"] = exec_query
-            query_res["statement_sql"] = cur.query
-            query_res["rowcount"] = cur.rowcount
-
+    def _get_query_row_func(self, query, pqb):
+        """Returns a function converting a query result row into the returned value"""
         id_only = query["query_args"].get("id_only", True)
+        query_format = query["query_args"].get("format", "")
         if query_format == "complex" and pqb.has_basic_cols:
             # Return format is list of lists
             if id_only:
-                res_vals = [[self._prep_id(row[0])] + list(row[1:]) for row in rows]
+                row_func = lambda row: [self._prep_id(row[0])] + list(row[1:])
             else:
-                res_vals = [[self._persistence_dict_to_ion_object(row[1])] + list(rows[2:]) for row in rows]
+                row_func = lambda row: [self._persistence_dict_to_ion_object(row[1])] + list(row[2:])
 
         elif query_format == "complex":
-            res_vals = [list(row) for row in rows]
+            row_func = list
 
         else:
             if id_only:
-                res_vals = [self._prep_id(row[0]) for row in rows]
+                row_func = lambda row: self._prep_id(row[0])
             else:
-                res_vals = [self._persistence_dict_to_ion_object(row[-1]) for row in rows]
+                row_func = lambda row: self._persistence_dict_to_ion_object(row[-1])
 
-        return res_vals
+        if pqb.page_cols:
+            # Strip the sort key values selected for the page token
+            num_page_cols = len(pqb.page_cols)
+            return lambda row: row_func(row[:-num_page_cols])
+        return row_func
 
     # -------------------------------------------------------------------------
     # Internal operations
@@ -4,9 +4,32 @@
 
 __author__ = 'Michael Meisinger'
 
+import json
+
 from pyon.core.exception import BadRequest
 from pyon.datastore.datastore import DataStore
-from pyon.datastore.datastore_query import DQ, DatastoreQueryBuilder
+from pyon.datastore.datastore_query import DQ, DatastoreQueryBuilder, encode_page_token, decode_page_token
+
+# Object schema types stored with the same JSON type as the given value type
+JSON_VALUE_TYPES = {str: {"str"}, unicode: {"str"}, bool: {"bool"},
+                    int: {"int", "long", "float"}, long: {"int", "long", "float"}, float: {"int", "long", "float"}}
+_attribute_types = None
+
+
+def get_attribute_types():
+    """Returns a dict of attribute name to the set of schema types declared for it in any object type"""
+    global _attribute_types
+    if _attribute_types is None:
+        from pyon.core.registry import model_classes
+        if not model_classes:
+            # Object registry not initialized yet - no types known
+            return {}
+        att_types = {}
+        for clzz in model_classes.itervalues():
+            for att_name, att_schema in getattr(clzz, "_schema", {}).iteritems():
+                att_types.setdefault(att_name, set()).add(att_schema["type"])
+        _attribute_types = att_types
+    return _attribute_types
 
 
 class PostgresQueryBuilder(object):
@@ -36,10 +59,17 @@ class PostgresQueryBuilder(object):
               DQ.XOP_ATTILIKE: "ILIKE",
               }
 
-    def __init__(self, query, basetable):
+    def __init__(self, query, basetable, jsonb=False):
+        """
+        @param query  A datastore query expression dict
+        @param basetable  Name of the table to query
+        @param jsonb  If True, documents are stored as jsonb and attribute filters use jsonb containment
+                    where the value has the JSON type of the attribute
+        """
         DatastoreQueryBuilder.check_query(query)
         self.query = query
         self.basetable = basetable
+        self.jsonb = jsonb
         self.from_tables = basetable
         self._valcnt = 0
         self.values = {}
@@ -48,6 +78,7 @@ class PostgresQueryBuilder(object):
         self.query_format = self.query["query_args"].get("format", "")
         self.table_aliases = [self.basetable]
         self.has_basic_cols = True
+        self.page_cols = None
 
         if self.query_format == "sql":
             self.basic_cols = False
@@ -112,6 +143,9 @@ class PostgresQueryBuilder(object):
             self.group_by = None
             self.having = None
 
+        if "page_token" in self.query["query_args"]:
+            self._build_page_seek(self.query["query_args"]["page_token"])
+
     def _value(self, value, flatten_list=True):
         """Saves a value for later type conformant insertion into the query"""
         if value and type(value) in (list, tuple) and flatten_list:
@@ -147,6 +181,8 @@ class PostgresQueryBuilder(object):
             attname, value = args
             if self._is_standard_col(attname):
                 return "%s%s%s%s" % (table_prefix, attname, self.OP_STR[op], self._value(self._sub_param(value)))
+            elif op == DQ.OP_EQ and self.jsonb and self._is_json_type_match(attname, self._sub_param(value)):
+                return self._jsonb_contains(table_prefix, attname, self._sub_param(value))
             else:
                 return "json_string(%sdoc,%s)%s%s" % (table_prefix, self._value(attname), self.OP_STR[op],
                                                       self._value(str(self._sub_param(value))))
@@ -156,6 +192,9 @@ class PostgresQueryBuilder(object):
             if self._is_standard_col(attname):
                 in_exp = ",".join(["%s" % self._value(self._sub_param(val)) for val in values])
                 return table_prefix + attname + " IN (" + in_exp + ")"
+            elif self.jsonb and values and all(self._is_json_type_match(attname, self._sub_param(val)) for val in values):
+                return "(%s)" % " OR ".join(self._jsonb_contains(table_prefix, attname, self._sub_param(val))
+                                            for val in values)
             else:
                 in_exp = ",".join(["%s" % self._value(str(self._sub_param(val))) for val in values])
                 return "json_string(%sdoc,%s) IN (%s)" % (table_prefix, self._value(attname), in_exp)
@@ -182,6 +221,8 @@ class PostgresQueryBuilder(object):
         elif op == DQ.XOP_KEYWORD:
             value = args[0]
             kw_values = value if type(value) in (list, tuple) else [value]
+            if self.jsonb:
+                return "%sdoc @> %s::jsonb" % (table_prefix, self._value(json.dumps(dict(keywords=list(kw_values)))))
             return "%s <@ json_keywords(%sdoc)" % (self._value(kw_values, flatten_list=False), table_prefix)
         elif op == DQ.XOP_ALTID:
             alt_id_ns, alt_id = args
@@ -341,6 +382,29 @@ class PostgresQueryBuilder(object):
         else:
             raise BadRequest("Unknown op: %s" % op)
 
+    def _is_json_type_match(self, attname, value):
+        """Returns True if value has the JSON type of the attribute (dot separated path) in all object
+        types that define it. Containment compares typed values, e.g. "5" does not match 5, while
+        json_string compares text."""
+        from pyon.core.registry import model_classes
+        att_types = get_attribute_types()
+        path = attname.split(".")
+        for part in path[:-1]:
+            # Values within free-form dicts can have any type
+            if not att_types.get(part, None) or not all(t in model_classes for t in att_types[part]):
+                return False
+        value_types = JSON_VALUE_TYPES.get(type(value), None)
+        leaf_types = att_types.get(path[-1], None)
+        return bool(value_types and leaf_types and leaf_types <= value_types)
+
+    def _jsonb_contains(self, table_prefix, attname, value):
+        """Returns a jsonb containment expression for attribute (dot separated path) equal to value,
+        which can use a GIN index on the doc column"""
+        contained = value
+        for key in reversed(attname.split(".")):
+            contained = {key: contained}
+        return "%sdoc @> %s::jsonb" % (table_prefix, self._value(json.dumps(contained)))
+
     def _build_order_by(self, expr):
         if not expr:
             return ""
@@ -350,6 +414,50 @@ class PostgresQueryBuilder(object):
         order_by = ",".join(order_by_list)
         return order_by
 
+    def _build_page_seek(self, page_token):
+        """
+        Sets up keyset pagination: orders by the sort columns followed by id, returns the sort key
+        values with each row and, given a continuation token, seeks past the last row of the previous
+        page with a row value comparison instead of scanning and discarding rows with OFFSET.
+        """
+        if self.query_format == "sql":
+            raise BadRequest("Paged queries not supported for format: %s" % self.query_format)
+        table_prefix = "base." if self.query_format == "complex" else ""
+        sort_cols, sort_desc = [], None
+        for col, colsort in self.query["order_by"] or []:
+            if not self._is_standard_col(col):
+                raise BadRequest("Paged query cannot order by: %s" % col)
+            col_desc = colsort.lower() == "desc"
+            if sort_desc is not None and col_desc != sort_desc:
+                raise BadRequest("Paged query must order all columns in one direction")
+            sort_desc = col_desc
+            sort_cols.append(table_prefix + col)
+        if table_prefix + "id" not in sort_cols:
+            # The id makes the sort key unique and the seek position well defined
+            sort_cols.append(table_prefix + "id")
+
+        self.page_cols = sort_cols
+        self.cols = self.cols + sort_cols
+        self.order_by = ",".join("%s %s" % (col, "DESC" if sort_desc else "ASC") for col in sort_cols)
+        if page_token:
+            key_values = decode_page_token(page_token)
+            if len(key_values) != len(sort_cols):
+                raise BadRequest("Page token does not match query order")
+            seek_op = "<" if sort_desc else ">"
+            seek_expr = "(%s)%s(%s)" % (",".join(sort_cols), seek_op, ",".join(self._value(val) for val in key_values))
+            if len(sort_cols) > 1:
+                # A plain bound on the leading column lets the planner use indexes and prune time partitions
+                seek_expr = "%s%s=%s AND %s" % (sort_cols[0], seek_op, self._value(key_values[0]), seek_expr)
+            self.where = "(%s) AND %s" % (self.where, seek_expr) if self.where else seek_expr
+
+    def get_page_token(self, rows):
+        """Returns the continuation token for the page after the given result rows of a paged
+        query or None if there is no further page"""
+        limit = self.query["query_args"].get("limit", 0)
+        if not self.page_cols or not rows or limit <= 0 or len(rows) < limit:
+            return None
+        return encode_page_token(rows[-1][-len(self.page_cols):])
+
     def get_query(self):
         qargs = self.query["query_args"]
         frags = []
@@ -372,7 +480,7 @@ class PostgresQueryBuilder(object):
         if qargs.get("limit", 0) > 0:
             frags.append(" LIMIT ")
             frags.append(str(qargs["limit"]))
-        if qargs.get("skip", 0) > 0:
+        if qargs.get("skip", 0) > 0 and not self.page_cols:
             frags.append(" OFFSET ")
             frags.append(str(qargs["skip"]))
 
@@ -392,7 +500,7 @@ class PostgresQueryBuilder(object):
         elif profile == DataStore.DS_PROFILE.RESOURCES:
             return col in {"id", "type_", "name", "lcstate", "availability", "ts_created", "ts_updated"}
         elif profile == DataStore.DS_PROFILE.EVENTS:
-            return col in {"id", "type_", "origin", "origin_type", "sub_type", "actor_id"}
+            return col in {"id", "type_", "origin", "origin_type", "sub_type", "actor_id", "ts_created"}
         raise BadRequest("Unknown query profile")
 
     def get_base_alias(self):
@@ -4,21 +4,28 @@
 
 __author__ = 'Michael Meisinger'
 
+import calendar
+from collections import OrderedDict
 import contextlib
+import datetime
 import gevent
-from gevent.queue import Queue
+from gevent.queue import LifoQueue, Empty
 from gevent.socket import wait_read, wait_write
+import re
 import time
 import sys
+import weakref
 import simplejson as json
 
+from putil.logging import log
+
 try:
     import psycopg2
     from psycopg2 import OperationalError, ProgrammingError, DatabaseError, IntegrityError, extensions
     from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
     from psycopg2.extensions import connection as _connection
     from psycopg2.extensions import cursor as _cursor
-    from psycopg2.extras import register_default_json
+    from psycopg2.extras import register_default_json, register_default_jsonb
 except ImportError:
     print "PostgreSQL imports not available!"
 
@@ -43,43 +50,180 @@ extensions.set_wait_callback(gevent_wait_callback)
 
 # Set JSON to Pyon default simplejson to get str instead of unicode in deserialization
 register_default_json(None, globally=True, loads=json.loads)
+register_default_jsonb(None, globally=True, loads=json.loads)
 
 
 class DatabaseConnectionPool(object):
-    """Gevent compliant database connection pool"""
-
-    def __init__(self, maxsize=100):
+    """
+    Gevent compliant database connection pool.
+    Connections are reused most recently used first, so that surplus connections become idle
+    and are closed after max_idle seconds (keeping at least minsize open). Checkouts wait at most
+    timeout seconds for a connection when maxsize connections are in use. Connections idle for
+    at least ping_idle seconds are validated before checkout.
+    """
+
+    def __init__(self, maxsize=100, minsize=0, timeout=None, max_idle=None, ping_idle=None, name=None):
         if not isinstance(maxsize, (int, long)):
             raise TypeError('Expected integer, got %r' % (maxsize, ))
         self.maxsize = maxsize  # Maximum connections (pool + checkout out)
-        self.pool = Queue()     # Open connection pool
+        self.minsize = minsize  # Connections kept open when reaping idle connections
+        self.timeout = timeout  # Max seconds to wait for a connection. None: wait indefinitely
+        self.max_idle = max_idle    # Seconds after which idle connections are closed. None: never
+        self.ping_idle = ping_idle  # Seconds of idle time after which to validate connection. None: never
+        self.name = name
+        self.pool = LifoQueue()     # Open connection pool, entries (conn, idle since) or None for a free slot
         self.size = 0           # Number of open connections
+        self.waiting = 0        # Number of greenlets waiting for a connection
+        self._last_reap = time.time()
+        self.pool_stats = dict(checkouts=0, waits=0, wait_time=0.0, max_wait_time=0.0, timeouts=0,
+                               created=0, closed=0, reaped=0, ping_failures=0)
+        self.greenlet_checkouts = None  # Greenlet -> time of last checkout, if tracked (see track_greenlets)
+
+    def track_greenlets(self):
+        """Enables tracking the time of the last connection checkout per greenlet"""
+        if self.greenlet_checkouts is None:
+            self.greenlet_checkouts = weakref.WeakKeyDictionary()
+
+    def get_last_checkout(self, glet=None):
+        """Returns the time the given (or current) greenlet last checked out a connection, or 0"""
+        if self.greenlet_checkouts is None:
+            return 0
+        return self.greenlet_checkouts.get(glet or gevent.getcurrent(), 0)
+
+    def reset_last_checkout(self, checkout_ts, glet=None):
+        """Restores the last checkout time of the given (or current) greenlet, e.g. after a read-only use"""
+        if self.greenlet_checkouts is None:
+            return
+        glet = glet or gevent.getcurrent()
+        if checkout_ts:
+            self.greenlet_checkouts[glet] = checkout_ts
+        else:
+            self.greenlet_checkouts.pop(glet, None)
 
     def get(self):
         pool = self.pool
-        if self.size >= self.maxsize or pool.qsize():
-            return pool.get()
-        else:
-            self.size += 1
-            try:
-                new_item = self.create_connection()
-            except:
-                self.size -= 1
-                raise
-            return new_item
+        stats = self.pool_stats
+        stats["checkouts"] += 1
+        if self.greenlet_checkouts is not None:
+            self.greenlet_checkouts[gevent.getcurrent()] = time.time()
+        t_begin = None
+        while True:
+            if pool.qsize():
+                entry = pool.get_nowait()
+            elif self.size < self.maxsize:
+                entry = None
+            else:
+                if t_begin is None:
+                    t_begin = time.time()
+                    stats["waits"] += 1
+                remaining = None
+                if self.timeout:
+                    remaining = self.timeout - (time.time() - t_begin)
+                self.waiting += 1
+                t_wait = time.time()
+                try:
+                    entry = pool.get(timeout=remaining) if remaining is None or remaining > 0 else pool.get_nowait()
+                except Empty:
+                    stats["timeouts"] += 1
+                    raise OperationalError("Timeout waiting %s sec for connection from pool %s (size=%s)" % (
+                        self.timeout, self.name, self.size))
+                finally:
+                    self.waiting -= 1
+                    stats["wait_time"] += time.time() - t_wait
+                    stats["max_wait_time"] = max(stats["max_wait_time"], time.time() - t_begin)
+            if entry is None:
+                # Free slot: open a new connection
+                if self.size >= self.maxsize:
+                    continue
+                self.size += 1
+                try:
+                    new_item = self.create_connection()
+                except:
+                    self.size -= 1
+                    self._release_slot()
+                    raise
+                stats["created"] += 1
+                return new_item
+
+            conn, idle_since = entry
+            idle_time = time.time() - idle_since
+            if self.max_idle is not None and idle_time > self.max_idle and self.size > self.minsize:
+                stats["reaped"] += 1
+                self._discard(conn)
+                continue
+            if self.ping_idle is not None and idle_time >= self.ping_idle and not self.ping_connection(conn):
+                stats["ping_failures"] += 1
+                self._discard(conn)
+                continue
+            return conn
 
     def put(self, item):
-        self.pool.put(item)
+        self.pool.put((item, time.time()))
+        if self.max_idle is not None and time.time() - self._last_reap > self.max_idle:
+            self.reap_idle()
+
+    def ping_connection(self, conn):
+        """Returns True if the connection is usable. Override for a database specific check"""
+        return not conn.closed
+
+    def create_connection(self):
+        raise NotImplementedError()
+
+    def _discard(self, conn):
+        """Closes a connection that is not returned to the pool and frees its slot"""
+        self.size -= 1
+        self.pool_stats["closed"] += 1
+        try:
+            conn.close()
+        except Exception:
+            pass
+        self._release_slot()
+
+    def _release_slot(self):
+        # Wake up a waiting greenlet to open a new connection instead of waiting for a return
+        if self.waiting:
+            self.pool.put(None)
+
+    def reap_idle(self):
+        """Closes connections idle for longer than max_idle, keeping minsize open"""
+        self._last_reap = time.time()
+        if self.max_idle is None:
+            return
+        entries = []
+        while self.pool.qsize():
+            entries.append(self.pool.get_nowait())
+        # Entries come most recently used first: close the least recently used first
+        keep_entries = []
+        for entry in reversed(entries):
+            if entry is not None and self._last_reap - entry[1] > self.max_idle and self.size > self.minsize:
+                self.pool_stats["reaped"] += 1
+                self._discard(entry[0])
+            else:
+                keep_entries.append(entry)
+        for entry in keep_entries:
+            self.pool.put(entry)
 
     def closeall(self):
         while not self.pool.empty():
-            conn = self.pool.get_nowait()
+            entry = self.pool.get_nowait()
+            if entry is None:
+                continue
             try:
-                conn.close()
+                entry[0].close()
                 self.size -= 1
+                self.pool_stats["closed"] += 1
             except Exception:
                 pass
 
+    def get_pool_stats(self):
+        """Returns a dict with pool size, usage and checkout wait statistics"""
+        stats = dict(self.pool_stats)
+        idle = len([entry for entry in self.pool.queue if entry is not None])
+        stats.update(name=self.name, size=self.size, idle=idle, in_use=self.size - idle,
+                     waiting=self.waiting, minsize=self.minsize, maxsize=self.maxsize)
+        stats["avg_wait_time"] = stats["wait_time"] / stats["waits"] if stats["waits"] else 0.0
+        return stats
+
     @contextlib.contextmanager
     def connection(self, isolation_level=None):
         conn = self.get()
@@ -92,7 +236,7 @@ class DatabaseConnectionPool(object):
             yield conn
         except:
             if conn.closed:
-                conn = None
+                # Other pooled connections are likely broken as well
                 self.closeall()
             else:
                 conn = self._rollback(conn)
@@ -102,10 +246,13 @@ class DatabaseConnectionPool(object):
                 raise OperationalError("Cannot commit because connection was closed: %r" % (conn, ))
             conn.commit()
         finally:
-            if conn is not None and not conn.closed:
-                if isolation_level is not None:
-                    conn.set_isolation_level(isolation_level)
-                self.put(conn)
+            if conn is not None:
+                if conn.closed:
+                    self._discard(conn)
+                else:
+                    if isolation_level is not None:
+                        conn.set_isolation_level(isolation_level)
+                    self.put(conn)
 
     @contextlib.contextmanager
     def cursor(self, *args, **kwargs):
@@ -124,7 +271,7 @@ class DatabaseConnectionPool(object):
             yield cur
         except:
             if conn.closed:
-                conn = None
+                # Other pooled connections are likely broken as well
                 self.closeall()
             else:
                 conn = self._rollback(conn)
@@ -134,16 +281,20 @@ class DatabaseConnectionPool(object):
                 raise OperationalError("Cannot commit because connection was closed: %r" % (conn, ))
             conn.commit()
         finally:
-            if conn is not None and not conn.closed:
-                if isolation_level is not None:
-                    conn.set_isolation_level(isolation_level)
-                self.put(conn)
+            if conn is not None:
+                if conn.closed:
+                    self._discard(conn)
+                else:
+                    if isolation_level is not None:
+                        conn.set_isolation_level(isolation_level)
+                    self.put(conn)
 
     def _rollback(self, conn):
         try:
             conn.rollback()
         except:
             gevent.get_hub().handle_error(conn, *sys.exc_info())
+            self._discard(conn)
             return
         return conn
 
@@ -179,11 +330,20 @@ class PostgresConnectionPool(DatabaseConnectionPool):
         self.connect = kwargs.pop('connect', psycopg2.connect)
         self.tracer = kwargs.pop('tracer', None)
         maxsize = kwargs.pop('maxsize', None)
+        pool_kwargs = {key: kwargs.pop(key) for key in ("minsize", "timeout", "max_idle", "ping_idle", "name")
+                       if key in kwargs}
+        # Max number of prepared statements per connection and statement shapes overall. 0 disables
+        self.prepared_max = kwargs.pop('prepared_max', 0)
         self.args = args
         self.kwargs = kwargs
         if self.tracer:
             self.kwargs.setdefault("connection_factory", TracingConnection)
-        DatabaseConnectionPool.__init__(self, maxsize)
+        DatabaseConnectionPool.__init__(self, maxsize, **pool_kwargs)
+
+        self._prepared = {}         # Statement text -> (prepared name, positional statement, argument keys)
+        self._prepared_count = 0
+        self._conn_prepared = weakref.WeakKeyDictionary()   # Connection -> OrderedDict of prepared names (LRU)
+        self.prepared_stats = dict(hits=0, prepares=0, evictions=0, unprepared=0)
 
     def create_connection(self):
         conn = self.connect(*self.args, **self.kwargs)
@@ -191,6 +351,180 @@ class PostgresConnectionPool(DatabaseConnectionPool):
             conn.set_tracer(self.tracer)
         return conn
 
+    def ping_connection(self, conn):
+        if conn.closed:
+            return False
+        try:
+            with conn.cursor() as cur:
+                cur.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except DatabaseError:
+            return False
+
+    def execute_prepared(self, cur, statement, statement_args=None):
+        """
+        Executes a statement with psycopg2 style arguments on a cursor of this pool as server side
+        prepared statement, saving parse and plan time on repeated execution. Statements are keyed
+        by their text (shape), e.g. table name and columns, and prepared once per connection on
+        first use. Prepared statements live until the connection closes or are deallocated when
+        the connection exceeds prepared_max. Falls back to a plain execute when disabled or when
+        the number of distinct statement shapes exceeds prepared_max.
+        """
+        if not self.prepared_max:
+            return cur.execute(statement, statement_args)
+
+        stmt_info = self._prepared.get(statement, None)
+        if stmt_info is None:
+            if len(self._prepared) >= self.prepared_max:
+                self.prepared_stats["unprepared"] += 1
+                return cur.execute(statement, statement_args)
+            self._prepared_count += 1
+            pos_statement, arg_keys = get_positional_statement(statement)
+            stmt_info = ("ps_%s" % self._prepared_count, pos_statement, arg_keys)
+            self._prepared[statement] = stmt_info
+        stmt_name, pos_statement, arg_keys = stmt_info
+
+        conn_prepared = self._conn_prepared.get(cur.connection, None)
+        if conn_prepared is None:
+            conn_prepared = self._conn_prepared[cur.connection] = OrderedDict()
+        if stmt_name in conn_prepared:
+            # Move to most recently used
+            del conn_prepared[stmt_name]
+            self.prepared_stats["hits"] += 1
+        else:
+            if len(conn_prepared) >= self.prepared_max:
+                old_name, _ = conn_prepared.popitem(last=False)
+                cur.execute("DEALLOCATE " + old_name)
+                self.prepared_stats["evictions"] += 1
+            cur.execute("PREPARE " + stmt_name + " AS " + pos_statement)
+            self.prepared_stats["prepares"] += 1
+        conn_prepared[stmt_name] = True
+
+        if not arg_keys:
+            return cur.execute("EXECUTE " + stmt_name)
+        exec_args = [statement_args[key] for key in arg_keys]
+        return cur.execute("EXECUTE " + stmt_name + " (" + ",".join(["%s"] * len(exec_args)) + ")", exec_args)
+
+    def reset_prepared(self):
+        """
+        Forgets all statement shapes, e.g. after a table was altered so that prepared statements
+        cannot be executed anymore. Statements already prepared on connections are not reused
+        and deallocated over time.
+        """
+        self._prepared.clear()
+
+    def get_prepared_stats(self):
+        """Returns a dict with prepared statement counts and hit rate"""
+        stats = dict(self.prepared_stats)
+        executions = stats["hits"] + stats["prepares"]
+        stats["hit_rate"] = float(stats["hits"]) / executions if executions else 0.0
+        stats["statements"] = len(self._prepared)
+        stats["connections"] = len(self._conn_prepared)
+        return stats
+
+
+class ReplicaPoolRouter(object):
+    """
+    Provides cursors for read-only operations from a set of read replica connection pools,
+    selected round robin. A greenlet that used the primary pool within sticky_time seconds
+    reads from the primary, so that it sees its own writes despite replication lag. A replica
+    that fails to provide a connection or fails with an OperationalError is skipped for
+    retry_time seconds. Cursors fall back to the primary if no replica is available.
+    """
+
+    def __init__(self, primary, replicas, sticky_time=0, retry_time=30):
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.sticky_time = sticky_time
+        self.retry_time = retry_time
+        self._next_replica = 0
+        self._failed = {}      # Replica pool -> time of last failure
+        self.router_stats = dict(replica_reads=0, primary_reads=0, sticky_reads=0, failures=0)
+        if self.sticky_time:
+            self.primary.track_greenlets()
+
+    def _select_pool(self):
+        now = time.time()
+        if self.sticky_time and now - self.primary.get_last_checkout() < self.sticky_time:
+            self.router_stats["sticky_reads"] += 1
+            return self.primary
+        for i in xrange(len(self.replicas)):
+            replica = self.replicas[(self._next_replica + i) % len(self.replicas)]
+            if now - self._failed.get(replica, 0) >= self.retry_time:
+                self._next_replica = (self._next_replica + i + 1) % len(self.replicas)
+                return replica
+        return self.primary
+
+    def _set_failed(self, replica, ex):
+        log.warn("Read replica pool %s failed, using primary for %s sec: %s", replica.name, self.retry_time, ex)
+        self.router_stats["failures"] += 1
+        self._failed[replica] = time.time()
+
+    @contextlib.contextmanager
+    def cursor(self, *args, **kwargs):
+        pool = self._select_pool()
+        # Reads from the primary must not extend the greenlet's read-your-writes window
+        last_checkout = self.primary.get_last_checkout()
+        cursor_cm = pool.cursor(*args, **dict(kwargs))
+        try:
+            cur = cursor_cm.__enter__()
+        except OperationalError as ex:
+            if pool is self.primary:
+                raise
+            self._set_failed(pool, ex)
+            pool = self.primary
+            cursor_cm = pool.cursor(*args, **kwargs)
+            cur = cursor_cm.__enter__()
+        if pool is self.primary:
+            self.primary.reset_last_checkout(last_checkout)
+            self.router_stats["primary_reads"] += 1
+        else:
+            self.router_stats["replica_reads"] += 1
+        try:
+            yield cur
+        except BaseException as ex:
+            # Also on GeneratorExit and GreenletExit, so the connection is rolled back and returned to the pool
+            if pool is not self.primary and isinstance(ex, OperationalError):
+                self._set_failed(pool, ex)
+            if not cursor_cm.__exit__(*sys.exc_info()):
+                raise
+        else:
+            cursor_cm.__exit__(None, None, None)
+
+    def execute_prepared(self, cur, statement, statement_args=None):
+        # Statement names are allocated by the primary pool and prepared state is kept per connection,
+        # so replica connections share the primary's statement cache
+        return self.primary.execute_prepared(cur, statement, statement_args)
+
+    def get_router_stats(self):
+        stats = dict(self.router_stats)
+        stats["replicas"] = [replica.name for replica in self.replicas]
+        stats["failed"] = [replica.name for replica, failed_ts in self._failed.iteritems()
+                           if time.time() - failed_ts < self.retry_time]
+        return stats
+
+
+STATEMENT_ARG_RE = re.compile(r"%\((\w+)\)s|%s|%%")
+
+
+def get_positional_statement(statement):
+    """
+    Converts a statement with psycopg2 named (%(name)s) or positional (%s) arguments into
+    a statement with $n parameters for PREPARE. Returns a tuple (statement, list of argument
+    keys), with keys being names or positions in the order of parameters.
+    """
+    arg_keys = []
+    def replace_arg(match):
+        if match.group(0) == "%%":
+            return "%"
+        key = match.group(1) if match.group(1) else len(arg_keys)
+        if key in arg_keys:
+            return "$%s" % (arg_keys.index(key) + 1)
+        arg_keys.append(key)
+        return "$%s" % len(arg_keys)
+    return STATEMENT_ARG_RE.sub(replace_arg, statement), arg_keys
+
 
 def psycopg2_connect(dsn=None, *args, **kwargs):
     if dsn is None:
@@ -253,6 +587,17 @@ class TracingCursor(_cursor):
             if self._tracer:
                 self._log_call(self._tracer, trace_stmt=self._trace_stmt, query_time=query_time)
 
+    def copy_expert(self, sql, file, size=8192):
+        query_time = 0
+        try:
+            t_begin = time.time()
+            res = super(TracingCursor, self).copy_expert(sql, file, size)
+            query_time = time.time() - t_begin
+            return res
+        finally:
+            if self._tracer:
+                self._log_call(self._tracer, trace_stmt=self._trace_stmt or sql, query_time=query_time)
+
     def fetchall(self):
         query_time = 0
         try:
@@ -297,3 +642,86 @@ class StatementBuilder(object):
     def build(self):
         self.statement = "".join(self.st_frag)
         return self.statement, self.statement_args
+
+
+def copy_expert_blocking(cur, sql, file):
+    """
+    Runs a COPY statement on the cursor. psycopg2 does not support COPY with a wait callback
+    (gevent mode), so the callback is removed for the duration of the COPY, which blocks the hub.
+    Keep the amount of data per COPY bounded.
+    """
+    wait_callback = extensions.get_wait_callback()
+    extensions.set_wait_callback(None)
+    try:
+        return cur.copy_expert(sql, file)
+    finally:
+        extensions.set_wait_callback(wait_callback)
+
+def format_copy_value(value):
+    """Returns the COPY text format representation of a Python value"""
+    if value is None:
+        return "\\N"
+    elif value is True:
+        return "t"
+    elif value is False:
+        return "f"
+    elif isinstance(value, unicode):
+        value = value.encode("utf8")
+    elif not isinstance(value, str):
+        value = str(value)
+    if "\\" in value:
+        value = value.replace("\\", "\\\\")
+    return value.replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+class CopyRowReader(object):
+    """
+    File-like object that produces COPY text format data from an iterable of row tuples,
+    for use with cursor.copy_expert(). Rows are consumed lazily as the database client reads.
+    """
+    def __init__(self, rows):
+        self._rows = iter(rows)
+        self._buf = ""
+        self.row_count = 0
+
+    def _next_line(self):
+        row = next(self._rows)
+        self.row_count += 1
+        return "\t".join(format_copy_value(val) for val in row) + "\n"
+
+    def read(self, size=-1):
+        parts = [self._buf]
+        length = len(self._buf)
+        try:
+            while size < 0 or length < size:
+                line = self._next_line()
+                parts.append(line)
+                length += len(line)
+        except StopIteration:
+            pass
+        data = "".join(parts)
+        if size < 0:
+            self._buf = ""
+            return data
+        self._buf = data[size:]
+        return data[:size]
+
+
+# Days covered by each time range partition of a partitioned events table
+PARTITION_INTERVAL_DAYS = {"day": 1, "week": 7}
+
+
+def get_time_partition(ts, interval):
+    """
+    Returns a tuple (name suffix, start ts, end ts) for the time range partition holding the given
+    ION timestamp (millis str). Daily partitions start at midnight UTC, weekly partitions on Mondays.
+    """
+    if interval not in PARTITION_INTERVAL_DAYS:
+        raise ValueError("Unknown partition interval: %s" % interval)
+    start_day = datetime.datetime.utcfromtimestamp(int(ts) / 1000).date()
+    if interval == "week":
+        start_day -= datetime.timedelta(days=start_day.weekday())
+    end_day = start_day + datetime.timedelta(days=PARTITION_INTERVAL_DAYS[interval])
+    return (start_day.strftime("%Y%m%d"),
+            str(calendar.timegm(start_day.timetuple()) * 1000),
+            str(calendar.timegm(end_day.timetuple()) * 1000))
@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+
+from mock import MagicMock, patch
+from psycopg2 import DatabaseError
+from nose.plugins.attrib import attr
+
+from pyon.util.unit_test import IonUnitTestCase
+
+from pyon.core.exception import Conflict, NotFound
+from pyon.datastore.datastore import DataStore
+from pyon.datastore.postgresql.base_store import PostgresDataStore
+
+
+@attr('UNIT', group='datastore')
+class PostgresBaseStoreUnitTest(IonUnitTestCase):
+
+    def _create_store(self, profile=DataStore.DS_PROFILE.EVENTS, **config):
+        """Returns a datastore instance on a mocked connection pool, with a mocked cursor"""
+        pool = MagicMock()
+        with patch.object(PostgresDataStore, '_get_connection_pool', return_value=pool):
+            store = PostgresDataStore(config=config, scope="test", profile=profile)
+        store.datastore_name = "ds"
+        cur = MagicMock()
+        pool.cursor.return_value.__enter__.return_value = cur
+        return store, cur
+
+    @patch('pyon.datastore.postgresql.base_store.gevent')
+    def test_create_mult_copy_chunks(self, gevent_mock):
+        store, cur = self._create_store(bulk_copy_min_rows=3, bulk_copy_chunk_size=2)
+        store._copy_docs = MagicMock(return_value=True)
+        store._insert_docs = MagicMock()
+
+        docs = [dict(type_="Event", ts_created="1400000000000", _id="id%s" % i) for i in xrange(5)]
+        res = store.create_doc_mult(docs)
+        self.assertEqual(res, [(True, "id%s" % i, "1") for i in xrange(5)])
+        self.assertEqual([len(c[0][3]) for c in store._copy_docs.call_args_list], [2, 2, 1])
+        self.assertFalse(store._insert_docs.called)
+        # Other greenlets get to run between (but not before) COPY chunks
+        self.assertEqual(gevent_mock.sleep.call_count, 2)
+
+        # Below the threshold a single INSERT is used without yielding
+        store._copy_docs.reset_mock()
+        gevent_mock.sleep.reset_mock()
+        store.create_doc_mult(docs[:2])
+        self.assertFalse(store._copy_docs.called)
+        self.assertEqual(len(store._insert_docs.call_args[0][3]), 2)
+        self.assertFalse(gevent_mock.sleep.called)
+
+    def _set_returned_ids(self, cur, updated_ids, deleted_ids):
+        """Makes the mocked cursor return the given ids for UPDATE and DELETE statements"""
+        def fetchall():
+            statement = cur.execute.call_args[0][0]
+            return [(doc_id, ) for doc_id in (updated_ids if statement.startswith("UPDATE") else deleted_ids)]
+        cur.fetchall.side_effect = fetchall
+
+    def test_update_mult_conflict(self):
+        store, cur = self._create_store(profile=DataStore.DS_PROFILE.RESOURCES)
+        self._set_returned_ids(cur, ["id1"], [])
+
+        # Mixed batch of update, revision conflict and delete of a missing document
+        docs = [dict(_id="id1", _rev="1", name="a"), dict(_id="id2", _rev="3", name="b"),
+                dict(_id="id3", _rev="1", _deleted=True)]
+        res = store.update_doc_mult(docs, raise_on_conflict=False)
+        self.assertEqual(res, [(True, "id1", "2"), (False, "id2", "3"), (False, "id3", "1")])
+
+        # By default a conflict fails the entire batch
+        docs = [dict(_id="id1", _rev="1", name="a"), dict(_id="id2", _rev="3", name="b")]
+        with self.assertRaises(Conflict):
+            store.update_doc_mult(docs)
+        self.assertEqual([doc["_rev"] for doc in docs], ["1", "3"])
+
+        docs = [dict(_id="id3", _rev="1", _deleted=True)]
+        with self.assertRaises(NotFound):
+            store.update_doc_mult(docs)
+
+        self._set_returned_ids(cur, ["id1", "id2"], [])
+        docs = [dict(_id="id1", _rev="1", name="a"), dict(_id="id2", _rev="3", name="b")]
+        res = store.update_doc_mult(docs)
+        self.assertEqual(res, [(True, "id1", "2"), (True, "id2", "4")])
+
+    def test_delete_mult_missing(self):
+        store, cur = self._create_store(profile=DataStore.DS_PROFILE.RESOURCES)
+        self._set_returned_ids(cur, [], ["id1"])
+
+        store.delete_doc_mult(["id1"])
+        with self.assertRaises(NotFound):
+            store.delete_doc_mult(["id1", "id2"])
+
+    @patch('pyon.datastore.postgresql.base_store.log')
+    @patch('pyon.datastore.postgresql.base_store.psycopg2_connect')
+    def test_event_partition_failure(self, connect_mock, log_mock):
+        store, cur = self._create_store(event_partition_interval="day", event_partition_retry_time=60)
+        admin_cur = connect_mock.return_value.__enter__.return_value.cursor.return_value.__enter__.return_value
+        admin_cur.execute.side_effect = DatabaseError("partition overlaps")
+
+        def load_partitions():
+            store._events_partitioned = True
+            store._event_partitions = set()
+        store._load_event_partitions = MagicMock(side_effect=load_partitions)
+        store._insert_docs = MagicMock()
+
+        docs = [dict(type_="Event", ts_created="1400000000000")]
+        store.create_doc_mult(docs)
+        self.assertEqual(admin_cur.execute.call_count, 1)
+        self.assertEqual(log_mock.warn.call_count, 1)
+        self.assertIn("20140513", store._event_partition_failures)
+        self.assertTrue(store._insert_docs.called)
+
+        # The failed partition is not retried for subsequent inserts until the retry time passed
+        for i in xrange(3):
+            store.create_doc_mult([dict(type_="Event", ts_created="1400000000000")])
+        self.assertEqual(admin_cur.execute.call_count, 1)
+        self.assertEqual(store._load_event_partitions.call_count, 2)
+
+        store._event_partition_failures["20140513"] = 0
+        store.create_doc_mult([dict(type_="Event", ts_created="1400000000000")])
+        self.assertEqual(admin_cur.execute.call_count, 2)
+        self.assertEqual(log_mock.warn.call_count, 1)
+
+        admin_cur.execute.side_effect = None
+        store._event_partition_failures["20140513"] = 0
+        store.create_doc_mult([dict(type_="Event", ts_created="1400000000000")])
+        self.assertEqual(admin_cur.execute.call_count, 3)
+        self.assertIn("20140513", store._event_partitions)
+        self.assertNotIn("20140513", store._event_partition_failures)
@@ -54,4 +54,97 @@ class PostgresDataStoreUnitTest(IonUnitTestCase):
         qb = DatastoreQueryBuilder()
         qb.build_query(where=qb.within_geom(qb.RA_GEOM_LOC,wkt,buf))
         pqb = PostgresQueryBuilder(qb.get_query(), 'test')
-        self.assertEquals(pqb.get_query(),"SELECT id,doc FROM test WHERE ST_Within(geom_loc,ST_Buffer(ST_GeomFromEWKT('SRID=4326;POINT(-72.0 40.0)'), 0.100000))")
\ No newline at end of file
+        self.assertEquals(pqb.get_query(),"SELECT id,doc FROM test WHERE ST_Within(geom_loc,ST_Buffer(ST_GeomFromEWKT('SRID=4326;POINT(-72.0 40.0)'), 0.100000))")
+
+    def test_page_seek(self):
+        """ unit test to verify the SQL translation of keyset paginated queries """
+        from pyon.core.exception import BadRequest
+        from pyon.datastore.datastore_query import encode_page_token, decode_page_token
+
+        # First page: order by sort columns and id, select sort key values, no seek predicate or OFFSET
+        qb = DatastoreQueryBuilder(limit=2, skip=10)
+        qb.build_query(where=qb.eq(qb.ATT_TYPE, "TestInstrument"), order_by=qb.order_by("name"))
+        qb.set_page_token(None)
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT id,doc,name,id FROM test WHERE type_=%(v1)s ORDER BY name ASC,id ASC LIMIT 2")
+        self.assertEquals(pqb.page_cols, ["name", "id"])
+
+        rows = [("id1", {}, "A", "id1"), ("id2", {}, "B", "id2")]
+        page_token = pqb.get_page_token(rows)
+        self.assertEquals(decode_page_token(page_token), ["B", "id2"])
+        self.assertIsNone(pqb.get_page_token(rows[:1]))
+
+        # Next page: seek past the last row of the previous page
+        qb.set_page_token(page_token)
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT id,doc,name,id FROM test WHERE (type_=%(v1)s) AND name>=%(v4)s AND (name,id)>(%(v2)s,%(v3)s) ORDER BY name ASC,id ASC LIMIT 2")
+        self.assertEquals(pqb.get_values(), dict(v1="TestInstrument", v2="B", v3="id2", v4="B"))
+
+        # Descending order seeks the other way
+        qb = DatastoreQueryBuilder(id_only=True, limit=5, profile="EVENTS", datastore="events")
+        qb.build_query(where=None, order_by=qb.order_by("ts_created", "desc"))
+        qb.set_page_token(encode_page_token(["1000", "ev1"]))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT id,ts_created,id FROM test WHERE ts_created<=%(v3)s AND (ts_created,id)<(%(v1)s,%(v2)s) ORDER BY ts_created DESC,id DESC LIMIT 5")
+
+        # Complex queries qualify sort columns with the base table alias
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.eq(qb.ATT_TYPE, "TestInstrument"), format="complex")
+        qb.set_page_token(None)
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT base.id,base.id FROM test AS base WHERE type_=%(v1)s ORDER BY base.id ASC")
+
+        # Unsupported orderings and tokens
+        qb = DatastoreQueryBuilder()
+        qb.build_query(where=None, order_by=qb.order_by([("name", "asc"), ("ts_created", "desc")]))
+        qb.set_page_token(None)
+        self.assertRaises(BadRequest, PostgresQueryBuilder, qb.get_query(), 'test')
+
+        qb = DatastoreQueryBuilder()
+        qb.build_query(where=None, order_by=qb.order_by("description"))
+        qb.set_page_token(None)
+        self.assertRaises(BadRequest, PostgresQueryBuilder, qb.get_query(), 'test')
+
+        qb = DatastoreQueryBuilder()
+        qb.build_query(where=None, order_by=qb.order_by("name"))
+        qb.set_page_token(encode_page_token(["A"]))
+        self.assertRaises(BadRequest, PostgresQueryBuilder, qb.get_query(), 'test')
+        qb.set_page_token("not a token")
+        self.assertRaises(BadRequest, PostgresQueryBuilder, qb.get_query(), 'test')
+
+    def test_jsonb(self):
+        """ unit test to verify attribute filters use jsonb containment for jsonb documents """
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.and_(qb.eq("details.contact.email", "a@b.org"), qb.in_("visible", True, None)))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test', jsonb=True)
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE (doc @> %(v1)s::jsonb AND json_string(doc,%(v4)s) IN (%(v2)s,%(v3)s))")
+        self.assertEquals(pqb.get_values()["v1"], '{"details": {"contact": {"email": "a@b.org"}}}')
+
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.or_(qb.in_("num", 1, 2), qb.op_expr(qb.XOP_KEYWORD, ["k1", "k2"])))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test', jsonb=True)
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE ((doc @> %(v1)s::jsonb OR doc @> %(v2)s::jsonb) OR doc @> %(v3)s::jsonb)")
+        self.assertEquals(pqb.get_values(), dict(v1='{"num": 1}', v2='{"num": 2}', v3='{"keywords": ["k1", "k2"]}'))
+
+        # Values that do not have the attribute's JSON type (e.g. strings from REST) compare as text
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.and_(qb.eq("num", "5"), qb.eq("enabled", "True"), qb.in_("num", 1, "2")))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test', jsonb=True)
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE (json_string(doc,%(v1)s)=%(v2)s AND "
+                                           "json_string(doc,%(v3)s)=%(v4)s AND json_string(doc,%(v7)s) IN (%(v5)s,%(v6)s))")
+        self.assertEquals(pqb.get_values()["v2"], "5")
+
+        # Attributes without schema and within free-form dicts
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.and_(qb.eq("unknown_attr", "x"), qb.eq("addl.name", "x")))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test', jsonb=True)
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE (json_string(doc,%(v1)s)=%(v2)s AND json_string(doc,%(v3)s)=%(v4)s)")
+
+        # Other operators and json documents use the JSON functions
+        qb = DatastoreQueryBuilder(id_only=True)
+        qb.build_query(where=qb.and_(qb.eq("name", "x"), qb.gt("num", 1)))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE (name=%(v1)s AND json_string(doc,%(v2)s)>%(v3)s)")
+        qb.build_query(where=qb.eq("num", 1))
+        pqb = PostgresQueryBuilder(qb.get_query(), 'test')
+        self.assertEquals(pqb.get_query(), "SELECT id FROM test WHERE json_string(doc,%(v1)s)=%(v2)s")
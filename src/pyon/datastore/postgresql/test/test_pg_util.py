@@ -0,0 +1,224 @@
+#!/usr/bin/env python
+
+import time
+from mock import MagicMock, Mock, call
+from psycopg2 import OperationalError
+from nose.plugins.attrib import attr
+
+from pyon.util.unit_test import IonUnitTestCase
+
+from pyon.datastore.postgresql.pg_util import CopyRowReader, PostgresConnectionPool, ReplicaPoolRouter, format_copy_value, \
+    get_positional_statement, get_time_partition
+
+
+@attr('UNIT', group='datastore')
+class PostgresUtilUnitTest(IonUnitTestCase):
+
+    def test_copy_format(self):
+        self.assertEqual(format_copy_value(None), "\\N")
+        self.assertEqual(format_copy_value(True), "t")
+        self.assertEqual(format_copy_value(False), "f")
+        self.assertEqual(format_copy_value(12), "12")
+        self.assertEqual(format_copy_value(u"\xe9"), "\xc3\xa9")
+        self.assertEqual(format_copy_value('{"a": "x\\ny"}'), '{"a": "x\\\\ny"}')
+        self.assertEqual(format_copy_value("a\tb\nc\rd"), "a\\tb\\nc\\rd")
+
+    def test_copy_row_reader(self):
+        rows = (("id%s" % i, 1, None) for i in xrange(3))
+        reader = CopyRowReader(rows)
+        self.assertEqual(reader.row_count, 0)
+
+        data = reader.read(5)
+        self.assertEqual(data, "id0\t1")
+        self.assertEqual(reader.row_count, 1)
+
+        data += reader.read(1000)
+        data += reader.read(1000)
+        self.assertEqual(data, "id0\t1\t\\N\nid1\t1\t\\N\nid2\t1\t\\N\n")
+        self.assertEqual(reader.row_count, 3)
+        self.assertEqual(reader.read(), "")
+
+    def test_time_partition(self):
+        # 2014-05-13 16:53:20 UTC, a Tuesday
+        self.assertEqual(get_time_partition("1400000000000", "day"), ("20140513", "1399939200000", "1400025600000"))
+        self.assertEqual(get_time_partition(1400000000000, "week"), ("20140512", "1399852800000", "1400457600000"))
+        self.assertEqual(get_time_partition("1399939200000", "day")[0], "20140513")
+        self.assertEqual(get_time_partition("1399939199999", "day")[0], "20140512")
+        self.assertRaises(ValueError, get_time_partition, "1400000000000", "month")
+
+    def test_positional_statement(self):
+        stmt, keys = get_positional_statement("SELECT doc FROM ds WHERE id=%s AND rev=%s")
+        self.assertEqual(stmt, "SELECT doc FROM ds WHERE id=$1 AND rev=$2")
+        self.assertEqual(keys, [0, 1])
+
+        stmt, keys = get_positional_statement("SELECT id FROM ds WHERE a=%(a)s AND b LIKE 'x%%' AND (c=%(a)s OR d=%(b)s)")
+        self.assertEqual(stmt, "SELECT id FROM ds WHERE a=$1 AND b LIKE 'x%' AND (c=$1 OR d=$2)")
+        self.assertEqual(keys, ["a", "b"])
+
+    def test_execute_prepared(self):
+        pool = PostgresConnectionPool("dsn", maxsize=1, prepared_max=2)
+        cur = Mock()
+        pool.execute_prepared(cur, "SELECT doc FROM ds WHERE id=%(id)s", dict(id="ID1", other=1))
+        self.assertEqual(cur.execute.call_args_list, [
+            call("PREPARE ps_1 AS SELECT doc FROM ds WHERE id=$1"),
+            call("EXECUTE ps_1 (%s)", ["ID1"])])
+
+        cur.reset_mock()
+        pool.execute_prepared(cur, "SELECT doc FROM ds WHERE id=%(id)s", dict(id="ID2"))
+        self.assertEqual(cur.execute.call_args_list, [call("EXECUTE ps_1 (%s)", ["ID2"])])
+
+        # Statements are prepared per connection
+        cur2 = Mock()
+        pool.execute_prepared(cur2, "SELECT doc FROM ds WHERE id=%(id)s", dict(id="ID3"))
+        self.assertEqual(cur2.execute.call_count, 2)
+
+        # Least recently used statement is deallocated
+        pool.execute_prepared(cur, "SELECT rev FROM ds WHERE id=%s", ("ID1",))
+        pool.execute_prepared(cur, "SELECT doc FROM ds WHERE id=%(id)s", dict(id="ID4"))
+        cur.reset_mock()
+        pool.reset_prepared()
+        pool.execute_prepared(cur, "SELECT rev FROM ds WHERE id=%s", ("ID1",))
+        self.assertEqual(cur.execute.call_args_list, [
+            call("DEALLOCATE ps_2"),
+            call("PREPARE ps_3 AS SELECT rev FROM ds WHERE id=$1"),
+            call("EXECUTE ps_3 (%s)", ["ID1"])])
+
+        # Statement shapes beyond the limit are not prepared
+        pool.execute_prepared(cur, "SELECT doc FROM ds WHERE id=%(id)s", dict(id="ID1"))
+        cur.reset_mock()
+        pool.execute_prepared(cur, "SELECT id FROM ds", None)
+        self.assertEqual(cur.execute.call_args_list, [call("SELECT id FROM ds", None)])
+
+        stats = pool.get_prepared_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["prepares"], 5)
+        self.assertEqual(stats["evictions"], 2)
+        self.assertEqual(stats["unprepared"], 1)
+        self.assertAlmostEqual(stats["hit_rate"], 2.0 / 7)
+
+        pool = PostgresConnectionPool("dsn", maxsize=1)
+        cur = Mock()
+        pool.execute_prepared(cur, "SELECT doc FROM ds WHERE id=%s", ("ID1",))
+        self.assertEqual(cur.execute.call_args_list, [call("SELECT doc FROM ds WHERE id=%s", ("ID1",))])
+
+    def test_connection_pool(self):
+        def create_conn(*args, **kwargs):
+            conn = Mock()
+            conn.closed = False
+            return conn
+        pool = PostgresConnectionPool("dsn", connect=create_conn, maxsize=2, timeout=0.1, name="test")
+
+        conn1 = pool.get()
+        conn2 = pool.get()
+        self.assertEqual(pool.size, 2)
+        self.assertRaises(OperationalError, pool.get)
+        pool.put(conn1)
+        pool.put(conn2)
+
+        # Most recently used connection is reused first
+        self.assertIs(pool.get(), conn2)
+        pool.put(conn2)
+
+        stats = pool.get_pool_stats()
+        self.assertEqual(stats["name"], "test")
+        self.assertEqual(stats["created"], 2)
+        self.assertEqual(stats["checkouts"], 4)
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["timeouts"], 1)
+        self.assertEqual(stats["idle"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+        # Connections closed during use free their slot
+        with self.assertRaises(ValueError):
+            with pool.connection() as conn:
+                conn.closed = True
+                raise ValueError()
+        self.assertEqual(pool.size, 0)
+        self.assertEqual(pool.get_pool_stats()["closed"], 2)
+
+        # Idle connections beyond minsize are closed and broken connections are discarded
+        pool = PostgresConnectionPool("dsn", connect=create_conn, maxsize=3, minsize=1, max_idle=0.05, name="test")
+        conns = [pool.get() for i in xrange(3)]
+        for conn in conns:
+            pool.put(conn)
+        time.sleep(0.1)
+        pool.reap_idle()
+        self.assertEqual(pool.size, 1)
+        self.assertIs(pool.get(), conns[-1])
+        self.assertEqual(pool.get_pool_stats()["reaped"], 2)
+
+        pool = PostgresConnectionPool("dsn", connect=create_conn, maxsize=3, ping_idle=0, name="test")
+        conn1 = pool.get()
+        conn1.closed = True
+        pool.put(conn1)
+        conn2 = pool.get()
+        self.assertIsNot(conn2, conn1)
+        self.assertEqual(pool.get_pool_stats()["ping_failures"], 1)
+        self.assertEqual(pool.size, 1)
+
+    def test_replica_router(self):
+        def create_conn(*args, **kwargs):
+            conn = Mock()
+            conn.closed = False
+            return conn
+        def fail_connect(*args, **kwargs):
+            raise OperationalError("could not connect")
+        primary = PostgresConnectionPool("dsn", connect=create_conn, maxsize=2, name="primary")
+        replica1 = PostgresConnectionPool("dsn1", connect=create_conn, maxsize=2, name="replica1")
+        replica2 = PostgresConnectionPool("dsn2", connect=fail_connect, maxsize=2, name="replica2")
+        router = ReplicaPoolRouter(primary, [replica1, replica2], sticky_time=10)
+
+        # Replicas are used round robin, failed replicas are skipped
+        with router.cursor() as cur:
+            pass
+        self.assertEqual(replica1.pool_stats["checkouts"], 1)
+        with router.cursor() as cur:
+            pass
+        self.assertEqual(replica2.pool_stats["checkouts"], 1)
+        self.assertEqual(primary.pool_stats["checkouts"], 1)
+        with router.cursor() as cur:
+            pass
+        with router.cursor() as cur:
+            pass
+        self.assertEqual(replica1.pool_stats["checkouts"], 3)
+        self.assertEqual(replica2.pool_stats["checkouts"], 1)
+
+        stats = router.get_router_stats()
+        self.assertEqual(stats["replica_reads"], 3)
+        self.assertEqual(stats["primary_reads"], 1)
+        self.assertEqual(stats["failures"], 1)
+        self.assertEqual(stats["failed"], ["replica2"])
+
+        # Reads of a greenlet that used the primary stay on the primary
+        with primary.cursor() as cur:
+            pass
+        with router.cursor() as cur:
+            pass
+        self.assertEqual(replica1.pool_stats["checkouts"], 3)
+        self.assertEqual(router.get_router_stats()["sticky_reads"], 1)
+
+    def test_replica_router_close_early(self):
+        primary = PostgresConnectionPool("dsn", connect=Mock(), maxsize=2, name="primary")
+        replica = Mock()
+        cursor_cm = replica.cursor.return_value = MagicMock()
+        cursor_cm.__exit__.return_value = False
+        router = ReplicaPoolRouter(primary, [replica])
+
+        def read_rows():
+            with router.cursor() as cur:
+                for i in xrange(3):
+                    yield i
+
+        # Closing an iterator before it is exhausted exits the replica cursor with the GeneratorExit
+        rows = read_rows()
+        self.assertEqual(rows.next(), 0)
+        self.assertFalse(cursor_cm.__exit__.called)
+        rows.close()
+        self.assertEqual(cursor_cm.__exit__.call_count, 1)
+        self.assertIs(cursor_cm.__exit__.call_args[0][0], GeneratorExit)
+        self.assertEqual(router.get_router_stats()["failures"], 0)
+
+        # Completed iterators exit the cursor without an exception
+        cursor_cm.__exit__.reset_mock()
+        self.assertEqual(list(read_rows()), [0, 1, 2])
+        cursor_cm.__exit__.assert_called_once_with(None, None, None)
@@ -4,6 +4,8 @@
 
 __author__ = 'Thomas R. Lennan, Michael Meisinger'
 
+import copy
+
 from pyon.core import bootstrap
 from pyon.core.bootstrap import CFG
 from pyon.core.exception import Inconsistent, BadRequest, NotFound, Conflict
@@ -12,7 +14,7 @@ from pyon.datastore.datastore import DataStore
 from pyon.ion.event import EventPublisher, EventSubscriber
 from pyon.ion.identifier import create_unique_directory_id
 from pyon.util.log import log
-from pyon.util.containers import get_ion_ts, get_ion_ts_millis
+from pyon.util.containers import get_ion_ts, get_ion_ts_millis, ExpiringLRUCache
 
 from interface.objects import DirEntry, DirectoryModificationType
 
@@ -22,6 +24,8 @@ LOCK_EXPIRES_DEFAULT = 5000
 LOCK_EXPIRES_NEVER = 0
 LOCK_HOLDER_ATTR = "holder"
 
+_CACHE_MISS = object()
+
 
 class Directory(object):
     """
@@ -29,6 +33,8 @@ class Directory(object):
     A directory is a system wide datastore backend tree of entries with attributes and child entries.
     Entries can be identified by a path. The root is '/'.
     Every Org can have its own directory. The default directory is for the root Org (ION).
+    Optionally keeps a bounded cache of entries and child listings, kept current by local changes and
+    DirectoryModifiedEvents (if published), with a time to live as fallback for missed changes.
     """
 
     def __init__(self, orgname=None, datastore_manager=None, container=None):
@@ -44,15 +50,23 @@ class Directory(object):
         self.event_pub = None
         self.event_sub = None
 
+        cache_size = CFG.get_safe("service.directory.cache_size", 0)
+        if cache_size:
+            self.dir_cache = ExpiringLRUCache(max_size=cache_size, ttl=CFG.get_safe("service.directory.cache_ttl", 60))
+        else:
+            self.dir_cache = None
+
     def start(self):
         if self.events_enabled:
             # init change event publisher
             self.event_pub = EventPublisher()
 
-            # Register to receive directory changes
-            # self.event_sub = EventSubscriber(event_type="ContainerConfigModifiedEvent",
-            #                                  origin="Directory",
-            #                                  callback=self.receive_directory_change_event)
+            if self.dir_cache is not None and self.container.has_capability(CCAP.EXCHANGE_MANAGER):
+                # Register to receive directory changes from other containers
+                self.event_sub = EventSubscriber(event_type="DirectoryModifiedEvent",
+                                                 origin=self.orgname + ".DIR",
+                                                 callback=self.receive_directory_change_event)
+                self.event_sub.start()
 
         # Create directory root entry (for current org) if not existing
         self.register("/", "DIR", sys_name=bootstrap.get_sys_name(), create_only=True)
@@ -65,7 +79,10 @@ class Directory(object):
         Close directory and all resources including datastore and event listener.
         """
         if self.event_sub:
-            self.event_sub.deactivate()
+            self.event_sub.stop()
+            self.event_sub = None
+        if self.dir_cache is not None:
+            self.dir_cache.clear()
         self.dir_store.close()
 
     # -------------------------------------------------------------------------
@@ -78,7 +95,7 @@ class Directory(object):
         @retval Either current DirEntry attributes dict or DirEntry object or None if not found.
         """
         path = self._get_path(parent, key) if key else parent
-        direntry = self._read_by_path(path)
+        direntry = self._read_by_path_cached(path)
         if return_entry:
             return direntry
         else:
@@ -138,6 +155,7 @@ class Directory(object):
             except Conflict:
                 # Concurrent update - we accept that we finished the race second and give up
                 log.warn("Concurrent update to %s detected. We lost: %s", dn, kwargs)
+            self._invalidate_cache(dn)
 
             if return_entry:
                 # Reset object back to prior state
@@ -164,6 +182,7 @@ class Directory(object):
                     raise
                 # Concurrent create - we accept that we finished the race second and give up
                 log.warn("Concurrent create of %s detected. We lost: %s", dn, kwargs)
+            self._invalidate_cache(dn)
 
         return entry_old
 
@@ -192,6 +211,8 @@ class Directory(object):
         de_list.extend(pe_list)
         deid_list = [create_unique_directory_id() for i in xrange(len(de_list))]
         self.dir_store.create_mult(de_list, deid_list)
+        for de in de_list:
+            self._invalidate_cache(self._get_path(de.parent, de.key))
 
         if self.events_enabled and self.container.has_capability(CCAP.EXCHANGE_MANAGER):
             for de in de_list:
@@ -212,6 +233,7 @@ class Directory(object):
         direntry = self._read_by_path(path)
         if direntry:
             self.dir_store.delete(direntry)
+            self._invalidate_cache(path)
             if self.events_enabled and self.container.has_capability(CCAP.EXCHANGE_MANAGER):
                 self.event_pub.publish_event(event_type="DirectoryModifiedEvent",
                                              origin=self.orgname + ".DIR", origin_type="DIR",
@@ -241,6 +263,13 @@ class Directory(object):
         """
         if not type(parent) is str or not parent.startswith("/"):
             raise BadRequest("Illegal argument parent: %s" % parent)
+        cache_key = None
+        if self.dir_cache is not None and not kwargs and self._is_cacheable(parent):
+            cache_key = ("C", parent, bool(direct_only))
+            match = self.dir_cache.get(cache_key, _CACHE_MISS)
+            if match is not _CACHE_MISS:
+                return copy.deepcopy(match)
+
         if direct_only:
             start_key = [self.orgname, parent, 0]
             end_key = [self.orgname, parent]
@@ -254,6 +283,8 @@ class Directory(object):
                 start_key=start_key, end_key=end_key, id_only=True, convert_doc=True, **kwargs)
 
         match = [value for docid, indexkey, value in res]
+        if cache_key:
+            self.dir_cache.put(cache_key, copy.deepcopy(match))
         return match
 
     def find_by_key(self, key=None, parent='/', **kwargs):
@@ -354,6 +385,8 @@ class Directory(object):
             else:
                 raise
 
+        if lock_result:
+            self._invalidate_cache(self._get_path(LOCK_DIR_PATH, key))
         log.debug("Directory.acquire_lock(%s): %s -> %s", key, lock_attrs, lock_result)
 
         return lock_result
@@ -406,13 +439,62 @@ class Directory(object):
     def _delete_lock(self, lock_entry):
         lock_entry_id = lock_entry._id
         self.dir_store.delete(lock_entry_id)
+        self._invalidate_cache(self._get_path(lock_entry.parent, lock_entry.key))
 
     # -------------------------------------------------------------------------
-    # Internal functions
+    # Cache
 
     def receive_directory_change_event(self, event_msg, headers):
-        # @TODO add support to fold updated config into container config
-        pass
+        """Removes cached entries and child listings affected by a directory change in any container"""
+        if self.dir_cache is None:
+            return
+        path = self._get_path(event_msg.parent, event_msg.key) if event_msg.key else event_msg.parent
+        self._invalidate_cache(path)
+
+    def get_cache_stats(self):
+        """Returns a dict with size, hit/miss/eviction counters and hit rate of the cache or None if disabled"""
+        if self.dir_cache is None:
+            return None
+        stats = self.dir_cache.get_stats()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = float(stats["hits"]) / lookups if lookups else 0.0
+        return stats
+
+    def _is_cacheable(self, path):
+        # Locks change frequently and need to be read consistently
+        return not path.startswith(LOCK_DIR_PATH)
+
+    def _read_by_path_cached(self, path):
+        """
+        Like _read_by_path, but serving from the cache if enabled. Returns a copy that the caller may modify.
+        Note: Read-modify-write operations must use _read_by_path to avoid conflicts on outdated revisions.
+        """
+        if self.dir_cache is None or path is None or not self._is_cacheable(path):
+            return self._read_by_path(path)
+        cache_key = ("E", path)
+        direntry = self.dir_cache.get(cache_key, _CACHE_MISS)
+        if direntry is _CACHE_MISS:
+            direntry = self._read_by_path(path)
+            # Also caches not found entries
+            self.dir_cache.put(cache_key, copy.deepcopy(direntry))
+            return direntry
+        return copy.deepcopy(direntry)
+
+    def _invalidate_cache(self, path):
+        """Removes the cached entry for given path and all cached child listings that may contain it"""
+        if self.dir_cache is None:
+            return
+        self.dir_cache.invalidate(("E", path))
+        parent = path.rsplit("/", 1)[0] or "/"
+        self.dir_cache.invalidate(("C", parent, True))
+        while True:
+            self.dir_cache.invalidate(("C", parent, False))
+            if parent == "/":
+                break
+            parent = parent.rsplit("/", 1)[0] or "/"
+
+    # -------------------------------------------------------------------------
+    # Internal functions
 
 
     def _get_path(self, parent, key):
@@ -501,6 +583,7 @@ class Directory(object):
                             if not ex.message.startswith("DirEntry already exists"):
                                 raise
                             # Else: Concurrent create
+                        self._invalidate_cache(parent)
         except Exception as ex:
             log.warn("_ensure_parents_exist(): Error creating directory parents", exc_info=True)
         return pe_list
@@ -528,6 +611,7 @@ class Directory(object):
             for de in remove_list:
                 try:
                     self.dir_store.delete(de)
+                    self._invalidate_cache(self._get_path(de.parent, de.key))
                 except Exception as ex:
                     log.warn("Removal of outdated %s directory entry failed: %s" % (common, de))
             log.info("Cleanup of %s old %s directory entries succeeded" % (len(remove_list), common))
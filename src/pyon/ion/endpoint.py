@@ -6,7 +6,8 @@ __author__ = 'Michael Meisinger, David Stuebe, Dave Foster <dfoster@asascience.c
 
 from pyon.core import MSG_HEADER_ACTOR, MSG_HEADER_VALID, MSG_HEADER_ROLES, MSG_HEADER_TOKENS
 from pyon.net.transport import BaseTransport
-from pyon.net.endpoint import Publisher, Subscriber, EndpointUnit, process_interceptors, RPCRequestEndpointUnit, BaseEndpoint, RPCClient, RPCResponseEndpointUnit, RPCServer, PublisherEndpointUnit, SubscriberEndpointUnit
+from pyon.core.interceptor.interceptor import Invocation
+from pyon.net.endpoint import Publisher, Subscriber, EndpointUnit, RPCRequestEndpointUnit, BaseEndpoint, RPCClient, RPCResponseEndpointUnit, RPCServer, PublisherEndpointUnit, SubscriberEndpointUnit
 from pyon.ion.event import BaseEventSubscriberMixin
 from pyon.util.log import log
 from pyon.core.exception import Timeout as IonTimeout
@@ -38,10 +39,9 @@ class ProcessEndpointUnitMixin(EndpointUnit):
             return None
 
     def _build_invocation(self, **kwargs):
-        newkwargs = kwargs.copy()
-        newkwargs.update({'process': self._process})
+        kwargs['process'] = self._process
 
-        inv = EndpointUnit._build_invocation(self, **newkwargs)
+        inv = EndpointUnit._build_invocation(self, **kwargs)
         return inv
 
     def _intercept_msg_in(self, inv):
@@ -51,7 +51,7 @@ class ProcessEndpointUnitMixin(EndpointUnit):
         This is a request, so the order should be Message, Process
         """
         inv_one = EndpointUnit._intercept_msg_in(self, inv)
-        inv_two = process_interceptors(self.interceptors["process_incoming"] if "process_incoming" in self.interceptors else [], inv_one)
+        inv_two = self._get_interceptor_chain("process_incoming", Invocation.PATH_IN).process(inv_one)
         return inv_two
 
     def _intercept_msg_out(self, inv):
@@ -60,7 +60,7 @@ class ProcessEndpointUnitMixin(EndpointUnit):
 
         This is request, so the order should be Process, Message
         """
-        inv_one = process_interceptors(self.interceptors["process_outgoing"] if "process_outgoing" in self.interceptors else [], inv)
+        inv_one = self._get_interceptor_chain("process_outgoing", Invocation.PATH_OUT).process(inv)
         inv_two = EndpointUnit._intercept_msg_out(self, inv_one)
 
         return inv_two
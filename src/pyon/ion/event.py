@@ -13,7 +13,7 @@ from pyon.core import bootstrap, MSG_HEADER_ACTOR
 from pyon.core.bootstrap import CFG
 from pyon.core.exception import BadRequest, IonException, StreamException
 from pyon.datastore.datastore import DataStore
-from pyon.datastore.datastore_query import QUERY_EXP_KEY, DatastoreQueryBuilder, DQ
+from pyon.datastore.datastore_query import QUERY_EXP_KEY, DatastoreQueryBuilder, DQ, encode_page_token
 from pyon.ion.identifier import create_unique_event_id, create_simple_unique_id
 from pyon.net.endpoint import Publisher, Subscriber, BaseEndpoint
 from pyon.net.transport import XOTransport, NameTrio
@@ -392,11 +392,12 @@ class EventRepository(object):
         new_event_id, _ = self.event_store.create(event, event_id)
         return new_event_id
 
-    def put_events(self, events):
+    def put_events(self, events, bulk_copy=None):
         """
         Place given list of event objects into the event repository. Retains event_ids if existing
         and otherwise creates event_ids.
         Returns list of event_ids in same order and index as original list of events objects.
+        @param bulk_copy  True to stream events to the datastore via COPY, None to decide by number of events
         """
         log.debug("Store %s events persistently", len(events))
         if type(events) is not list:
@@ -405,7 +406,7 @@ class EventRepository(object):
             raise BadRequest("events must all be type Event")
 
         if events:
-            event_res = self.event_store.create_mult(events, allow_ids=True)
+            event_res = self.event_store.create_mult(events, allow_ids=True, bulk_copy=bulk_copy)
             return [eid for success, eid, eobj in event_res]
         else:
             return None
@@ -422,6 +423,8 @@ class EventRepository(object):
         """
         Returns an ordered list of event objects for given query arguments.
         Return format is list of (event_id, event_key, event object) tuples
+        Pass page_token=None for the first page of a paged query and the result of
+        get_next_page_token() for subsequent pages instead of skip.
         """
         log.trace("Retrieving persistent event for event_type=%s, origin=%s, start_ts=%s, end_ts=%s, descending=%s, limit=%s",
                   event_type, origin, start_ts, end_ts, kwargs.get("descending", None), kwargs.get("limit", None))
@@ -462,10 +465,29 @@ class EventRepository(object):
                                                id_only=id_only, **kwargs)
         return events
 
-    def find_events_query(self, query, id_only=False):
+    def maintain_partitions(self, retention_days=None):
+        """
+        Creates upcoming and drops expired time range partitions of a partitioned events datastore.
+        Returns the list of dropped partitions.
+        """
+        return self.event_store.maintain_event_partitions(retention_days=retention_days)
+
+    def get_next_page_token(self, events, limit):
+        """
+        Returns the continuation token for the page following the given find_events result,
+        or None if there is no further page.
+        """
+        if not events or limit <= 0 or len(events) < limit:
+            return None
+        event_id, _, event = events[-1]
+        ts_created = event if isinstance(event, basestring) else event.ts_created
+        return encode_page_token([ts_created, event_id])
+
+    def find_events_query(self, query, id_only=False, as_iterator=False):
         """
         Find events or event ids by using a standard datastore query. This function fills in datastore and
         profile entries, so these can be omitted from the datastore query.
+        @param as_iterator  If True, return an iterator that fetches and converts events lazily
         """
         if not query or not isinstance(query, dict) or not QUERY_EXP_KEY in query:
             raise BadRequest("Illegal events query")
@@ -473,6 +495,8 @@ class EventRepository(object):
         qargs["datastore"] = DataStore.DS_EVENTS
         qargs["profile"] = DataStore.DS_PROFILE.EVENTS
         qargs["id_only"] = id_only
+        if as_iterator:
+            return self.event_store.find_by_query_iter(query)
         events = self.event_store.find_by_query(query)
         log.debug("find_events_query() found %s events", len(events))
         return events
@@ -56,11 +56,11 @@ class ObjectStore(object):
     def update_doc(self, doc):
         return self.obj_store.update_doc(doc)
 
-    def update_mult(self, objects):
-        return self.obj_store.update_mult(objects)
+    def update_mult(self, objects, raise_on_conflict=True):
+        return self.obj_store.update_mult(objects, raise_on_conflict=raise_on_conflict)
 
-    def update_doc_mult(self, docs):
-        return self.obj_store.update_doc_mult(docs)
+    def update_doc_mult(self, docs, raise_on_conflict=True):
+        return self.obj_store.update_doc_mult(docs, raise_on_conflict=raise_on_conflict)
 
 
     def delete(self, obj):
@@ -6,7 +6,7 @@ __author__ = 'Michael Meisinger'
 
 from pyon.core import bootstrap
 from pyon.core.bootstrap import IonObject, CFG
-from pyon.core.governance import get_system_actor
+from pyon.core.governance import get_system_actor, invalidate_governance_cache, is_governance_cache_enabled
 from pyon.core.exception import BadRequest, NotFound, Inconsistent
 from pyon.core.object import IonObjectBase
 from pyon.core.registry import getextends
@@ -187,9 +187,11 @@ class ResourceRegistry(object):
             self._delete_owners(object_id)
 
         if del_associations:
-            assoc_ids = self.find_associations(anyside=object_id, id_only=True)
-            self.rr_store.delete_doc_mult(assoc_ids, object_type="Association")
-            #log.debug("Deleted %s associations for resource %s", len(assoc_ids), object_id)
+            assocs = self.find_associations(anyside=object_id, id_only=False)
+            self.rr_store.delete_doc_mult([assoc._id for assoc in assocs], object_type="Association")
+            for assoc in assocs:
+                invalidate_governance_cache(assoc.s, assoc.p, assoc.o)
+            #log.debug("Deleted %s associations for resource %s", len(assocs), object_id)
 
         elif self._is_in_association(object_id):
             log.warn("Deleting object %s that still has associations" % object_id)
@@ -236,6 +238,8 @@ class ResourceRegistry(object):
             assoc.retired = True  # retired means soft deleted
         if assocs:
             self.rr_store.update_mult(assocs)
+            for assoc in assocs:
+                invalidate_governance_cache(assoc.s, assoc.p, assoc.o)
             log.debug("lcs_delete(res_id=%s). Retired %s associations", resource_id, len(assocs))
 
         if self.container.has_capability(self.container.CCAP.EVENT_PUBLISHER):
@@ -497,6 +501,7 @@ class ResourceRegistry(object):
 
         # Note: Unique key constraints prevents S, P, O duplicates
         res = self.rr_store.create(assoc, create_unique_association_id())
+        invalidate_governance_cache(subject_id, predicate, object_id)
 
         return res
 
@@ -567,7 +572,11 @@ class ResourceRegistry(object):
             new_assoc_list.append(assoc)
 
         new_assoc_ids = [create_unique_association_id() for i in xrange(len(new_assoc_list))]
-        return self.rr_store.create_mult(new_assoc_list, new_assoc_ids)
+        res = self.rr_store.create_mult(new_assoc_list, new_assoc_ids)
+        for assoc in new_assoc_list:
+            invalidate_governance_cache(assoc.s, assoc.p, assoc.o)
+
+        return res
 
     def delete_association(self, association=''):
         """
@@ -580,9 +589,17 @@ class ResourceRegistry(object):
             success = True
             for aid in assoc_id_list:
                 success = success and self.rr_store.delete(aid, object_type="Association")
+            invalidate_governance_cache(subject, predicate, obj)
             return success
         else:
-            return self.rr_store.delete(association, object_type="Association")
+            assoc = association
+            if isinstance(association, basestring):
+                # Read first to know which cached governance entries the association affects
+                assoc = self.rr_store.read(association, object_type="Association") if is_governance_cache_enabled() else None
+            res = self.rr_store.delete(association, object_type="Association")
+            if assoc is not None:
+                invalidate_governance_cache(assoc.s, assoc.p, assoc.o)
+            return res
 
     def _is_in_association(self, obj_id):
         if not obj_id:
@@ -686,6 +703,17 @@ class ResourceRegistry(object):
     def find_subjects_mult(self, objects=[], id_only=False, predicate="", access_args=None):
         return self.rr_store.find_subjects_mult(objects=objects, id_only=id_only, predicate=predicate, access_args=access_args)
 
+    def get_subgraph(self, root="", predicate=None, max_depth=0, direction="O", id_only=False, access_args=None):
+        """Returns resources and associations reachable from a root resource following associations recursively,
+        e.g. a site or device hierarchy, in one datastore query. Cycles are not followed.
+        @param predicate  A predicate or list of predicates to follow. All predicates if empty
+        @param max_depth  Maximum number of association levels to follow. 0 for unlimited
+        @param direction  O=follow from subject to object, S=from object to subject, A=any side
+        @retval tuple (list of resource objects or ids starting with root, list of association objects)
+        """
+        return self.rr_store.find_subgraph(root, predicate=predicate, max_depth=max_depth, direction=direction,
+                                           id_only=id_only, access_args=access_args)
+
     def get_association(self, subject="", predicate="", object="", assoc_type=None, id_only=False):
         assoc = self.rr_store.find_associations(subject, predicate, object, id_only=id_only)
         if not assoc:
@@ -707,7 +735,7 @@ class ResourceRegistry(object):
                            attr_name=None, attr_value=None, alt_id="", alt_id_ns="",
                            limit=None, skip=None, descending=None, id_only=False,
                            query=None,
-                           access_args=None):
+                           access_args=None, as_iterator=False):
         """Return a list of resource objects or resource ids based on given arguments.
         Internally applies one of several search strategies. Search strategies cannot be combined (use
         ResourceQuery for more advanced combinations of filters and search strategies).
@@ -730,12 +758,15 @@ class ResourceRegistry(object):
         - skip  Return entries after skipping n entries
         - descending  Return entries in reverse order
         - access_args  dict with info about calling actor id, org memberships and superusers for visibility filter
+        - as_iterator  If True, return an iterator fetching results lazily (requires query)
+        A query with a page token (see DatastoreQueryBuilder.set_page_token) is paged by keyset instead of
+        skip, with the next page's token set in the query's _result dict.
         """
         return self.rr_store.find_resources_ext(restype=restype, lcstate=lcstate, name=name,
             keyword=keyword, nested_type=nested_type,
             attr_name=attr_name, attr_value=attr_value, alt_id=alt_id, alt_id_ns=alt_id_ns,
             limit=limit, skip=skip, descending=descending,
-            id_only=id_only, query=query, access_args=access_args)
+            id_only=id_only, query=query, access_args=access_args, as_iterator=as_iterator)
 
 
     def get_superuser_actors(self, reset=False):
@@ -858,6 +889,12 @@ class ResourceRegistryServiceWrapper(object):
         return self._rr.find_subjects_mult(objects=objects, id_only=id_only,
                                                          predicate=predicate, access_args=access_args)
 
+    def get_subgraph(self, root="", predicate=None, max_depth=0, direction="O", id_only=False):
+        access_args = create_access_args(current_actor_id=get_ion_actor_id(self._process),
+                                         superuser_actor_ids=self._rr.get_superuser_actors())
+        return self._rr.get_subgraph(root=root, predicate=predicate, max_depth=max_depth, direction=direction,
+                                     id_only=id_only, access_args=access_args)
+
     def find_resources(self, restype="", lcstate="", name="", id_only=False):
         access_args = create_access_args(current_actor_id=get_ion_actor_id(self._process),
                                          superuser_actor_ids=self._rr.get_superuser_actors())
@@ -63,21 +63,25 @@ class StreamPublisher(Publisher):
         self.container = process.container
         self.xp = self.container.ex_manager.create_xp(self.stream_route.exchange_point)
         self.xp_route = self.xp.create_route(self.stream_route.routing_key)
+        self._xp_routes = {}    # (exchange_point, routing_key) -> xp route, for routes given to publish
 
     def publish(self, msg, stream_id='', stream_route=None):
         '''
         Encapsulates and publishes a message; the message is sent to either the specified
-        stream/route or the stream/route specified at instantiation
+        stream/route or the stream/route specified at instantiation.
+        numpy arrays in the message are sent as raw byte buffers (see EncodeInterceptor) and
+        arrive as read-only arrays.
         '''
-        xp = self.xp
-        xp_route = self.xp_route
-        log.trace('Exchange: %s', xp.exchange)
         if stream_route:
-            xp = self.container.ex_manager.create_xp(stream_route.exchange_point)
-            xp_route = xp.create_route(stream_route.routing_key)
+            route_key = (stream_route.exchange_point, stream_route.routing_key)
+            xp_route = self._xp_routes.get(route_key, None)
+            if xp_route is None:
+                xp = self.container.ex_manager.create_xp(stream_route.exchange_point)
+                xp_route = self._xp_routes[route_key] = xp.create_route(stream_route.routing_key)
         else:
+            xp_route = self.xp_route
             stream_route = self.stream_route
-        log.trace('Publishing (%s,%s)', xp.exchange, stream_route.routing_key)
+        log.trace('Publishing (%s,%s)', stream_route.exchange_point, stream_route.routing_key)
         super(StreamPublisher,self).publish(msg, to_name=xp_route, headers={'exchange_point':stream_route.exchange_point, 'stream':stream_id or self.stream_id})
 
 
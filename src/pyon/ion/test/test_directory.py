@@ -12,7 +12,7 @@ from pyon.core.exception import BadRequest, NotFound
 from pyon.datastore.datastore import DatastoreManager
 from pyon.ion.directory import Directory
 
-from interface.objects import DirEntry
+from interface.objects import DirEntry, DirectoryModifiedEvent
 
 
 @attr('UNIT', group='datastore')
@@ -204,4 +204,62 @@ class TestDirectory(IonUnitTestCase):
         lock5 = directory.acquire_lock("LOCK5", lock_holder="proc2", timeout=100)
         self.assertEquals(lock5, True)
 
-        directory.stop()
\ No newline at end of file
+        directory.stop()
+
+    def test_directory_cache(self):
+        dsm = DatastoreManager()
+        ds = dsm.get_datastore("resources", "DIRECTORY")
+        ds.delete_datastore()
+        ds.create_datastore()
+
+        self.patch_cfg('pyon.ion.directory.CFG', {'service': {'directory': {'publish_events': False,
+                                                                            'cache_size': 100, 'cache_ttl': 60}}})
+
+        directory = Directory(datastore_manager=dsm)
+        directory.start()
+
+        directory.register("/Cached/Sub", "entry1", foo="awesome")
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "awesome"})
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "awesome"})
+        self.assertEquals(directory.lookup("/Cached/Sub/entry2"), None)
+        self.assertEquals(directory.lookup("/Cached/Sub/entry2"), None)
+        stats = directory.get_cache_stats()
+        self.assertGreaterEqual(stats["hits"], 2)
+        self.assertGreater(stats["hit_rate"], 0)
+
+        # Modifying a returned entry does not change the cached entry
+        de = directory.lookup("/Cached/Sub/entry1", return_entry=True)
+        de.attributes["foo"] = "changed"
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "awesome"})
+
+        # Local changes invalidate entries and child listings
+        self.assertEquals(len(directory.find_child_entries("/Cached/Sub")), 1)
+        self.assertEquals(len(directory.find_child_entries("/Cached", direct_only=False)), 2)
+        directory.register("/Cached/Sub", "entry1", foo="ingenious")
+        directory.register("/Cached/Sub", "entry2", foo="new")
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "ingenious"})
+        self.assertEquals(directory.lookup("/Cached/Sub/entry2"), {"foo": "new"})
+        self.assertEquals(len(directory.find_child_entries("/Cached/Sub")), 2)
+        self.assertEquals(len(directory.find_child_entries("/Cached", direct_only=False)), 3)
+
+        directory.unregister("/Cached/Sub", "entry2")
+        self.assertEquals(directory.lookup("/Cached/Sub/entry2"), None)
+        self.assertEquals(len(directory.find_child_entries("/Cached/Sub")), 1)
+        self.assertEquals(len(directory.find_child_entries("/Cached", direct_only=False)), 2)
+
+        # Changes by other containers are seen after the change event
+        de = directory.lookup("/Cached/Sub/entry1", return_entry=True)
+        de.attributes = {"foo": "remote"}
+        directory.dir_store.update(de)
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "ingenious"})
+        event = DirectoryModifiedEvent(org="ION", parent="/Cached/Sub", key="entry1")
+        directory.receive_directory_change_event(event, {})
+        self.assertEquals(directory.lookup("/Cached/Sub/entry1"), {"foo": "remote"})
+
+        # Locks are not cached
+        directory.acquire_lock("LOCK1")
+        self.assertTrue(directory.is_locked("LOCK1"))
+        directory.release_lock("LOCK1")
+        self.assertFalse(directory.is_locked("LOCK1"))
+
+        directory.stop()
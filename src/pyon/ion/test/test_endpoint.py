@@ -31,30 +31,36 @@ class TestProcessEndpointUnitMixin(PyonTestCase):
 
         mockbi.assert_called_once_with(ep, process=sentinel.proc, invother=sentinel.anything)
 
-    @patch('pyon.ion.endpoint.process_interceptors')
-    @patch('pyon.net.endpoint.process_interceptors')
-    def test__intercept_msg_in(self, mocknpi, mockipi):
-        mockipi.return_value = sentinel.inv2
-        mocknpi.return_value = sentinel.inv2
+    def _mock_chains(self, ep):
+        chains = {name: Mock() for name in sentinel_interceptors}
+        ep._get_interceptor_chain = Mock(side_effect=lambda name, path: chains[name])
+        return chains
+
+    def test__intercept_msg_in(self):
         ep = ProcessEndpointUnitMixin(process=sentinel.proc, interceptors=sentinel_interceptors)
+        chains = self._mock_chains(ep)
+        chains['message_incoming'].process.return_value = sentinel.inv2
+        chains['process_incoming'].process.return_value = sentinel.inv3
 
-        ep._intercept_msg_in(sentinel.inv)
+        self.assertEquals(ep._intercept_msg_in(sentinel.inv), sentinel.inv3)
 
-        mocknpi.assert_has_calls([call(sentinel.msg_incoming, sentinel.inv)])
-        mockipi.assert_has_calls([call(sentinel.proc_incoming, sentinel.inv2)])
+        chains['message_incoming'].process.assert_called_once_with(sentinel.inv)
+        chains['process_incoming'].process.assert_called_once_with(sentinel.inv2)
+        ep._get_interceptor_chain.assert_has_calls([call('message_incoming', 'incoming'),
+                                                    call('process_incoming', 'incoming')])
 
-    @patch('pyon.ion.endpoint.process_interceptors')
-    @patch('pyon.net.endpoint.process_interceptors')
-    def test__intercept_msg_out(self, mocknpi, mockipi):
-        mockipi.return_value = sentinel.inv2
-        mocknpi.return_value = sentinel.inv2
+    def test__intercept_msg_out(self):
         ep = ProcessEndpointUnitMixin(process=sentinel.proc, interceptors=sentinel_interceptors)
+        chains = self._mock_chains(ep)
+        chains['process_outgoing'].process.return_value = sentinel.inv2
+        chains['message_outgoing'].process.return_value = sentinel.inv3
 
-        ep._intercept_msg_out(sentinel.inv)
-
-        mockipi.assert_has_calls([call(sentinel.proc_outgoing, sentinel.inv)])
-        mocknpi.assert_has_calls([call(sentinel.msg_outgoing, sentinel.inv2)])
+        self.assertEquals(ep._intercept_msg_out(sentinel.inv), sentinel.inv3)
 
+        chains['process_outgoing'].process.assert_called_once_with(sentinel.inv)
+        chains['message_outgoing'].process.assert_called_once_with(sentinel.inv2)
+        ep._get_interceptor_chain.assert_has_calls([call('process_outgoing', 'outgoing'),
+                                                    call('message_outgoing', 'outgoing')])
 
     @patch('pyon.net.endpoint.BaseEndpoint._get_container_instance')
     def test__build_header_no_context(self, mockgci):
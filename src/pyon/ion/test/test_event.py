@@ -502,6 +502,14 @@ class TestEventRepoInt(IonIntegrationTestCase):
         self.assertEquals(len(ev_obj), 3)
         self.assertTrue(all([True for eo in ev_obj if isinstance(eo, basestring)]))
 
+        eq = EventQuery()
+        eq.set_filter(eq.filter_sub_type("ST", cmpop=DQ.TXT_CONTAINS))
+        ev_iter = self.er.find_events_query(query=eq.get_query(), id_only=False, as_iterator=True)
+        self.assertFalse(isinstance(ev_iter, list))
+        ev_obj = list(ev_iter)
+        self.assertEquals(len(ev_obj), 6)
+        self.assertTrue(all(isinstance(eo, Event) for eo in ev_obj))
+
         eq = EventQuery()
         eq.set_filter(eq.filter_sub_type("ST", cmpop=DQ.TXT_CONTAINS))
         ev_obj = self.er.find_events_query(query=eq.get_query(), id_only=False)
@@ -855,6 +855,31 @@ class TestResourceRegistry(IonIntegrationTestCase):
         assoc_objs = self.rr.find_associations(query=aq.get_query(), id_only=False)
         self.assertEquals(len(assoc_objs), 3)
 
+        # --- Subgraph (recursively)
+
+        res_ids, assoc_objs = self.rr.get_subgraph(res_by_name["OS1"], predicate=PRED.hasTestSite, id_only=True)
+        self.assertEquals(res_ids, [res_by_name[n] for n in ("OS1", "PS0", "PS1", "IS1")])
+        self.assertEquals(len(assoc_objs), 3)
+
+        res_ids, assoc_objs = self.rr.get_subgraph(res_by_name["OS1"], predicate=PRED.hasTestSite, max_depth=2, id_only=True)
+        self.assertEquals(len(res_ids), 3)
+        self.assertEquals(len(assoc_objs), 2)
+
+        res_objs, assoc_objs = self.rr.get_subgraph(res_by_name["OS1"], predicate=[PRED.hasTestSite, PRED.hasTestDevice])
+        self.assertEquals({o.name for o in res_objs}, {"OS1", "PS0", "PS1", "IS1", "PD1", "ID1"})
+        self.assertEquals(len(assoc_objs), 6)
+
+        res_ids, assoc_objs = self.rr.get_subgraph(res_by_name["ID1"], predicate=PRED.hasTestDevice, direction="S", id_only=True)
+        self.assertEquals(set(res_ids), {res_by_name[n] for n in ("ID1", "IS1", "PD1", "PS1")})
+        self.assertEquals(len(assoc_objs), 3)
+
+        res_ids, assoc_objs = self.rr.get_subgraph(res_by_name["ID1"], max_depth=1, direction="A", id_only=True)
+        self.assertEquals(set(res_ids), {res_by_name[n] for n in ("ID1", "DP1", "DP2", "PD1", "IS1")})
+        self.assertEquals(len(assoc_objs), 4)
+
+        with self.assertRaises(NotFound):
+            self.rr.get_subgraph("NONE", id_only=True)
+
         #print assoc_objs
 
         #from pyon.util.breakpoint import breakpoint
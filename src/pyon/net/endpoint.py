@@ -18,8 +18,9 @@ import threading
 from pyon.core import bootstrap, exception
 from pyon.core.bootstrap import CFG, IonObject
 from pyon.core.exception import ExceptionFactory, IonException, BadRequest, Unauthorized
-from pyon.net.channel import ChannelClosedError, PublisherChannel, ListenChannel, SubscriberChannel, ServerChannel, BidirClientChannel
-from pyon.core.interceptor.interceptor import Invocation, process_interceptors
+from pyon.net.channel import ChannelClosedError, ChannelShutdownMessage, PublisherChannel, ListenChannel, SubscriberChannel, ServerChannel, BidirClientChannel, RecvChannel
+from pyon.core.interceptor.interceptor import Invocation, process_interceptors, get_interceptor_chain
+from pyon.util.async import spawn
 from pyon.util.containers import get_ion_ts, get_ion_ts_millis
 from pyon.util.log import log
 from pyon.net.transport import NameTrio, BaseTransport, XOTransport
@@ -77,6 +78,19 @@ class EndpointUnit(object):
     @interceptors.setter
     def interceptors(self, value):
         self._interceptors = value
+        self._interceptor_chains = {}
+
+    def _get_interceptor_chain(self, stack_name, path):
+        """
+        Returns the compiled InterceptorChain for the named interceptor stack.
+        Uses the endpoint's chains unless this unit has its own interceptors.
+        """
+        if self._interceptors is None and self._endpoint is not None:
+            return self._endpoint.get_interceptor_chain(stack_name, path)
+        chains = self.__dict__.get('_interceptor_chains', None)
+        if chains is None:
+            chains = self._interceptor_chains = {}
+        return get_interceptor_chain(chains, self.interceptors, stack_name, path)
 
     def attach_channel(self, channel):
         self.channel = channel
@@ -123,7 +137,7 @@ class EndpointUnit(object):
         @param inv      An Invocation instance.
         @returns        A processed Invocation instance.
         """
-        inv_prime = process_interceptors(self.interceptors["message_incoming"] if "message_incoming" in self.interceptors else [], inv)
+        inv_prime = self._get_interceptor_chain("message_incoming", Invocation.PATH_IN).process(inv)
         return inv_prime
 
     def message_received(self, msg, headers):
@@ -189,7 +203,7 @@ class EndpointUnit(object):
         @param  inv     An Invocation instance.
         @returns        A processed Invocation instance.
         """
-        inv_prime = process_interceptors(self.interceptors["message_outgoing"] if "message_outgoing" in self.interceptors else [], inv)
+        inv_prime = self._get_interceptor_chain("message_outgoing", Invocation.PATH_OUT).process(inv)
         return inv_prime
 
     def close(self):
@@ -297,6 +311,17 @@ class BaseEndpoint(object):
     @interceptors.setter
     def interceptors(self, value):
         self._interceptors = value
+        self._interceptor_chains = {}
+
+    def get_interceptor_chain(self, stack_name, path):
+        """
+        Returns the InterceptorChain for the named interceptor stack, compiled once per endpoint
+        and shared by its endpoint units.
+        """
+        chains = self.__dict__.get('_interceptor_chains', None)
+        if chains is None:
+            chains = self._interceptor_chains = {}
+        return get_interceptor_chain(chains, self.interceptors, stack_name, path)
 
     def create_endpoint(self, to_name=None, existing_channel=None, **kwargs):
         """
@@ -816,7 +841,257 @@ class BidirectionalListeningEndpointUnit(EndpointUnit):
 #  REQ / RESP (and RPC)
 #
 
+class RequestFuture(object):
+    """
+    Pending response of a request sent without waiting, e.g. via RPCClient.call_async.
+
+    The response is awaited and processed (incoming interceptors, error conversion) when get() is
+    called, in the calling greenlet. The outcome is remembered, so get() may be called repeatedly.
+    """
+    def __init__(self, waiter, ready_check=None):
+        self._waiter = waiter
+        self._ready_check = ready_check
+        self._done = False
+        self._value = None
+        self._exc_info = None
+        self.received_at = None     # Time the response arrived, if known
+
+    @classmethod
+    def completed(cls, func, *args, **kwargs):
+        """
+        Performs the given call right away and returns a future holding its outcome.
+        """
+        future = cls(lambda: func(*args, **kwargs))
+        future._resolve()
+        return future
+
+    def then(self, func):
+        """
+        Returns a new future whose value is func applied to the value of this future.
+        """
+        return RequestFuture(lambda: func(self.get()), ready_check=self.ready)
+
+    def ready(self):
+        """
+        Returns True if get() will not block waiting for the response.
+        """
+        return self._done or (self._ready_check is not None and self._ready_check())
+
+    def get(self):
+        """
+        Waits for the response and returns the result, or raises the error of the request.
+        """
+        if not self._done:
+            self._resolve()
+        if self._exc_info is not None:
+            raise self._exc_info[0], self._exc_info[1], self._exc_info[2]
+        return self._value
+
+    def _resolve(self):
+        try:
+            self._value = self._waiter()
+        except Exception:
+            self._exc_info = sys.exc_info()
+        self._done = True
+        self._waiter = None
+        self._ready_check = None
+
+
+def gather(futures, return_exceptions=False):
+    """
+    Waits for all given RequestFutures and returns their results in order.
+
+    Because all requests are in flight already, this takes about as long as the slowest of them.
+    If return_exceptions is False, the first error is raised after all futures are resolved,
+    otherwise errors are returned in place of the results.
+    """
+    results, first_exc_info = [], None
+    for future in futures:
+        try:
+            results.append(future.get())
+        except Exception as ex:
+            if return_exceptions:
+                results.append(ex)
+            elif first_exc_info is None:
+                first_exc_info = sys.exc_info()
+
+    if first_exc_info is not None:
+        raise first_exc_info[0], first_exc_info[1], first_exc_info[2]
+    return results
+
+
+class RPCReplyListener(object):
+    """
+    Long-lived, shared reply queue for requests sent via one node to one exchange.
+
+    Instead of declaring, binding, consuming and tearing down an anonymous queue for every request,
+    requests register their conv-id here, set reply-to to the shared queue and wait on an AsyncResult.
+    A single consumer greenlet acks incoming replies and routes them by conv-id to the waiting greenlet.
+    Incoming interceptors are run by the waiting endpoint unit, not by the listener.
+    """
+    _lock = RLock()
+
+    def __init__(self, node, exchange):
+        self.node = node
+        self.exchange = exchange
+        self.reply_to = None
+        self._chan = None
+        self._gl_consume = None
+        self._waiting = {}          # conv-id -> AsyncResult
+        self._active = False
+
+    @classmethod
+    def get_listener(cls, node, exchange, transport=None):
+        """
+        Returns the active reply listener for the given node and exchange, starting a new one if necessary.
+        Returns None if the node does not keep shared reply listeners.
+        """
+        listeners = getattr(node, "rpc_reply_listeners", None)
+        if listeners is None:
+            return None
+
+        listener = listeners.get(exchange, None)
+        if listener is not None and listener.active:
+            return listener
+
+        with cls._lock:
+            listener = listeners.get(exchange, None)
+            if listener is None or not listener.active:
+                listener = cls(node, exchange)
+                listener.start(transport=transport)
+                listeners[exchange] = listener
+
+        return listener
+
+    @property
+    def active(self):
+        return self._active
+
+    def start(self, transport=None):
+        """
+        Declares the anonymous reply queue, starts consuming and spawns the dispatching greenlet.
+        """
+        self._chan = self.node.channel(RecvChannel, transport=transport)
+        self._chan.queue_auto_delete = True
+        self._chan.set_closed_error_callback(self._on_channel_error)
+        self._chan.setup_listener(NameTrio(self.exchange))     # anon queue
+        # replies for concurrent requests arrive interleaved, do not serialize them on acks
+        self._chan._transport.qos_impl(prefetch_count=CFG.get_safe('container.messaging.endpoint.rpc_reply_prefetch_count', 50))
+        self._chan.start_consume()
+
+        self.reply_to = "%s,%s" % (self._chan._recv_name.exchange, self._chan._recv_name.queue)
+        self._active = True
+
+        self._gl_consume = spawn(self._consume_replies)
+        self._gl_consume._glname = "pyon.net RPC reply listener %s" % self.reply_to
+        log.debug("Started RPC reply listener on %s", self.reply_to)
+
+    def close(self):
+        """
+        Stops the listener. Requests still waiting for a reply fail immediately.
+        """
+        self._active = False
+        if self._chan is not None:
+            ev = self._chan.close()
+            if not ev.wait(timeout=3):
+                log.warn("RPC reply listener channel (%s) close did not respond in time, giving up", self._chan.get_channel_id())
+        self._abort_waiting()
+
+    def register(self, conv_id):
+        """
+        Registers interest in the reply to a conversation. Must be called before the request is sent.
+
+        @returns    An AsyncResult that is set to a 4-tuple of raw body, raw headers, delivery tag and receive time.
+        """
+        ar = event.AsyncResult()
+        self._waiting[conv_id] = ar
+        return ar
+
+    def unregister(self, conv_id):
+        self._waiting.pop(conv_id, None)
+
+    def _consume_replies(self):
+        while True:
+            try:
+                rmsg, rheaders, rdtag = self._chan.recv()
+            except ChannelClosedError:
+                break
+
+            try:
+                self._chan.ack(rdtag)
+            except Exception:
+                log.warn("Could not ack RPC reply (%s)", rdtag, exc_info=True)
+
+            conv_id = rheaders.get('conv-id', None)
+            ar = self._waiting.pop(conv_id, None)
+            if ar is not None:
+                ar.set((rmsg, rheaders, rdtag, time.time()))
+            else:
+                log.warn("Discarding unknown message, likely from a previous timed out request (conv-id: %s, seq: %s, perf: %s)", conv_id, rheaders.get('conv-seq', 'no conv seq'), rheaders.get('performative', 'None'))
+
+        self._active = False
+        self._abort_waiting()
+
+    def _on_channel_error(self, ch, code, text):
+        log.warn("RPC reply listener channel %s closed with error (%s: %s)", self.reply_to, code, text)
+        self._active = False
+        ch._recv_queue.put(ChannelShutdownMessage())
+
+    def _abort_waiting(self):
+        waiting, self._waiting = self._waiting, {}
+        for ar in waiting.itervalues():
+            ar.set_exception(EndpointError("RPC reply listener %s closed" % self.reply_to))
+
+
 class RequestEndpointUnit(BidirectionalEndpointUnit):
+    def _get_reply_listener(self):
+        """
+        Returns the shared RPCReplyListener to use for this request, or None to use a per-request queue.
+        """
+        if not CFG.get_safe('container.messaging.endpoint.rpc_reply_queue', True):
+            return None
+        node = self._endpoint.node if self._endpoint is not None else None
+        if node is None or not isinstance(self.channel._send_name, NameTrio):
+            return None
+
+        transport = self.channel._send_name if isinstance(self.channel._send_name, BaseTransport) else None
+        return RPCReplyListener.get_listener(node, self.channel._send_name.exchange, transport=transport)
+
+    def _send_shared(self, reply_listener, msg, headers, timeout):
+        """
+        Sends a request with reply-to set to the shared reply queue, without waiting for the response.
+
+        @returns    A RequestFuture that waits for the response (within the timeout counted from now), runs it
+                    through the incoming interceptors and returns a 2-tuple of message body and headers.
+        """
+        conv_id = headers['conv-id']
+        headers['reply-to'] = reply_listener.reply_to
+        reply_ar = reply_listener.register(conv_id)
+        try:
+            BidirectionalEndpointUnit._send(self, msg, headers=headers)
+        except Exception:
+            reply_listener.unregister(conv_id)
+            raise
+
+        deadline = time.time() + timeout
+
+        def wait_response():
+            try:
+                with Timeout(seconds=max(deadline - time.time(), 0)):
+                    rmsg, rheaders, rdtag, future.received_at = reply_ar.get()
+            except Timeout:
+                raise exception.Timeout('Request timed out (%d sec) waiting for response from %s, conv %s' % (timeout, str(self.channel._send_name), conv_id))
+            finally:
+                reply_listener.unregister(conv_id)
+
+            # Provide a hook for any message received
+            trigger_msg_in_callback(rmsg, rheaders, rdtag, self)
+
+            return self.intercept_in(rmsg, rheaders)
+
+        future = RequestFuture(wait_response, ready_check=reply_ar.ready)
+        return future
+
     def _get_response(self, conv_id, timeout):
         """
         Gets a response message to the conv_id within the given timeout.
@@ -848,9 +1123,10 @@ class RequestEndpointUnit(BidirectionalEndpointUnit):
                 else:
                     log.warn("Discarding unknown message, likely from a previous timed out request (conv-id: %s, seq: %s, perf: %s)", nh.get('conv-id', "no conv id"), nh.get('conv-seq', 'no conv seq'), nh.get('performative', 'None'))
 
-    def _send(self, msg, headers=None, **kwargs):
-        """Handles an RPC send with response timeout"""
-
+    def _get_request_timeout(self, headers, kwargs):
+        """
+        Determines the response timeout in seconds and sets the reply-by header accordingly.
+        """
         # could have a specified timeout in kwargs
         if 'timeout' in kwargs and kwargs['timeout'] is not None:
             timeout = kwargs['timeout']
@@ -859,6 +1135,41 @@ class RequestEndpointUnit(BidirectionalEndpointUnit):
 
         # we have a timeout, update reply-by header
         headers['reply-by'] = str(int(headers['ts']) + int(timeout * 1000))
+        return timeout
+
+    def send_async(self, msg, headers=None, **kwargs):
+        """
+        Sends a request like send, but does not wait for the response.
+
+        @returns    A RequestFuture; its get() returns what send would have returned.
+        """
+        _msg, _header = self._build_msg(msg, headers)
+        if headers:
+            _header.update(headers)
+        return self._send_async(_msg, _header, **kwargs)
+
+    def _send_async(self, msg, headers=None, **kwargs):
+        """
+        Sends a request via the shared reply queue, so that many requests can be in flight at once.
+
+        Without a shared reply queue, the request is performed synchronously and the returned future is complete.
+        """
+        reply_listener = self._get_reply_listener() if headers.get('conv-id', None) else None
+        if reply_listener is None:
+            return RequestFuture.completed(RequestEndpointUnit._send, self, msg, headers, **kwargs)
+
+        timeout = self._get_request_timeout(headers, kwargs)
+        return self._send_shared(reply_listener, msg, headers, timeout)
+
+    def _send(self, msg, headers=None, **kwargs):
+        """Handles an RPC send with response timeout"""
+        timeout = self._get_request_timeout(headers, kwargs)
+
+        # use the shared reply queue if possible, saving the declare/bind/consume round-trips per request
+        reply_listener = self._get_reply_listener() if headers.get('conv-id', None) else None
+        if reply_listener is not None:
+            return self._send_shared(reply_listener, msg, headers, timeout).get()
+
         # TODO: Set a better name for RPC response queue with system prefix
         ep_name = NameTrio(self.channel._send_name.exchange)
         #ep_name = NameTrio(self.channel._send_name.exchange, self._unique_name)
@@ -901,6 +1212,20 @@ class RequestResponseClient(SendingBaseEndpoint):
             e.close()
         return retval
 
+    def request_async(self, msg, headers=None, timeout=None):
+        """
+        Sends a request without waiting for the response.
+
+        @returns    A RequestFuture; its get() returns what request would have returned.
+        """
+        e = self.create_endpoint(self._send_name)
+        try:
+            future = e.send_async(msg, headers=headers, timeout=timeout)
+        finally:
+            # the response arrives via the shared reply queue, the channel is not needed anymore
+            e.close()
+        return future.then(lambda res: res[0])
+
 
 class ResponseEndpointUnit(BidirectionalListeningEndpointUnit):
     """
@@ -942,13 +1267,34 @@ class RPCRequestEndpointUnit(RequestEndpointUnit):
         ######
         res, res_headers = RequestEndpointUnit._send(self, msg, headers=headers, **kwargs)
 
+        return self._process_response(res, res_headers, headers, timer)
+
+    def _send_async(self, msg, headers=None, **kwargs):
+        log_message("MESSAGE SEND >>> RPC-request", msg, headers, is_send=True)
+        timer = Timer(logger=None) if stats.is_log_enabled() else None
+
+        future = RequestEndpointUnit._send_async(self, msg, headers=headers, **kwargs)
+        # the caller may call get() much later, so stop the timer at the time the response arrived
+        return future.then(lambda res: self._process_response(res[0], res[1], headers, timer,
+                                                              received_at=future.received_at))
+
+    def _process_response(self, res, res_headers, headers, timer=None, received_at=None):
+        """
+        Records RPC stats for a received response and raises the remote exception if the call failed.
+        If received_at is given, the recorded latency ends there instead of now.
+
+        @returns    A 2-tuple of the response body and response headers.
+        """
         if timer:
             # record elapsed time in RPC stats
             receiver = headers.get('receiver', '?')  # header field is generally: exchange,queue
             receiver = receiver.split(',')[-1]       # want to log just the service_name for consistency
             receiver = receiver.split('.')[-1]       # want to log just the service_name for consistency
             stepid = 'rpc-client.%s.%s=%s' % (receiver, headers.get('op', '?'), res_headers["status_code"])
-            timer.complete_step(stepid)
+            if received_at is None:
+                timer.complete_step(stepid)
+            else:
+                timer.times.append((stepid, received_at))
             stats.add(timer)
         log_message("MESSAGE RECV >>> RPC-reply", res, res_headers, is_send=False)
 
@@ -1100,6 +1446,48 @@ class RPCClient(RequestResponseClient):
 
         return RequestResponseClient.request(self, msg, headers=headers, timeout=timeout)
 
+    def request_async(self, msg, headers=None, op=None, timeout=None):
+        """
+        Like request, but returns a RequestFuture instead of waiting for the response.
+        """
+        assert op
+        assert headers is None or isinstance(headers, dict)
+
+        if headers is not None:
+            headers = headers.copy()
+        else:
+            headers = {}
+
+        headers['op'] = op
+
+        return RequestResponseClient.request_async(self, msg, headers=headers, timeout=timeout)
+
+    def call_async(self, op, **kwargs):
+        """
+        Calls the named service operation without waiting for the response.
+
+        Takes the same keyword arguments as the operation method (including headers and timeout)
+        and returns a RequestFuture. Many calls can be in flight at once; use gather to collect them.
+        """
+        op_method = getattr(type(self), op, None)
+        if op_method is None:
+            raise BadRequest("Unknown op name: %s" % op)
+        return op_method.__func__(_AsyncRequestProxy(self), **kwargs)
+
+
+class _AsyncRequestProxy(object):
+    """
+    Stands in for an RPCClient when calling one of its operation methods, turning request into request_async.
+    """
+    def __init__(self, client):
+        self._client = client
+
+    def request(self, msg, headers=None, op=None, timeout=None):
+        return self._client.request_async(msg, headers=headers, op=op, timeout=timeout)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
 
 class RPCResponseEndpointUnit(ResponseEndpointUnit):
     def __init__(self, routing_obj=None, **kwargs):
@@ -34,6 +34,7 @@ class BaseNode(object):
         self._lock = RLock()
 
         self.interceptors = {}  # endpoint interceptors
+        self.rpc_reply_listeners = {}   # exchange -> shared RPC reply listener (see pyon.net.endpoint)
 
     def on_connection_open(self, client):
         """
@@ -69,6 +70,17 @@ class BaseNode(object):
         log.debug("In Node.stop_node")
         self.running = False
 
+    def _close_reply_listeners(self):
+        """
+        Closes any shared RPC reply listeners started on this node.
+        """
+        listeners, self.rpc_reply_listeners = self.rpc_reply_listeners, {}
+        for listener in listeners.itervalues():
+            try:
+                listener.close()
+            except Exception:
+                log.warn("Error closing RPC reply listener", exc_info=True)
+
     def channel(self, ch_type):
         """
         Create a channel on current node.
@@ -156,7 +168,8 @@ class NodeB(BaseNode):
         log.debug("NodeB.stop_node (running: %s)", self.running)
 
         if self.running:
-            # clean up pooling before we shut connection
+            # clean up shared reply queues and pooling before we shut connection
+            self._close_reply_listeners()
             self._destroy_pool()
             self.client.close()
 
@@ -413,6 +426,7 @@ class LocalNode(BaseNode):
 
     def stop_node(self):
         if self.running:
+            self._close_reply_listeners()
             if self._own_router:
                 self._local_router.stop()
         self.running = False
@@ -7,6 +7,7 @@ from nose.plugins.attrib import attr
 from mock import Mock, sentinel, patch, ANY, call, MagicMock
 from gevent import event, spawn
 import unittest
+import time
 from zope.interface.declarations import implements
 from zope.interface.interface import Interface
 from gevent import sleep
@@ -18,7 +19,7 @@ from pyon.core.bootstrap import get_sys_name, CFG
 from pyon.container.cc import Container
 from pyon.core.interceptor.interceptor import Invocation
 from pyon.net.channel import BaseChannel, SendChannel, BidirClientChannel, SubscriberChannel, ChannelClosedError, ServerChannel, RecvChannel, ListenChannel
-from pyon.net.endpoint import EndpointUnit, BaseEndpoint, RPCServer, Subscriber, Publisher, RequestResponseClient, RequestEndpointUnit, RPCRequestEndpointUnit, RPCClient, RPCResponseEndpointUnit, EndpointError, SendingBaseEndpoint, ListeningBaseEndpoint
+from pyon.net.endpoint import EndpointUnit, BaseEndpoint, RPCServer, Subscriber, Publisher, RequestResponseClient, RequestEndpointUnit, RPCRequestEndpointUnit, RPCClient, RPCResponseEndpointUnit, EndpointError, SendingBaseEndpoint, ListeningBaseEndpoint, RPCReplyListener, RequestFuture, gather
 from pyon.net.messaging import NodeB
 from pyon.ion.service import BaseService
 from pyon.net.transport import NameTrio, BaseTransport
@@ -527,6 +528,92 @@ class TestRequestResponse(PyonTestCase, RecvMockMixin):
         pass
 
 
+@attr('UNIT')
+class TestRPCReplyListener(PyonTestCase):
+
+    def _setup_listener_channel(self, replies):
+        ch = MagicMock(spec=RecvChannel())
+        ch._recv_name = NameTrio('ex', 'q-reply')
+        vals = list(reversed(replies))
+        def _ret(*args, **kwargs):
+            if len(vals):
+                return vals.pop()
+            raise ChannelClosedError()
+        ch.recv.side_effect = _ret
+        return ch
+
+    def test_get_listener_unsupported_node(self):
+        self.assertIsNone(RPCReplyListener.get_listener(Mock(spec=NodeB), 'ex'))
+
+    def test_get_listener_reuses_active(self):
+        node = Mock()
+        node.rpc_reply_listeners = {}
+        node.channel.return_value = self._setup_listener_channel([])
+
+        with patch('pyon.net.endpoint.spawn'):
+            rl = RPCReplyListener.get_listener(node, 'ex')
+            self.assertEquals(rl.reply_to, 'ex,q-reply')
+            self.assertEquals(node.rpc_reply_listeners, {'ex': rl})
+            self.assertIs(RPCReplyListener.get_listener(node, 'ex'), rl)
+
+        self.assertEquals(node.channel.call_count, 1)
+
+    def test_dispatch_by_conv_id(self):
+        node = Mock()
+        ch = self._setup_listener_channel([("late", {'conv-id': 'other'}, 'dtag1'),
+                                           ("reply", {'conv-id': 'conv1'}, 'dtag2')])
+        node.channel.return_value = ch
+
+        rl = RPCReplyListener(node, 'ex')
+        ar = rl.register('conv1')
+        rl.start()
+
+        self.assertEquals(ar.get(timeout=5)[:3], ("reply", {'conv-id': 'conv1'}, 'dtag2'))
+        rl._gl_consume.join(timeout=5)
+
+        ch.ack.assert_has_calls([call('dtag1'), call('dtag2')])
+        self.assertFalse(rl.active)
+
+    def test_waiting_aborted_on_close(self):
+        rl = RPCReplyListener(Mock(), 'ex')
+        ar = rl.register('conv1')
+        rl.close()
+
+        self.assertRaises(EndpointError, ar.get, timeout=1)
+
+    @patch('pyon.net.endpoint.BidirectionalEndpointUnit._send')
+    def test_request_uses_shared_listener(self, bsendmock):
+        rl = RPCReplyListener(Mock(), 'ex')
+        rl.reply_to = 'ex,q-reply'
+
+        def _fake_send(ep, msg, headers=None):
+            self.assertEquals(headers['reply-to'], 'ex,q-reply')
+            rl._waiting[headers['conv-id']].set(("bidirmsg", {'conv-id': headers['conv-id']}, sentinel.dtag, 0))
+            return msg, headers
+        bsendmock.side_effect = _fake_send
+
+        e = RequestEndpointUnit(interceptors={})
+        e.channel = Mock()
+        e._get_reply_listener = Mock(return_value=rl)
+
+        retval, heads = e._send("msg", {'ts': '0', 'conv-id': 'conv1'})
+
+        self.assertEquals(retval, "bidirmsg")
+        self.assertFalse(e.channel.setup_listener.called)
+        self.assertEquals(rl._waiting, {})
+
+    def test_request_shared_listener_timeout(self):
+        rl = RPCReplyListener(Mock(), 'ex')
+        rl.reply_to = 'ex,q-reply'
+
+        e = RequestEndpointUnit(interceptors={})
+        e.channel = Mock()
+        e._get_reply_listener = Mock(return_value=rl)
+
+        self.assertRaises(exception.Timeout, e._send, sentinel.msg, {'ts': '0', 'conv-id': 'conv1'}, timeout=1)
+        self.assertEquals(rl._waiting, {})
+
+
 class ISimpleInterface(Interface):
     """
 Defines a simple interface for testing rpc client/servers.
@@ -599,6 +686,119 @@ class TestRPCClient(PyonTestCase, RecvMockMixin):
         rpcc = RPCClient(to_name="simply", iface=ISimpleInterface)
         self.assertRaises(AssertionError, rpcc.simple, "zap", "zip")
 
+@attr('UNIT')
+class TestRequestFuture(PyonTestCase):
+
+    def test_completed(self):
+        f = RequestFuture.completed(lambda x: x + 1, 1)
+        self.assertTrue(f.ready())
+        self.assertEquals(f.get(), 2)
+
+        def _fail():
+            raise exception.NotFound("nope")
+        f = RequestFuture.completed(_fail)
+        self.assertTrue(f.ready())
+        self.assertRaises(exception.NotFound, f.get)
+        self.assertRaises(exception.NotFound, f.get)
+
+    def test_lazy_wait(self):
+        ar = event.AsyncResult()
+        waiter = Mock(side_effect=lambda: ar.get())
+        f = RequestFuture(waiter, ready_check=ar.ready)
+        f2 = f.then(lambda val: val * 2)
+
+        self.assertFalse(waiter.called)
+        self.assertFalse(f2.ready())
+
+        ar.set(21)
+        self.assertTrue(f2.ready())
+        self.assertEquals(f2.get(), 42)
+        self.assertEquals(f.get(), 21)
+        self.assertEquals(waiter.call_count, 1)
+
+    def test_gather(self):
+        def _fail():
+            raise exception.BadRequest("bad")
+        futures = [RequestFuture.completed(lambda: 1), RequestFuture(_fail), RequestFuture(lambda: 3)]
+
+        self.assertEquals(gather(futures[:1] + futures[2:]), [1, 3])
+        self.assertRaises(exception.BadRequest, gather, futures)
+
+        res = gather(futures, return_exceptions=True)
+        self.assertEquals(res[0], 1)
+        self.assertIsInstance(res[1], exception.BadRequest)
+        self.assertEquals(res[2], 3)
+
+@attr('UNIT')
+class TestRPCClientAsync(PyonTestCase, RecvMockMixin):
+
+    @patch('pyon.net.endpoint.IonObject')
+    @patch('pyon.net.endpoint.RPCRequestEndpointUnit._build_conv_id', Mock(return_value=sentinel.conv_id))
+    def test_call_async_without_shared_queue(self, iomock):
+        node = Mock(spec=NodeB)
+
+        rpcc = RPCClient(node=node, to_name="simply", iface=ISimpleInterface)
+        rpcc.node.channel.return_value = self._setup_mock_channel()
+        rpcc.node.interceptors = {}
+
+        future = rpcc.call_async("simple", one="zap", two="zip")
+
+        iomock.assert_called_once_with('SimpleInterface_simple_in', one='zap', two='zip')
+        self.assertTrue(future.ready())
+        self.assertEquals(future.get(), "bidirmsg")
+
+    def test_call_async_unknown_op(self):
+        rpcc = RPCClient(to_name="simply", iface=ISimpleInterface)
+        self.assertRaises(exception.BadRequest, rpcc.call_async, "notanop")
+
+    @patch('pyon.net.endpoint.BidirectionalEndpointUnit._send')
+    def test_send_async_pipelined(self, bsendmock):
+        rl = RPCReplyListener(Mock(), 'ex')
+        rl.reply_to = 'ex,q-reply'
+        sent = []
+        bsendmock.side_effect = lambda ep, msg, headers=None: sent.append(headers['conv-id']) or (msg, headers)
+
+        futures = []
+        for conv_id, status in (('conv1', 200), ('conv2', 404)):
+            e = RPCRequestEndpointUnit(interceptors={})
+            e.channel = Mock()
+            e._get_reply_listener = Mock(return_value=rl)
+            futures.append(e.send_async("msg", headers={'conv-id': conv_id, 'status': status}))
+
+        # both requests are in flight before any response arrived
+        self.assertEquals(sent, ['conv1', 'conv2'])
+        self.assertFalse(futures[0].ready())
+
+        rl._waiting['conv2'].set(("", {'conv-id': 'conv2', 'status_code': 404, 'error_message': 'gone'}, sentinel.dtag2, 0))
+        rl._waiting['conv1'].set(("res1", {'conv-id': 'conv1', 'status_code': 200, 'error_message': ''}, sentinel.dtag1, 0))
+
+        res = gather(futures, return_exceptions=True)
+        self.assertEquals(res[0][0], "res1")
+        self.assertIsInstance(res[1], exception.NotFound)
+        self.assertEquals(rl._waiting, {})
+
+    @patch('pyon.net.endpoint.stats')
+    @patch('pyon.net.endpoint.BidirectionalEndpointUnit._send')
+    def test_send_async_stats_end_at_receive(self, bsendmock, statsmock):
+        rl = RPCReplyListener(Mock(), 'ex')
+        rl.reply_to = 'ex,q-reply'
+        bsendmock.side_effect = lambda ep, msg, headers=None: (msg, headers)
+        statsmock.is_log_enabled.return_value = True
+
+        e = RPCRequestEndpointUnit(interceptors={})
+        e.channel = Mock()
+        e._get_reply_listener = Mock(return_value=rl)
+        future = e.send_async("msg", headers={'conv-id': 'conv1', 'receiver': 'ex,svc', 'op': 'do'})
+
+        received_at = time.time()
+        rl._waiting['conv1'].set(("res1", {'conv-id': 'conv1', 'status_code': 200, 'error_message': ''}, sentinel.dtag1, received_at))
+        # the caller does other work before getting the result
+        sleep(0.05)
+        future.get()
+
+        timer = statsmock.add.call_args[0][0]
+        self.assertEquals(timer.times[-1], ('rpc-client.svc.do=200', received_at))
+
 @attr('UNIT')
 class TestRPCResponseEndpoint(PyonTestCase, RecvMockMixin):
 
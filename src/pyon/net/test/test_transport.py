@@ -600,6 +600,44 @@ class TestTopicTrie(PyonTestCase):
         self.assertEquals({sentinel.wild},
                           set(self.tt.get_all_matches('a.b.b.b.b.b.b')))
 
+    def test_match_cache(self):
+        self.tt.add_topic_tree('a.*', sentinel.p1)
+
+        self.assertEquals({sentinel.p1}, self.tt.get_all_matches('a.b'))
+        self.assertEquals({sentinel.p1}, self.tt.get_all_matches('a.b'))
+        self.assertEquals((self.tt.cache_hits, self.tt.cache_misses), (1, 1))
+
+        # adding and removing binds invalidates cached results
+        self.tt.add_topic_tree('a.b', sentinel.p2)
+        self.assertEquals({sentinel.p1, sentinel.p2}, self.tt.get_all_matches('a.b'))
+
+        self.tt.remove_topic_tree('a.*', sentinel.p1)
+        self.assertEquals({sentinel.p2}, self.tt.get_all_matches('a.b'))
+        self.assertEquals(self.tt.cache_misses, 3)
+
+    def test_match_cache_bounded(self):
+        tt = TopicTrie(cache_size=2)
+        tt.add_topic_tree('#', sentinel.all)
+
+        for rkey in ('a', 'b', 'a', 'c'):
+            self.assertEquals({sentinel.all}, tt.get_all_matches(rkey))
+
+        self.assertEquals(tt._match_cache.keys(), ['a', 'c'])
+
+    def test_remove_prunes_empty_nodes(self):
+        self.tt.add_topic_tree('a.b.c', sentinel.p1)
+        self.tt.add_topic_tree('a.b', sentinel.p2)
+
+        self.tt.remove_topic_tree('a.b.c', sentinel.p1)
+        self.assertEquals(self.tt.root.children['a'].children['b'].children, {})
+
+        self.tt.remove_topic_tree('a.b', sentinel.p2)
+        self.assertEquals(self.tt.root.children, {})
+
+        # removing unknown topic trees does not create nodes
+        self.tt.remove_topic_tree('x.y', sentinel.p1)
+        self.assertEquals(self.tt.root.children, {})
+
 @attr('UNIT')
 class TestLocalRouter(PyonTestCase):
 
@@ -652,6 +690,38 @@ class TestLocalRouter(PyonTestCase):
         self.assertEquals(self.lr._queues['iamqueue'].qsize(), 1)
         #self.assertIn(('known', 'binzim', 'body', 'props'), self.lr._queues['iamqueue'])
 
+    @patch('pyon.net.transport.sleep')
+    def test_publish_routes_without_sleeping(self, sleepmock):
+        self.lr.declare_exchange('known')
+        self.lr.declare_queue('iamqueue')
+        self.lr.bind('known', 'iamqueue', 'binzim')
+
+        self.lr.publish('known', 'binzim', 'body', 'props')
+
+        # routed synchronously, no yield needed
+        self.assertEquals(self.lr._queues['iamqueue'].qsize(), 1)
+        self.assertEquals(sleepmock.call_count, 0)
+
+        # yields every PUBLISH_YIELD_INTERVAL publishes
+        for x in xrange(LocalRouter.PUBLISH_YIELD_INTERVAL - 1):
+            self.lr.publish('known', 'binzim', 'body', 'props')
+
+        self.assertEquals(self.lr._queues['iamqueue'].qsize(), LocalRouter.PUBLISH_YIELD_INTERVAL)
+        sleepmock.assert_called_once_with(0)
+
+    def test_declare_queue_copy_on_write(self):
+        queues = self.lr._queues
+        self.lr.declare_queue('iamqueue')
+
+        self.assertNotIn('iamqueue', queues)
+        self.assertIn('iamqueue', self.lr._queues)
+
+        queues = self.lr._queues
+        self.lr.delete_queue('iamqueue')
+
+        self.assertIn('iamqueue', queues)
+        self.assertNotIn('iamqueue', self.lr._queues)
+
     def test_publish_to_many_queues(self):
         # declare exchange/queue/binding
         self.lr.declare_exchange('known')
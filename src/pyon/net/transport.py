@@ -12,7 +12,7 @@ __author__ = 'Dave Foster <dfoster@asascience.com>'
 import os
 from contextlib import contextmanager
 from uuid import uuid4
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
 from pika import BasicProperties
 from gevent.event import AsyncResult, Event
 from gevent.queue import Queue
@@ -22,7 +22,6 @@ from gevent.timeout import Timeout
 from gevent.pool import Pool
 
 from pyon.util.log import log
-from pyon.util.containers import DotDict
 from pyon.util.async import spawn
 from pyon.util.pool import IDPool
 
@@ -538,12 +537,17 @@ class TopicTrie(object):
     Used for events/pubsub in our system with the local transport. Efficiently stores all registered
     subscription topic trees in a trie structure, handling wildcards * and #.
 
+    Match results are kept in a bounded LRU cache keyed by topic tree (routing key), which is
+    cleared whenever a topic tree is added or removed.
+
     See:
         http://www.zeromq.org/whitepapers:message-matching      (doesn't handle # so scrapped)
         http://www.rabbitmq.com/blog/2010/09/14/very-fast-and-scalable-topic-routing-part-1/
         http://www.rabbitmq.com/blog/2011/03/28/very-fast-and-scalable-topic-routing-part-2/
     """
 
+    MATCH_CACHE_SIZE = 1024     # max number of cached topic tree match results
+
     class Node(object):
         """
         Internal node of a trie.
@@ -570,50 +574,58 @@ class TopicTrie(object):
 
             return new_node
 
+        def is_empty(self):
+            return not self.patterns and not self.children
+
         def get_all_matches(self, topics):
             """
-            Given a list of topic tokens, returns all patterns stored in child nodes/self that match the topic tokens.
+            Given a list of topic tokens, returns a set of all patterns stored in child nodes/self that match the topic tokens.
+            """
+            results = set()
+            self._collect_matches(topics, 0, len(topics), results)
+            return results
 
+        def _collect_matches(self, topics, pos, num_topics, results):
+            """
             This is a depth-first search pruned by token, with special handling for both wildcard types.
+            Walks the topic tokens by position (no list slicing) and adds matching patterns to results.
             """
-            results = []
+            if pos == num_topics:
+                # terminal point, any pattern we have here matches
+                results.update(self.patterns)
+                return
 
-            if len(topics) == 0:
-                # terminal point, return any pattern we have here
-                return self.patterns
-
-            cur_token = topics[0]
-            rem_tokens = topics[1:]     # will always be a list, even if empty or 1-len
-            #log.debug('get_all_matches(%s): cur_token %s, rem_tokens %s', self.token, cur_token, rem_tokens)
+            children = self.children
 
             # child node direct matching
-            if cur_token in self.children:
-                results.extend(self.children[cur_token].get_all_matches(rem_tokens))
+            child = children.get(topics[pos], None)
+            if child is not None:
+                child._collect_matches(topics, pos + 1, num_topics, results)
 
             # now '*' wildcard
-            if '*' in self.children:
-                results.extend(self.children['*'].get_all_matches(rem_tokens))
-
-            # '#' means any number of tokens - naive method of descent, we'll feed it nothing to start. Then chop the full
-            # topics all the way down, put the results in a set to remove duplicates, and also any patterns on self.
-            if '#' in self.children:
-                # keep popping off and descend, make a set out of results
-                all_wild_childs = set()
-                for i in xrange(len(topics)):
-                    res = self.children['#'].get_all_matches(topics[i:])
-                    map(all_wild_childs.add, res)
-
-                results.extend(all_wild_childs)
-                results.extend(self.children['#'].patterns)     # any patterns defined in # are legal too
-
-            return results
-
-    def __init__(self):
+            child = children.get('*', None)
+            if child is not None:
+                child._collect_matches(topics, pos + 1, num_topics, results)
+
+            # '#' means any number of tokens - descend with the remaining topics starting at every position,
+            # and also any patterns defined in # are legal too
+            child = children.get('#', None)
+            if child is not None:
+                for i in xrange(pos, num_topics):
+                    child._collect_matches(topics, i, num_topics, results)
+                results.update(child.patterns)
+
+    def __init__(self, cache_size=None):
         """
         Creates a dummy root node that all topic trees hang off of.
         """
         self.root = self.Node(None)
 
+        self._cache_size = self.MATCH_CACHE_SIZE if cache_size is None else cache_size
+        self._match_cache = OrderedDict()       # topic tree -> frozenset of patterns, least recent first
+        self.cache_hits = 0
+        self.cache_misses = 0
+
     def add_topic_tree(self, topic_tree, pattern):
         """
         Splits a string topic_tree into tokens (by .) and recursively adds them to the trie.
@@ -628,30 +640,88 @@ class TopicTrie(object):
 
         if not pattern in curnode.patterns:
             curnode.patterns.append(pattern)
+            self._match_cache.clear()
 
     def remove_topic_tree(self, topic_tree, pattern):
         """
         Splits a string topic_tree into tokens (by .) and removes the pattern from the terminal node.
-        @TODO should remove empty nodes
+        Nodes left without patterns and children are pruned from the trie.
         """
         topics = topic_tree.split(".")
 
-        curnode = self.root
-
+        path = [self.root]
         for topic in topics:
-            curnode = curnode.get_or_create_child(topic)
+            curnode = path[-1].children.get(topic, None)
+            if curnode is None:
+                return
+            path.append(curnode)
+
+        curnode = path[-1]
+        if pattern not in curnode.patterns:
+            return
 
-        if pattern in curnode.patterns:
-            curnode.patterns.remove(pattern)
+        curnode.patterns.remove(pattern)
+        self._match_cache.clear()
+
+        # prune empty nodes bottom up (never the root)
+        for i in xrange(len(path) - 1, 0, -1):
+            node = path[i]
+            if not node.is_empty():
+                break
+            del path[i - 1].children[node.token]
 
     def get_all_matches(self, topic_tree):
         """
-        Returns a list of all matches for a given topic tree string.
-        Creates a set out of the matching patterns, so multiple binds matching on the same pattern only
-        return once.
+        Returns a set of all matches for a given topic tree string.
+        Multiple binds matching on the same pattern only return once.
+
+        The result is shared via the match cache and must not be modified.
         """
-        topics = topic_tree.split(".")
-        return set(self.root.get_all_matches(topics))
+        try:
+            matches = self._match_cache.pop(topic_tree)
+            self.cache_hits += 1
+        except KeyError:
+            matches = frozenset(self.root.get_all_matches(topic_tree.split(".")))
+            self.cache_misses += 1
+            if self._cache_size <= 0:
+                return matches
+            if len(self._match_cache) >= self._cache_size:
+                self._match_cache.popitem(last=False)    # purge least recently used entry
+
+        self._match_cache[topic_tree] = matches     # record recent use
+        return matches
+
+
+class LocalFrame(object):
+    """
+    Lightweight stand-in for the Pika method and header frames delivered to LocalRouter consumers.
+    Supports attribute access like the Pika frames and conversion via dict().
+    """
+    __slots__ = ()
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+
+class LocalMethodFrame(LocalFrame):
+    __slots__ = ('consumer_tag', 'delivery_tag', 'redelivered', 'exchange', 'routing_key')
+
+    def __init__(self, consumer_tag, delivery_tag, redelivered, exchange, routing_key):
+        self.consumer_tag = consumer_tag
+        self.delivery_tag = delivery_tag
+        self.redelivered = redelivered
+        self.exchange = exchange
+        self.routing_key = routing_key
+
+
+class LocalHeaderFrame(LocalFrame):
+    __slots__ = ('headers',)
+
+    def __init__(self, headers):
+        self.headers = headers
 
 
 class LocalRouter(object):
@@ -659,8 +729,14 @@ class LocalRouter(object):
     A RabbitMQ-like routing device implemented with gevent mechanisms for an in-memory broker.
     Using LocalTransport, can handle topic-exchange-like communication in ION within the context
     of a single container.
+
+    Messages are routed synchronously at publish time. Routing does not lock: declares, deletes
+    and binds replace the exchange and queue tables (copy-on-write) under the declarables lock,
+    and TopicTrie updates never yield to other greenlets while in progress.
     """
 
+    PUBLISH_YIELD_INTERVAL = 100    # publishes between explicit yields to other greenlets
+
     class ConsumerClosedMessage(object):
         """
         Dummy object used to exit queue get looping greenlets.
@@ -675,7 +751,7 @@ class LocalRouter(object):
         self._exchanges = {}                            # names -> { subscriber, topictrie(queue name) }
         self._queues = {}                               # names -> gevent queue
         self._bindings_by_queue = defaultdict(list)     # queue name -> [(ex, binding)]
-        self._lock_declarables = RLock()                # exchanges, queues, bindings, routing method
+        self._lock_declarables = RLock()                # exchanges, queues, bindings (not needed for routing)
 
         # consumers
         self._consumers = defaultdict(list)             # queue name -> [ctag, channel._on_deliver]
@@ -687,7 +763,9 @@ class LocalRouter(object):
         self._unacked = {}                              # dtag -> (ctag, msg)
         self._lock_unacked = RLock()                    # lock for interacting with unacked field
 
-        self._gl_msgs = None
+        self._publish_count = 0
+
+        self._gl_main = None
         self._gl_pool = Pool()
         self.gl_ioloop = None
 
@@ -701,44 +779,40 @@ class LocalRouter(object):
         """
         Starts all internal greenlets of this router device.
         """
-        self._queue_incoming = Queue()
-        self._gl_msgs = self._gl_pool.spawn(self._run_gl_msgs)
-        self._gl_msgs._glname = "pyon.net AMQP msgs"
-        self._gl_msgs.link_exception(self._child_failed)
+        self._gl_main = self._gl_pool.spawn(self._run_main)
+        self._gl_main._glname = "pyon.net AMQP router"
+        self._gl_main.link_exception(self._child_failed)
 
         self.gl_ioloop = spawn(self._run_ioloop)
         self.gl_ioloop._glname = "pyon.net AMQP ioloop"
 
     def stop(self):
-        self._gl_msgs.kill()    # @TODO: better
+        self._gl_main.kill()    # @TODO: better
         self._gl_pool.join(timeout=5, raise_error=True)
 
-    def _run_gl_msgs(self):
+    def _run_main(self):
+        """
+        Keeps the greenlet pool (and thus the "ioloop" greenlet) alive until the router is stopped.
+        Messages are routed in publish, so there is nothing else to do here.
+        """
         self.ready.set()
-        while True:
-            ex, rkey, body, props = self._queue_incoming.get()
-            try:
-                with self._lock_declarables:
-                    self._route(ex, rkey, body, props)
-            except Exception as e:
-                self.errors.append(e)
-                log.exception("Routing message")
+        Event().wait()
 
     def _route(self, exchange, routing_key, body, props):
         """
         Delivers incoming messages into queues based on known routes.
-        This entire method runs in a lock (likely pretty slow).
+        Uses whatever exchange and queue tables are current, without locking.
         """
-        assert exchange in self._exchanges, "Unknown exchange %s" % exchange
+        topic_trie = self._exchanges.get(exchange, None)
+        if topic_trie is None:
+            raise TransportError("Unknown exchange %s" % exchange)
 
-        queues = self._exchanges[exchange].get_all_matches(routing_key)
-        log.debug("route: ex %s, rkey %s,  matched %s routes", exchange, routing_key, len(queues))
+        queues = self._queues
+        msg = (exchange, routing_key, body, props)
 
         # deliver to each queue
-        for q in queues:
-            assert q in self._queues
-            log.debug("deliver -> %s", q)
-            self._queues[q].put((exchange, routing_key, body, props))
+        for q in topic_trie.get_all_matches(routing_key):
+            queues[q].put(msg)
 
     def _child_failed(self, gproc):
         """
@@ -758,18 +832,30 @@ class LocalRouter(object):
         self._gl_pool.join()
 
     def publish(self, exchange, routing_key, body, properties, immediate=False, mandatory=False):
-        self._queue_incoming.put((exchange, routing_key, body, properties))
-        sleep(0.0001)      # really wish switch would work instead of a sleep, seems wrong
+        try:
+            self._route(exchange, routing_key, body, properties)
+        except Exception as e:
+            self.errors.append(e)
+            log.exception("Routing message")
+
+        # no yield per message, but do not let a publishing loop starve the consumers
+        self._publish_count += 1
+        if self._publish_count % self.PUBLISH_YIELD_INTERVAL == 0:
+            sleep(0)
 
     def declare_exchange(self, exchange, **kwargs):
         with self._lock_declarables:
             if not exchange in self._exchanges:
-                self._exchanges[exchange] = TopicTrie()
+                exchanges = self._exchanges.copy()
+                exchanges[exchange] = TopicTrie()
+                self._exchanges = exchanges
 
     def delete_exchange(self, exchange, **kwargs):
         with self._lock_declarables:
             if exchange in self._exchanges:
-                del self._exchanges[exchange]
+                exchanges = self._exchanges.copy()
+                del exchanges[exchange]
+                self._exchanges = exchanges
 
     def declare_queue(self, queue, **kwargs):
         with self._lock_declarables:
@@ -782,14 +868,18 @@ class LocalRouter(object):
                         break
 
             if not queue in self._queues:
-                self._queues[queue] = Queue()
+                queues = self._queues.copy()
+                queues[queue] = Queue()
+                self._queues = queues
 
             return queue
 
     def delete_queue(self, queue, **kwargs):
         with self._lock_declarables:
             if queue in self._queues:
-                del self._queues[queue]
+                queues = self._queues.copy()
+                del queues[queue]
+                self._queues = queues
 
                 # kill bindings
                 for ex, binding in self._bindings_by_queue[queue]:
@@ -867,25 +957,16 @@ class LocalRouter(object):
                 break
             exchange, routing_key, body, props = m
 
-            # create method frame
-            method_frame = DotDict()
-            method_frame['consumer_tag']    = ctag
-            method_frame['redelivered']     = False     # @TODO
-            method_frame['exchange']        = exchange
-            method_frame['routing_key']     = routing_key
-
-            # create header frame
-            header_frame = DotDict()
-            header_frame['headers'] = props.copy()
-
             # make delivery tag for ack/reject later
             dtag = self._generate_dtag(ctag, cnt)
             cnt += 1
 
-            with self._lock_unacked:
-                self._unacked[dtag] = (ctag, queue_name, m)
+            # no lock needed, does not yield
+            self._unacked[dtag] = (ctag, queue_name, m)
 
-            method_frame['delivery_tag'] = dtag
+            # create method and header frames (headers are modified by the receiving channel)
+            method_frame = LocalMethodFrame(ctag, dtag, False, exchange, routing_key)     # @TODO redelivered
+            header_frame = LocalHeaderFrame(props.copy())
 
             # deliver to callback
             try:
@@ -910,8 +991,8 @@ class LocalRouter(object):
     def ack(self, delivery_tag):
         assert delivery_tag in self._unacked
 
-        with self._lock_unacked:
-            del self._unacked[delivery_tag]
+        # no lock needed, does not yield
+        del self._unacked[delivery_tag]
 
     def reject(self, delivery_tag, requeue=False):
         assert delivery_tag in self._unacked
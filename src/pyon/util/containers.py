@@ -16,6 +16,7 @@ from types import NoneType
 from copy import deepcopy
 
 DICT_LOCKING_ATTR = "__locked__"
+DICT_COPIED_ATTR = "__copied__"
 
 
 class DotNotationGetItem(object):
@@ -64,7 +65,7 @@ class DotDict(DotNotationGetItem, dict):
     """
 
     def __dir__(self):
-        return [k for k in self.__dict__.keys() + self.keys() if k != DICT_LOCKING_ATTR]
+        return [k for k in self.__dict__.keys() + self.keys() if k not in (DICT_LOCKING_ATTR, DICT_COPIED_ATTR)]
 
     def __getattr__(self, key):
         """ Make attempts to lookup by nonexistent attributes also attempt key lookups. """
@@ -132,6 +133,92 @@ class DotDict(DotNotationGetItem, dict):
         return DotDict(dict.fromkeys(seq, value))
 
 
+class LazyCopyDotDict(DotDict):
+    """
+    DotDict that behaves like a deep copy of a given base dict, but copies nested values lazily.
+    Starts as a shallow copy of the base. When a key is first read, a nested dict value becomes a
+    LazyCopyDotDict of its own and a list or other mutable value is deep copied. Changes therefore
+    never affect the base, while parts never accessed are not copied at all.
+    Values set directly are not copied (same as for a DotDict).
+    Note: Nested values not accessed yet reflect changes made to the base dict in the meantime.
+    """
+
+    def __init__(self, base=None):
+        dict.__init__(self, base or {})
+        self.__dict__[DICT_COPIED_ATTR] = set()
+
+    def _copied_keys(self):
+        # May not exist yet while unpickling
+        return self.__dict__.setdefault(DICT_COPIED_ATTR, set())
+
+    def __getitem__(self, key):
+        copied = self._copied_keys()
+        if key in copied:
+            return DotDict.__getitem__(self, key)
+        val = dict.__getitem__(self, key)
+        if isinstance(val, dict):
+            val = LazyCopyDotDict(val)
+        elif isinstance(val, list):
+            val = DotList(deepcopy(val))
+        elif type(val) not in IMMUTABLE_TYPES:
+            val = deepcopy(val)
+        dict.__setitem__(self, key, val)
+        copied.add(key)
+        return val
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._copied_keys().add(key)
+
+    def __copy__(self):
+        return LazyCopyDotDict(self)
+
+    # All access to values goes through __getitem__
+
+    def get(self, key, default=None):
+        return self[key] if dict.__contains__(self, key) else default
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return self[key]
+
+    def pop(self, key, *args):
+        if dict.__contains__(self, key):
+            val = self[key]
+            DotDict.pop(self, key)
+            return val
+        return DotDict.pop(self, key, *args)
+
+    def popitem(self):
+        if not self:
+            raise KeyError("popitem(): dictionary is empty")
+        key = next(iter(self))
+        return key, self.pop(key)
+
+    def update(self, *args, **kwargs):
+        for key, val in dict(*args, **kwargs).iteritems():
+            self[key] = val
+
+    def iteritems(self):
+        for key in self.keys():
+            yield key, self[key]
+
+    def itervalues(self):
+        for key in self.keys():
+            yield self[key]
+
+    def items(self):
+        return list(self.iteritems())
+
+    def values(self):
+        return list(self.itervalues())
+
+
+# Types of values that are shared and not copied
+IMMUTABLE_TYPES = frozenset([str, unicode, int, long, float, bool, NoneType])
+
+
 class DictDiffer(object):
     """
     Calculate the difference between two dictionaries as:
@@ -154,6 +241,66 @@ class DictDiffer(object):
         return set(o for o in self.intersect if self.past_dict[o] == self.current_dict[o])
 
 
+class ExpiringLRUCache(object):
+    """
+    Bounded cache that evicts least recently used entries and optionally expires entries after
+    a time to live. Keeps hit/miss/eviction counters. Does not yield (safe to use across greenlets).
+    """
+    def __init__(self, max_size=1000, ttl=0):
+        """
+        @param max_size  Maximum number of entries
+        @param ttl       Default time to live of entries in seconds (0 for no expiration)
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._cache = collections.OrderedDict()     # key -> (value, expiration time or None), least recent first
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key, default=None):
+        try:
+            value, expires = self._cache.pop(key)
+        except KeyError:
+            self.misses += 1
+            return default
+        if expires is not None and expires < time.time():
+            self.misses += 1
+            return default
+        self._cache[key] = (value, expires)
+        self.hits += 1
+        return value
+
+    def put(self, key, value, ttl=None):
+        """
+        Adds or replaces an entry.
+        @param ttl  Time to live in seconds for this entry, overriding the default (0 for no expiration)
+        """
+        if ttl is None:
+            ttl = self.ttl
+        cache = self._cache
+        if cache.pop(key, None) is None and len(cache) >= self.max_size:
+            cache.popitem(last=False)
+            self.evictions += 1
+        cache[key] = (value, time.time() + ttl if ttl else None)
+
+    def invalidate(self, key):
+        self._cache.pop(key, None)
+
+    def invalidate_matching(self, match_func):
+        """Removes all entries for which match_func(key, value) is True"""
+        for key in [k for k, (v, _) in self._cache.iteritems() if match_func(k, v)]:
+            del self._cache[key]
+
+    def clear(self):
+        self._cache.clear()
+
+    def __len__(self):
+        return len(self._cache)
+
+    def get_stats(self):
+        return dict(size=len(self._cache), max_size=self.max_size, hits=self.hits, misses=self.misses,
+                    evictions=self.evictions)
+
+
 def simple_deepcopy(coll):
     """Performs a recursive deep copy on given collection, only using dict, list and set
     collection types and not checking for cycles."""
@@ -376,7 +523,8 @@ def is_valid_identifier(name, valid_chars=BASIC_VALID, dot_sub=None, ws_sub=None
 
 #Used by json encoder
 def ion_object_encoder(obj):
-    return obj.__dict__
+    from pyon.core.object import get_obj_dict
+    return get_obj_dict(obj)
 
 def make_json(data):
     result = simplejson.dumps(data, default=ion_object_encoder, indent=2)
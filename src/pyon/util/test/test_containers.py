@@ -7,6 +7,7 @@ import copy
 from nose.plugins.attrib import attr
 
 from pyon.util.containers import DotDict, create_unique_identifier, make_json, is_valid_identifier, is_basic_identifier, NORMAL_VALID, is_valid_ts, get_ion_ts, dict_merge, DictDiffer
+from pyon.util.containers import ExpiringLRUCache, LazyCopyDotDict
 from pyon.util.containers import DICT_LOCKING_ATTR
 from pyon.util.int_test import IonIntegrationTestCase
 
@@ -86,6 +87,44 @@ class Test_Containers(IonIntegrationTestCase):
             d.foo2 = "nope"
 
 
+    def test_lazy_copy_dotdict(self):
+        base = DotDict({"process": {"name": "proc1", "list": [{"a": 1}], "sub": {"x": 1}},
+                        "container": {"org": "ION"}, "other": {"y": 2}})
+        base_copy = copy.deepcopy(base)
+        d = LazyCopyDotDict(base)
+        self.assertEqual(d, base)
+        self.assertIs(dict.__getitem__(d, "other"), dict.__getitem__(base, "other"))
+
+        d.process.name = "proc2"
+        d.process.list[0]["a"] = 2
+        d.process.sub.z = 3
+        d["container"]["org"] = "Org2"
+        d.get("other")["y"] = 3
+        d.new_key = "new"
+        dict_merge(d, {"process": {"sub": {"x": 5}}}, inplace=True)
+        self.assertEqual(base, base_copy)
+        self.assertEqual(d.get_safe("process.name"), "proc2")
+        self.assertEqual(d.process.list, [{"a": 2}])
+        self.assertEqual(d.process.sub, {"x": 5, "z": 3})
+        self.assertEqual(d.other.y, 3)
+        self.assertIsInstance(d.process, LazyCopyDotDict)
+
+        # Copies are independent
+        d2 = LazyCopyDotDict(base)
+        d2.setdefault("process", {})["name"] = "proc3"
+        for d3 in (copy.copy(d), copy.deepcopy(d)):
+            self.assertEqual(d3, d)
+            d3.process.sub.x = 6
+            for key, value in d3.iteritems():
+                if key == "other":
+                    value.y = 4
+        self.assertEqual(base, base_copy)
+        self.assertEqual(d.process.sub.x, 5)
+        self.assertEqual(d.other.y, 3)
+        self.assertEqual(d2.process.name, "proc3")
+        self.assertEqual(d.pop("other"), {"y": 3})
+        self.assertNotIn("other", d)
+
     def test_dotdict_chaining(self):
         base = DotDict({'test':None})
         base.chained.example.provides.utility = True
@@ -189,6 +228,32 @@ class Test_Containers(IonIntegrationTestCase):
         ]'''.split()))
 
 
+    def test_expiring_lru_cache(self):
+        cache = ExpiringLRUCache(max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 0)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("b"), 0)
+        cache.get("a")
+        cache.put("c", 3)   # Evicts least recently used "b"
+        self.assertEqual(cache.get("b", "missing"), "missing")
+        self.assertEqual(len(cache), 2)
+        stats = cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (3, 1, 1))
+
+        cache.invalidate_matching(lambda key, value: value == 3)
+        self.assertIsNone(cache.get("c"))
+        cache.invalidate("a")
+        self.assertEqual(len(cache), 0)
+
+        # Expired entries are not returned
+        cache.put("d", 4, ttl=-1)
+        cache.put("e", 5, ttl=60)
+        self.assertIsNone(cache.get("d"))
+        self.assertEqual(cache.get("e"), 5)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
     def test_create_unique_identifier(self):
         id = create_unique_identifier('abc123')
         self.assertIn('abc123', id)
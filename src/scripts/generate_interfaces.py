@@ -25,6 +25,8 @@ def main():
                         help='Generate HTML service doc inclusion files')
     parser.add_argument('-od', '--objectdoc', action='store_true',
                         help='Generate HTML object doc files')
+    parser.add_argument('-sl', '--slots', action='store_true',
+                        help='Generate object classes with __slots__ instead of instance __dict__')
     parser.add_argument('-s', '--sysname', action='store', help='System name')
     parser.add_argument('-ry', '--read_from_yaml_file', action='store_true',
                         help='Read configuration from YAML files instead of datastore - Default')